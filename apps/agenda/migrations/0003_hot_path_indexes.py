@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("agenda", "0002_restructure_models"),
+        ("finance", "0003_monthly_category_total"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["user", "start_datetime"], name="event_user_start_idx"
+            ),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.conf import settings
 from django.db import models
 
+from apps.core.search import FullTextIndex, register
+
 
 class Event(models.Model):
     """Evento na agenda (aula, show, freela)."""
@@ -87,6 +89,12 @@ class Event(models.Model):
         verbose_name = "Evento"
         verbose_name_plural = "Eventos"
         ordering = ["start_datetime"]
+        indexes = [
+            models.Index(
+                fields=["user", "start_datetime"],
+                name="event_user_start_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.start_datetime.strftime('%d/%m/%Y %H:%M')}"
@@ -100,3 +108,8 @@ class Event(models.Model):
     def has_transaction(self):
         """Retorna True se já tem transação vinculada."""
         return self.linked_transaction is not None
+
+
+EVENT_SEARCH_INDEX = register(
+    FullTextIndex("agenda_event", ["title", "location", "notes"])
+)
@@ -1,16 +1,26 @@
 from django_filters import rest_framework as filters
 from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 
-from .models import Event
+from apps.core.exports import ExportMixin
+from apps.core.pagination import PageOrCursorPagination
+from apps.core.periods import (
+    local_day_start,
+    month_datetime_filter,
+    next_day,
+    parse_month,
+)
+
+from .models import EVENT_SEARCH_INDEX, Event
 from .serializers import EventSerializer
 
 
 class EventFilter(filters.FilterSet):
     status = filters.CharFilter(field_name="status")
     event_type = filters.CharFilter(field_name="event_type")
-    start_date = filters.DateFilter(field_name="start_datetime", lookup_expr="date__gte")
-    end_date = filters.DateFilter(field_name="start_datetime", lookup_expr="date__lte")
+    start_date = filters.DateFilter(method="filter_start_date")
+    end_date = filters.DateFilter(method="filter_end_date")
     month = filters.CharFilter(method="filter_by_month")
 
     class Meta:
@@ -20,20 +30,45 @@ class EventFilter(filters.FilterSet):
     def filter_by_month(self, queryset, name, value):
         """Filter by month in format YYYY-MM."""
         try:
-            year, month = value.split("-")
-            return queryset.filter(
-                start_datetime__year=int(year), start_datetime__month=int(month)
-            )
-        except (ValueError, AttributeError):
-            return queryset
+            month = parse_month(value)
+        except ValueError:
+            raise ValidationError({"month": "Formato inválido. Use YYYY-MM"})
+        return queryset.filter(**month_datetime_filter("start_datetime", month))
+
+    def filter_start_date(self, queryset, name, value):
+        """Eventos que começam a partir do dia (timezone local)."""
+        return queryset.filter(start_datetime__gte=local_day_start(value))
+
+    def filter_end_date(self, queryset, name, value):
+        """Eventos que começam até o fim do dia (timezone local)."""
+        return queryset.filter(start_datetime__lt=local_day_start(next_day(value)))
 
 
-class EventViewSet(viewsets.ModelViewSet):
+class EventViewSet(ExportMixin, viewsets.ModelViewSet):
     serializer_class = EventSerializer
     permission_classes = [IsAuthenticated]
     filterset_class = EventFilter
     search_fields = ["title", "location", "notes"]
+    search_index = EVENT_SEARCH_INDEX
+    export_fields = (
+        "id",
+        "title",
+        "event_type",
+        "status",
+        "start_datetime",
+        "end_datetime",
+        "location",
+        "client_name",
+        "expected_amount",
+        "actual_amount",
+        "payment_date",
+        "notes",
+    )
+    export_ordering = ("start_datetime", "id")
+    export_filename = "eventos"
     ordering_fields = ["start_datetime", "expected_amount", "created_at"]
+    pagination_class = PageOrCursorPagination
+    cursor_ordering = ("start_datetime", "id")
 
     def get_queryset(self):
         return Event.objects.filter(user=self.request.user)
@@ -1,6 +1,13 @@
 from django.contrib import admin
 
-from .models import AIUsageLog, ChatConversation, ChatMessage
+from .models import (
+    AIAnalysisResult,
+    AIJob,
+    AIUsageDaily,
+    AIUsageLog,
+    ChatConversation,
+    ChatMessage,
+)
 
 
 @admin.register(AIUsageLog)
@@ -9,8 +16,8 @@ class AIUsageLogAdmin(admin.ModelAdmin):
         "user",
         "feature",
         "model_name",
-        "input_chars",
-        "output_chars",
+        "input_tokens",
+        "output_tokens",
         "success",
         "created_at",
     ]
@@ -22,6 +29,8 @@ class AIUsageLogAdmin(admin.ModelAdmin):
         "input_text",
         "input_chars",
         "output_chars",
+        "input_tokens",
+        "output_tokens",
         "model_name",
         "success",
         "error_message",
@@ -29,6 +38,48 @@ class AIUsageLogAdmin(admin.ModelAdmin):
     ]
 
 
+@admin.register(AIUsageDaily)
+class AIUsageDailyAdmin(admin.ModelAdmin):
+    list_display = [
+        "day",
+        "user",
+        "feature",
+        "model_name",
+        "calls",
+        "failures",
+        "input_tokens",
+        "output_tokens",
+    ]
+    list_filter = ["feature", "model_name", "day"]
+    search_fields = ["user__username"]
+    date_hierarchy = "day"
+    readonly_fields = list_display
+
+
+@admin.register(AIJob)
+class AIJobAdmin(admin.ModelAdmin):
+    list_display = [
+        "id",
+        "user",
+        "feature",
+        "status",
+        "attempts",
+        "created_at",
+        "finished_at",
+    ]
+    list_filter = ["feature", "status", "created_at"]
+    search_fields = ["user__username", "error_message"]
+    readonly_fields = ["result", "locked_at", "created_at", "finished_at"]
+
+
+@admin.register(AIAnalysisResult)
+class AIAnalysisResultAdmin(admin.ModelAdmin):
+    list_display = ["user", "feature", "period", "tokens_used", "updated_at"]
+    list_filter = ["feature"]
+    search_fields = ["user__username", "period"]
+    readonly_fields = ["fingerprint", "result", "updated_at"]
+
+
 @admin.register(ChatConversation)
 class ChatConversationAdmin(admin.ModelAdmin):
     list_display = ["title", "user", "is_active", "updated_at"]
@@ -0,0 +1,78 @@
+"""
+Análises do LLM (insights, previsão e orçamentos) guardadas no banco.
+
+A chave é (usuário, funcionalidade, período) e o ``fingerprint`` é um hash
+dos dados enviados ao LLM (totais, categorias, histórico ou situação dos
+orçamentos) e do modelo. Enquanto os dados do período não mudam, a análise
+guardada é devolvida sem nova chamada; ``?refresh=1`` força uma nova análise.
+"""
+
+import hashlib
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import AIAnalysisResult
+from .services import get_llm_model
+
+
+def analysis_fingerprint(*inputs) -> str:
+    """Hash estável das entradas de uma análise (inclui o modelo ativo)."""
+    raw = json.dumps(
+        [get_llm_model(), *inputs],
+        cls=DjangoJSONEncoder,
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _stored(user, feature: str, period: str, fingerprint: str):
+    return AIAnalysisResult.objects.filter(
+        user=user, feature=feature, period=period, fingerprint=fingerprint
+    ).values_list("result", flat=True)
+
+
+def get_analysis(user, feature: str, period: str, fingerprint: str) -> dict | None:
+    """Resultado guardado para exatamente estas entradas, se houver."""
+    return _stored(user, feature, period, fingerprint).first()
+
+
+async def aget_analysis(
+    user, feature: str, period: str, fingerprint: str
+) -> dict | None:
+    """Versão assíncrona de ``get_analysis``."""
+    return await _stored(user, feature, period, fingerprint).afirst()
+
+
+def save_analysis(
+    user, feature: str, period: str, fingerprint: str, result: dict, tokens_used=0
+):
+    """Guarda a análise do período, substituindo a anterior."""
+    AIAnalysisResult.objects.update_or_create(
+        user=user,
+        feature=feature,
+        period=period,
+        defaults={
+            "fingerprint": fingerprint,
+            "result": result,
+            "tokens_used": tokens_used,
+        },
+    )
+
+
+async def asave_analysis(
+    user, feature: str, period: str, fingerprint: str, result: dict, tokens_used=0
+):
+    """Versão assíncrona de ``save_analysis``."""
+    await AIAnalysisResult.objects.aupdate_or_create(
+        user=user,
+        feature=feature,
+        period=period,
+        defaults={
+            "fingerprint": fingerprint,
+            "result": result,
+            "tokens_used": tokens_used,
+        },
+    )
@@ -5,3 +5,6 @@ class AiConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.ai"
     verbose_name = "Inteligência Artificial"
+
+    def ready(self):
+        import apps.ai.signals  # noqa: F401
@@ -0,0 +1,198 @@
+"""
+Fila de tarefas de IA no próprio banco (sem broker externo).
+
+- ``enqueue`` grava um ``AIJob`` pendente; a view responde na hora com o id.
+  A view reserva a requisição no rate limit ao enfileirar (o worker só soma
+  os tokens) e reaproveita uma tarefa idêntica ainda não concluída
+  (``afind_pending``), então rajadas de ``?async=1`` não multiplicam as
+  chamadas ao LLM.
+- ``claim_jobs`` reserva as próximas tarefas com
+  ``select_for_update(skip_locked=True)``: workers concorrentes nunca pegam a
+  mesma tarefa e não esperam uns pelos outros. Reservas mais antigas que
+  ``AI_JOB_LOCK_TIMEOUT`` (worker que morreu) voltam a ser elegíveis enquanto
+  restarem tentativas; as que já usaram todas são marcadas como falhas.
+- ``run_job`` executa o handler da funcionalidade e grava o resultado. Falhas
+  voltam para a fila com espera crescente (``AI_JOB_RETRY_BACKOFF`` dobrando a
+  cada tentativa) até ``max_attempts``. A gravação é repetida em erros de
+  banco; se o resultado não puder ser gravado, a tarefa é marcada como falha
+  em vez de ficar em execução (e ser repetida, com nova chamada ao LLM, quando
+  a reserva expirar).
+
+O comando ``runworker`` consome a fila com um pool de threads; o tamanho do
+pool limita as chamadas simultâneas ao LLM.
+"""
+
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import AIJob, AIUsageLog
+
+logger = logging.getLogger(__name__)
+
+# Tentativas de gravar o estado da tarefa (ex.: "database table is locked")
+SAVE_ATTEMPTS = 3
+SAVE_RETRY_DELAY = 0.5  # segundos; cresce a cada tentativa
+
+# Funcionalidade -> handler ``(user, payload) -> dict`` (resolvido sob demanda).
+JOB_HANDLERS = {
+    AIUsageLog.Feature.INSIGHTS: "apps.ai.views.run_insights_job",
+    AIUsageLog.Feature.FORECAST: "apps.ai.views.run_forecast_job",
+    AIUsageLog.Feature.BUDGET_CHECK: "apps.ai.views.run_budget_check_job",
+}
+
+
+def _new_job(user, feature: str, payload: dict | None) -> AIJob:
+    if feature not in JOB_HANDLERS:
+        raise ValueError(f"Funcionalidade sem tarefa em segundo plano: {feature}")
+    return AIJob(
+        user=user,
+        feature=feature,
+        payload=payload or {},
+        max_attempts=settings.AI_JOB_MAX_ATTEMPTS,
+    )
+
+
+def enqueue(user, feature: str, payload: dict | None = None) -> AIJob:
+    """Cria uma tarefa pendente."""
+    job = _new_job(user, feature, payload)
+    job.save(force_insert=True)
+    return job
+
+
+async def aenqueue(user, feature: str, payload: dict | None = None) -> AIJob:
+    """Versão assíncrona de ``enqueue``."""
+    job = _new_job(user, feature, payload)
+    await job.asave(force_insert=True)
+    return job
+
+
+async def afind_pending(
+    user, feature: str, payload: dict | None = None
+) -> AIJob | None:
+    """Tarefa com os mesmos parâmetros ainda pendente ou em execução."""
+    return (
+        await AIJob.objects.filter(
+            user=user,
+            feature=feature,
+            payload=payload or {},
+            status__in=[AIJob.Status.PENDING, AIJob.Status.RUNNING],
+        )
+        .order_by("id")
+        .afirst()
+    )
+
+
+def claim_jobs(limit: int) -> list[AIJob]:
+    """Reserva até ``limit`` tarefas prontas, marcando-as como em execução."""
+    if limit <= 0:
+        return []
+
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.AI_JOB_LOCK_TIMEOUT)
+    with transaction.atomic():
+        # Reserva expirada sem tentativas sobrando: falha em vez de rodar de novo
+        AIJob.objects.filter(
+            status=AIJob.Status.RUNNING,
+            locked_at__lt=stale,
+            attempts__gte=F("max_attempts"),
+        ).update(
+            status=AIJob.Status.FAILED,
+            locked_at=None,
+            finished_at=now,
+            error_message="Tarefa interrompida sem resultado.",
+        )
+        jobs = list(
+            AIJob.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=AIJob.Status.PENDING, run_after__lte=now)
+                | Q(
+                    status=AIJob.Status.RUNNING,
+                    locked_at__lt=stale,
+                    attempts__lt=F("max_attempts"),
+                )
+            )
+            .order_by("run_after", "id")[:limit]
+        )
+        AIJob.objects.filter(pk__in=[job.pk for job in jobs]).update(
+            status=AIJob.Status.RUNNING,
+            locked_at=now,
+            attempts=F("attempts") + 1,
+        )
+
+    for job in jobs:
+        job.status = AIJob.Status.RUNNING
+        job.locked_at = now
+        job.attempts += 1
+    return jobs
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Espera antes da próxima tentativa (dobra a cada falha)."""
+    return timedelta(seconds=settings.AI_JOB_RETRY_BACKOFF * 2 ** max(attempts - 1, 0))
+
+
+def _save_job(job: AIJob, fields: list[str]):
+    """Grava o estado da tarefa, repetindo em erros de banco."""
+    for attempt in range(1, SAVE_ATTEMPTS + 1):
+        try:
+            job.save(update_fields=fields)
+            return
+        except DatabaseError:
+            if attempt == SAVE_ATTEMPTS:
+                raise
+            logger.warning(f"Erro ao gravar a tarefa #{job.pk}; tentativa {attempt}")
+            time.sleep(SAVE_RETRY_DELAY * attempt)
+
+
+def run_job(job: AIJob) -> AIJob:
+    """Executa uma tarefa reservada e grava o resultado ou a falha."""
+    handler = import_string(JOB_HANDLERS[job.feature])
+    try:
+        result = handler(job.user, job.payload)
+    except Exception as exc:
+        logger.exception(f"Erro na tarefa {job.feature} #{job.pk}")
+        now = timezone.now()
+        job.error_message = str(exc)
+        job.locked_at = None
+        if job.attempts >= job.max_attempts:
+            job.status = AIJob.Status.FAILED
+            job.finished_at = now
+        else:
+            job.status = AIJob.Status.PENDING
+            job.run_after = now + retry_delay(job.attempts)
+        _save_job(
+            job, ["status", "error_message", "locked_at", "run_after", "finished_at"]
+        )
+        return job
+
+    job.status = AIJob.Status.DONE
+    job.result = result
+    job.error_message = ""
+    job.locked_at = None
+    job.finished_at = timezone.now()
+    fields = ["status", "result", "error_message", "locked_at", "finished_at"]
+    try:
+        _save_job(job, fields)
+    except DatabaseError as exc:
+        # O LLM já respondeu: falha definitiva em vez de repetir a chamada
+        logger.exception(f"Erro ao gravar o resultado da tarefa #{job.pk}")
+        job.status = AIJob.Status.FAILED
+        job.result = None
+        job.error_message = f"Erro ao gravar o resultado: {exc}"
+        _save_job(job, fields)
+    return job
+
+
+def run_job_in_thread(job: AIJob) -> AIJob:
+    """``run_job`` para threads do worker: fecha a conexão da thread ao terminar."""
+    try:
+        return run_job(job)
+    finally:
+        connections.close_all()
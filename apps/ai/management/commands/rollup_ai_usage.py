@@ -0,0 +1,52 @@
+from datetime import date
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.ai.usage_rollup import prune_usage_logs, rollup_usage
+
+
+class Command(BaseCommand):
+    help = "Consolida o uso da IA por dia e aplica a retenção dos registros brutos."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since",
+            help="Recalcula a partir desta data (YYYY-MM-DD) em vez do último dia consolidado.",
+        )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Apaga registros brutos mais antigos que a retenção após consolidar.",
+        )
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=settings.AI_USAGE_LOG_RETENTION_DAYS,
+            help="Dias de registros brutos mantidos (com --prune).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.AI_USAGE_LOG_PRUNE_BATCH_SIZE,
+            help="Registros apagados por comando DELETE (com --prune).",
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since"]:
+            try:
+                since = date.fromisoformat(options["since"])
+            except ValueError as exc:
+                raise CommandError(f"Data inválida: {options['since']!r}") from exc
+
+        rows = rollup_usage(since)
+        self.stdout.write(f"Uso diário consolidado: {rows} linhas.")
+
+        if options["prune"]:
+            deleted = prune_usage_logs(
+                options["retention_days"], max(1, options["batch_size"])
+            )
+            self.stdout.write(f"Registros brutos apagados: {deleted}.")
+
+        self.stdout.write(self.style.SUCCESS("Concluído."))
@@ -0,0 +1,70 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.ai.jobs import claim_jobs, run_job_in_thread
+
+
+class Command(BaseCommand):
+    help = "Executa as tarefas de IA em segundo plano (fila no banco)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=settings.AI_JOB_WORKER_CONCURRENCY,
+            help="Tarefas simultâneas (limita as chamadas paralelas ao LLM).",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=settings.AI_JOB_POLL_INTERVAL,
+            help="Segundos entre consultas à fila quando não há tarefas.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Processa as tarefas prontas e encerra.",
+        )
+
+    def handle(self, *args, **options):
+        concurrency = max(1, options["concurrency"])
+        poll_interval = options["poll_interval"]
+        processed = failed = 0
+        running = set()
+
+        self.stdout.write(f"Worker de IA iniciado ({concurrency} threads).")
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            try:
+                while True:
+                    jobs = claim_jobs(concurrency - len(running))
+                    running.update(
+                        executor.submit(run_job_in_thread, job) for job in jobs
+                    )
+                    if not running:
+                        if options["once"]:
+                            break
+                        time.sleep(poll_interval)
+                        continue
+
+                    done, running = wait(
+                        running, timeout=poll_interval, return_when=FIRST_COMPLETED
+                    )
+                    for future in done:
+                        try:
+                            job = future.result()
+                        except Exception as exc:  # erro de banco ao gravar o resultado
+                            self.stderr.write(f"Erro no worker: {exc}")
+                            continue
+                        processed += 1
+                        failed += job.status == job.Status.FAILED
+            except KeyboardInterrupt:
+                self.stdout.write("Encerrando; aguardando as tarefas em andamento.")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Concluido. Tarefas processadas: {processed} ({failed} falharam)."
+            )
+        )
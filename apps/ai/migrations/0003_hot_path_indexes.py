@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0002_chat_models"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="aiusagelog",
+            name="feature",
+            field=models.CharField(
+                choices=[
+                    ("parse_transaction", "Parse Transaction"),
+                    ("insights", "Insights"),
+                    ("chat", "Chat"),
+                    ("categorize", "Categorize"),
+                    ("forecast", "Forecast"),
+                    ("budget_check", "Budget Check"),
+                ],
+                max_length=50,
+                verbose_name="Feature",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="aiusagelog",
+            index=models.Index(
+                fields=["user", "created_at"], name="aiusagelog_user_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from apps.core.search import FullTextIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0003_hot_path_indexes"),
+    ]
+
+    operations = [
+        FullTextIndex("ai_chatmessage", ["content"]).operation(),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:19
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0005_ai_jobs"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AIAnalysisResult",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "feature",
+                    models.CharField(
+                        choices=[
+                            ("parse_transaction", "Parse Transaction"),
+                            ("insights", "Insights"),
+                            ("chat", "Chat"),
+                            ("categorize", "Categorize"),
+                            ("forecast", "Forecast"),
+                            ("budget_check", "Budget Check"),
+                        ],
+                        max_length=50,
+                        verbose_name="Feature",
+                    ),
+                ),
+                ("period", models.CharField(max_length=20, verbose_name="Período")),
+                (
+                    "fingerprint",
+                    models.CharField(max_length=64, verbose_name="Fingerprint"),
+                ),
+                (
+                    "result",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        verbose_name="Resultado",
+                    ),
+                ),
+                ("tokens_used", models.IntegerField(default=0, verbose_name="Tokens")),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ai_analysis_results",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Análise de IA",
+                "verbose_name_plural": "Análises de IA",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "feature", "period"),
+                        name="aianalysisresult_user_feature_period_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:26
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0006_analysis_results"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="aiusagelog",
+            name="input_tokens",
+            field=models.PositiveIntegerField(default=0, verbose_name="Input Tokens"),
+        ),
+        migrations.AddField(
+            model_name="aiusagelog",
+            name="output_tokens",
+            field=models.PositiveIntegerField(default=0, verbose_name="Output Tokens"),
+        ),
+        migrations.AlterField(
+            model_name="aiusagelog",
+            name="created_at",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, editable=False
+            ),
+        ),
+    ]
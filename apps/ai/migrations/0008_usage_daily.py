@@ -0,0 +1,96 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0007_usage_log_tokens"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AIUsageDaily",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "feature",
+                    models.CharField(
+                        choices=[
+                            ("parse_transaction", "Parse Transaction"),
+                            ("insights", "Insights"),
+                            ("chat", "Chat"),
+                            ("categorize", "Categorize"),
+                            ("forecast", "Forecast"),
+                            ("budget_check", "Budget Check"),
+                        ],
+                        max_length=50,
+                        verbose_name="Feature",
+                    ),
+                ),
+                ("model_name", models.CharField(max_length=50, verbose_name="Model")),
+                ("day", models.DateField(verbose_name="Dia")),
+                (
+                    "calls",
+                    models.PositiveIntegerField(default=0, verbose_name="Chamadas"),
+                ),
+                (
+                    "failures",
+                    models.PositiveIntegerField(default=0, verbose_name="Falhas"),
+                ),
+                (
+                    "input_tokens",
+                    models.PositiveBigIntegerField(
+                        default=0, verbose_name="Input Tokens"
+                    ),
+                ),
+                (
+                    "output_tokens",
+                    models.PositiveBigIntegerField(
+                        default=0, verbose_name="Output Tokens"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Uso Diário IA",
+                "verbose_name_plural": "Uso Diário IA",
+                "ordering": ["-day"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="aiusagelog",
+            index=models.Index(fields=["created_at"], name="aiusagelog_created_idx"),
+        ),
+        migrations.AddField(
+            model_name="aiusagedaily",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="ai_usage_daily",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="aiusagedaily",
+            index=models.Index(fields=["day"], name="aiusagedaily_day_idx"),
+        ),
+        migrations.AddConstraint(
+            model_name="aiusagedaily",
+            constraint=models.UniqueConstraint(
+                fields=("user", "day", "feature", "model_name"),
+                name="aiusagedaily_user_day_feature_model_uniq",
+            ),
+        ),
+    ]
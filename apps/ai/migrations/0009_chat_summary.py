@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0008_usage_daily"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chatconversation",
+            name="summary",
+            field=models.TextField(blank=True, verbose_name="Resumo"),
+        ),
+        migrations.AddField(
+            model_name="chatconversation",
+            name="summary_until",
+            field=models.BigIntegerField(
+                blank=True,
+                help_text="Id da última mensagem incorporada ao resumo",
+                null=True,
+                verbose_name="Resumo até a mensagem",
+            ),
+        ),
+    ]
@@ -1,5 +1,9 @@
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.utils import timezone
+
+from apps.core.search import FullTextIndex, register
 
 
 class AIUsageLog(models.Model):
@@ -26,20 +30,157 @@ class AIUsageLog(models.Model):
     input_text = models.TextField("Input", blank=True)
     input_chars = models.IntegerField("Input Chars", default=0)
     output_chars = models.IntegerField("Output Chars", default=0)
+    input_tokens = models.PositiveIntegerField("Input Tokens", default=0)
+    output_tokens = models.PositiveIntegerField("Output Tokens", default=0)
     model_name = models.CharField("Model", max_length=50)
     success = models.BooleanField("Sucesso", default=True)
     error_message = models.TextField("Erro", blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Momento da chamada (não da gravação, que pode ser em lote depois)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         verbose_name = "Log de Uso IA"
         verbose_name_plural = "Logs de Uso IA"
         ordering = ["-created_at"]
+        indexes = [
+            # Uso do usuário em um intervalo (ex.: última hora).
+            models.Index(
+                fields=["user", "created_at"],
+                name="aiusagelog_user_created_idx",
+            ),
+            # Rollup diário e retenção: varredura por intervalo de datas.
+            models.Index(fields=["created_at"], name="aiusagelog_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.feature} - {self.created_at}"
 
 
+class AIUsageDaily(models.Model):
+    """Uso diário da IA consolidado (rollup) por usuário, funcionalidade e modelo."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="ai_usage_daily",
+    )
+    feature = models.CharField(
+        "Feature", max_length=50, choices=AIUsageLog.Feature.choices
+    )
+    model_name = models.CharField("Model", max_length=50)
+    day = models.DateField("Dia")
+    calls = models.PositiveIntegerField("Chamadas", default=0)
+    failures = models.PositiveIntegerField("Falhas", default=0)
+    input_tokens = models.PositiveBigIntegerField("Input Tokens", default=0)
+    output_tokens = models.PositiveBigIntegerField("Output Tokens", default=0)
+
+    class Meta:
+        verbose_name = "Uso Diário IA"
+        verbose_name_plural = "Uso Diário IA"
+        ordering = ["-day"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "day", "feature", "model_name"],
+                name="aiusagedaily_user_day_feature_model_uniq",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["day"], name="aiusagedaily_day_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.feature} - {self.day}"
+
+
+class AIJob(models.Model):
+    """Tarefa de IA executada em segundo plano pelo comando ``runworker``."""
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pendente"
+        RUNNING = "running", "Em execução"
+        DONE = "done", "Concluída"
+        FAILED = "failed", "Falhou"
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="ai_jobs",
+    )
+    feature = models.CharField(
+        "Feature",
+        max_length=50,
+        choices=AIUsageLog.Feature.choices,
+    )
+    status = models.CharField(
+        "Status",
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    payload = models.JSONField("Parâmetros", default=dict, encoder=DjangoJSONEncoder)
+    result = models.JSONField(
+        "Resultado", null=True, blank=True, encoder=DjangoJSONEncoder
+    )
+    error_message = models.TextField("Erro", blank=True)
+    attempts = models.PositiveIntegerField("Tentativas", default=0)
+    max_attempts = models.PositiveIntegerField("Máximo de tentativas", default=3)
+    run_after = models.DateTimeField("Executar após", default=timezone.now)
+    locked_at = models.DateTimeField("Reservada em", null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField("Concluída em", null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Tarefa de IA"
+        verbose_name_plural = "Tarefas de IA"
+        ordering = ["-created_at"]
+        indexes = [
+            # Worker: próximas tarefas pendentes (e reservas expiradas).
+            models.Index(
+                fields=["status", "run_after"], name="aijob_status_run_after_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.feature} #{self.pk} ({self.status})"
+
+
+class AIAnalysisResult(models.Model):
+    """
+    Última análise do LLM por (usuário, funcionalidade, período). O
+    ``fingerprint`` identifica os dados de entrada: enquanto eles não mudam a
+    análise é reaproveitada.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="ai_analysis_results",
+    )
+    feature = models.CharField(
+        "Feature",
+        max_length=50,
+        choices=AIUsageLog.Feature.choices,
+    )
+    period = models.CharField("Período", max_length=20)
+    fingerprint = models.CharField("Fingerprint", max_length=64)
+    result = models.JSONField("Resultado", encoder=DjangoJSONEncoder)
+    tokens_used = models.IntegerField("Tokens", default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Análise de IA"
+        verbose_name_plural = "Análises de IA"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "feature", "period"],
+                name="aianalysisresult_user_feature_period_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.feature} {self.period} ({self.user.username})"
+
+
 class ChatConversation(models.Model):
     """Conversa de chat financeiro."""
 
@@ -50,6 +191,14 @@ class ChatConversation(models.Model):
     )
     title = models.CharField("Título", max_length=200)
     is_active = models.BooleanField("Ativa", default=True)
+    # Mensagens antigas que saíram da janela do histórico (ver services/chat_history.py)
+    summary = models.TextField("Resumo", blank=True)
+    summary_until = models.BigIntegerField(
+        "Resumo até a mensagem",
+        null=True,
+        blank=True,
+        help_text="Id da última mensagem incorporada ao resumo",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -86,3 +235,6 @@ class ChatMessage(models.Model):
 
     def __str__(self):
         return f"{self.role} - {self.conversation_id}"
+
+
+CHAT_MESSAGE_SEARCH_INDEX = register(FullTextIndex("ai_chatmessage", ["content"]))
@@ -1,34 +1,76 @@
-from .budget_service import BudgetCheckResult, generate_budget_check
-from .categorization_service import categorize_transaction_text
-from .chat_service import ChatResponse, generate_chat_response
-from .forecast_service import ForecastResult, generate_cashflow_forecast
+from .budget_service import (
+    BudgetCheckResult,
+    agenerate_budget_check,
+    generate_budget_check,
+)
+from .categorization_service import (
+    acategorize_transaction_text,
+    categorize_transaction_text,
+    categorize_transaction_texts,
+)
+from .chat_service import (
+    ChatResponse,
+    ChatStream,
+    agenerate_chat_response,
+    astream_chat_response,
+    asummarize_conversation,
+    generate_chat_response,
+    summarize_conversation,
+)
+from .forecast_service import (
+    ForecastResult,
+    agenerate_cashflow_forecast,
+    generate_cashflow_forecast,
+)
 from .ollama_client import (
     MonthlyInsights,
     TransactionProposal,
+    agenerate_monthly_insights,
+    aparse_transaction_text,
+    generate_monthly_insights,
+    get_available_models,
     get_llm_base_url,
     get_llm_model,
     get_llm_provider,
-    generate_monthly_insights,
-    get_available_models,
     is_ollama_available,
+    llm_health,
     parse_transaction_text,
 )
+from .rate_limit import rate_limiter
+from .response_cache import response_cache, response_cache_key
+from .rule_parser import parse_transaction_rules
 
 __all__ = [
     "parse_transaction_text",
+    "aparse_transaction_text",
+    "parse_transaction_rules",
     "is_ollama_available",
+    "llm_health",
+    "rate_limiter",
+    "response_cache",
+    "response_cache_key",
     "get_available_models",
     "get_llm_provider",
     "get_llm_base_url",
     "get_llm_model",
     "generate_monthly_insights",
+    "agenerate_monthly_insights",
     "TransactionProposal",
     "MonthlyInsights",
     "generate_chat_response",
+    "agenerate_chat_response",
     "ChatResponse",
+    "ChatStream",
+    "astream_chat_response",
+    "summarize_conversation",
+    "asummarize_conversation",
     "categorize_transaction_text",
+    "acategorize_transaction_text",
+    "categorize_transaction_texts",
     "generate_cashflow_forecast",
+    "agenerate_cashflow_forecast",
     "ForecastResult",
     "generate_budget_check",
+    "agenerate_budget_check",
     "BudgetCheckResult",
 ]
@@ -4,7 +4,12 @@ from dataclasses import dataclass
 
 from django.conf import settings
 
-from .ollama_client import get_llm_model, get_ollama_client
+from .ollama_client import (
+    get_async_llm_client,
+    get_llm_model,
+    get_ollama_client,
+    llm_health,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,11 +35,7 @@ Responda APENAS com JSON válido.
 """
 
 
-def generate_budget_check(status_list: list[dict]) -> tuple[BudgetCheckResult, dict]:
-    """Gera análise de orçamentos e recomendações."""
-    client = get_ollama_client()
-    model = get_llm_model()
-
+def _budget_check_request(status_list: list[dict]) -> dict:
     budget_lines = [
         (
             f"- {item['category_name']}: limite {item['amount']:.2f}, "
@@ -45,17 +46,43 @@ def generate_budget_check(status_list: list[dict]) -> tuple[BudgetCheckResult, d
     ]
 
     prompt = BUDGET_CHECK_PROMPT.format(budgets="\n".join(budget_lines))
-
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": "Você responde apenas em JSON sobre orçamentos."},
+    return {
+        "model": get_llm_model(),
+        "messages": [
+            {
+                "role": "system",
+                "content": "Você responde apenas em JSON sobre orçamentos.",
+            },
             {"role": "user", "content": prompt},
         ],
-        max_tokens=settings.AI_MAX_OUTPUT_TOKENS,
-        temperature=settings.AI_TEMPERATURE,
-    )
+        "max_tokens": settings.AI_MAX_OUTPUT_TOKENS,
+        "temperature": settings.AI_TEMPERATURE,
+    }
+
+
+def generate_budget_check(status_list: list[dict]) -> tuple[BudgetCheckResult, dict]:
+    """Gera análise de orçamentos e recomendações."""
+    client = get_ollama_client("budget")
+    request = _budget_check_request(status_list)
+
+    with llm_health.track():
+        response = client.chat.completions.create(**request)
+    return _budget_check_result(request["model"], response)
+
+
+async def agenerate_budget_check(
+    status_list: list[dict],
+) -> tuple[BudgetCheckResult, dict]:
+    """Versão assíncrona de ``generate_budget_check``."""
+    client = get_async_llm_client("budget")
+    request = _budget_check_request(status_list)
+
+    with llm_health.track():
+        response = await client.chat.completions.create(**request)
+    return _budget_check_result(request["model"], response)
+
 
+def _budget_check_result(model: str, response) -> tuple[BudgetCheckResult, dict]:
     content = response.choices[0].message.content.strip()
     if content.startswith("```"):
         content = content.split("```")[1]
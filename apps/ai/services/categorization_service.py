@@ -3,7 +3,12 @@ import logging
 
 from django.conf import settings
 
-from .ollama_client import get_llm_model, get_ollama_client
+from .ollama_client import (
+    get_async_llm_client,
+    get_llm_model,
+    get_ollama_client,
+    llm_health,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,30 +28,155 @@ Texto do usuário: {text}
 """
 
 
-def categorize_transaction_text(text: str, categories: list[str]) -> tuple[str | None, float, dict]:
+BATCH_CATEGORIZE_PROMPT = """Você é um assistente que classifica transações financeiras.
+
+Para CADA texto numerado abaixo, escolha a categoria MAIS adequada entre as opções disponíveis.
+
+Categorias disponíveis:
+{categories}
+
+Responda APENAS com um array JSON válido, sem markdown, com um item por texto e o mesmo índice "i".
+Formato:
+[{{"i":0,"category":"Nome da categoria ou null","confidence":0.0}}]
+
+Textos:
+{texts}
+"""
+
+# Saída estimada por item do lote ({"i":..,"category":..,"confidence":..}).
+BATCH_ITEM_OUTPUT_TOKENS = 24
+
+
+def _categorize_request(text: str, categories: list[str]) -> dict:
+    prompt = CATEGORIZE_PROMPT.format(
+        categories="\n".join(f"- {name}" for name in categories),
+        text=text.strip(),
+    )
+    return {
+        "model": get_llm_model(),
+        "messages": [
+            {
+                "role": "system",
+                "content": "Você classifica transações e responde apenas em JSON.",
+            },
+            {"role": "user", "content": prompt},
+        ],
+        "max_tokens": settings.AI_MAX_OUTPUT_TOKENS,
+        "temperature": settings.AI_TEMPERATURE,
+    }
+
+
+def _categorize_result(
+    categories: list[str], model: str, response
+) -> tuple[str | None, float, dict]:
+    data = _load_json(response.choices[0].message.content)
+    suggestion = _map_category(data.get("category"), categories)
+    confidence = float(data.get("confidence", 0.5))
+
+    usage_info = _usage_info(model, response)
+    logger.info(f"Categorize: {usage_info['total_tokens']} tokens usados")
+    return suggestion, confidence, usage_info
+
+
+def categorize_transaction_text(
+    text: str, categories: list[str]
+) -> tuple[str | None, float, dict]:
     """Sugere categoria para um texto de transação."""
     if not categories:
         return None, 0.0, {"model": get_llm_model(), "total_tokens": 0}
 
-    client = get_ollama_client()
+    client = get_ollama_client("categorize")
+    request = _categorize_request(text, categories)
+
+    with llm_health.track():
+        response = client.chat.completions.create(**request)
+    return _categorize_result(categories, request["model"], response)
+
+
+async def acategorize_transaction_text(
+    text: str, categories: list[str]
+) -> tuple[str | None, float, dict]:
+    """Versão assíncrona de ``categorize_transaction_text``."""
+    if not categories:
+        return None, 0.0, {"model": get_llm_model(), "total_tokens": 0}
+
+    client = get_async_llm_client("categorize")
+    request = _categorize_request(text, categories)
+
+    with llm_health.track():
+        response = await client.chat.completions.create(**request)
+    return _categorize_result(categories, request["model"], response)
+
+
+def categorize_transaction_texts(
+    texts: list[str], categories: list[str]
+) -> tuple[list[tuple[str | None, float]], dict]:
+    """
+    Sugere categorias para vários textos em uma única chamada: a lista de
+    categorias e as instruções vão uma vez no prompt e a resposta é um array
+    indexado. Itens ausentes ou inválidos na resposta ficam ``(None, 0.0)``.
+    """
+    if not categories or not texts:
+        return [(None, 0.0) for _ in texts], {
+            "model": get_llm_model(),
+            "total_tokens": 0,
+        }
+
+    client = get_ollama_client("categorize")
     model = get_llm_model()
 
-    prompt = CATEGORIZE_PROMPT.format(
+    prompt = BATCH_CATEGORIZE_PROMPT.format(
         categories="\n".join(f"- {name}" for name in categories),
-        text=text.strip(),
+        texts="\n".join(f"{i}. {text.strip()}" for i, text in enumerate(texts)),
     )
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": "Você classifica transações e responde apenas em JSON."},
-            {"role": "user", "content": prompt},
-        ],
-        max_tokens=settings.AI_MAX_OUTPUT_TOKENS,
-        temperature=settings.AI_TEMPERATURE,
+    with llm_health.track():
+        response = client.chat.completions.create(
+            model=model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "Você classifica transações e responde apenas em JSON.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            max_tokens=max(
+                settings.AI_MAX_OUTPUT_TOKENS,
+                BATCH_ITEM_OUTPUT_TOKENS * len(texts) + 16,
+            ),
+            temperature=settings.AI_TEMPERATURE,
+        )
+
+    data = _load_json(response.choices[0].message.content)
+    if isinstance(data, dict):
+        data = data.get("items") or data.get("results") or []
+    if not isinstance(data, list):
+        raise ValueError("Resposta inválida da IA: esperado um array")
+
+    results = [(None, 0.0)] * len(texts)
+    for item in data:
+        if not isinstance(item, dict):
+            continue
+        try:
+            index = int(item.get("i"))
+            confidence = float(item.get("confidence", 0.5))
+        except (TypeError, ValueError):
+            continue
+        if 0 <= index < len(texts):
+            results[index] = (
+                _map_category(item.get("category"), categories),
+                confidence,
+            )
+
+    usage_info = _usage_info(model, response)
+    logger.info(
+        f"Categorize (lote de {len(texts)}): {usage_info['total_tokens']} tokens usados"
     )
+    return results, usage_info
 
-    content = response.choices[0].message.content.strip()
+
+def _load_json(content: str):
+    content = content.strip()
     if content.startswith("```"):
         content = content.split("```")[1]
         if content.startswith("json"):
@@ -54,32 +184,27 @@ def categorize_transaction_text(text: str, categories: list[str]) -> tuple[str |
     content = content.strip()
 
     try:
-        data = json.loads(content)
+        return json.loads(content)
     except json.JSONDecodeError as exc:
         logger.error(f"Erro ao parsear JSON da IA (categorize): {exc}")
         raise ValueError(f"Resposta inválida da IA: {exc}") from exc
 
-    suggestion = data.get("category")
-    confidence = float(data.get("confidence", 0.5))
 
-    if suggestion:
-        normalized = suggestion.strip().lower()
-        mapped = next(
-            (name for name in categories if name.lower() == normalized),
-            None,
-        )
-        if not mapped:
-            fallback = next((name for name in categories if name.lower() == "outros"), None)
-            suggestion = fallback
-        else:
-            suggestion = mapped
+def _map_category(suggestion, categories: list[str]) -> str | None:
+    """Nome exato da lista (sem caixa); fora da lista vira "Outros", se existir."""
+    if not suggestion or not isinstance(suggestion, str):
+        return None
+    normalized = suggestion.strip().lower()
+    mapped = next((name for name in categories if name.lower() == normalized), None)
+    if mapped:
+        return mapped
+    return next((name for name in categories if name.lower() == "outros"), None)
+
 
-    usage_info = {
+def _usage_info(model: str, response) -> dict:
+    return {
         "model": model,
         "input_tokens": response.usage.prompt_tokens if response.usage else 0,
         "output_tokens": response.usage.completion_tokens if response.usage else 0,
         "total_tokens": response.usage.total_tokens if response.usage else 0,
     }
-
-    logger.info(f"Categorize: {usage_info['total_tokens']} tokens usados")
-    return suggestion, confidence, usage_info
@@ -0,0 +1,83 @@
+"""
+Histórico do chat limitado por orçamento de tokens.
+
+As mensagens mais recentes entram inteiras enquanto cabem em
+``AI_CHAT_HISTORY_TOKEN_BUDGET`` (descontada a reserva do resumo); as mais
+antigas que saem da janela são incorporadas ao resumo persistido da conversa
+(``ChatConversation.summary``), atualizado só quando a janela transborda.
+Ao transbordar, a janela é reduzida até ``AI_CHAT_HISTORY_LOW_WATER`` (fração
+do orçamento): as próximas mensagens cabem sem novo resumo, que passa a
+acontecer a cada poucos turnos e não a cada mensagem. Os tokens de cada
+mensagem vêm de ``ChatMessage.tokens_used`` ou, na falta, de uma estimativa
+local (~4 caracteres por token). Assim os tokens de entrada de cada mensagem
+do chat ficam limitados, qualquer que seja o tamanho da conversa.
+"""
+
+import math
+
+from django.conf import settings
+
+SUMMARY_HEADER = "Resumo da conversa até aqui:"
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimativa local de tokens (~4 caracteres por token)."""
+    return math.ceil(len(text) / 4)
+
+
+def message_tokens(message) -> int:
+    return message.tokens_used or estimate_tokens(message.content)
+
+
+def window_budget() -> int:
+    """Tokens disponíveis para as mensagens recentes (reserva o espaço do resumo)."""
+    return max(
+        0, settings.AI_CHAT_HISTORY_TOKEN_BUDGET - settings.AI_CHAT_SUMMARY_MAX_TOKENS
+    )
+
+
+def window_low_water() -> int:
+    """Tokens mantidos na janela depois de um resumo (histerese)."""
+    return int(window_budget() * settings.AI_CHAT_HISTORY_LOW_WATER)
+
+
+def split_history(
+    recent_messages, budget: int, low_water: int | None = None
+) -> tuple[list, list]:
+    """
+    Separa as mensagens ainda não resumidas (mais recentes primeiro) em
+    ``(janela, transbordo)``, ambas em ordem cronológica. Se tudo cabe em
+    ``budget`` nada transborda; senão a janela fica com até ``low_water``
+    tokens (padrão: ``budget``). A janela nunca começa com uma resposta do
+    assistente sem a pergunta correspondente.
+    """
+    limit = budget
+    if low_water is not None and sum(map(message_tokens, recent_messages)) > budget:
+        limit = min(low_water, budget)
+
+    window = []
+    used = 0
+    for index, message in enumerate(recent_messages):
+        used += message_tokens(message)
+        if used > limit:
+            break
+        window.append(message)
+    else:
+        index = len(recent_messages)
+
+    if window and window[-1].role == "assistant":
+        index -= 1
+        window.pop()
+
+    overflow = list(reversed(recent_messages[index:]))
+    window.reverse()
+    return window, overflow
+
+
+def history_messages(summary: str, window) -> list[dict]:
+    """Histórico enviado ao LLM: resumo (se houver) e mensagens da janela."""
+    history = []
+    if summary:
+        history.append({"role": "system", "content": f"{SUMMARY_HEADER}\n{summary}"})
+    history.extend({"role": msg.role, "content": msg.content} for msg in window)
+    return history
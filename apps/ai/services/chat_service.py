@@ -1,13 +1,23 @@
 import logging
+import time
 from dataclasses import dataclass
 from datetime import date
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from django.db.models import Sum
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
 
 from apps.finance.models import Goal, Transaction
+from apps.finance.monthly_totals import get_month_summary
 
-from .ollama_client import get_llm_model, get_ollama_client
+from .ollama_client import (
+    get_async_llm_client,
+    get_llm_model,
+    get_ollama_client,
+    llm_health,
+    usage_info_from,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,31 +36,14 @@ def build_financial_context(user) -> str:
     """Cria um contexto financeiro resumido do usuário."""
     today = date.today()
 
-    transactions = Transaction.objects.filter(
-        user=user,
-        date__year=today.year,
-        date__month=today.month,
-        is_confirmed=True,
-    )
-
-    income = (
-        transactions.filter(transaction_type=Transaction.TransactionType.INCOME)
-        .aggregate(total=Sum("amount"))
-        .get("total")
-        or 0
-    )
-    expenses = (
-        transactions.filter(transaction_type=Transaction.TransactionType.EXPENSE)
-        .aggregate(total=Sum("amount"))
-        .get("total")
-        or 0
-    )
+    summary = get_month_summary(user, today.replace(day=1))
+    income = summary["income"]
+    expenses = summary["expenses"]
     balance = float(income) - float(expenses)
 
-    recent_transactions = (
-        Transaction.objects.filter(user=user, is_confirmed=True)
-        .order_by("-date", "-created_at")[:5]
-    )
+    recent_transactions = Transaction.objects.filter(
+        user=user, is_confirmed=True
+    ).order_by("-date", "-created_at")[:5]
     recent_lines = [
         f"- {t.date}: {t.description} ({t.get_transaction_type_display()}) {_format_currency(float(t.amount))}"
         for t in recent_transactions
@@ -78,15 +71,68 @@ def build_financial_context(user) -> str:
     )
 
 
-def generate_chat_response(
-    user,
-    message: str,
-    history: list[dict] | None = None,
-) -> ChatResponse:
-    """Gera resposta do chatbot com contexto financeiro."""
-    client = get_ollama_client()
-    model = get_llm_model()
-    context = build_financial_context(user)
+# Contexto financeiro em cache por usuário. A chave inclui uma versão que os
+# signals de Transaction/Goal (e a importação em lote) trocam a cada escrita,
+# então uma sequência de mensagens consulta o banco uma vez e o prompt de
+# sistema fica idêntico byte a byte (reaproveitável pelo cache de prompt do
+# provedor). O mês entra na chave para a virada do mês; o TTL limita o efeito
+# de escritas que não disparam signals (``QuerySet.update``).
+#
+# A versão só é vista por todos os processos num cache compartilhado
+# (Redis/Memcached). Em cache de memória (``LocMemCache``) a escrita feita em
+# um worker não invalidaria os demais: o cache fica desativado, salvo com
+# ``ALLOW_LOCAL_MEMORY`` (um único processo servidor).
+CONTEXT_PREFIX = "ai:chat-context:"
+
+
+def _context_cache():
+    return caches[settings.AI_CHAT_CONTEXT_CACHE["CACHE_ALIAS"]]
+
+
+def financial_context_cached() -> bool:
+    """Cache ativo: TTL configurado e versão visível a todos os processos."""
+    config = settings.AI_CHAT_CONTEXT_CACHE
+    if not config["TTL"]:
+        return False
+    shared = not isinstance(_context_cache(), LocMemCache)
+    return shared or config.get("ALLOW_LOCAL_MEMORY", False)
+
+
+def financial_context_version(user_id: int) -> int:
+    """Versão atual do contexto financeiro do usuário."""
+    return _context_cache().get_or_set(
+        f"{CONTEXT_PREFIX}version:{user_id}", time.time_ns, timeout=None
+    )
+
+
+def invalidate_financial_context(user_id: int):
+    """Troca a versão: o próximo chat remonta o contexto."""
+    _context_cache().set(
+        f"{CONTEXT_PREFIX}version:{user_id}", time.time_ns(), timeout=None
+    )
+
+
+def get_financial_context(user) -> str:
+    """``build_financial_context`` em cache até a próxima escrita do usuário."""
+    if not financial_context_cached():
+        return build_financial_context(user)
+
+    ttl = settings.AI_CHAT_CONTEXT_CACHE["TTL"]
+    cache = _context_cache()
+    version = financial_context_version(user.pk)
+    key = f"{CONTEXT_PREFIX}{user.pk}:{version}:{date.today():%Y-%m}"
+    context = cache.get(key)
+    if context is None:
+        context = build_financial_context(user)
+        cache.set(key, context, timeout=ttl)
+    return context
+
+
+def build_chat_messages(
+    user, message: str, history: list[dict] | None = None
+) -> list[dict]:
+    """Mensagens enviadas ao LLM: sistema (com contexto financeiro), histórico e pergunta."""
+    context = get_financial_context(user)
 
     system_prompt = (
         "Você é um assistente financeiro pessoal. Use o contexto abaixo para responder "
@@ -98,21 +144,191 @@ def generate_chat_response(
     if history:
         messages.extend(history)
     messages.append({"role": "user", "content": message})
+    return messages
+
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=messages,
-        max_tokens=settings.AI_MAX_OUTPUT_TOKENS,
-        temperature=settings.AI_TEMPERATURE,
+def generate_chat_response(
+    user,
+    message: str,
+    history: list[dict] | None = None,
+) -> ChatResponse:
+    """Gera resposta do chatbot com contexto financeiro."""
+    client = get_ollama_client("chat")
+    model = get_llm_model()
+    messages = build_chat_messages(user, message, history)
+
+    with llm_health.track():
+        response = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            max_tokens=settings.AI_MAX_OUTPUT_TOKENS,
+            temperature=settings.AI_TEMPERATURE,
+        )
+    return _chat_response(model, response)
+
+
+async def agenerate_chat_response(
+    user,
+    message: str,
+    history: list[dict] | None = None,
+) -> ChatResponse:
+    """Versão assíncrona de ``generate_chat_response``."""
+    client = get_async_llm_client("chat")
+    model = get_llm_model()
+    # O contexto financeiro pode agregar várias consultas; roda fora do event loop
+    messages = await sync_to_async(build_chat_messages)(user, message, history)
+
+    with llm_health.track():
+        response = await client.chat.completions.create(
+            model=model,
+            messages=messages,
+            max_tokens=settings.AI_MAX_OUTPUT_TOKENS,
+            temperature=settings.AI_TEMPERATURE,
+        )
+    return _chat_response(model, response)
+
+
+SUMMARY_PROMPT = """Atualize o resumo de uma conversa entre um usuário e um assistente financeiro.
+Mantenha fatos, valores, decisões e pedidos em aberto; descarte cumprimentos e repetições.
+Responda apenas com o resumo atualizado, em português, com no máximo {max_words} palavras.
+
+Resumo atual:
+{summary}
+
+Novas mensagens:
+{messages}"""
+
+
+def _summary_request(summary: str, messages) -> dict:
+    lines = "\n".join(
+        f"{'Usuário' if msg.role == 'user' else 'Assistente'}: {msg.content}"
+        for msg in messages
+    )
+    prompt = SUMMARY_PROMPT.format(
+        max_words=settings.AI_CHAT_SUMMARY_MAX_TOKENS * 3 // 4,
+        summary=summary or "(vazio)",
+        messages=lines,
     )
+    return {
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": settings.AI_CHAT_SUMMARY_MAX_TOKENS,
+        "temperature": settings.AI_TEMPERATURE,
+    }
+
+
+def summarize_conversation(summary: str, messages) -> tuple[str, dict]:
+    """Incorpora ``messages`` (``ChatMessage``) ao resumo da conversa."""
+    client = get_ollama_client("chat")
+    model = get_llm_model()
+    with llm_health.track():
+        response = client.chat.completions.create(
+            model=model, **_summary_request(summary, messages)
+        )
+    return response.choices[0].message.content.strip(), usage_info_from(model, response)
+
+
+async def asummarize_conversation(summary: str, messages) -> tuple[str, dict]:
+    """Versão assíncrona de ``summarize_conversation``."""
+    client = get_async_llm_client("chat")
+    model = get_llm_model()
+    with llm_health.track():
+        response = await client.chat.completions.create(
+            model=model, **_summary_request(summary, messages)
+        )
+    return response.choices[0].message.content.strip(), usage_info_from(model, response)
 
+
+def _chat_response(model: str, response) -> ChatResponse:
     content = response.choices[0].message.content.strip()
-    usage_info = {
-        "model": model,
-        "input_tokens": response.usage.prompt_tokens if response.usage else 0,
-        "output_tokens": response.usage.completion_tokens if response.usage else 0,
-        "total_tokens": response.usage.total_tokens if response.usage else 0,
-    }
+    usage_info = usage_info_from(model, response)
 
     logger.info(f"Chat: {usage_info['total_tokens']} tokens usados")
     return ChatResponse(message=content, usage_info=usage_info)
+
+
+class ChatStream:
+    """
+    Resposta do chat em streaming: ``async for`` devolve os trechos de texto
+    conforme chegam do ``AsyncOpenAI``. Ao final, ``message`` e
+    ``usage_info`` ficam disponíveis. ``aclose()`` fecha a conexão com o
+    provedor, o que interrompe a geração.
+    """
+
+    def __init__(self, stream, model: str, started_at: float):
+        self._stream = stream
+        self.model = model
+        self.started_at = started_at
+        self.first_token_at: float | None = None
+        self.finished_at: float | None = None
+        self.parts: list[str] = []
+        self.usage = None
+
+    async def __aiter__(self):
+        with llm_health.track():
+            async for chunk in self._stream:
+                if getattr(chunk, "usage", None):
+                    self.usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    if self.first_token_at is None:
+                        self.first_token_at = time.monotonic()
+                    self.parts.append(delta)
+                    yield delta
+        self.finished_at = time.monotonic()
+
+    async def aclose(self):
+        await self._stream.close()
+
+    @property
+    def message(self) -> str:
+        return "".join(self.parts).strip()
+
+    @property
+    def usage_info(self) -> dict:
+        # Sem o bloco de uso (stream interrompido ou provedor sem
+        # ``include_usage``), cada trecho conta como um token.
+        usage = self.usage
+        output_tokens = usage.completion_tokens if usage else len(self.parts)
+        return {
+            "model": self.model,
+            "input_tokens": usage.prompt_tokens if usage else 0,
+            "output_tokens": output_tokens,
+            "total_tokens": usage.total_tokens if usage else output_tokens,
+        }
+
+    @property
+    def timing(self) -> dict:
+        """Tempo até o primeiro token e total, em milissegundos."""
+
+        def elapsed(moment):
+            return round((moment - self.started_at) * 1000) if moment else None
+
+        return {
+            "first_token_ms": elapsed(self.first_token_at),
+            "total_ms": elapsed(self.finished_at),
+        }
+
+
+async def astream_chat_response(
+    user,
+    message: str,
+    history: list[dict] | None = None,
+) -> ChatStream:
+    """Inicia a resposta do chatbot com ``stream=True`` (API compatível com OpenAI)."""
+    started_at = time.monotonic()
+    client = get_async_llm_client("chat")
+    model = get_llm_model()
+    messages = await sync_to_async(build_chat_messages)(user, message, history)
+
+    with llm_health.track():
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=messages,
+            max_tokens=settings.AI_MAX_OUTPUT_TOKENS,
+            temperature=settings.AI_TEMPERATURE,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+    return ChatStream(stream, model, started_at)
@@ -4,7 +4,12 @@ from dataclasses import dataclass
 
 from django.conf import settings
 
-from .ollama_client import get_llm_model, get_ollama_client
+from .ollama_client import (
+    get_async_llm_client,
+    get_llm_model,
+    get_ollama_client,
+    llm_health,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,27 +40,49 @@ Responda APENAS com JSON válido.
 """
 
 
-def generate_cashflow_forecast(history: list[dict]) -> tuple[ForecastResult, dict]:
-    """Gera previsão de fluxo de caixa com base no histórico."""
-    client = get_ollama_client()
-    model = get_llm_model()
-
+def _forecast_request(history: list[dict]) -> dict:
     history_lines = [
         f"- {item['month']}: receitas {item['income']:.2f}, despesas {item['expenses']:.2f}, saldo {item['balance']:.2f}"
         for item in history
     ]
     prompt = FORECAST_PROMPT.format(history="\n".join(history_lines))
-
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": "Você responde apenas em JSON com previsões financeiras."},
+    return {
+        "model": get_llm_model(),
+        "messages": [
+            {
+                "role": "system",
+                "content": "Você responde apenas em JSON com previsões financeiras.",
+            },
             {"role": "user", "content": prompt},
         ],
-        max_tokens=settings.AI_MAX_OUTPUT_TOKENS,
-        temperature=settings.AI_TEMPERATURE,
-    )
+        "max_tokens": settings.AI_MAX_OUTPUT_TOKENS,
+        "temperature": settings.AI_TEMPERATURE,
+    }
+
+
+def generate_cashflow_forecast(history: list[dict]) -> tuple[ForecastResult, dict]:
+    """Gera previsão de fluxo de caixa com base no histórico."""
+    client = get_ollama_client("forecast")
+    request = _forecast_request(history)
+
+    with llm_health.track():
+        response = client.chat.completions.create(**request)
+    return _forecast_result(request["model"], response)
+
+
+async def agenerate_cashflow_forecast(
+    history: list[dict],
+) -> tuple[ForecastResult, dict]:
+    """Versão assíncrona de ``generate_cashflow_forecast``."""
+    client = get_async_llm_client("forecast")
+    request = _forecast_request(history)
+
+    with llm_health.track():
+        response = await client.chat.completions.create(**request)
+    return _forecast_result(request["model"], response)
+
 
+def _forecast_result(model: str, response) -> tuple[ForecastResult, dict]:
     content = response.choices[0].message.content.strip()
     if content.startswith("```"):
         content = content.split("```")[1]
@@ -0,0 +1,167 @@
+"""
+Estado de saúde do provedor LLM compartilhado pelo processo.
+
+- A sonda (``GET /models``) tem o resultado guardado por ``AI_HEALTH_TTL``
+  segundos; enquanto o provedor está saudável as views não fazem a sonda.
+- Chamadas reais atualizam o estado passivamente (``track``): sucesso
+  renova o TTL, falhas de conexão/5xx contam para o circuit breaker.
+- Com ``AI_BREAKER_FAILURES`` falhas seguidas (ou uma sonda com falha) o
+  circuito abre: por ``AI_BREAKER_COOLDOWN`` segundos ``is_available``
+  retorna ``False`` sem acessar a rede. Depois disso uma única sonda decide
+  se o circuito fecha ou abre novamente.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import openai
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+HEALTH_SETTINGS = {"AI_HEALTH_TTL", "AI_BREAKER_FAILURES", "AI_BREAKER_COOLDOWN"}
+
+# Erros que indicam indisponibilidade do provedor (e não do pedido).
+UNAVAILABLE_ERRORS = (openai.APIConnectionError, openai.InternalServerError)
+
+
+@dataclass
+class HealthState:
+    checked_at: float | None = None
+    failures: int = 0
+    opened_at: float | None = None
+    probing: bool = False
+    models: list[str] = field(default_factory=list)
+    models_at: float | None = None
+
+
+class LLMHealth:
+    """
+    Cache da disponibilidade do LLM com circuit breaker.
+
+    Args:
+        probe: Função sem argumentos que retorna os modelos disponíveis e
+            levanta exceção se o provedor não responder
+        key: Função que identifica o provedor ativo (estado separado por chave)
+        clock: Relógio monotônico (substituível em testes)
+    """
+
+    def __init__(self, probe, key, clock=time.monotonic):
+        self._probe = probe
+        self._key = key
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._states: dict = {}
+
+    @property
+    def ttl(self) -> float:
+        return getattr(settings, "AI_HEALTH_TTL", 30.0)
+
+    @property
+    def cooldown(self) -> float:
+        return getattr(settings, "AI_BREAKER_COOLDOWN", 30.0)
+
+    def _state(self) -> HealthState:
+        return self._states.setdefault(self._key(), HealthState())
+
+    def retry_after(self) -> int:
+        """Segundos até a próxima tentativa (0 se o circuito está fechado)."""
+        with self._lock:
+            state = self._state()
+            if state.opened_at is None:
+                return 0
+            return max(0, int(state.opened_at + self.cooldown - self._clock()) + 1)
+
+    def is_available(self) -> bool:
+        """Retorna a disponibilidade, sondando o provedor só quando necessário."""
+        with self._lock:
+            state = self._state()
+            now = self._clock()
+            if state.opened_at is not None:
+                if now - state.opened_at < self.cooldown or state.probing:
+                    return False
+            elif state.checked_at is not None and now - state.checked_at < self.ttl:
+                return True
+            elif state.probing:
+                # Outra requisição já está sondando; usa o último estado conhecido.
+                return state.checked_at is not None
+            state.probing = True
+
+        try:
+            return self.probe() is not None
+        finally:
+            with self._lock:
+                state.probing = False
+
+    def probe(self) -> list[str] | None:
+        """Consulta o provedor e atualiza o estado. Retorna os modelos ou None."""
+        try:
+            models = self._probe()
+        except Exception as exc:
+            logger.warning(f"Serviço de IA não disponível: {exc}")
+            with self._lock:
+                self._open(self._state())
+            return None
+
+        with self._lock:
+            state = self._state()
+            self._close(state)
+            state.models, state.models_at = models, self._clock()
+        return models
+
+    def available_models(self) -> list[str]:
+        """Modelos da última sonda dentro do TTL, ou uma nova sonda."""
+        with self._lock:
+            state = self._state()
+            if (
+                state.opened_at is not None
+                and self._clock() - state.opened_at < self.cooldown
+            ):
+                return []
+            if (
+                state.models_at is not None
+                and self._clock() - state.models_at < self.ttl
+            ):
+                return state.models
+        return self.probe() or []
+
+    def record_success(self):
+        with self._lock:
+            self._close(self._state())
+
+    def record_failure(self):
+        with self._lock:
+            state = self._state()
+            state.failures += 1
+            threshold = getattr(settings, "AI_BREAKER_FAILURES", 3)
+            if state.opened_at is not None or state.failures >= threshold:
+                self._open(state)
+
+    @contextmanager
+    def track(self):
+        """Atualiza o estado a partir do resultado de uma chamada real ao LLM."""
+        try:
+            yield
+        except UNAVAILABLE_ERRORS:
+            self.record_failure()
+            raise
+        self.record_success()
+
+    def reset(self):
+        with self._lock:
+            self._states.clear()
+
+    def _open(self, state: HealthState):
+        if state.opened_at is None:
+            logger.warning("Circuit breaker do LLM aberto")
+        state.opened_at = self._clock()
+        state.checked_at = None
+        state.models_at = None
+
+    def _close(self, state: HealthState):
+        state.failures = 0
+        state.opened_at = None
+        state.checked_at = self._clock()
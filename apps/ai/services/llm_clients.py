@@ -0,0 +1,162 @@
+"""
+Registro de clientes LLM compartilhados pelo processo.
+
+Cada combinação (provedor, URL base, API key) tem um único ``OpenAI`` com um
+``httpx.Client`` próprio, reaproveitando conexões keep-alive entre
+requisições em vez de abrir TCP/TLS a cada chamada. Os timeouts por
+funcionalidade são cópias leves (``with_options``) que compartilham o mesmo
+pool. O registro é limpo quando as configurações de LLM mudam.
+
+As views assíncronas usam ``AsyncOpenAI`` (``async_registry``), com pool
+próprio e maior (``AI_ASYNC_HTTP_MAX_CONNECTIONS``): cada chamada em
+andamento ocupa uma conexão, não uma thread.
+"""
+
+import asyncio
+import threading
+import weakref
+
+import httpx
+from django.conf import settings
+from openai import AsyncOpenAI, OpenAI
+
+DEFAULT_TIMEOUTS = {
+    "default": 30.0,
+    "parse": 15.0,
+    "categorize": 15.0,
+    "insights": 45.0,
+    "chat": 60.0,
+    "forecast": 45.0,
+    "budget": 45.0,
+    "probe": 5.0,
+}
+
+# Configurações que invalidam os clientes em cache.
+CLIENT_SETTINGS = {
+    "LLM_PROVIDER",
+    "OLLAMA_BASE_URL",
+    "OLLAMA_API_KEY",
+    "GROQ_BASE_URL",
+    "GROQ_API_KEY",
+    "AI_HTTP_MAX_CONNECTIONS",
+    "AI_ASYNC_HTTP_MAX_CONNECTIONS",
+    "AI_HTTP_MAX_KEEPALIVE",
+    "AI_HTTP_KEEPALIVE_EXPIRY",
+    "AI_CONNECT_TIMEOUT",
+    "AI_TIMEOUTS",
+}
+
+
+def get_feature_timeout(feature: str) -> httpx.Timeout:
+    """Timeout da funcionalidade (leitura) com conexão limitada."""
+    timeouts = {**DEFAULT_TIMEOUTS, **getattr(settings, "AI_TIMEOUTS", {})}
+    seconds = timeouts.get(feature, timeouts["default"])
+    return httpx.Timeout(seconds, connect=getattr(settings, "AI_CONNECT_TIMEOUT", 5.0))
+
+
+def _pool_limits(max_connections: int | None = None) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections
+        or getattr(settings, "AI_HTTP_MAX_CONNECTIONS", 20),
+        max_keepalive_connections=getattr(settings, "AI_HTTP_MAX_KEEPALIVE", 10),
+        keepalive_expiry=getattr(settings, "AI_HTTP_KEEPALIVE_EXPIRY", 60.0),
+    )
+
+
+class LLMClientRegistry:
+    """Cache thread-safe de clientes ``OpenAI`` por (provedor, URL, key)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients: dict[tuple, OpenAI] = {}
+        self._feature_clients: dict[tuple, OpenAI] = {}
+
+    def get(
+        self, provider: str, base_url: str, api_key: str, feature: str = "default"
+    ) -> OpenAI:
+        key = (provider, base_url, api_key, feature)
+        client = self._feature_clients.get(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._feature_clients.get(key)
+            if client is None:
+                base = self._clients.get(key[:3])
+                if base is None:
+                    base = OpenAI(
+                        api_key=api_key,
+                        base_url=base_url,
+                        http_client=httpx.Client(
+                            limits=_pool_limits(),
+                            timeout=get_feature_timeout("default"),
+                        ),
+                    )
+                    self._clients[key[:3]] = base
+                client = base.with_options(timeout=get_feature_timeout(feature))
+                self._feature_clients[key] = client
+            return client
+
+    def clear(self):
+        """Descarta os clientes e fecha as conexões abertas."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._feature_clients.clear()
+        for client in clients:
+            client.close()
+
+    def __len__(self):
+        return len(self._clients)
+
+
+class AsyncLLMClientRegistry:
+    """
+    Cache de clientes ``AsyncOpenAI`` por event loop e (provedor, URL, key).
+
+    O pool de um ``httpx.AsyncClient`` só pode ser usado no loop em que foi
+    criado. Sob ASGI há um único loop por processo; fora dele (``async_to_sync``,
+    testes) cada loop ganha seus clientes, descartados junto com o loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loops: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def get(
+        self, provider: str, base_url: str, api_key: str, feature: str = "default"
+    ) -> AsyncOpenAI:
+        loop = asyncio.get_running_loop()
+        key = (provider, base_url, api_key, feature)
+        with self._lock:
+            clients = self._loops.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None:
+                base = clients.get(key[:3])
+                if base is None:
+                    base = AsyncOpenAI(
+                        api_key=api_key,
+                        base_url=base_url,
+                        http_client=httpx.AsyncClient(
+                            limits=_pool_limits(
+                                getattr(settings, "AI_ASYNC_HTTP_MAX_CONNECTIONS", 200)
+                            ),
+                            timeout=get_feature_timeout("default"),
+                        ),
+                    )
+                    clients[key[:3]] = base
+                client = base.with_options(timeout=get_feature_timeout(feature))
+                clients[key] = client
+            return client
+
+    def clear(self):
+        """
+        Descarta os clientes. As conexões são fechadas quando os clientes são
+        coletados (fechar exigiria aguardar no loop de origem).
+        """
+        with self._lock:
+            self._loops.clear()
+
+
+registry = LLMClientRegistry()
+async_registry = AsyncLLMClientRegistry()
@@ -10,9 +10,11 @@ from datetime import date
 from decimal import Decimal
 from typing import Optional
 
-import httpx
 from django.conf import settings
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+from .health import LLMHealth
+from .llm_clients import async_registry, registry
 
 logger = logging.getLogger(__name__)
 
@@ -104,44 +106,63 @@ Exemplo de saída:
 Texto do usuário: {text}"""
 
 
-def get_llm_client() -> OpenAI:
-    """Retorna cliente do provedor ativo usando API compatível com OpenAI."""
-    return OpenAI(api_key=get_llm_api_key(), base_url=get_llm_base_url())
+def get_llm_client(feature: str = "default") -> OpenAI:
+    """
+    Retorna o cliente compartilhado do provedor ativo (API compatível com
+    OpenAI), com o timeout da funcionalidade informada.
+    """
+    return registry.get(
+        get_llm_provider(), get_llm_base_url(), get_llm_api_key(), feature
+    )
 
 
-def get_ollama_client() -> OpenAI:
+def get_ollama_client(feature: str = "default") -> OpenAI:
     """Compat: retorna cliente do provedor ativo."""
-    return get_llm_client()
+    return get_llm_client(feature)
 
 
-def is_ollama_available() -> bool:
-    """Verifica se o servidor de IA está disponível."""
-    base_url = get_llm_base_url()
-    api_key = get_llm_api_key()
+def get_async_llm_client(feature: str = "default") -> AsyncOpenAI:
+    """Cliente assíncrono do provedor ativo (deve ser chamado dentro do event loop)."""
+    return async_registry.get(
+        get_llm_provider(), get_llm_base_url(), get_llm_api_key(), feature
+    )
 
-    try:
-        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
-        response = httpx.get(f"{base_url}/models", headers=headers, timeout=5.0)
-        return response.status_code == 200
-    except Exception as e:
-        logger.warning(f"Serviço de IA não disponível: {e}")
-        return False
+
+def _probe_models() -> list[str]:
+    """Sonda ``GET /models`` do provedor ativo (sem retentativas)."""
+    client = get_llm_client("probe").with_options(max_retries=0)
+    return [model.id for model in client.models.list()]
+
+
+llm_health = LLMHealth(
+    probe=_probe_models,
+    key=lambda: (get_llm_provider(), get_llm_base_url()),
+)
+
+
+def is_ollama_available() -> bool:
+    """
+    Verifica se o servidor de IA está disponível.
+    Usa o estado em cache; só acessa a rede quando o TTL expira ou após o
+    cooldown do circuit breaker.
+    """
+    return llm_health.is_available()
 
 
 def get_available_models() -> list[str]:
-    """Retorna lista de modelos disponíveis."""
-    base_url = get_llm_base_url()
-    api_key = get_llm_api_key()
+    """Retorna lista de modelos disponíveis (da última sonda dentro do TTL)."""
+    return llm_health.available_models()
 
-    try:
-        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
-        response = httpx.get(f"{base_url}/models", headers=headers, timeout=5.0)
-        if response.status_code == 200:
-            data = response.json()
-            return [model["id"] for model in data.get("data", [])]
-    except Exception as e:
-        logger.warning(f"Erro ao listar modelos: {e}")
-    return []
+
+def normalize_amount(raw) -> Decimal:
+    """Converte valores como ``38,90``, ``1.234,56`` ou ``38.90`` em Decimal."""
+    amount_str = str(raw).strip() or "0"
+    if "," in amount_str and "." in amount_str:
+        if amount_str.rfind(",") > amount_str.rfind("."):
+            amount_str = amount_str.replace(".", "").replace(",", ".")
+    elif "," in amount_str:
+        amount_str = amount_str.replace(",", ".")
+    return Decimal(amount_str)
 
 
 def _normalize_categories(categories: list[str] | None, limit: int = 30) -> list[str]:
@@ -167,6 +188,79 @@ def _format_categories(categories: list[str]) -> str:
     return "\n".join(f"- {name}" for name in categories)
 
 
+def _parse_transaction_request(
+    text: str,
+    expense_categories: list[str] | None,
+    income_categories: list[str] | None,
+) -> dict:
+    prompt = PARSE_TRANSACTION_PROMPT.format(
+        today=date.today().isoformat(),
+        text=text.strip(),
+        expense_categories=_format_categories(
+            _normalize_categories(expense_categories)
+        ),
+        income_categories=_format_categories(_normalize_categories(income_categories)),
+    )
+    return {
+        "model": get_llm_model(),
+        "messages": [
+            {
+                "role": "system",
+                "content": "Você extrai dados financeiros de texto e responde apenas em JSON.",
+            },
+            {"role": "user", "content": prompt},
+        ],
+        "max_tokens": settings.AI_MAX_OUTPUT_TOKENS,
+        "temperature": settings.AI_TEMPERATURE,
+    }
+
+
+def _load_json(content: str, feature: str):
+    """JSON da resposta, sem marcadores de código markdown."""
+    content = content.strip()
+    if content.startswith("```"):
+        content = content.split("```")[1]
+        if content.startswith("json"):
+            content = content[4:]
+    content = content.strip()
+
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError as e:
+        logger.error(f"Erro ao parsear JSON da IA ({feature}): {e}")
+        raise ValueError(f"Resposta inválida da IA: {e}") from e
+
+
+def usage_info_from(model: str, response) -> dict:
+    """Info de uso (tokens) de uma resposta do LLM, para logging."""
+    return {
+        "model": model,
+        "input_tokens": response.usage.prompt_tokens if response.usage else 0,
+        "output_tokens": response.usage.completion_tokens if response.usage else 0,
+        "total_tokens": response.usage.total_tokens if response.usage else 0,
+    }
+
+
+def _transaction_proposal(
+    text: str, model: str, response
+) -> tuple[TransactionProposal, dict]:
+    data = _load_json(response.choices[0].message.content, "parse")
+
+    proposal = TransactionProposal(
+        transaction_type=data.get("type", "EXPENSE"),
+        amount=normalize_amount(data.get("amount", 0)),
+        date=data.get("date", date.today().isoformat()),
+        description=data.get("description", text[:50]),
+        category_suggestion=data.get("category_suggestion"),
+        account_suggestion=data.get("account_suggestion"),
+        confidence=float(data.get("confidence", 0.5)),
+    )
+
+    usage_info = usage_info_from(model, response)
+    logger.info(f"Parse transaction: {usage_info['total_tokens']} tokens usados")
+    return proposal, usage_info
+
+
 def parse_transaction_text(
     text: str,
     expense_categories: list[str] | None = None,
@@ -184,81 +278,35 @@ def parse_transaction_text(
     Raises:
         ValueError: Se o LLM nao estiver disponivel ou resposta invalida
     """
-    client = get_ollama_client()
-    model = get_llm_model()
-
-    expense_list = _normalize_categories(expense_categories)
-    income_list = _normalize_categories(income_categories)
-
-    prompt = PARSE_TRANSACTION_PROMPT.format(
-        today=date.today().isoformat(),
-        text=text.strip(),
-        expense_categories=_format_categories(expense_list),
-        income_categories=_format_categories(income_list),
-    )
+    client = get_ollama_client("parse")
+    request = _parse_transaction_request(text, expense_categories, income_categories)
 
     try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "Você extrai dados financeiros de texto e responde apenas em JSON.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            max_tokens=settings.AI_MAX_OUTPUT_TOKENS,
-            temperature=settings.AI_TEMPERATURE,
-        )
-
-        content = response.choices[0].message.content.strip()
-
-        # Remove possíveis marcadores de código markdown
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-        content = content.strip()
-
-        # Parse JSON
-        data = json.loads(content)
-
-        raw_amount = data.get("amount", 0)
-        amount_str = str(raw_amount).strip() or "0"
-        if "," in amount_str and "." in amount_str:
-            if amount_str.rfind(",") > amount_str.rfind("."):
-                amount_str = amount_str.replace(".", "").replace(",", ".")
-        elif "," in amount_str:
-            amount_str = amount_str.replace(",", ".")
-
-        # Cria proposta
-        proposal = TransactionProposal(
-            transaction_type=data.get("type", "EXPENSE"),
-            amount=Decimal(amount_str),
-            date=data.get("date", date.today().isoformat()),
-            description=data.get("description", text[:50]),
-            category_suggestion=data.get("category_suggestion"),
-            account_suggestion=data.get("account_suggestion"),
-            confidence=float(data.get("confidence", 0.5)),
-        )
-
-        # Info de uso para logging
-        usage_info = {
-            "model": model,
-            "input_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "output_tokens": response.usage.completion_tokens if response.usage else 0,
-            "total_tokens": response.usage.total_tokens if response.usage else 0,
-        }
+        with llm_health.track():
+            response = client.chat.completions.create(**request)
+        return _transaction_proposal(text, request["model"], response)
+    except ValueError:
+        raise
+    except Exception as e:
+        logger.error(f"Erro na chamada LLM: {e}")
+        raise
 
-        logger.info(
-            f"Parse transaction: {usage_info['total_tokens']} tokens usados"
-        )
 
-        return proposal, usage_info
+async def aparse_transaction_text(
+    text: str,
+    expense_categories: list[str] | None = None,
+    income_categories: list[str] | None = None,
+) -> tuple[TransactionProposal, dict]:
+    """Versão assíncrona de ``parse_transaction_text``."""
+    client = get_async_llm_client("parse")
+    request = _parse_transaction_request(text, expense_categories, income_categories)
 
-    except json.JSONDecodeError as e:
-        logger.error(f"Erro ao parsear JSON da IA: {e}")
-        raise ValueError(f"Resposta inválida da IA: {e}")
+    try:
+        with llm_health.track():
+            response = await client.chat.completions.create(**request)
+        return _transaction_proposal(text, request["model"], response)
+    except ValueError:
+        raise
     except Exception as e:
         logger.error(f"Erro na chamada LLM: {e}")
         raise
@@ -285,6 +333,66 @@ Exemplo:
 {{"summary":"Mês equilibrado com saldo positivo. Gastos com alimentação acima da média.","recommendations":["Reduzir pedidos de delivery em 20%","Separar 10% do saldo para reserva"]}}"""
 
 
+def _insights_request(
+    month: str,
+    income: float,
+    expenses: float,
+    balance: float,
+    top_categories: list[dict],
+) -> dict:
+    categories_text = (
+        "\n".join(
+            f"- {cat.get('category__name', 'Sem categoria')}: R$ {cat.get('total', 0):.2f}"
+            for cat in top_categories
+        )
+        or "- Nenhuma categoria registrada"
+    )
+
+    prompt = INSIGHTS_PROMPT.format(
+        month=month,
+        income=income,
+        expenses=expenses,
+        balance=balance,
+        top_categories=categories_text,
+    )
+    return {
+        "model": get_llm_model(),
+        "messages": [
+            {
+                "role": "system",
+                "content": "Você é um consultor financeiro que responde apenas em JSON.",
+            },
+            {"role": "user", "content": prompt},
+        ],
+        "max_tokens": settings.AI_MAX_OUTPUT_TOKENS,
+        "temperature": settings.AI_TEMPERATURE,
+    }
+
+
+def _monthly_insights(
+    model: str,
+    response,
+    income: float,
+    expenses: float,
+    balance: float,
+    top_categories: list[dict],
+) -> tuple[MonthlyInsights, dict]:
+    data = _load_json(response.choices[0].message.content, "insights")
+
+    insights = MonthlyInsights(
+        summary=data.get("summary", "Sem resumo disponível"),
+        total_income=income,
+        total_expenses=expenses,
+        balance=balance,
+        top_expenses=top_categories,
+        recommendations=data.get("recommendations", []),
+    )
+
+    usage_info = usage_info_from(model, response)
+    logger.info(f"Insights: {usage_info['total_tokens']} tokens usados")
+    return insights, usage_info
+
+
 def generate_monthly_insights(
     month: str,
     income: float,
@@ -305,71 +413,41 @@ def generate_monthly_insights(
     Returns:
         tuple: (MonthlyInsights, usage_info)
     """
-    client = get_ollama_client()
-    model = get_llm_model()
-
-    # Formata categorias para o prompt
-    categories_text = "\n".join(
-        f"- {cat.get('category__name', 'Sem categoria')}: R$ {cat.get('total', 0):.2f}"
-        for cat in top_categories
-    ) or "- Nenhuma categoria registrada"
-
-    prompt = INSIGHTS_PROMPT.format(
-        month=month,
-        income=income,
-        expenses=expenses,
-        balance=balance,
-        top_categories=categories_text,
-    )
+    client = get_ollama_client("insights")
+    request = _insights_request(month, income, expenses, balance, top_categories)
 
     try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "Você é um consultor financeiro que responde apenas em JSON.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            max_tokens=settings.AI_MAX_OUTPUT_TOKENS,
-            temperature=settings.AI_TEMPERATURE,
+        with llm_health.track():
+            response = client.chat.completions.create(**request)
+        return _monthly_insights(
+            request["model"], response, income, expenses, balance, top_categories
         )
+    except ValueError:
+        raise
+    except Exception as e:
+        logger.error(f"Erro na chamada LLM (insights): {e}")
+        raise
 
-        content = response.choices[0].message.content.strip()
-
-        # Remove possíveis marcadores de código markdown
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-        content = content.strip()
 
-        data = json.loads(content)
+async def agenerate_monthly_insights(
+    month: str,
+    income: float,
+    expenses: float,
+    balance: float,
+    top_categories: list[dict],
+) -> tuple[MonthlyInsights, dict]:
+    """Versão assíncrona de ``generate_monthly_insights``."""
+    client = get_async_llm_client("insights")
+    request = _insights_request(month, income, expenses, balance, top_categories)
 
-        insights = MonthlyInsights(
-            summary=data.get("summary", "Sem resumo disponível"),
-            total_income=income,
-            total_expenses=expenses,
-            balance=balance,
-            top_expenses=top_categories,
-            recommendations=data.get("recommendations", []),
+    try:
+        with llm_health.track():
+            response = await client.chat.completions.create(**request)
+        return _monthly_insights(
+            request["model"], response, income, expenses, balance, top_categories
         )
-
-        usage_info = {
-            "model": model,
-            "input_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "output_tokens": response.usage.completion_tokens if response.usage else 0,
-            "total_tokens": response.usage.total_tokens if response.usage else 0,
-        }
-
-        logger.info(f"Insights: {usage_info['total_tokens']} tokens usados")
-
-        return insights, usage_info
-
-    except json.JSONDecodeError as e:
-        logger.error(f"Erro ao parsear JSON da IA (insights): {e}")
-        raise ValueError(f"Resposta inválida da IA: {e}")
+    except ValueError:
+        raise
     except Exception as e:
         logger.error(f"Erro na chamada LLM (insights): {e}")
         raise
@@ -0,0 +1,334 @@
+"""
+Rate limit das funcionalidades de IA por janela deslizante.
+
+Cada limite é um contador por (usuário, escopo, janela fixa) incrementado de
+forma atômica. A requisição é reservada (``reserve``) antes de chamar o LLM:
+a decisão usa o valor devolvido pelo incremento, então requisições
+simultâneas não passam todas pela verificação antes de alguma contar. Os
+tokens são somados depois (``hit`` com ``requests=0``). O consumo estimado na última janela
+deslizante é ``atual + anterior * (fração da janela anterior ainda coberta)``
+(sliding window counter): duas leituras por limite, sem contar linhas de
+``AIUsageLog``.
+
+Limites (por usuário, por ``AI_RATE_LIMIT["WINDOW"]`` segundos):
+
+- ``AI_RATE_LIMIT_PER_HOUR``: requisições ao LLM em todas as funcionalidades;
+- ``FEATURE_LIMITS``: requisições por funcionalidade (ex.: ``{"chat": 20}``);
+- ``TOKENS_PER_WINDOW`` e ``FEATURE_TOKEN_LIMITS``: tokens consumidos
+  (0/ausente desativa).
+
+O backend é configurável em ``AI_RATE_LIMIT["BACKEND"]``:
+
+- ``"local"``: contadores em memória do processo (um único servidor);
+- ``"django"``: cache do Django (``CACHE_ALIAS``) com ``incr`` atômico
+  (Redis/Memcached), compartilhado entre workers;
+- caminho pontilhado para uma classe com ``incr``/``get_many``/``clear``
+  (e ``shared`` verdadeiro se os contadores forem vistos por todos os processos).
+
+Contadores que não são compartilhados (backend local ou cache em memória)
+não enxergam os tokens gastos pelo ``runworker``: a requisição das tarefas é
+reservada pela view ao enfileirar, mas limites de tokens só valem para
+``?async=1`` com um backend compartilhado (as views recusam o modo
+assíncrono nesse caso).
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils.module_loading import import_string
+
+DEFAULT_CONFIG = {
+    "BACKEND": "local",
+    "CACHE_ALIAS": "default",
+    "WINDOW": 60 * 60,
+    "FEATURE_LIMITS": {},
+    "TOKENS_PER_WINDOW": 0,
+    "FEATURE_TOKEN_LIMITS": {},
+}
+
+
+class LocalCounterBackend:
+    """Contadores em memória com expiração (thread-safe)."""
+
+    shared = False
+
+    def __init__(self, clock=time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._counters: dict[str, tuple[float, int]] = {}
+
+    def incr(self, key: str, amount: int, ttl: float) -> int:
+        with self._lock:
+            now = self._clock()
+            expires_at, value = self._counters.get(key, (0.0, 0))
+            if expires_at <= now:
+                if amount < 0:  # devolução de uma janela que já expirou
+                    return 0
+                expires_at, value = now + ttl, 0
+            value += amount
+            self._counters[key] = (expires_at, value)
+            if len(self._counters) > 10_000:
+                self._purge(now)
+            return value
+
+    def get_many(self, keys: list[str]) -> dict[str, int]:
+        with self._lock:
+            now = self._clock()
+            return {
+                key: entry[1]
+                for key in keys
+                if (entry := self._counters.get(key)) is not None and entry[0] > now
+            }
+
+    def _purge(self, now: float):
+        for key in [
+            key for key, (expires_at, _) in self._counters.items() if expires_at <= now
+        ]:
+            del self._counters[key]
+
+    def clear(self):
+        with self._lock:
+            self._counters.clear()
+
+
+class DjangoCacheCounterBackend:
+    """Contadores em um cache do Django compartilhado entre processos."""
+
+    prefix = "ai:ratelimit:"
+    blocking = True  # I/O de rede: views assíncronas chamam fora do event loop
+
+    def __init__(self, alias: str):
+        self.cache = caches[alias]
+        self.shared = not isinstance(self.cache, LocMemCache)
+
+    def incr(self, key: str, amount: int, ttl: float) -> int:
+        key = self.prefix + key
+        if amount < 0:
+            try:
+                return self.cache.incr(key, amount)
+            except ValueError:  # devolução de uma janela que já expirou
+                return 0
+        if self.cache.add(key, amount, timeout=math.ceil(ttl)):
+            return amount
+        try:
+            return self.cache.incr(key, amount)
+        except ValueError:
+            # Expirou entre o add e o incr
+            self.cache.add(key, amount, timeout=math.ceil(ttl))
+            return amount
+
+    def get_many(self, keys: list[str]) -> dict[str, int]:
+        values = self.cache.get_many([self.prefix + key for key in keys])
+        return {key.removeprefix(self.prefix): value for key, value in values.items()}
+
+    def clear(self):
+        # Não limpa o cache inteiro (pode ser compartilhado); os contadores expiram.
+        pass
+
+
+def build_backend(config: dict):
+    backend = config["BACKEND"]
+    if backend == "local":
+        return LocalCounterBackend()
+    if backend == "django":
+        return DjangoCacheCounterBackend(config["CACHE_ALIAS"])
+    return import_string(backend)(config)
+
+
+@dataclass(frozen=True)
+class Limit:
+    scope: str
+    limit: int
+    tokens: bool = False
+
+
+class RateLimiter:
+    """Janela deslizante por usuário sobre contadores atômicos."""
+
+    def __init__(self, clock=time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._backend = None
+
+    @property
+    def config(self) -> dict:
+        return {**DEFAULT_CONFIG, **getattr(settings, "AI_RATE_LIMIT", {})}
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = build_backend(self.config)
+        return self._backend
+
+    def limits(self, feature: str | None = None) -> list[Limit]:
+        """Limites aplicáveis a uma chamada (lidos das settings a cada uso)."""
+        config = self.config
+        limits = [Limit("requests", settings.AI_RATE_LIMIT_PER_HOUR)]
+        if config["TOKENS_PER_WINDOW"]:
+            limits.append(Limit("tokens", config["TOKENS_PER_WINDOW"], tokens=True))
+        if feature in config["FEATURE_LIMITS"]:
+            limits.append(
+                Limit(f"requests:{feature}", config["FEATURE_LIMITS"][feature])
+            )
+        if feature in config["FEATURE_TOKEN_LIMITS"]:
+            limits.append(
+                Limit(
+                    f"tokens:{feature}",
+                    config["FEATURE_TOKEN_LIMITS"][feature],
+                    tokens=True,
+                )
+            )
+        return limits
+
+    @property
+    def shared(self) -> bool:
+        """Contadores vistos por todos os processos (web e ``runworker``)."""
+        return getattr(self.backend, "shared", False)
+
+    def limits_tokens(self, feature: str | None = None) -> bool:
+        return any(limit.tokens for limit in self.limits(feature))
+
+    def request_limit(self, feature: str | None = None) -> int:
+        """Menor limite de requisições aplicável (``X-RateLimit-Limit``)."""
+        return min(limit.limit for limit in self.limits(feature) if not limit.tokens)
+
+    def _window(self) -> tuple[int, int, float]:
+        """(tamanho da janela, índice da janela atual, fração já decorrida)."""
+        window = self.config["WINDOW"]
+        now = self._clock()
+        return window, int(now // window), (now % window) / window
+
+    def _balances(
+        self, user_id, feature: str | None, reserved: dict | None = None
+    ) -> list[tuple[Limit, int]]:
+        """
+        Saldo de cada limite (negativo se estourado). ``reserved``: valores da
+        janela atual já devolvidos pelo incremento, que não são lidos de novo.
+        """
+        _, index, elapsed = self._window()
+        reserved = reserved or {}
+        keys = {
+            limit: (
+                f"{limit.scope}:{user_id}:{index}",
+                f"{limit.scope}:{user_id}:{index - 1}",
+            )
+            for limit in self.limits(feature)
+        }
+        counts = self.backend.get_many(
+            [
+                key
+                for limit, (current, previous) in keys.items()
+                for key in ((previous,) if limit in reserved else (current, previous))
+            ]
+        )
+        balances = []
+        for limit, (current, previous) in keys.items():
+            current_count = (
+                reserved[limit] if limit in reserved else counts.get(current, 0)
+            )
+            used = current_count + counts.get(previous, 0) * (1 - elapsed)
+            balances.append((limit, limit.limit - math.ceil(used)))
+        return balances
+
+    def check(self, user_id, feature: str | None = None) -> tuple[bool, int]:
+        """``(permitido, requisições restantes)`` sem consumir o limite."""
+        balances = self._balances(user_id, feature)
+        allowed = all(left > 0 for _, left in balances)
+        requests = min(left for limit, left in balances if not limit.tokens)
+        return allowed, max(0, requests)
+
+    def reserve(self, user_id, feature: str | None = None) -> tuple[bool, int]:
+        """
+        Reserva uma requisição antes de chamar o LLM: ``(permitido,
+        requisições restantes já descontada esta)``. A decisão usa o valor
+        devolvido pelo incremento atômico, então requisições simultâneas não
+        passam todas; se não for permitida, a reserva é devolvida na hora.
+        Uma reserva que acabar sem chamada ao LLM volta com ``release``.
+        """
+        window, index, _ = self._window()
+        ttl = 2 * window
+        reserved = {
+            limit: self.backend.incr(f"{limit.scope}:{user_id}:{index}", 1, ttl)
+            for limit in self.limits(feature)
+            if not limit.tokens
+        }
+        balances = self._balances(user_id, feature, reserved)
+        # A reservada já está contada: cabe se o saldo de requisições não ficou
+        # negativo; tokens precisam de saldo para a chamada que vai ser feita
+        allowed = all(
+            left > 0 if limit.tokens else left >= 0 for limit, left in balances
+        )
+        if not allowed:
+            self.release(user_id, feature)
+            return False, 0
+        return True, min(left for limit, left in balances if not limit.tokens)
+
+    def release(self, user_id, feature: str | None = None):
+        """Devolve uma requisição reservada com ``reserve`` que não chamou o LLM."""
+        window, index, _ = self._window()
+        for limit in self.limits(feature):
+            if not limit.tokens:
+                self.backend.incr(f"{limit.scope}:{user_id}:{index}", -1, 2 * window)
+
+    def hit(self, user_id, feature: str, tokens: int = 0, requests: int = 1):
+        """
+        Registra uma chamada ao LLM (e seus tokens) nos contadores. Com
+        ``requests=0`` só os tokens são somados (requisição já reservada com
+        ``reserve``).
+        """
+        window, index, _ = self._window()
+        ttl = 2 * window  # a janela atual ainda é lida como "anterior" na próxima
+        for limit in self.limits(feature):
+            amount = tokens if limit.tokens else requests
+            if amount:
+                self.backend.incr(f"{limit.scope}:{user_id}:{index}", amount, ttl)
+
+    async def acheck(self, user_id, feature: str | None = None) -> tuple[bool, int]:
+        """Versão assíncrona de ``check``."""
+        if getattr(self.backend, "blocking", False):
+            return await sync_to_async(self.check, thread_sensitive=False)(
+                user_id, feature
+            )
+        return self.check(user_id, feature)
+
+    async def areserve(self, user_id, feature: str | None = None) -> tuple[bool, int]:
+        """Versão assíncrona de ``reserve``."""
+        if getattr(self.backend, "blocking", False):
+            return await sync_to_async(self.reserve, thread_sensitive=False)(
+                user_id, feature
+            )
+        return self.reserve(user_id, feature)
+
+    async def arelease(self, user_id, feature: str | None = None):
+        """Versão assíncrona de ``release``."""
+        if getattr(self.backend, "blocking", False):
+            await sync_to_async(self.release, thread_sensitive=False)(user_id, feature)
+        else:
+            self.release(user_id, feature)
+
+    async def ahit(self, user_id, feature: str, tokens: int = 0, requests: int = 1):
+        """Versão assíncrona de ``hit``."""
+        if getattr(self.backend, "blocking", False):
+            await sync_to_async(self.hit, thread_sensitive=False)(
+                user_id, feature, tokens, requests
+            )
+        else:
+            self.hit(user_id, feature, tokens, requests)
+
+    def reset(self):
+        """Descarta o backend (e os contadores locais)."""
+        with self._lock:
+            if self._backend is not None:
+                self._backend.clear()
+            self._backend = None
+
+
+rate_limiter = RateLimiter()
@@ -0,0 +1,197 @@
+"""
+Cache de respostas do LLM para parse e categorização.
+
+Textos curtos se repetem muito ("uber 23,50", "mercado 150 pix") e, com
+``AI_TEMPERATURE`` baixa, a resposta é praticamente determinística. A chave
+é um hash de (modelo, funcionalidade, texto normalizado, categorias e
+contexto extra como a data); o valor é o resultado já processado.
+
+O backend é configurável em ``AI_RESPONSE_CACHE["BACKEND"]``:
+
+- ``"local"``: LRU em memória do processo com TTL;
+- ``"django"``: cache do Django (``CACHE_ALIAS``), compartilhado entre workers;
+- caminho pontilhado para uma classe com ``get``/``set``/``clear`` (e
+  ``blocking`` verdadeiro se fizer I/O de rede).
+
+As views assíncronas usam ``aget``/``aset``: backends com ``blocking`` rodam
+fora do event loop.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+DEFAULT_CONFIG = {
+    "BACKEND": "local",
+    "MAX_ENTRIES": 1000,
+    "TTL": 24 * 60 * 60,
+    "CACHE_ALIAS": "default",
+}
+
+
+def normalize_text(text: str) -> str:
+    """Minúsculas e espaços colapsados."""
+    return " ".join(text.casefold().split())
+
+
+def response_cache_key(model: str, feature: str, text: str, *context) -> str:
+    """
+    Hash estável da entrada de uma chamada ao LLM. Listas em ``context``
+    (ex.: categorias) são comparadas sem ordem e sem caixa.
+    """
+    payload = [model, feature, normalize_text(text)]
+    for item in context:
+        if isinstance(item, (list, tuple, set)):
+            payload.append(sorted({normalize_text(name) for name in item}))
+        else:
+            payload.append(str(item))
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class LocalLRUBackend:
+    """LRU em memória com expiração por TTL (thread-safe)."""
+
+    def __init__(self, max_entries: int, ttl: float, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value):
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DjangoCacheBackend:
+    """Usa um cache do Django (ex.: Redis/Memcached) compartilhado entre processos."""
+
+    prefix = "ai:response:"
+    blocking = True  # I/O de rede: views assíncronas chamam fora do event loop
+
+    def __init__(self, alias: str, ttl: float):
+        self.cache = caches[alias]
+        self.ttl = ttl
+
+    def get(self, key: str):
+        return self.cache.get(self.prefix + key)
+
+    def set(self, key: str, value):
+        self.cache.set(self.prefix + key, value, timeout=self.ttl)
+
+    def clear(self):
+        # Não limpa o cache inteiro (pode ser compartilhado); as entradas expiram pelo TTL.
+        pass
+
+
+def build_backend(config: dict):
+    backend = config["BACKEND"]
+    if backend == "local":
+        return LocalLRUBackend(config["MAX_ENTRIES"], config["TTL"])
+    if backend == "django":
+        return DjangoCacheBackend(config["CACHE_ALIAS"], config["TTL"])
+    return import_string(backend)(config)
+
+
+class ResponseCache:
+    """Cache de respostas com contadores de acertos e falhas."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._backend = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def config(self) -> dict:
+        return {**DEFAULT_CONFIG, **getattr(settings, "AI_RESPONSE_CACHE", {})}
+
+    @property
+    def enabled(self) -> bool:
+        return self.config["TTL"] > 0
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = build_backend(self.config)
+        return self._backend
+
+    def get(self, key: str):
+        if not self.enabled:
+            return None
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value):
+        if self.enabled:
+            self.backend.set(key, value)
+
+    async def aget(self, key: str):
+        """Versão assíncrona de ``get``."""
+        if getattr(self.backend, "blocking", False):
+            return await sync_to_async(self.get, thread_sensitive=False)(key)
+        return self.get(key)
+
+    async def aset(self, key: str, value):
+        """Versão assíncrona de ``set``."""
+        if getattr(self.backend, "blocking", False):
+            await sync_to_async(self.set, thread_sensitive=False)(key, value)
+        else:
+            self.set(key, value)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "backend": self.config["BACKEND"],
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+    def reset(self):
+        """Descarta o backend (e as entradas locais) e zera os contadores."""
+        with self._lock:
+            if self._backend is not None:
+                self._backend.clear()
+            self._backend = None
+            self.hits = self.misses = 0
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,293 @@
+"""
+Parser determinístico (pt-BR) para textos curtos de transação.
+
+Entradas como "gastei 38,90 em cordas no pix ontem" têm estrutura fixa:
+valor, verbo (entrada/saída), data relativa e forma de pagamento. As regras
+extraem esses campos sem chamar o LLM; a categoria vem do nome de uma
+categoria citada na descrição ou de um categorizador informado (ex.: o modelo
+local do usuário). Quando algum campo obrigatório fica ambíguo ou vazio,
+o parser retorna ``None`` e a chamada segue para o LLM.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import Callable, Optional
+
+from .ollama_client import TransactionProposal, normalize_amount
+
+AMOUNT = re.compile(
+    r"(?<![\w/.,:$])(?P<prefix>r\$\s*)?"
+    r"(?P<number>\d{1,3}(?:\.\d{3})+(?:,\d{1,2})?|\d+(?:[.,]\d{1,2})?)"
+    r"(?:\s*(?P<multiplier>mil\b|k\b))?"
+    r"(?:\s*(?P<suffix>reais|real|contos?|pilas?)\b)?"
+    r"(?![\w/%:]|[.,]\d)"
+)
+THOUSANDS = re.compile(r"\d{1,3}(?:\.\d{3})+")
+TIME = re.compile(r"\b(?:as\s+)?\d{1,2}(?::\d{2}|h\d{0,2})\b")
+INSTALLMENTS = re.compile(r"\b\d+\s*x\b|\bparcelad[oa]\b")
+
+RELATIVE_DAYS = re.compile(r"\b(anteontem|ontem|hoje|hj|amanha)\b")
+RELATIVE_OFFSETS = {"anteontem": -2, "ontem": -1, "hoje": 0, "hj": 0, "amanha": 1}
+DAY_OF_MONTH = re.compile(r"\b(?:(?:no|em)\s+)?dia\s+(\d{1,2})\b(?!\s*/)")
+NUMERIC_DATE = re.compile(r"(?<![\d/])(\d{1,2})/(\d{1,2})(?:/(\d{4}|\d{2}))?(?![\d/])")
+# Dia da semana só conta como data com artigo ("na sexta") ou sufixo ("sexta-feira").
+WEEKDAY = re.compile(
+    r"\b((?:na|no|nessa|nesta|neste|nesse)\s+)?"
+    r"(segunda|terca|quarta|quinta|sexta|sabado|domingo)(-feira|\s+feira)?"
+    r"(\s+passad[ao])?\b"
+)
+WEEKDAYS = ["segunda", "terca", "quarta", "quinta", "sexta", "sabado", "domingo"]
+
+# Em ordem de prioridade: "débito automático" é banco, não cartão.
+ACCOUNT_HINTS = [
+    (
+        "Banco",
+        re.compile(
+            r"\b(?:debito\s+automatico|boleto|transferencia|ted|doc|deposito)\b"
+        ),
+    ),
+    ("PIX", re.compile(r"\b(?:via\s+|no\s+|pelo\s+)?pix\b")),
+    (
+        "Cartão",
+        re.compile(
+            r"\b(?:(?:no|com\s+o|pelo)\s+)?(?:cartao(?:\s+de\s+(?:credito|debito))?|credito|debito)\b"
+        ),
+    ),
+    ("Dinheiro", re.compile(r"\b(?:em\s+)?(?:dinheiro|especie|cash)\b")),
+]
+
+# Verbos são removidos da descrição; pistas (substantivos) permanecem nela.
+INCOME_VERBS = re.compile(
+    r"\b(?:recebi|recebemos|ganhei|ganhamos|entrou|entraram|caiu|vendi|vendemos"
+    r"|me\s+(?:pagou|pagaram|transferiu|mandou)|pagaram)\b"
+)
+EXPENSE_VERBS = re.compile(
+    r"\b(?:paguei|pagamos|gastei|gastamos|comprei|compramos|torrei|saiu|sairam"
+    r"|transferi|mandei|debitou|pago)\b"
+)
+INCOME_HINTS = re.compile(
+    r"\b(?:salario|cache|freela|reembolso|rendimentos?|dividendos?|bonus|venda|pro-labore)\b"
+)
+EXPENSE_HINTS = re.compile(
+    r"\b(?:compra|conta|fatura|mensalidade|assinatura|aluguel|parcela|boleto)\b"
+)
+
+EDGE_WORDS = {
+    "a", "as", "o", "os", "um", "uma", "e", "de", "do", "da", "dos", "das", "em", "no",
+    "na", "nos", "nas", "com", "pra", "pro", "para", "por", "pelo", "pela", "via", "valor",
+    "foi", "ja", "hj",
+}  # fmt: skip
+EDGE_PUNCTUATION = " \t,.;:-!?()"
+
+VERB_CONFIDENCE = 0.95
+HINT_CONFIDENCE = 0.85
+DEFAULT_TYPE_CONFIDENCE = 0.8
+NAMED_CATEGORY_CONFIDENCE = 0.9
+
+
+@dataclass
+class RuleFields:
+    """Campos extraídos pelas regras, antes da categoria."""
+
+    transaction_type: str
+    type_confidence: float
+    amount: Decimal
+    date: date
+    description: str
+    account_suggestion: Optional[str] = None
+
+
+def fold(text: str) -> str:
+    """Minúsculas e sem acentos, preservando o tamanho (posições iguais ao original)."""
+    return "".join(unicodedata.normalize("NFKD", ch.lower())[:1] or " " for ch in text)
+
+
+def _mask(text: str, start: int, end: int) -> str:
+    return text[:start] + " " * (end - start) + text[end:]
+
+
+def _parse_amount(match: re.Match) -> Decimal | None:
+    number = match["number"]
+    if THOUSANDS.fullmatch(number):
+        number = number.replace(".", "")
+    try:
+        amount = normalize_amount(number)
+    except InvalidOperation:
+        return None
+    if match["multiplier"]:
+        amount *= 1000
+    return amount if amount > 0 else None
+
+
+def _resolve_date(match: re.Match, pattern: re.Pattern, today: date) -> date | None:
+    """Data absoluta de um trecho; datas sem mês/ano ficam no passado mais próximo."""
+    try:
+        if pattern is RELATIVE_DAYS:
+            return today + timedelta(days=RELATIVE_OFFSETS[match[1]])
+        if pattern is DAY_OF_MONTH:
+            value = today.replace(day=int(match[1]))
+            if value > today:
+                previous = today.replace(day=1) - timedelta(days=1)
+                value = previous.replace(day=int(match[1]))
+            return value
+        if pattern is NUMERIC_DATE:
+            day, month, year = int(match[1]), int(match[2]), match[3]
+            if year:
+                year = int(year) + (2000 if len(year) == 2 else 0)
+                return date(year, month, day)
+            value = date(today.year, month, day)
+            return value if value <= today else date(today.year - 1, month, day)
+        weekday = WEEKDAYS.index(match[2])
+        return today - timedelta(days=(today.weekday() - weekday) % 7)
+    except ValueError:
+        return None
+
+
+def _extract_type(folded: str) -> tuple[str, float] | None:
+    income = 2 * len(INCOME_VERBS.findall(folded)) + len(INCOME_HINTS.findall(folded))
+    expense = 2 * len(EXPENSE_VERBS.findall(folded)) + len(
+        EXPENSE_HINTS.findall(folded)
+    )
+    if income == expense:
+        return None if income else ("EXPENSE", DEFAULT_TYPE_CONFIDENCE)
+    transaction_type = "INCOME" if income > expense else "EXPENSE"
+    return transaction_type, (
+        VERB_CONFIDENCE if max(income, expense) >= 2 else HINT_CONFIDENCE
+    )
+
+
+def _is_edge_word(word: str) -> bool:
+    word = fold(word).strip(EDGE_PUNCTUATION)
+    return not word or word in EDGE_WORDS
+
+
+def _clean_description(text: str) -> str:
+    """Remove conectivos e pontuação das pontas do texto restante."""
+    words = text.split()
+    while words and _is_edge_word(words[0]):
+        words.pop(0)
+    while words and _is_edge_word(words[-1]):
+        words.pop()
+    description = " ".join(words).strip(EDGE_PUNCTUATION)[:50]
+    return description[:1].upper() + description[1:]
+
+
+def extract_fields(text: str, today: date | None = None) -> RuleFields | None:
+    """
+    Extrai valor, tipo, data, forma de pagamento e descrição. Retorna None
+    se o valor estiver ausente/ambíguo (ou parcelado), o tipo for
+    contraditório, houver datas conflitantes ou nada sobrar para a descrição.
+    """
+    today = today or date.today()
+    folded = fold(text.strip())
+    original = text.strip()
+    masked = folded
+
+    transaction_type = _extract_type(folded)
+    if transaction_type is None or INSTALLMENTS.search(folded):
+        return None
+
+    dates = set()
+    for pattern in (NUMERIC_DATE, DAY_OF_MONTH, RELATIVE_DAYS, WEEKDAY):
+        for match in pattern.finditer(masked):
+            if pattern is WEEKDAY and not (match[1] or match[3] or match[4]):
+                continue
+            value = _resolve_date(match, pattern, today)
+            if value is None:
+                return None
+            dates.add(value)
+            masked = _mask(masked, *match.span())
+    if len(dates) > 1:
+        return None
+
+    for match in TIME.finditer(masked):
+        masked = _mask(masked, *match.span())
+
+    account = None
+    for name, pattern in ACCOUNT_HINTS:
+        for match in pattern.finditer(masked):
+            account = account or name
+            masked = _mask(masked, *match.span())
+
+    candidates = [m for m in AMOUNT.finditer(masked) if _parse_amount(m) is not None]
+    marked = [m for m in candidates if m["prefix"] or m["suffix"]]
+    if len(marked) == 1:
+        candidates = marked
+    if len(candidates) != 1:
+        return None
+    amount_match = candidates[0]
+    masked = _mask(masked, *amount_match.span())
+
+    for pattern in (INCOME_VERBS, EXPENSE_VERBS):
+        for match in pattern.finditer(masked):
+            masked = _mask(masked, *match.span())
+
+    # Mantém apenas os trechos não reconhecidos, com a grafia original.
+    remaining = "".join(ch if m != " " else " " for ch, m in zip(original, masked))
+    description = _clean_description(remaining)
+    if not any(ch.isalpha() for ch in description):
+        return None
+
+    return RuleFields(
+        transaction_type=transaction_type[0],
+        type_confidence=transaction_type[1],
+        amount=_parse_amount(amount_match),
+        date=dates.pop() if dates else today,
+        description=description,
+        account_suggestion=account,
+    )
+
+
+def match_category_name(text: str, categories: list[str]) -> str | None:
+    """Categoria cujo nome aparece no texto (a mais longa, se houver várias)."""
+    folded = fold(text)
+    found = [
+        name
+        for name in categories
+        if name.strip() and re.search(rf"\b{re.escape(fold(name.strip()))}\b", folded)
+    ]
+    return max(found, key=len) if found else None
+
+
+def parse_transaction_rules(
+    text: str,
+    expense_categories: list[str] | None = None,
+    income_categories: list[str] | None = None,
+    categorize: Callable[[str, str], tuple[str | None, float]] | None = None,
+    today: date | None = None,
+) -> TransactionProposal | None:
+    """
+    Proposta de transação só com regras, ou None se for preciso o LLM.
+
+    ``categorize(descrição, tipo)`` é consultado quando nenhuma categoria é
+    citada na descrição e deve retornar (nome ou None, confiança).
+    """
+    fields = extract_fields(text, today)
+    if fields is None:
+        return None
+
+    categories = (
+        income_categories if fields.transaction_type == "INCOME" else expense_categories
+    )
+    # Só a descrição: "no cartão de crédito" é forma de pagamento, não categoria.
+    category = match_category_name(fields.description, categories or [])
+    category_confidence = NAMED_CATEGORY_CONFIDENCE
+    if category is None and categorize is not None:
+        category, category_confidence = categorize(
+            fields.description, fields.transaction_type
+        )
+    if category is None:
+        return None
+
+    return TransactionProposal(
+        transaction_type=fields.transaction_type,
+        amount=fields.amount,
+        date=fields.date.isoformat(),
+        description=fields.description,
+        category_suggestion=category,
+        account_suggestion=fields.account_suggestion,
+        confidence=round(fields.type_confidence * category_confidence, 2),
+    )
@@ -0,0 +1,45 @@
+from django.core.signals import setting_changed
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.finance.models import Goal, Transaction
+from apps.finance.signals import transactions_imported
+
+from .services.chat_service import invalidate_financial_context
+from .services.health import HEALTH_SETTINGS
+from .services.llm_clients import CLIENT_SETTINGS, async_registry, registry
+from .services.ollama_client import llm_health
+from .services.rate_limit import rate_limiter
+from .services.response_cache import response_cache
+from .usage_log import usage_log_buffer
+
+
+@receiver(setting_changed)
+def reset_llm_clients(sender, setting, **kwargs):
+    """Descarta clientes, estado de saúde, cache e rate limit do LLM quando a configuração muda."""
+    if setting in CLIENT_SETTINGS:
+        registry.clear()
+        async_registry.clear()
+    if setting in CLIENT_SETTINGS | HEALTH_SETTINGS:
+        llm_health.reset()
+    if setting == "AI_RESPONSE_CACHE":
+        response_cache.reset()
+    if setting == "AI_RATE_LIMIT":
+        rate_limiter.reset()
+    if setting == "AI_USAGE_LOG_BUFFER":
+        usage_log_buffer.stop()
+
+
+@receiver(post_save, sender=Transaction)
+@receiver(post_delete, sender=Transaction)
+@receiver(post_save, sender=Goal)
+@receiver(post_delete, sender=Goal)
+def invalidate_chat_context(sender, instance, **kwargs):
+    """Transações e metas alteradas invalidam o contexto financeiro do chat."""
+    invalidate_financial_context(instance.user_id)
+
+
+@receiver(transactions_imported)
+def invalidate_chat_context_on_import(sender, user, **kwargs):
+    """Importação em lote (sem post_save) também invalida o contexto."""
+    invalidate_financial_context(user.pk)
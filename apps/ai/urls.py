@@ -6,9 +6,13 @@ urlpatterns = [
     path("parse-transaction/", views.parse_transaction, name="parse-transaction"),
     path("insights/", views.insights, name="insights"),
     path("categorize/", views.categorize, name="categorize"),
+    path("categorize/batch/", views.categorize_batch, name="categorize-batch"),
     path("forecast/", views.forecast, name="forecast"),
     path("budget-check/", views.budget_check, name="budget-check"),
+    path("jobs/<int:job_id>/", views.job_detail, name="ai-job-detail"),
+    path("usage/report/", views.usage_report, name="ai-usage-report"),
     path("chat/", views.chat, name="chat"),
+    path("chat/stream/", views.chat_stream, name="chat-stream"),
     path(
         "chat/conversations/",
         views.chat_conversations,
@@ -0,0 +1,130 @@
+"""
+Gravação em lote do ``AIUsageLog``.
+
+Cada chamada à IA gera um registro de uso. Em vez de um INSERT (e commit)
+no caminho da requisição, os registros vão para um buffer em memória do
+processo e são gravados com ``bulk_create`` quando:
+
+- o buffer atinge ``AI_USAGE_LOG_BUFFER["MAX_SIZE"]`` registros;
+- o registro mais antigo espera mais que ``FLUSH_INTERVAL`` segundos
+  (verificado a cada registro e por uma thread de fundo);
+- o processo termina (``atexit``).
+
+Com ``ENABLED`` falso cada registro é gravado na hora. O rate limit não
+depende destes registros (usa contadores próprios), então o atraso da
+gravação não afeta os limites. Registros ainda no buffer se perdem se o
+processo for morto sem encerramento normal.
+"""
+
+import atexit
+import logging
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+
+from .models import AIUsageLog
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = {
+    "ENABLED": False,
+    "MAX_SIZE": 100,
+    "FLUSH_INTERVAL": 5.0,
+}
+
+
+class UsageLogBuffer:
+    """Buffer thread-safe de ``AIUsageLog`` gravado com ``bulk_create``."""
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: list[AIUsageLog] = []
+        self._oldest = None
+        self._flusher = None
+        self._wakeup = threading.Event()
+        atexit.register(self.flush)
+
+    @property
+    def config(self) -> dict:
+        return {**DEFAULT_CONFIG, **getattr(settings, "AI_USAGE_LOG_BUFFER", {})}
+
+    def _append(self, log: AIUsageLog, config: dict) -> bool:
+        """Enfileira o registro; indica se o buffer deve ser gravado agora."""
+        with self._lock:
+            self._pending.append(log)
+            if self._oldest is None:
+                self._oldest = self._clock()
+            self._start_flusher()
+            return (
+                len(self._pending) >= config["MAX_SIZE"]
+                or self._clock() - self._oldest >= config["FLUSH_INTERVAL"]
+            )
+
+    def add(self, log: AIUsageLog):
+        """Grava o registro (buffer ativo: quando atingir algum limite)."""
+        config = self.config
+        if not config["ENABLED"]:
+            log.save(force_insert=True)
+        elif self._append(log, config):
+            self.flush()
+
+    async def aadd(self, log: AIUsageLog):
+        """Versão assíncrona de ``add``."""
+        config = self.config
+        if not config["ENABLED"]:
+            await log.asave(force_insert=True)
+        elif self._append(log, config):
+            await sync_to_async(self.flush)()
+
+    def flush(self) -> int:
+        """Grava os registros pendentes; retorna quantos foram gravados."""
+        with self._lock:
+            pending, self._pending, self._oldest = self._pending, [], None
+        if not pending:
+            return 0
+        try:
+            AIUsageLog.objects.bulk_create(pending, batch_size=500)
+        except Exception:
+            logger.exception(f"Falha ao gravar {len(pending)} registros de uso da IA")
+            return 0
+        return len(pending)
+
+    def _start_flusher(self):
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(
+                target=self._run_flusher, name="ai-usage-log-flusher", daemon=True
+            )
+            self._flusher.start()
+
+    def _run_flusher(self):
+        while not self._wakeup.wait(self.config["FLUSH_INTERVAL"]):
+            with self._lock:
+                due = (
+                    self._oldest is not None
+                    and self._clock() - self._oldest >= self.config["FLUSH_INTERVAL"]
+                )
+            if due:
+                try:
+                    self.flush()
+                finally:
+                    connections.close_all()
+        self._wakeup.clear()
+
+    def stop(self):
+        """Encerra a thread de fundo e grava o que estiver pendente."""
+        flusher = self._flusher
+        if flusher is not None and flusher.is_alive():
+            self._wakeup.set()
+            flusher.join()
+        self._flusher = None
+        self.flush()
+
+    def __len__(self):
+        return len(self._pending)
+
+
+usage_log_buffer = UsageLogBuffer()
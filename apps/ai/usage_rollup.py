@@ -0,0 +1,94 @@
+"""
+Uso diário da IA consolidado (rollup) e retenção dos registros brutos.
+
+``rollup_usage`` agrega o ``AIUsageLog`` em ``AIUsageDaily`` de forma
+incremental: recalcula a partir do penúltimo dia já consolidado (registros
+gravados em lote podem chegar depois da meia-noite) até hoje.
+``prune_usage_logs`` apaga, em lotes, os registros brutos mais antigos que a
+retenção, e só de dias já consolidados. Relatórios leem apenas o rollup.
+"""
+
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.core.periods import datetime_range_filter, local_day_start
+
+from .models import AIUsageDaily, AIUsageLog
+
+
+def first_log_day() -> date | None:
+    """Dia do registro bruto mais antigo ainda mantido."""
+    first = AIUsageLog.objects.aggregate(first=Min("created_at"))["first"]
+    return timezone.localdate(first) if first else None
+
+
+def rollup_start() -> date | None:
+    """Primeiro dia a recalcular (``None`` se não há nada consolidado nem registros)."""
+    last_day = AIUsageDaily.objects.aggregate(last=Max("day"))["last"]
+    if last_day is not None:
+        return last_day - timedelta(days=1)
+    return first_log_day()
+
+
+def rollup_usage(since: date | None = None) -> int:
+    """
+    Recalcula o uso diário de ``since`` (padrão: ``rollup_start``) até hoje.
+    Dias cujos registros brutos já foram apagados pela retenção não são
+    tocados. Retorna quantidade de linhas gravadas.
+    """
+    first_day = first_log_day()
+    since = since or rollup_start()
+    if since is None or first_day is None:
+        return 0
+    since = max(since, first_day)
+    end = timezone.localdate() + timedelta(days=1)
+
+    rows = (
+        AIUsageLog.objects.filter(**datetime_range_filter("created_at", since, end))
+        .annotate(day=TruncDate("created_at"))
+        .values("user_id", "day", "feature", "model_name")
+        .annotate(
+            calls=Count("id"),
+            failures=Count("id", filter=Q(success=False)),
+            input_tokens=Sum("input_tokens"),
+            output_tokens=Sum("output_tokens"),
+        )
+        .order_by()
+    )
+
+    with transaction.atomic():
+        AIUsageDaily.objects.filter(day__gte=since).delete()
+        created = AIUsageDaily.objects.bulk_create(
+            [AIUsageDaily(**row) for row in rows],
+            batch_size=1000,
+        )
+    return len(created)
+
+
+def prune_usage_logs(retention_days: int, batch_size: int = 5000) -> int:
+    """
+    Apaga registros brutos com mais de ``retention_days`` dias, em lotes de
+    ``batch_size``, sem passar de dias ainda não consolidados.
+    Retorna quantidade de registros apagados.
+    """
+    consolidated = rollup_start()
+    if consolidated is None:
+        return 0
+    cutoff = local_day_start(
+        min(timezone.localdate() - timedelta(days=retention_days), consolidated)
+    )
+
+    deleted = 0
+    while True:
+        pks = list(
+            AIUsageLog.objects.filter(created_at__lt=cutoff)
+            .order_by()
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not pks:
+            return deleted
+        deleted += AIUsageLog.objects.filter(pk__in=pks).delete()[0]
@@ -1,82 +1,84 @@
+import asyncio
 import logging
-from calendar import monthrange
 from datetime import date, timedelta
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from django.db.models import Q, Sum
+from django.db.models import OuterRef, Subquery, Sum
+from django.http import StreamingHttpResponse
+from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
+from apps.core.async_views import async_api_view
+from apps.core.periods import add_months, parse_month
+from apps.core.sse import EventStreamRenderer, sse_event
+from apps.finance.budgets import active_budgets, evaluate_budgets
+from apps.finance.categorizer import suggest_categories, suggest_category
 from apps.finance.default_categories import (
     get_default_expense_category_names,
     get_default_income_category_names,
 )
-from apps.finance.models import Budget, Category, Transaction
-
-from .models import AIUsageLog, ChatConversation, ChatMessage
+from apps.finance.models import Category
+from apps.finance.monthly_totals import get_month_summary, get_months_history
+
+from .analysis_results import (
+    aget_analysis,
+    analysis_fingerprint,
+    asave_analysis,
+    get_analysis,
+    save_analysis,
+)
+from .jobs import aenqueue, afind_pending
+from .models import (
+    CHAT_MESSAGE_SEARCH_INDEX,
+    AIJob,
+    AIUsageDaily,
+    AIUsageLog,
+    ChatConversation,
+    ChatMessage,
+)
 from .services import (
     ChatResponse,
-    categorize_transaction_text,
+    acategorize_transaction_text,
+    agenerate_budget_check,
+    agenerate_cashflow_forecast,
+    agenerate_chat_response,
+    agenerate_monthly_insights,
+    aparse_transaction_text,
+    astream_chat_response,
+    asummarize_conversation,
+    categorize_transaction_texts,
+    generate_budget_check,
+    generate_cashflow_forecast,
+    generate_monthly_insights,
     get_llm_base_url,
     get_llm_model,
     get_llm_provider,
-    generate_cashflow_forecast,
-    generate_budget_check,
-    generate_chat_response,
-    generate_monthly_insights,
     is_ollama_available,
-    parse_transaction_text,
+    llm_health,
+    parse_transaction_rules,
+    rate_limiter,
+    response_cache,
+    response_cache_key,
+)
+from .services.chat_history import (
+    estimate_tokens,
+    history_messages,
+    split_history,
+    window_budget,
+    window_low_water,
 )
+from .services.response_cache import normalize_text
+from .usage_log import usage_log_buffer
 
 logger = logging.getLogger(__name__)
 
 
-def _add_months(value: date, months: int) -> date:
-    total_months = value.month - 1 + months
-    year = value.year + total_months // 12
-    month = total_months % 12 + 1
-    day = min(value.day, monthrange(year, month)[1])
-    return date(year, month, day)
-
-
-def _get_budget_period_range(start_date: date, period_type: str, today: date) -> tuple[date, date]:
-    if today < start_date:
-        if period_type == Budget.PeriodType.WEEKLY:
-            period_start = start_date
-            period_end = start_date + timedelta(days=6)
-        elif period_type == Budget.PeriodType.MONTHLY:
-            period_start = start_date
-            period_end = _add_months(start_date, 1) - timedelta(days=1)
-        else:
-            period_start = start_date
-            period_end = _add_months(start_date, 12) - timedelta(days=1)
-        return period_start, period_end
-
-    if period_type == Budget.PeriodType.WEEKLY:
-        weeks = (today - start_date).days // 7
-        period_start = start_date + timedelta(days=weeks * 7)
-        period_end = period_start + timedelta(days=6)
-        return period_start, period_end
-
-    if period_type == Budget.PeriodType.MONTHLY:
-        months = (today.year - start_date.year) * 12 + (today.month - start_date.month)
-        period_start = _add_months(start_date, months)
-        if period_start > today:
-            period_start = _add_months(period_start, -1)
-        period_end = _add_months(period_start, 1) - timedelta(days=1)
-        return period_start, period_end
-
-    years = today.year - start_date.year
-    period_start = _add_months(start_date, years * 12)
-    if period_start > today:
-        period_start = _add_months(period_start, -12)
-    period_end = _add_months(period_start, 12) - timedelta(days=1)
-    return period_start, period_end
-
-
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def healthcheck(request):
@@ -97,43 +99,227 @@ def healthcheck(request):
                 "url": get_llm_base_url(),
                 "model": get_llm_model(),
                 "installed_models": models,
+                "response_cache": response_cache.stats(),
             },
         }
     )
 
 
-def check_rate_limit(user) -> tuple[bool, int]:
+def llm_unavailable_response() -> Response:
+    """503 para LLM indisponível; com o circuito aberto informa o Retry-After."""
+    response = Response(
+        {"error": "LLM não está disponível. Verifique a configuração."},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+    retry_after = llm_health.retry_after()
+    if retry_after:
+        response["Retry-After"] = str(retry_after)
+    return response
+
+
+def rate_limit_headers(response, remaining: int, feature=None):
+    """Cabeçalhos ``X-RateLimit-*`` com o limite e o saldo de requisições do limiter."""
+    response["X-RateLimit-Limit"] = str(rate_limiter.request_limit(feature))
+    response["X-RateLimit-Remaining"] = str(max(0, remaining))
+    return response
+
+
+def rate_limited_response(feature=None) -> Response:
+    """429 quando o usuário esgotou as requisições (ou tokens) da última hora."""
+    return rate_limit_headers(
+        Response(
+            {
+                "error": "Limite de requisições atingido. Tente novamente em 1 hora.",
+                "rate_limit": rate_limiter.request_limit(feature),
+                "remaining": 0,
+            },
+            status=status.HTTP_429_TOO_MANY_REQUESTS,
+        ),
+        0,
+        feature,
+    )
+
+
+async def llm_available() -> bool:
+    """
+    ``is_ollama_available`` para views assíncronas: a sonda (só quando o TTL
+    expira) é uma chamada HTTP bloqueante e roda fora do event loop.
+    """
+    return await sync_to_async(is_ollama_available, thread_sensitive=False)()
+
+
+def no_llm_response(data: dict, user, **usage) -> Response:
+    """Resposta sem chamada ao LLM (cache/modelo local): não consome o rate limit."""
+    _, remaining = check_rate_limit(user)
+    return rate_limit_headers(
+        Response(
+            {
+                **data,
+                "usage": {"tokens_used": 0, "requests_remaining": remaining, **usage},
+            }
+        ),
+        remaining,
+    )
+
+
+async def ano_llm_response(data: dict, user, **usage) -> Response:
+    """Versão assíncrona de ``no_llm_response``."""
+    _, remaining = await acheck_rate_limit(user)
+    return rate_limit_headers(
+        Response(
+            {
+                **data,
+                "usage": {"tokens_used": 0, "requests_remaining": remaining, **usage},
+            }
+        ),
+        remaining,
+    )
+
+
+def local_category_name(
+    user, text: str, category_type: str
+) -> tuple[str | None, float]:
+    """Nome da categoria sugerida pelo modelo local do usuário, se confiante."""
+    category_id, confidence = suggest_category(user, text, category_type)
+    if category_id is None:
+        return None, confidence
+    name = (
+        Category.objects.filter(pk=category_id).values_list("name", flat=True).first()
+    )
+    return name, confidence
+
+
+def with_local_category(user, proposal: dict) -> dict:
+    """
+    Troca a categoria sugerida pelo LLM pela do modelo local do usuário
+    quando ele tem confiança suficiente. Não altera o dict original (que
+    pode estar no cache compartilhado).
+    """
+    name, _ = local_category_name(user, proposal["description"], proposal["type"])
+    return {**proposal, "category_suggestion": name} if name else proposal
+
+
+def proposal_data(proposal) -> dict:
+    """Serializa uma ``TransactionProposal`` para a resposta."""
+    return {
+        "type": proposal.transaction_type,
+        "amount": float(proposal.amount),
+        "date": proposal.date,
+        "description": proposal.description,
+        "category_suggestion": proposal.category_suggestion,
+        "account_suggestion": proposal.account_suggestion,
+        "confidence": proposal.confidence,
+    }
+
+
+def check_rate_limit(user, feature=None) -> tuple[bool, int]:
     """
-    Verifica rate limit do usuário.
+    Verifica rate limit do usuário (e da funcionalidade, se configurada).
     Returns: (is_allowed, requests_remaining)
     """
-    one_hour_ago = timezone.now() - timedelta(hours=1)
-    usage_count = AIUsageLog.objects.filter(
-        user=user,
-        created_at__gte=one_hour_ago,
-    ).count()
+    return rate_limiter.check(user.pk, feature)
+
+
+async def acheck_rate_limit(user, feature=None) -> tuple[bool, int]:
+    """Versão assíncrona de ``check_rate_limit``."""
+    return await rate_limiter.acheck(user.pk, feature)
+
+
+def reserve_rate_limit(user, feature=None) -> tuple[bool, int]:
+    """
+    Reserva a requisição antes de chamar o LLM (incremento atômico: chamadas
+    simultâneas não passam todas). Returns: (is_allowed, requests_remaining)
+    já descontada a reservada. O uso é registrado depois com ``reserved=True``.
+    """
+    return rate_limiter.reserve(user.pk, feature)
+
+
+async def areserve_rate_limit(user, feature=None) -> tuple[bool, int]:
+    """Versão assíncrona de ``reserve_rate_limit``."""
+    return await rate_limiter.areserve(user.pk, feature)
 
-    remaining = settings.AI_RATE_LIMIT_PER_HOUR - usage_count
-    return remaining > 0, max(0, remaining)
 
+def release_rate_limit(user, feature=None):
+    """Devolve uma requisição reservada que não chegou a chamar o LLM."""
+    rate_limiter.release(user.pk, feature)
 
-def log_ai_usage(user, feature, input_text, usage_info, success=True, error_message=""):
-    """Registra uso da IA para controle de custos."""
-    AIUsageLog.objects.create(
+
+async def arelease_rate_limit(user, feature=None):
+    """Versão assíncrona de ``release_rate_limit``."""
+    await rate_limiter.arelease(user.pk, feature)
+
+
+def _usage_log(
+    user, feature, input_text, usage_info, success, error_message
+) -> AIUsageLog:
+    return AIUsageLog(
         user=user,
         feature=feature,
         input_text=input_text[:500],  # Limita tamanho
         input_chars=len(input_text),
-        output_chars=usage_info.get("output_tokens", 0) * 4,  # ~4 chars por token
+        output_chars=usage_info.get("output_chars", 0),
+        input_tokens=usage_info.get("input_tokens", 0),
+        output_tokens=usage_info.get("output_tokens", 0),
         model_name=usage_info.get("model", get_llm_model()),
         success=success,
         error_message=error_message,
     )
 
 
-@api_view(["POST"])
+def log_ai_usage(
+    user,
+    feature,
+    input_text,
+    usage_info,
+    success=True,
+    error_message="",
+    reserved=False,
+):
+    """
+    Registra uso da IA para controle de custos e consome o rate limit.
+    ``reserved``: a requisição já foi contada (``reserve_rate_limit`` ou ao
+    enfileirar a tarefa); só os tokens são somados.
+    """
+    usage_log_buffer.add(
+        _usage_log(user, feature, input_text, usage_info, success, error_message)
+    )
+    rate_limiter.hit(
+        user.pk,
+        feature,
+        usage_info.get("total_tokens", 0),
+        requests=0 if reserved else 1,
+    )
+
+
+async def alog_ai_usage(
+    user,
+    feature,
+    input_text,
+    usage_info,
+    success=True,
+    error_message="",
+    reserved=False,
+):
+    """Versão assíncrona de ``log_ai_usage``."""
+    await usage_log_buffer.aadd(
+        _usage_log(user, feature, input_text, usage_info, success, error_message)
+    )
+    await rate_limiter.ahit(
+        user.pk,
+        feature,
+        usage_info.get("total_tokens", 0),
+        requests=0 if reserved else 1,
+    )
+
+
+async def _category_names(user, category_type) -> list[str]:
+    queryset = Category.objects.filter(user=user, category_type=category_type)
+    return [name async for name in queryset.values_list("name", flat=True)]
+
+
+@async_api_view(["POST"])
 @permission_classes([IsAuthenticated])
-def parse_transaction(request):
+async def parse_transaction(request):
     """
     Recebe texto livre e retorna proposta de transação.
 
@@ -162,92 +348,113 @@ def parse_transaction(request):
 
     if len(text) > settings.AI_MAX_INPUT_CHARS:
         return Response(
-            {"error": f"Texto muito longo. Máximo: {settings.AI_MAX_INPUT_CHARS} caracteres"},
+            {
+                "error": f"Texto muito longo. Máximo: {settings.AI_MAX_INPUT_CHARS} caracteres"
+            },
             status=status.HTTP_400_BAD_REQUEST,
         )
 
+    expense_categories = await _category_names(
+        request.user, Category.CategoryType.EXPENSE
+    )
+    income_categories = await _category_names(
+        request.user, Category.CategoryType.INCOME
+    )
+
+    if not expense_categories:
+        expense_categories = get_default_expense_category_names()
+    if not income_categories:
+        income_categories = get_default_income_category_names()
+
+    # Textos estruturados ("uber 23,50 no pix ontem") são resolvidos por regras
+    if settings.AI_RULE_PARSER_ENABLED:
+        # O categorizador local consulta o banco: as regras rodam fora do loop
+        proposal = await sync_to_async(parse_transaction_rules)(
+            text,
+            expense_categories=expense_categories,
+            income_categories=income_categories,
+            categorize=lambda description, category_type: local_category_name(
+                request.user, description, category_type
+            ),
+        )
+        if (
+            proposal is not None
+            and proposal.confidence >= settings.AI_RULE_PARSER_MIN_CONFIDENCE
+        ):
+            return await ano_llm_response(
+                {"proposal": proposal_data(proposal)}, request.user, rules=True
+            )
+
+    # Respostas em cache não consomem o rate limit nem geram log de uso
+    cache_key = response_cache_key(
+        get_llm_model(),
+        "parse",
+        text,
+        expense_categories,
+        income_categories,
+        date.today().isoformat(),  # o prompt usa a data de hoje
+    )
+    cached = await response_cache.aget(cache_key)
+    if cached is not None:
+        proposal = await sync_to_async(with_local_category)(request.user, cached)
+        return await ano_llm_response({"proposal": proposal}, request.user, cached=True)
+
     # Rate limiting
-    is_allowed, remaining = check_rate_limit(request.user)
+    is_allowed, remaining = await areserve_rate_limit(
+        request.user, AIUsageLog.Feature.PARSE_TRANSACTION
+    )
     if not is_allowed:
-        return Response(
-            {
-                "error": "Limite de requisições atingido. Tente novamente em 1 hora.",
-                "rate_limit": settings.AI_RATE_LIMIT_PER_HOUR,
-                "remaining": 0,
-            },
-            status=status.HTTP_429_TOO_MANY_REQUESTS,
-        )
+        return rate_limited_response(AIUsageLog.Feature.PARSE_TRANSACTION)
 
     # Verifica se LLM está disponível
-    if not is_ollama_available():
-        return Response(
-            {"error": "LLM não está disponível. Verifique a configuração."},
-            status=status.HTTP_503_SERVICE_UNAVAILABLE,
-        )
+    if not await llm_available():
+        await arelease_rate_limit(request.user, AIUsageLog.Feature.PARSE_TRANSACTION)
+        return llm_unavailable_response()
 
     try:
-        expense_categories = list(
-            Category.objects.filter(
-                user=request.user,
-                category_type=Category.CategoryType.EXPENSE,
-            ).values_list("name", flat=True)
-        )
-        income_categories = list(
-            Category.objects.filter(
-                user=request.user,
-                category_type=Category.CategoryType.INCOME,
-            ).values_list("name", flat=True)
-        )
-
-        if not expense_categories:
-            expense_categories = get_default_expense_category_names()
-        if not income_categories:
-            income_categories = get_default_income_category_names()
-
         # Chama serviço de IA
-        proposal, usage_info = parse_transaction_text(
+        proposal, usage_info = await aparse_transaction_text(
             text,
             expense_categories=expense_categories,
             income_categories=income_categories,
         )
 
         # Log de uso
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.PARSE_TRANSACTION,
             input_text=text,
             usage_info=usage_info,
+            reserved=True,
         )
 
-        # Converte dataclass para dict
-        response_data = {
-            "type": proposal.transaction_type,
-            "amount": float(proposal.amount),
-            "date": proposal.date,
-            "description": proposal.description,
-            "category_suggestion": proposal.category_suggestion,
-            "account_suggestion": proposal.account_suggestion,
-            "confidence": proposal.confidence,
-        }
+        response_data = proposal_data(proposal)
+        await response_cache.aset(cache_key, response_data)
+        proposal = await sync_to_async(with_local_category)(request.user, response_data)
 
-        return Response(
-            {
-                "proposal": response_data,
-                "usage": {
-                    "tokens_used": usage_info.get("total_tokens", 0),
-                    "requests_remaining": remaining - 1,
-                },
-            }
+        return rate_limit_headers(
+            Response(
+                {
+                    "proposal": proposal,
+                    "usage": {
+                        "tokens_used": usage_info.get("total_tokens", 0),
+                        "requests_remaining": remaining,
+                    },
+                }
+            ),
+            remaining,
+            AIUsageLog.Feature.PARSE_TRANSACTION,
         )
 
     except ValueError as e:
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.PARSE_TRANSACTION,
             input_text=text,
             usage_info={"model": get_llm_model()},
             success=False,
             error_message=str(e),
+            reserved=True,
         )
         return Response(
             {"error": str(e)},
@@ -255,13 +462,14 @@ def parse_transaction(request):
         )
     except Exception as e:
         logger.exception("Erro no parse_transaction")
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.PARSE_TRANSACTION,
             input_text=text,
             usage_info={"model": get_llm_model()},
             success=False,
             error_message=str(e),
+            reserved=True,
         )
         return Response(
             {"error": "Erro interno ao processar transação"},
@@ -269,12 +477,123 @@ def parse_transaction(request):
         )
 
 
-@api_view(["POST"])
+def _month_overview(user, month_date: date) -> dict:
+    """Totais do mês e top categorias de gasto, a partir dos totais consolidados."""
+    summary = get_month_summary(user, month_date)
+    income = float(summary["income"])
+    expenses = float(summary["expenses"])
+    return {
+        "income": income,
+        "expenses": expenses,
+        "balance": income - expenses,
+        "top_categories": [
+            {"category__name": item["category__name"], "total": item["total"]}
+            for item in summary["top_expense_categories"][:5]
+        ],
+        "transaction_count": summary["transaction_count"],
+    }
+
+
+def _empty_insights(month: str) -> dict:
+    return {
+        "month": month,
+        "summary": "Nenhuma transação registrada neste mês.",
+        "total_income": 0,
+        "total_expenses": 0,
+        "balance": 0,
+        "top_expenses": [],
+        "recommendations": [
+            "Comece registrando suas transações para obter insights personalizados."
+        ],
+    }
+
+
+def _insights_data(month: str, overview: dict, insights_data) -> dict:
+    return {
+        "month": month,
+        "summary": insights_data.summary,
+        "total_income": overview["income"],
+        "total_expenses": overview["expenses"],
+        "balance": overview["balance"],
+        "top_expenses": [
+            {
+                "category": cat.get("category__name") or "Sem categoria",
+                "total": float(cat.get("total", 0)),
+            }
+            for cat in overview["top_categories"]
+        ],
+        "recommendations": insights_data.recommendations,
+    }
+
+
+def _query_flag(request, name: str) -> bool:
+    return request.query_params.get(name, "").lower() in {"1", "true"}
+
+
+def _wants_job(request) -> bool:
+    """``?async=1``: a análise roda no worker e a resposta traz o id da tarefa."""
+    return _query_flag(request, "async")
+
+
+def _wants_refresh(request) -> bool:
+    """``?refresh=1``: ignora a análise guardada para os mesmos dados."""
+    return _query_flag(request, "refresh")
+
+
+async def job_accepted_response(
+    request, feature: str, payload: dict | None = None
+) -> Response:
+    """
+    Enfileira a tarefa e responde 202 com o id. A requisição ao LLM é
+    reservada no rate limit já aqui; uma tarefa idêntica ainda não concluída
+    é devolvida sem enfileirar (nem reservar) outra. Com limite de tokens e
+    contadores por processo, os tokens do worker não seriam vistos pelas
+    views: o modo assíncrono é recusado.
+    """
+    if rate_limiter.limits_tokens(feature) and not rate_limiter.shared:
+        return Response(
+            {
+                "error": "Modo assíncrono indisponível com limite de tokens. "
+                "Faça a requisição sem ?async=1."
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    job = await afind_pending(request.user, feature, payload)
+    if job is not None:
+        _, remaining = await acheck_rate_limit(request.user, feature)
+    else:
+        is_allowed, remaining = await areserve_rate_limit(request.user, feature)
+        if not is_allowed:
+            return rate_limited_response(feature)
+
+        job = await aenqueue(request.user, feature, payload)
+
+    return rate_limit_headers(
+        Response(
+            {
+                "job_id": job.id,
+                "status": job.status,
+                "status_url": reverse("ai-job-detail", args=[job.id]),
+                "usage": {"requests_remaining": remaining},
+            },
+            status=status.HTTP_202_ACCEPTED,
+        ),
+        remaining,
+        feature,
+    )
+
+
+@async_api_view(["POST"])
 @permission_classes([IsAuthenticated])
-def insights(request):
+async def insights(request):
     """
     Gera insights do mês baseado nas transações.
 
+    Com ``?async=1`` responde 202 com ``job_id``; o resultado sai em
+    ``GET /api/ai/jobs/<id>/``. Uma análise guardada para os mesmos dados é
+    devolvida na hora (mesmo com o rate limit esgotado ou ``?async=1``).
+
     Input:
         {"month": "2026-01"}
 
@@ -298,128 +617,111 @@ def insights(request):
 
     # Valida formato do mês
     try:
-        year, month_num = month.split("-")
-        year = int(year)
-        month_num = int(month_num)
-        if month_num < 1 or month_num > 12:
-            raise ValueError("Mês inválido")
-    except (ValueError, AttributeError):
+        month_date = parse_month(month)
+    except ValueError:
         return Response(
             {"error": "Formato inválido. Use YYYY-MM"},
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    # Rate limiting
-    is_allowed, remaining = check_rate_limit(request.user)
-    if not is_allowed:
-        return Response(
-            {
-                "error": "Limite de requisições atingido. Tente novamente em 1 hora.",
-                "rate_limit": settings.AI_RATE_LIMIT_PER_HOUR,
-                "remaining": 0,
-            },
-            status=status.HTTP_429_TOO_MANY_REQUESTS,
-        )
+    # Busca dados do mês nos totais consolidados
+    overview = await sync_to_async(_month_overview)(request.user, month_date)
 
-    # Verifica se LLM está disponível
-    if not is_ollama_available():
-        return Response(
-            {"error": "LLM não está disponível. Verifique a configuração."},
-            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+    # Mesmos dados do mês: devolve a análise guardada sem chamar o LLM (nem
+    # consumir o rate limit ou enfileirar tarefa)
+    refresh = _wants_refresh(request)
+    period = f"{month_date:%Y-%m}"
+    fingerprint = analysis_fingerprint(overview)
+    if not refresh:
+        stored = await aget_analysis(
+            request.user, AIUsageLog.Feature.INSIGHTS, period, fingerprint
         )
+        if stored is not None:
+            return await ano_llm_response(stored, request.user, cached=True)
 
-    # Busca dados do mês
-    transactions = Transaction.objects.filter(
-        user=request.user,
-        date__year=year,
-        date__month=month_num,
-        is_confirmed=True,
-    )
-
-    income = (
-        transactions.filter(
-            transaction_type=Transaction.TransactionType.INCOME
-        ).aggregate(total=Sum("amount"))["total"]
-        or 0
-    )
+    if _wants_job(request):
+        return await job_accepted_response(
+            request, AIUsageLog.Feature.INSIGHTS, {"month": month, "refresh": refresh}
+        )
 
-    expenses = (
-        transactions.filter(
-            transaction_type=Transaction.TransactionType.EXPENSE
-        ).aggregate(total=Sum("amount"))["total"]
-        or 0
+    # Rate limiting
+    is_allowed, remaining = await areserve_rate_limit(
+        request.user, AIUsageLog.Feature.INSIGHTS
     )
+    if not is_allowed:
+        return rate_limited_response(AIUsageLog.Feature.INSIGHTS)
 
-    balance = float(income) - float(expenses)
-
-    # Top categorias de gasto
-    top_categories = list(
-        transactions.filter(transaction_type=Transaction.TransactionType.EXPENSE)
-        .values("category__name")
-        .annotate(total=Sum("amount"))
-        .order_by("-total")[:5]
-    )
+    # Verifica se LLM está disponível
+    if not await llm_available():
+        await arelease_rate_limit(request.user, AIUsageLog.Feature.INSIGHTS)
+        return llm_unavailable_response()
 
     # Se não há transações, retorna dados básicos sem chamar IA
-    if not transactions.exists():
-        return Response(
-            {
-                "month": month,
-                "summary": "Nenhuma transação registrada neste mês.",
-                "total_income": 0,
-                "total_expenses": 0,
-                "balance": 0,
-                "top_expenses": [],
-                "recommendations": ["Comece registrando suas transações para obter insights personalizados."],
-                "usage": {"tokens_used": 0, "requests_remaining": remaining},
-            }
+    if not overview["transaction_count"]:
+        await arelease_rate_limit(request.user, AIUsageLog.Feature.INSIGHTS)
+        return rate_limit_headers(
+            Response(
+                {
+                    **_empty_insights(month),
+                    "usage": {"tokens_used": 0, "requests_remaining": remaining + 1},
+                }
+            ),
+            remaining + 1,
+            AIUsageLog.Feature.INSIGHTS,
         )
 
     try:
         # Chama serviço de IA
-        insights_data, usage_info = generate_monthly_insights(
+        insights_data, usage_info = await agenerate_monthly_insights(
             month=month,
-            income=float(income),
-            expenses=float(expenses),
-            balance=balance,
-            top_categories=top_categories,
+            income=overview["income"],
+            expenses=overview["expenses"],
+            balance=overview["balance"],
+            top_categories=overview["top_categories"],
         )
 
         # Log de uso
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.INSIGHTS,
             input_text=f"Insights {month}",
             usage_info=usage_info,
+            reserved=True,
         )
 
-        return Response(
-            {
-                "month": month,
-                "summary": insights_data.summary,
-                "total_income": float(income),
-                "total_expenses": float(expenses),
-                "balance": balance,
-                "top_expenses": [
-                    {"category": cat.get("category__name") or "Sem categoria", "total": float(cat.get("total", 0))}
-                    for cat in top_categories
-                ],
-                "recommendations": insights_data.recommendations,
-                "usage": {
-                    "tokens_used": usage_info.get("total_tokens", 0),
-                    "requests_remaining": remaining - 1,
-                },
-            }
+        data = _insights_data(month, overview, insights_data)
+        await asave_analysis(
+            request.user,
+            AIUsageLog.Feature.INSIGHTS,
+            period,
+            fingerprint,
+            data,
+            usage_info.get("total_tokens", 0),
+        )
+
+        return rate_limit_headers(
+            Response(
+                {
+                    **data,
+                    "usage": {
+                        "tokens_used": usage_info.get("total_tokens", 0),
+                        "requests_remaining": remaining,
+                    },
+                }
+            ),
+            remaining,
+            AIUsageLog.Feature.INSIGHTS,
         )
 
     except ValueError as e:
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.INSIGHTS,
             input_text=f"Insights {month}",
             usage_info={"model": get_llm_model()},
             success=False,
             error_message=str(e),
+            reserved=True,
         )
         return Response(
             {"error": str(e)},
@@ -427,13 +729,14 @@ def insights(request):
         )
     except Exception as e:
         logger.exception("Erro no insights")
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.INSIGHTS,
             input_text=f"Insights {month}",
             usage_info={"model": get_llm_model()},
             success=False,
             error_message=str(e),
+            reserved=True,
         )
         return Response(
             {"error": "Erro interno ao gerar insights"},
@@ -441,9 +744,29 @@ def insights(request):
         )
 
 
-@api_view(["POST"])
+async def _category_suggestion(categories_qs, name: str | None) -> dict:
+    category = await categories_qs.filter(name__iexact=name).afirst() if name else None
+    return {"id": category.id if category else None, "name": name}
+
+
+def _categorize_choices(user, category_type):
+    """Categorias do usuário (filtradas pelo tipo) e os nomes enviados ao LLM."""
+    categories_qs = Category.objects.filter(user=user)
+    if category_type in [Category.CategoryType.INCOME, Category.CategoryType.EXPENSE]:
+        categories_qs = categories_qs.filter(category_type=category_type)
+
+    category_names = list(categories_qs.values_list("name", flat=True))
+    if not category_names:
+        if category_type == Category.CategoryType.INCOME:
+            category_names = get_default_income_category_names()
+        else:
+            category_names = get_default_expense_category_names()
+    return categories_qs, category_names
+
+
+@async_api_view(["POST"])
 @permission_classes([IsAuthenticated])
-def categorize(request):
+async def categorize(request):
     """
     Sugere categoria para um texto de transação.
 
@@ -461,75 +784,96 @@ def categorize(request):
 
     if len(text) > settings.AI_MAX_INPUT_CHARS:
         return Response(
-            {"error": f"Texto muito longo. Máximo: {settings.AI_MAX_INPUT_CHARS} caracteres"},
+            {
+                "error": f"Texto muito longo. Máximo: {settings.AI_MAX_INPUT_CHARS} caracteres"
+            },
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    is_allowed, remaining = check_rate_limit(request.user)
-    if not is_allowed:
-        return Response(
+    categories_qs, category_names = await sync_to_async(_categorize_choices)(
+        request.user, category_type
+    )
+
+    # Modelo local treinado com o histórico do usuário dispensa o LLM
+    local_type = (
+        category_type if category_type in Category.CategoryType.values else None
+    )
+    local_id, local_confidence = await sync_to_async(suggest_category)(
+        request.user, text, local_type
+    )
+    if local_id is not None:
+        category = await categories_qs.filter(pk=local_id).afirst()
+        if category is not None:
+            return await ano_llm_response(
+                {
+                    "suggestion": {"id": category.id, "name": category.name},
+                    "confidence": round(local_confidence, 3),
+                },
+                request.user,
+                local=True,
+            )
+
+    cache_key = response_cache_key(get_llm_model(), "categorize", text, category_names)
+    cached = await response_cache.aget(cache_key)
+    if cached is not None:
+        return await ano_llm_response(
             {
-                "error": "Limite de requisições atingido. Tente novamente em 1 hora.",
-                "rate_limit": settings.AI_RATE_LIMIT_PER_HOUR,
-                "remaining": 0,
+                "suggestion": await _category_suggestion(categories_qs, cached["name"]),
+                "confidence": cached["confidence"],
             },
-            status=status.HTTP_429_TOO_MANY_REQUESTS,
-        )
-
-    if not is_ollama_available():
-        return Response(
-            {"error": "LLM não está disponível. Verifique a configuração."},
-            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            request.user,
+            cached=True,
         )
 
-    categories_qs = Category.objects.filter(user=request.user)
-    if category_type in [Category.CategoryType.INCOME, Category.CategoryType.EXPENSE]:
-        categories_qs = categories_qs.filter(category_type=category_type)
+    is_allowed, remaining = await areserve_rate_limit(
+        request.user, AIUsageLog.Feature.CATEGORIZE
+    )
+    if not is_allowed:
+        return rate_limited_response(AIUsageLog.Feature.CATEGORIZE)
 
-    category_names = list(categories_qs.values_list("name", flat=True))
-    if not category_names:
-        if category_type == Category.CategoryType.INCOME:
-            category_names = get_default_income_category_names()
-        else:
-            category_names = get_default_expense_category_names()
+    if not await llm_available():
+        await arelease_rate_limit(request.user, AIUsageLog.Feature.CATEGORIZE)
+        return llm_unavailable_response()
 
     try:
-        suggestion, confidence, usage_info = categorize_transaction_text(
+        suggestion, confidence, usage_info = await acategorize_transaction_text(
             text, category_names
         )
+        await response_cache.aset(
+            cache_key, {"name": suggestion, "confidence": confidence}
+        )
 
-        category_obj = None
-        if suggestion:
-            category_obj = categories_qs.filter(name__iexact=suggestion).first()
-
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.CATEGORIZE,
             input_text=text,
             usage_info=usage_info,
+            reserved=True,
         )
 
-        return Response(
-            {
-                "suggestion": {
-                    "id": category_obj.id if category_obj else None,
-                    "name": suggestion,
-                },
-                "confidence": confidence,
-                "usage": {
-                    "tokens_used": usage_info.get("total_tokens", 0),
-                    "requests_remaining": remaining - 1,
-                },
-            }
+        return rate_limit_headers(
+            Response(
+                {
+                    "suggestion": await _category_suggestion(categories_qs, suggestion),
+                    "confidence": confidence,
+                    "usage": {
+                        "tokens_used": usage_info.get("total_tokens", 0),
+                        "requests_remaining": remaining,
+                    },
+                }
+            ),
+            remaining,
+            AIUsageLog.Feature.CATEGORIZE,
         )
     except ValueError as e:
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.CATEGORIZE,
             input_text=text,
             usage_info={"model": get_llm_model()},
             success=False,
             error_message=str(e),
+            reserved=True,
         )
         return Response(
             {"error": str(e)},
@@ -537,13 +881,14 @@ def categorize(request):
         )
     except Exception as e:
         logger.exception("Erro no categorize")
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.CATEGORIZE,
             input_text=text,
             usage_info={"model": get_llm_model()},
             success=False,
             error_message=str(e),
+            reserved=True,
         )
         return Response(
             {"error": "Erro interno ao sugerir categoria"},
@@ -553,127 +898,353 @@ def categorize(request):
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
-def forecast(request):
+def categorize_batch(request):
     """
-    Gera previsão de fluxo de caixa baseada nos últimos meses.
+    Sugere categorias para vários textos.
+
+    Cada item é resolvido pelo modelo local, pelo cache ou pelo LLM, que
+    recebe os pendentes em lotes de ``AI_CATEGORIZE_BATCH_SIZE`` (uma chamada,
+    um prompt e um registro de uso por lote).
 
     Input:
-        {"months": 3}
+        {"texts": ["uber 23,50", "mercado 150"], "category_type": "EXPENSE"}
+
+    Output:
+        {
+            "results": [
+                {"index": 0, "suggestion": {"id": 3, "name": "Uber e 99"},
+                 "confidence": 0.92, "source": "llm"},
+                ...
+            ],
+            "usage": {"tokens_used": 310, "llm_calls": 1, "requests_remaining": 28}
+        }
     """
-    months = request.data.get("months", 3)
-    try:
-        months = int(months)
-        if months <= 0:
-            raise ValueError
-    except (TypeError, ValueError):
+    texts = request.data.get("texts")
+    category_type = request.data.get("category_type")
+
+    if not isinstance(texts, list) or not texts:
         return Response(
-            {"error": "O campo 'months' deve ser um inteiro positivo."},
+            {"error": "O campo 'texts' deve ser uma lista não vazia"},
             status=status.HTTP_400_BAD_REQUEST,
         )
-
-    is_allowed, remaining = check_rate_limit(request.user)
-    if not is_allowed:
+    if len(texts) > settings.AI_CATEGORIZE_BATCH_MAX:
         return Response(
             {
-                "error": "Limite de requisições atingido. Tente novamente em 1 hora.",
-                "rate_limit": settings.AI_RATE_LIMIT_PER_HOUR,
-                "remaining": 0,
+                "error": f"Máximo de {settings.AI_CATEGORIZE_BATCH_MAX} textos por requisição"
             },
-            status=status.HTTP_429_TOO_MANY_REQUESTS,
+            status=status.HTTP_400_BAD_REQUEST,
         )
+    texts = [text.strip() if isinstance(text, str) else "" for text in texts]
+    for index, text in enumerate(texts):
+        if not text:
+            return Response(
+                {"error": f"Texto vazio ou inválido no índice {index}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(text) > settings.AI_MAX_INPUT_CHARS:
+            return Response(
+                {
+                    "error": f"Texto muito longo no índice {index}. "
+                    f"Máximo: {settings.AI_MAX_INPUT_CHARS} caracteres"
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-    if not is_ollama_available():
-        return Response(
-            {"error": "LLM não está disponível. Verifique a configuração."},
-            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+    categories_qs, category_names = _categorize_choices(request.user, category_type)
+    names_by_id = dict(categories_qs.values_list("id", "name"))
+    category_ids = {
+        name.lower(): category_id for category_id, name in names_by_id.items()
+    }
+    local_type = (
+        category_type if category_type in Category.CategoryType.values else None
+    )
+    model = get_llm_model()
+
+    def result(index, name, confidence, source):
+        return {
+            "index": index,
+            "suggestion": {
+                "id": category_ids.get(name.lower()) if name else None,
+                "name": name,
+            },
+            "confidence": confidence,
+            "source": source,
+        }
+
+    results = [None] * len(texts)
+    pending: dict[str, list[int]] = {}  # texto normalizado -> índices
+    local = suggest_categories(request.user, texts, local_type)
+    for index, (text, (local_id, local_confidence)) in enumerate(zip(texts, local)):
+        if local_id in names_by_id:
+            results[index] = result(
+                index, names_by_id[local_id], round(local_confidence, 3), "local"
+            )
+            continue
+        cached = response_cache.get(
+            response_cache_key(model, "categorize", text, category_names)
         )
+        if cached is not None:
+            results[index] = result(
+                index, cached["name"], cached["confidence"], "cache"
+            )
+            continue
+        pending.setdefault(normalize_text(text), []).append(index)
+
+    tokens_used = llm_calls = 0
+    if pending:
+        # Cada lote reserva sua requisição antes de chamar o LLM
+        is_allowed, remaining = reserve_rate_limit(
+            request.user, AIUsageLog.Feature.CATEGORIZE
+        )
+        if not is_allowed:
+            return rate_limited_response(AIUsageLog.Feature.CATEGORIZE)
+        if not is_ollama_available():
+            release_rate_limit(request.user, AIUsageLog.Feature.CATEGORIZE)
+            return llm_unavailable_response()
+    else:
+        _, remaining = check_rate_limit(request.user, AIUsageLog.Feature.CATEGORIZE)
+
+    groups = list(pending.values())
+    size = settings.AI_CATEGORIZE_BATCH_SIZE
+    for start in range(0, len(groups), size):
+        chunk = groups[start : start + size]
+        chunk_texts = [texts[indexes[0]] for indexes in chunk]
+        if start and is_allowed:
+            # Tokens dos lotes anteriores já contam (limites de tokens)
+            is_allowed, remaining = reserve_rate_limit(
+                request.user, AIUsageLog.Feature.CATEGORIZE
+            )
+        if not is_allowed:
+            # Sem saldo (requisições ou tokens): os lotes restantes não são enviados
+            for indexes in chunk:
+                for index in indexes:
+                    results[index] = result(index, None, 0.0, "skipped")
+            continue
+
+        input_text = "\n".join(chunk_texts)
+        try:
+            suggestions, usage_info = categorize_transaction_texts(
+                chunk_texts, category_names
+            )
+        except ValueError as e:
+            error = str(e)
+        except Exception as e:
+            logger.exception("Erro no categorize em lote")
+            error = str(e)
+        else:
+            error = None
 
-    today = timezone.localdate()
-    history = []
-    for offset in range(months):
-        month_date = _add_months(today.replace(day=1), -offset)
-        year = month_date.year
-        month_num = month_date.month
+        if error is not None:
+            log_ai_usage(
+                user=request.user,
+                feature=AIUsageLog.Feature.CATEGORIZE,
+                input_text=input_text,
+                usage_info={"model": model},
+                success=False,
+                error_message=error,
+                reserved=True,
+            )
+            for indexes in chunk:
+                for index in indexes:
+                    results[index] = result(index, None, 0.0, "error")
+            continue
 
-        transactions = Transaction.objects.filter(
+        log_ai_usage(
             user=request.user,
-            date__year=year,
-            date__month=month_num,
-            is_confirmed=True,
-        )
-        income = (
-            transactions.filter(transaction_type=Transaction.TransactionType.INCOME)
-            .aggregate(total=Sum("amount"))["total"]
-            or 0
-        )
-        expenses = (
-            transactions.filter(transaction_type=Transaction.TransactionType.EXPENSE)
-            .aggregate(total=Sum("amount"))["total"]
-            or 0
-        )
+            feature=AIUsageLog.Feature.CATEGORIZE,
+            input_text=input_text,
+            usage_info=usage_info,
+            reserved=True,
+        )
+        llm_calls += 1
+        tokens_used += usage_info.get("total_tokens", 0)
+        for indexes, text, (name, confidence) in zip(chunk, chunk_texts, suggestions):
+            if name is not None:
+                response_cache.set(
+                    response_cache_key(model, "categorize", text, category_names),
+                    {"name": name, "confidence": confidence},
+                )
+            for index in indexes:
+                results[index] = result(index, name, confidence, "llm")
+
+    return rate_limit_headers(
+        Response(
+            {
+                "results": results,
+                "usage": {
+                    "tokens_used": tokens_used,
+                    "llm_calls": llm_calls,
+                    "requests_remaining": remaining,
+                },
+            }
+        ),
+        remaining,
+        AIUsageLog.Feature.CATEGORIZE,
+    )
+
+
+def _cashflow_history(user, months: int) -> list[dict]:
+    """Receitas, despesas e saldo dos últimos ``months`` meses (mais antigo primeiro)."""
+    current_month = timezone.localdate().replace(day=1)
+    totals_by_month = get_months_history(
+        user, add_months(current_month, -(months - 1)), current_month
+    )
+    history = []
+    for offset in range(months):
+        month_date = add_months(current_month, -offset)
+        totals = totals_by_month.get(month_date, {})
+        income = totals.get("income", 0)
+        expenses = totals.get("expenses", 0)
 
         history.append(
             {
-                "month": f"{year}-{month_num:02d}",
+                "month": f"{month_date.year}-{month_date.month:02d}",
                 "income": float(income),
                 "expenses": float(expenses),
                 "balance": float(income) - float(expenses),
             }
         )
 
-    history = list(reversed(history))
+    return list(reversed(history))
+
+
+def _has_history(history: list[dict]) -> bool:
+    return any(item["income"] or item["expenses"] for item in history)
 
-    if not any(item["income"] or item["expenses"] for item in history):
+
+def _empty_forecast(history: list[dict]) -> dict:
+    return {
+        "history": history,
+        "forecast": {
+            "summary": "Sem histórico suficiente para previsão.",
+            "forecast_income": 0,
+            "forecast_expenses": 0,
+            "forecast_balance": 0,
+            "recommendations": [
+                "Registre mais transações para liberar previsões personalizadas."
+            ],
+        },
+    }
+
+
+def _forecast_data(history: list[dict], forecast_data) -> dict:
+    return {
+        "history": history,
+        "forecast": {
+            "summary": forecast_data.summary,
+            "forecast_income": forecast_data.forecast_income,
+            "forecast_expenses": forecast_data.forecast_expenses,
+            "forecast_balance": forecast_data.forecast_balance,
+            "recommendations": forecast_data.recommendations,
+        },
+    }
+
+
+@async_api_view(["POST"])
+@permission_classes([IsAuthenticated])
+async def forecast(request):
+    """
+    Gera previsão de fluxo de caixa baseada nos últimos meses.
+
+    Com ``?async=1`` responde 202 com ``job_id`` (resultado em ``/jobs/<id>/``).
+
+    Input:
+        {"months": 3}
+    """
+    months = request.data.get("months", 3)
+    try:
+        months = int(months)
+        if months <= 0:
+            raise ValueError
+    except (TypeError, ValueError):
         return Response(
-            {
-                "history": history,
-                "forecast": {
-                    "summary": "Sem histórico suficiente para previsão.",
-                    "forecast_income": 0,
-                    "forecast_expenses": 0,
-                    "forecast_balance": 0,
-                    "recommendations": [
-                        "Registre mais transações para liberar previsões personalizadas."
-                    ],
-                },
-                "usage": {"tokens_used": 0, "requests_remaining": remaining},
-            }
+            {"error": "O campo 'months' deve ser um inteiro positivo."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    history = await sync_to_async(_cashflow_history)(request.user, months)
+
+    refresh = _wants_refresh(request)
+    period = f"{months}m"
+    fingerprint = analysis_fingerprint(history)
+    if not refresh:
+        stored = await aget_analysis(
+            request.user, AIUsageLog.Feature.FORECAST, period, fingerprint
+        )
+        if stored is not None:
+            return await ano_llm_response(stored, request.user, cached=True)
+
+    if _wants_job(request):
+        return await job_accepted_response(
+            request, AIUsageLog.Feature.FORECAST, {"months": months, "refresh": refresh}
+        )
+
+    is_allowed, remaining = await areserve_rate_limit(
+        request.user, AIUsageLog.Feature.FORECAST
+    )
+    if not is_allowed:
+        return rate_limited_response(AIUsageLog.Feature.FORECAST)
+
+    if not await llm_available():
+        await arelease_rate_limit(request.user, AIUsageLog.Feature.FORECAST)
+        return llm_unavailable_response()
+
+    if not _has_history(history):
+        await arelease_rate_limit(request.user, AIUsageLog.Feature.FORECAST)
+        return rate_limit_headers(
+            Response(
+                {
+                    **_empty_forecast(history),
+                    "usage": {"tokens_used": 0, "requests_remaining": remaining + 1},
+                }
+            ),
+            remaining + 1,
+            AIUsageLog.Feature.FORECAST,
         )
 
     try:
-        forecast_data, usage_info = generate_cashflow_forecast(history)
+        forecast_data, usage_info = await agenerate_cashflow_forecast(history)
 
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.FORECAST,
             input_text=f"Forecast últimos {months} meses",
             usage_info=usage_info,
+            reserved=True,
         )
 
-        return Response(
-            {
-                "history": history,
-                "forecast": {
-                    "summary": forecast_data.summary,
-                    "forecast_income": forecast_data.forecast_income,
-                    "forecast_expenses": forecast_data.forecast_expenses,
-                    "forecast_balance": forecast_data.forecast_balance,
-                    "recommendations": forecast_data.recommendations,
-                },
-                "usage": {
-                    "tokens_used": usage_info.get("total_tokens", 0),
-                    "requests_remaining": remaining - 1,
-                },
-            }
+        data = _forecast_data(history, forecast_data)
+        await asave_analysis(
+            request.user,
+            AIUsageLog.Feature.FORECAST,
+            period,
+            fingerprint,
+            data,
+            usage_info.get("total_tokens", 0),
+        )
+
+        return rate_limit_headers(
+            Response(
+                {
+                    **data,
+                    "usage": {
+                        "tokens_used": usage_info.get("total_tokens", 0),
+                        "requests_remaining": remaining,
+                    },
+                }
+            ),
+            remaining,
+            AIUsageLog.Feature.FORECAST,
         )
     except ValueError as e:
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.FORECAST,
             input_text=f"Forecast últimos {months} meses",
             usage_info={"model": get_llm_model()},
             success=False,
             error_message=str(e),
+            reserved=True,
         )
         return Response(
             {"error": str(e)},
@@ -681,13 +1252,14 @@ def forecast(request):
         )
     except Exception as e:
         logger.exception("Erro no forecast")
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.FORECAST,
             input_text=f"Forecast últimos {months} meses",
             usage_info={"model": get_llm_model()},
             success=False,
             error_message=str(e),
+            reserved=True,
         )
         return Response(
             {"error": "Erro interno ao gerar previsão"},
@@ -695,113 +1267,123 @@ def forecast(request):
         )
 
 
-@api_view(["POST"])
+def _empty_budget_check() -> dict:
+    return {
+        "summary": "Nenhum orçamento ativo cadastrado.",
+        "alerts": [],
+        "recommendations": [
+            "Crie orçamentos para receber recomendações personalizadas."
+        ],
+        "budgets": [],
+    }
+
+
+def _budget_check_data(status_list: list[dict], budget_data) -> dict:
+    return {
+        "summary": budget_data.summary,
+        "alerts": budget_data.alerts,
+        "recommendations": budget_data.recommendations,
+        "budgets": status_list,
+    }
+
+
+@async_api_view(["POST"])
 @permission_classes([IsAuthenticated])
-def budget_check(request):
+async def budget_check(request):
     """
     Analisa orçamentos e gera recomendações.
+
+    Com ``?async=1`` responde 202 com ``job_id`` (resultado em ``/jobs/<id>/``).
     """
-    is_allowed, remaining = check_rate_limit(request.user)
-    if not is_allowed:
-        return Response(
-            {
-                "error": "Limite de requisições atingido. Tente novamente em 1 hora.",
-                "rate_limit": settings.AI_RATE_LIMIT_PER_HOUR,
-                "remaining": 0,
-            },
-            status=status.HTTP_429_TOO_MANY_REQUESTS,
+    today = timezone.localdate()
+    budgets = [budget async for budget in active_budgets(request.user, today)]
+    status_list = (
+        await sync_to_async(evaluate_budgets)(request.user, budgets, today)
+        if budgets
+        else []
+    )
+
+    refresh = _wants_refresh(request)
+    period = f"{today:%Y-%m}"
+    fingerprint = analysis_fingerprint(status_list)
+    if budgets and not refresh:
+        stored = await aget_analysis(
+            request.user, AIUsageLog.Feature.BUDGET_CHECK, period, fingerprint
         )
+        if stored is not None:
+            return await ano_llm_response(stored, request.user, cached=True)
 
-    if not is_ollama_available():
-        return Response(
-            {"error": "LLM não está disponível. Verifique a configuração."},
-            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+    if _wants_job(request):
+        return await job_accepted_response(
+            request, AIUsageLog.Feature.BUDGET_CHECK, {"refresh": refresh}
         )
 
-    today = timezone.localdate()
-    budgets = (
-        Budget.objects.filter(user=request.user, is_active=True)
-        .filter(Q(end_date__isnull=True) | Q(end_date__gte=today))
-        .select_related("category")
+    is_allowed, remaining = await areserve_rate_limit(
+        request.user, AIUsageLog.Feature.BUDGET_CHECK
     )
+    if not is_allowed:
+        return rate_limited_response(AIUsageLog.Feature.BUDGET_CHECK)
 
-    if not budgets.exists():
-        return Response(
-            {
-                "summary": "Nenhum orçamento ativo cadastrado.",
-                "alerts": [],
-                "recommendations": [
-                    "Crie orçamentos para receber recomendações personalizadas."
-                ],
-                "budgets": [],
-                "usage": {"tokens_used": 0, "requests_remaining": remaining},
-            }
-        )
+    if not await llm_available():
+        await arelease_rate_limit(request.user, AIUsageLog.Feature.BUDGET_CHECK)
+        return llm_unavailable_response()
 
-    status_list = []
-    for budget in budgets:
-        period_start, period_end = _get_budget_period_range(
-            budget.start_date, budget.period_type, today
-        )
-        spent = (
-            Transaction.objects.filter(
-                user=request.user,
-                transaction_type=Transaction.TransactionType.EXPENSE,
-                category=budget.category,
-                date__gte=period_start,
-                date__lte=period_end,
-                is_confirmed=True,
-            ).aggregate(total=Sum("amount"))["total"]
-            or 0
-        )
-        percentage = float((spent / budget.amount) * 100) if budget.amount else 0.0
-        status_list.append(
-            {
-                "id": budget.id,
-                "category": budget.category_id,
-                "category_name": budget.category.name,
-                "amount": float(budget.amount),
-                "spent": float(spent),
-                "remaining": float(budget.amount - spent),
-                "percentage_used": round(percentage, 2),
-                "alert_threshold": budget.alert_threshold,
-                "alert_reached": percentage >= budget.alert_threshold,
-                "period_type": budget.period_type,
-                "period_start": period_start.isoformat(),
-                "period_end": period_end.isoformat(),
-            }
+    if not budgets:
+        await arelease_rate_limit(request.user, AIUsageLog.Feature.BUDGET_CHECK)
+        return rate_limit_headers(
+            Response(
+                {
+                    **_empty_budget_check(),
+                    "usage": {"tokens_used": 0, "requests_remaining": remaining + 1},
+                }
+            ),
+            remaining + 1,
+            AIUsageLog.Feature.BUDGET_CHECK,
         )
 
     try:
-        budget_data, usage_info = generate_budget_check(status_list)
+        budget_data, usage_info = await agenerate_budget_check(status_list)
 
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.BUDGET_CHECK,
             input_text="Budget check",
             usage_info=usage_info,
+            reserved=True,
         )
 
-        return Response(
-            {
-                "summary": budget_data.summary,
-                "alerts": budget_data.alerts,
-                "recommendations": budget_data.recommendations,
-                "budgets": status_list,
-                "usage": {
-                    "tokens_used": usage_info.get("total_tokens", 0),
-                    "requests_remaining": remaining - 1,
-                },
-            }
+        data = _budget_check_data(status_list, budget_data)
+        await asave_analysis(
+            request.user,
+            AIUsageLog.Feature.BUDGET_CHECK,
+            period,
+            fingerprint,
+            data,
+            usage_info.get("total_tokens", 0),
+        )
+
+        return rate_limit_headers(
+            Response(
+                {
+                    **data,
+                    "usage": {
+                        "tokens_used": usage_info.get("total_tokens", 0),
+                        "requests_remaining": remaining,
+                    },
+                }
+            ),
+            remaining,
+            AIUsageLog.Feature.BUDGET_CHECK,
         )
     except ValueError as e:
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.BUDGET_CHECK,
             input_text="Budget check",
             usage_info={"model": get_llm_model()},
             success=False,
             error_message=str(e),
+            reserved=True,
         )
         return Response(
             {"error": str(e)},
@@ -809,13 +1391,14 @@ def budget_check(request):
         )
     except Exception as e:
         logger.exception("Erro no budget_check")
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.BUDGET_CHECK,
             input_text="Budget check",
             usage_info={"model": get_llm_model()},
             success=False,
             error_message=str(e),
+            reserved=True,
         )
         return Response(
             {"error": "Erro interno ao analisar orçamentos"},
@@ -823,121 +1406,442 @@ def budget_check(request):
         )
 
 
-@api_view(["POST"])
+# Tarefas em segundo plano (``apps.ai.jobs``): mesmas respostas das views,
+# geradas pelo worker com os serviços síncronos. Falhas são registradas no
+# log de uso e propagadas para a fila tentar de novo. A requisição foi
+# reservada no rate limit ao enfileirar: aqui só os tokens são contados.
+
+
+def _job_analysis(
+    user, payload: dict, feature: str, period: str, inputs, input_text, generate, build
+):
+    """
+    Análise guardada para as mesmas entradas (salvo ``refresh``) ou nova
+    chamada ao LLM, registrada no log de uso e guardada.
+    """
+    fingerprint = analysis_fingerprint(inputs)
+    if not payload.get("refresh"):
+        stored = get_analysis(user, feature, period, fingerprint)
+        if stored is not None:
+            return {**stored, "usage": {"tokens_used": 0, "cached": True}}
+
+    try:
+        result, usage_info = generate()
+    except Exception as e:
+        log_ai_usage(
+            user=user,
+            feature=feature,
+            input_text=input_text,
+            usage_info={"model": get_llm_model()},
+            success=False,
+            error_message=str(e),
+            reserved=True,
+        )
+        raise
+    log_ai_usage(
+        user=user,
+        feature=feature,
+        input_text=input_text,
+        usage_info=usage_info,
+        reserved=True,
+    )
+
+    tokens_used = usage_info.get("total_tokens", 0)
+    data = build(result)
+    save_analysis(user, feature, period, fingerprint, data, tokens_used)
+    return {**data, "usage": {"tokens_used": tokens_used}}
+
+
+def run_insights_job(user, payload: dict) -> dict:
+    month = payload["month"]
+    month_date = parse_month(month)
+    overview = _month_overview(user, month_date)
+    if not overview["transaction_count"]:
+        return {**_empty_insights(month), "usage": {"tokens_used": 0}}
+
+    return _job_analysis(
+        user,
+        payload,
+        AIUsageLog.Feature.INSIGHTS,
+        f"{month_date:%Y-%m}",
+        overview,
+        f"Insights {month}",
+        lambda: generate_monthly_insights(
+            month=month,
+            income=overview["income"],
+            expenses=overview["expenses"],
+            balance=overview["balance"],
+            top_categories=overview["top_categories"],
+        ),
+        lambda insights_data: _insights_data(month, overview, insights_data),
+    )
+
+
+def run_forecast_job(user, payload: dict) -> dict:
+    months = payload["months"]
+    history = _cashflow_history(user, months)
+    if not _has_history(history):
+        return {**_empty_forecast(history), "usage": {"tokens_used": 0}}
+
+    return _job_analysis(
+        user,
+        payload,
+        AIUsageLog.Feature.FORECAST,
+        f"{months}m",
+        history,
+        f"Forecast últimos {months} meses",
+        lambda: generate_cashflow_forecast(history),
+        lambda forecast_data: _forecast_data(history, forecast_data),
+    )
+
+
+def run_budget_check_job(user, payload: dict) -> dict:
+    today = timezone.localdate()
+    budgets = list(active_budgets(user, today))
+    if not budgets:
+        return {**_empty_budget_check(), "usage": {"tokens_used": 0}}
+
+    status_list = evaluate_budgets(user, budgets, today)
+    return _job_analysis(
+        user,
+        payload,
+        AIUsageLog.Feature.BUDGET_CHECK,
+        f"{today:%Y-%m}",
+        status_list,
+        "Budget check",
+        lambda: generate_budget_check(status_list),
+        lambda budget_data: _budget_check_data(status_list, budget_data),
+    )
+
+
+@api_view(["GET"])
 @permission_classes([IsAuthenticated])
-def chat(request):
+def job_detail(request, job_id: int):
     """
-    Chat financeiro com contexto do usuário.
+    Status de uma tarefa em segundo plano.
 
-    Input:
-        {"message": "...", "conversation_id": 1}
+    Output:
+        {"id": 1, "feature": "insights", "status": "done", "attempts": 1,
+         "result": {...}, "error": "", "created_at": "...", "finished_at": "..."}
+
+    ``result`` tem o mesmo formato da resposta síncrona do endpoint; ``error``
+    só é preenchido quando a tarefa falhou em todas as tentativas.
     """
+    job = AIJob.objects.filter(user=request.user, id=job_id).first()
+    if not job:
+        return Response(
+            {"error": "Tarefa não encontrada."},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    return Response(
+        {
+            "id": job.id,
+            "feature": job.feature,
+            "status": job.status,
+            "attempts": job.attempts,
+            "result": job.result,
+            "error": job.error_message if job.status == AIJob.Status.FAILED else "",
+            "created_at": job.created_at,
+            "finished_at": job.finished_at,
+        }
+    )
+
+
+def _chat_message(request):
+    """Valida a mensagem do chat. Retorna ``(resposta de erro, mensagem)``."""
     message = request.data.get("message", "").strip()
-    conversation_id = request.data.get("conversation_id")
 
     if not message:
-        return Response(
-            {"error": "O campo 'message' é obrigatório"},
-            status=status.HTTP_400_BAD_REQUEST,
+        return (
+            Response(
+                {"error": "O campo 'message' é obrigatório"},
+                status=status.HTTP_400_BAD_REQUEST,
+            ),
+            None,
         )
 
     if len(message) > settings.AI_MAX_INPUT_CHARS:
-        return Response(
-            {"error": f"Texto muito longo. Máximo: {settings.AI_MAX_INPUT_CHARS} caracteres"},
-            status=status.HTTP_400_BAD_REQUEST,
+        return (
+            Response(
+                {
+                    "error": f"Texto muito longo. Máximo: {settings.AI_MAX_INPUT_CHARS} caracteres"
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            ),
+            None,
         )
 
-    # Rate limiting
-    is_allowed, remaining = check_rate_limit(request.user)
-    if not is_allowed:
-        return Response(
-            {
-                "error": "Limite de requisições atingido. Tente novamente em 1 hora.",
-                "rate_limit": settings.AI_RATE_LIMIT_PER_HOUR,
-                "remaining": 0,
-            },
-            status=status.HTTP_429_TOO_MANY_REQUESTS,
-        )
+    return None, message
 
-    # Verifica se IA está disponível
-    if not is_ollama_available():
-        return Response(
-            {"error": "LLM não está disponível. Verifique a configuração."},
-            status=status.HTTP_503_SERVICE_UNAVAILABLE,
-        )
+
+def _conversation_not_found() -> Response:
+    return Response(
+        {"error": "Conversa não encontrada."},
+        status=status.HTTP_404_NOT_FOUND,
+    )
+
+
+# Mensagens ainda não resumidas lidas por mensagem do chat (as mais recentes)
+# e tamanho máximo de cada trecho enviado ao resumo
+CHAT_HISTORY_SCAN_LIMIT = 50
+
+
+def _unsummarized_messages(conversation):
+    return conversation.messages.filter(
+        id__gt=conversation.summary_until or 0
+    ).order_by("-id")[:CHAT_HISTORY_SCAN_LIMIT]
+
+
+def _split_chat_history(conversation, recent):
+    """
+    ``(janela, transbordo)`` das mensagens lidas e, se a leitura bateu no
+    limite (conversa antiga ou resumos que falharam), a consulta das mensagens
+    mais antigas ainda não resumidas. Elas entram no resumo em ordem
+    cronológica, um trecho por mensagem do chat, antes do transbordo recente:
+    nada é descartado sem passar pelo resumo.
+    """
+    window, overflow = split_history(recent, window_budget(), window_low_water())
+    if len(recent) < CHAT_HISTORY_SCAN_LIMIT:
+        return window, overflow, None
+    window_start = window[0].id if window else recent[0].id + 1
+    backlog = conversation.messages.filter(
+        id__gt=conversation.summary_until or 0, id__lt=window_start
+    ).order_by("id")[:CHAT_HISTORY_SCAN_LIMIT]
+    return window, overflow, backlog
+
+
+def _summary_input(conversation) -> str:
+    return f"Resumo da conversa {conversation.id}"
+
+
+def _apply_summary(conversation, summary: str, overflow) -> list[str]:
+    conversation.summary = summary
+    conversation.summary_until = overflow[-1].id
+    return ["summary", "summary_until"]
+
+
+async def _achat_history(user, conversation, remaining: int) -> tuple[list[dict], int]:
+    """
+    Histórico dentro do orçamento de tokens e requisições restantes. Quando a
+    janela transborda, as mensagens mais antigas (até sobrar
+    ``window_low_water``) são incorporadas ao resumo da conversa com uma
+    chamada ao LLM, que reserva sua própria requisição no rate limit; sem
+    saldo, ou se o resumo falhar, ficam de fora e voltam na próxima.
+    """
+    recent = [msg async for msg in _unsummarized_messages(conversation)]
+    window, overflow, backlog = _split_chat_history(conversation, recent)
+    if backlog is not None:
+        overflow = [msg async for msg in backlog]
+    if overflow:
+        is_allowed, left = await areserve_rate_limit(user, AIUsageLog.Feature.CHAT)
+        if is_allowed:
+            remaining = left
+            try:
+                summary, usage_info = await asummarize_conversation(
+                    conversation.summary, overflow
+                )
+            except Exception as e:
+                logger.exception("Erro ao resumir a conversa")
+                await alog_ai_usage(
+                    user=user,
+                    feature=AIUsageLog.Feature.CHAT,
+                    input_text=_summary_input(conversation),
+                    usage_info={"model": get_llm_model()},
+                    success=False,
+                    error_message=str(e),
+                    reserved=True,
+                )
+            else:
+                await conversation.asave(
+                    update_fields=_apply_summary(conversation, summary, overflow)
+                )
+                await alog_ai_usage(
+                    user=user,
+                    feature=AIUsageLog.Feature.CHAT,
+                    input_text=_summary_input(conversation),
+                    usage_info=usage_info,
+                    reserved=True,
+                )
+    return history_messages(conversation.summary, window), remaining
+
+
+async def _aprepare_chat(request):
+    """
+    Valida a mensagem, aplica o rate limit e carrega conversa e histórico.
+    Retorna ``(resposta de erro, None)`` ou ``(None, (mensagem, conversa,
+    histórico, requisições restantes))``.
+    """
+    error, message = _chat_message(request)
+    if error is not None:
+        return error, None
+    conversation_id = request.data.get("conversation_id")
 
     conversation = None
     if conversation_id:
-        conversation = ChatConversation.objects.filter(
+        conversation = await ChatConversation.objects.filter(
             user=request.user, id=conversation_id
-        ).first()
+        ).afirst()
         if not conversation:
-            return Response(
-                {"error": "Conversa não encontrada."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+            return _conversation_not_found(), None
+
+    is_allowed, remaining = await areserve_rate_limit(
+        request.user, AIUsageLog.Feature.CHAT
+    )
+    if not is_allowed:
+        return rate_limited_response(AIUsageLog.Feature.CHAT), None
+
+    if not await llm_available():
+        await arelease_rate_limit(request.user, AIUsageLog.Feature.CHAT)
+        return llm_unavailable_response(), None
 
     if not conversation:
         title = message[:60].strip()
-        conversation = ChatConversation.objects.create(
+        conversation = await ChatConversation.objects.acreate(
             user=request.user,
             title=title or "Nova conversa",
         )
 
-    history_messages = (
-        conversation.messages.order_by("-created_at")[:10]
+    history, remaining = await _achat_history(request.user, conversation, remaining)
+    return None, (message, conversation, history, remaining)
+
+
+async def _asave_chat_turn(conversation, message: str, reply: str, usage_info: dict):
+    """Grava pergunta e resposta e atualiza a conversa."""
+    await ChatMessage.objects.acreate(
+        conversation=conversation,
+        role=ChatMessage.Role.USER,
+        content=message,
+        tokens_used=estimate_tokens(message),
     )
-    history = [
-        {"role": msg.role, "content": msg.content}
-        for msg in reversed(history_messages)
-    ]
+    await ChatMessage.objects.acreate(
+        conversation=conversation,
+        role=ChatMessage.Role.ASSISTANT,
+        content=reply,
+        tokens_used=usage_info.get("output_tokens") or estimate_tokens(reply),
+    )
+    await conversation.asave(update_fields=["updated_at"])
+
+
+USAGE_TOTALS = ("calls", "failures", "input_tokens", "output_tokens")
+
+
+def _usage_totals(queryset, field: str) -> list[dict]:
+    return list(
+        queryset.values(field)
+        .annotate(**{name: Sum(name) for name in USAGE_TOTALS})
+        .order_by(field)
+    )
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def usage_report(request):
+    """
+    Relatório de uso da IA, lido apenas do rollup diário (``AIUsageDaily``).
+
+    Query params:
+        start, end: YYYY-MM-DD, inclusivos (padrão: últimos 30 dias)
+        all: 1 para somar todos os usuários (apenas staff)
 
+    Output:
+        {"start": "2026-01-01", "end": "2026-01-30",
+         "totals": {"calls": 42, "failures": 1, "input_tokens": 9000, "output_tokens": 1200},
+         "by_feature": [{"feature": "chat", ...}], "by_model": [...], "by_day": [...]}
+
+    Reflete o uso até a última execução de ``rollup_ai_usage``.
+    """
+    end = timezone.localdate()
+    start = end - timedelta(days=29)
     try:
-        chat_response: ChatResponse = generate_chat_response(
-            request.user, message, history
+        if request.query_params.get("start"):
+            start = date.fromisoformat(request.query_params["start"])
+        if request.query_params.get("end"):
+            end = date.fromisoformat(request.query_params["end"])
+    except ValueError:
+        return Response(
+            {"error": "Formato inválido. Use YYYY-MM-DD"},
+            status=status.HTTP_400_BAD_REQUEST,
         )
+    if start > end:
+        return Response(
+            {"error": "'start' deve ser anterior ou igual a 'end'"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    rows = AIUsageDaily.objects.filter(day__gte=start, day__lte=end)
+    if not (_query_flag(request, "all") and request.user.is_staff):
+        rows = rows.filter(user=request.user)
 
-        ChatMessage.objects.create(
-            conversation=conversation,
-            role=ChatMessage.Role.USER,
-            content=message,
-            tokens_used=0,
+    totals = rows.aggregate(**{name: Sum(name) for name in USAGE_TOTALS})
+    return Response(
+        {
+            "start": start,
+            "end": end,
+            "totals": {name: totals[name] or 0 for name in USAGE_TOTALS},
+            "by_feature": _usage_totals(rows, "feature"),
+            "by_model": _usage_totals(rows, "model_name"),
+            "by_day": _usage_totals(rows, "day"),
+        }
+    )
+
+
+@async_api_view(["POST"])
+@permission_classes([IsAuthenticated])
+async def chat(request):
+    """
+    Chat financeiro com contexto do usuário.
+
+    Input:
+        {"message": "...", "conversation_id": 1}
+    """
+    error, turn = await _aprepare_chat(request)
+    if error is not None:
+        return error
+    message, conversation, history, remaining = turn
+
+    try:
+        chat_response: ChatResponse = await agenerate_chat_response(
+            request.user, message, history
         )
-        ChatMessage.objects.create(
-            conversation=conversation,
-            role=ChatMessage.Role.ASSISTANT,
-            content=chat_response.message,
-            tokens_used=chat_response.usage_info.get("output_tokens", 0),
+
+        await _asave_chat_turn(
+            conversation, message, chat_response.message, chat_response.usage_info
         )
-        conversation.save(update_fields=["updated_at"])
 
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.CHAT,
             input_text=message,
             usage_info=chat_response.usage_info,
+            reserved=True,
         )
 
-        return Response(
-            {
-                "conversation_id": conversation.id,
-                "message": chat_response.message,
-                "usage": {
-                    "tokens_used": chat_response.usage_info.get("total_tokens", 0),
-                    "requests_remaining": remaining - 1,
-                },
-            }
+        return rate_limit_headers(
+            Response(
+                {
+                    "conversation_id": conversation.id,
+                    "message": chat_response.message,
+                    "usage": {
+                        "tokens_used": chat_response.usage_info.get("total_tokens", 0),
+                        "requests_remaining": remaining,
+                    },
+                }
+            ),
+            remaining,
+            AIUsageLog.Feature.CHAT,
         )
 
     except Exception as e:
         logger.exception("Erro no chat")
-        log_ai_usage(
+        await alog_ai_usage(
             user=request.user,
             feature=AIUsageLog.Feature.CHAT,
             input_text=message,
             usage_info={"model": get_llm_model()},
             success=False,
             error_message=str(e),
+            reserved=True,
         )
         return Response(
             {"error": "Erro interno ao processar chat"},
@@ -945,13 +1849,163 @@ def chat(request):
         )
 
 
+@async_api_view(["POST"])
+@permission_classes([IsAuthenticated])
+@renderer_classes([JSONRenderer, EventStreamRenderer])
+async def chat_stream(request):
+    """
+    Chat com a resposta enviada token a token via server-sent events.
+
+    Input:
+        {"message": "...", "conversation_id": 1}
+
+    Eventos:
+        start  {"conversation_id": 1}
+        token  {"text": "..."}  (um por trecho recebido do LLM)
+        done   {"conversation_id", "message", "usage", "timing"}
+        error  {"error": "..."}
+
+    O stream é um gerador assíncrono sobre o ``AsyncOpenAI``: sob ASGI cada
+    evento sai assim que o trecho chega (um iterador síncrono seria lido
+    inteiro antes do envio). As mensagens e o log de uso são gravados quando
+    o stream termina. Se o cliente desconecta, a conexão com o provedor é
+    fechada (a geração para) e o uso parcial é registrado como cancelado.
+    """
+    error, turn = await _aprepare_chat(request)
+    if error is not None:
+        return error
+    message, conversation, history, remaining = turn
+
+    try:
+        stream = await astream_chat_response(request.user, message, history)
+    except Exception as e:
+        logger.exception("Erro no chat (stream)")
+        await alog_ai_usage(
+            user=request.user,
+            feature=AIUsageLog.Feature.CHAT,
+            input_text=message,
+            usage_info={"model": get_llm_model()},
+            success=False,
+            error_message=str(e),
+            reserved=True,
+        )
+        return Response(
+            {"error": "Erro interno ao processar chat"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    response = StreamingHttpResponse(
+        _chat_events(request.user, message, conversation, stream, remaining),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # nginx: não acumular o stream
+    return rate_limit_headers(response, remaining, AIUsageLog.Feature.CHAT)
+
+
+async def _chat_events(user, message: str, conversation, stream, remaining: int):
+    try:
+        yield sse_event("start", {"conversation_id": conversation.id})
+        async for text in stream:
+            yield sse_event("token", {"text": text})
+    except (asyncio.CancelledError, GeneratorExit):
+        # Cliente desconectou (o ASGI cancela a tarefa ou fecha o gerador):
+        # fecha o upstream e registra o uso parcial, sem gravar mensagens
+        await stream.aclose()
+        await alog_ai_usage(
+            user=user,
+            feature=AIUsageLog.Feature.CHAT,
+            input_text=message,
+            usage_info=stream.usage_info,
+            success=False,
+            error_message="Cancelado pelo cliente",
+            reserved=True,
+        )
+        raise
+    except Exception as e:
+        logger.exception("Erro no chat (stream)")
+        await stream.aclose()
+        await alog_ai_usage(
+            user=user,
+            feature=AIUsageLog.Feature.CHAT,
+            input_text=message,
+            usage_info=stream.usage_info,
+            success=False,
+            error_message=str(e),
+            reserved=True,
+        )
+        yield sse_event("error", {"error": "Erro interno ao processar chat"})
+        return
+
+    usage_info = stream.usage_info
+    try:
+        await _asave_chat_turn(conversation, message, stream.message, usage_info)
+        await alog_ai_usage(
+            user=user,
+            feature=AIUsageLog.Feature.CHAT,
+            input_text=message,
+            usage_info=usage_info,
+            reserved=True,
+        )
+    except Exception as e:
+        # Resposta gerada mas não gravada: registra o uso (se ainda possível)
+        logger.exception("Erro ao gravar o chat (stream)")
+        try:
+            await alog_ai_usage(
+                user=user,
+                feature=AIUsageLog.Feature.CHAT,
+                input_text=message,
+                usage_info=usage_info,
+                success=False,
+                error_message=str(e),
+                reserved=True,
+            )
+        except Exception:
+            logger.exception("Erro ao registrar o uso do chat (stream)")
+        yield sse_event("error", {"error": "Erro interno ao processar chat"})
+        return
+    logger.info(
+        f"Chat (stream): primeiro token em {stream.timing['first_token_ms']} ms"
+    )
+    yield sse_event(
+        "done",
+        {
+            "conversation_id": conversation.id,
+            "message": stream.message,
+            "usage": {
+                "tokens_used": usage_info.get("total_tokens", 0),
+                "requests_remaining": remaining,
+            },
+            "timing": stream.timing,
+        },
+    )
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def chat_conversations(request):
-    """Lista conversas do usuário."""
+    """Lista conversas do usuário (``?search=`` busca no conteúdo das mensagens)."""
     conversations = ChatConversation.objects.filter(user=request.user).order_by(
         "-updated_at"
     )
+    search = request.query_params.get("search", "").strip()
+    if search:
+        messages = ChatMessage.objects.filter(conversation__user=request.user)
+        matches = CHAT_MESSAGE_SEARCH_INDEX.search(messages, search)
+        if matches is None:
+            matches = messages.filter(content__icontains=search)
+        else:
+            # Como no FullTextSearchFilter, ordena por relevância: cada
+            # conversa vale pela sua mensagem mais relevante.
+            best = (
+                matches.filter(conversation=OuterRef("pk"))
+                .order_by("-search_rank")
+                .values("search_rank")[:1]
+            )
+            conversations = conversations.annotate(search_rank=Subquery(best)).order_by(
+                "-search_rank", "-updated_at"
+            )
+        conversations = conversations.filter(id__in=matches.values("conversation_id"))
     data = []
     for convo in conversations:
         last_message = convo.messages.order_by("-created_at").first()
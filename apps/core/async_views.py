@@ -0,0 +1,88 @@
+"""
+Views assíncronas com o Django REST Framework.
+
+O DRF só despacha handlers síncronos. ``AsyncAPIView`` mantém o ciclo do
+``APIView`` (autenticação, permissões, throttling, negociação de conteúdo e
+tratamento de exceções), mas aguarda handlers ``async def``: sob ASGI a view
+roda no event loop e não ocupa uma thread enquanto espera I/O (ex.: o LLM).
+As etapas síncronas que podem acessar o banco (autenticação JWT, permissões)
+rodam via ``sync_to_async``.
+
+``async_api_view`` é o equivalente de ``@api_view`` para funções ``async``
+e respeita os mesmos decoradores de política (``@permission_classes`` etc.).
+"""
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                # OPTIONS (metadados) e métodos não permitidos
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+POLICY_ATTRIBUTES = (
+    "renderer_classes",
+    "parser_classes",
+    "authentication_classes",
+    "throttle_classes",
+    "permission_classes",
+    "content_negotiation_class",
+    "metadata_class",
+)
+
+
+def async_api_view(http_method_names=None):
+    """Converte uma função ``async def`` em uma ``AsyncAPIView``."""
+    http_method_names = ["GET"] if http_method_names is None else http_method_names
+
+    def decorator(func):
+        assert iscoroutinefunction(func), "@async_api_view requer uma função async"
+
+        attrs = {
+            "__doc__": func.__doc__,
+            "http_method_names": [
+                method.lower() for method in {*http_method_names, "options"}
+            ],
+            "throttle_scope": getattr(func, "throttle_scope", None),
+        }
+        for name in POLICY_ATTRIBUTES:
+            attrs[name] = getattr(func, name, getattr(APIView, name))
+
+        async def handler(self, *args, **kwargs):
+            return await func(*args, **kwargs)
+
+        for method in http_method_names:
+            attrs[method.lower()] = handler
+
+        view_class = type(func.__name__, (AsyncAPIView,), attrs)
+        view_class.__module__ = func.__module__
+        return view_class.as_view()
+
+    return decorator
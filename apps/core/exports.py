@@ -0,0 +1,156 @@
+"""
+Exportação em streaming (CSV ou NDJSON).
+
+As linhas vêm de ``QuerySet.values().iterator(chunk_size=...)`` (sem
+instanciar models nem serializers) e são escritas conforme são lidas, então
+a memória fica constante e o cabeçalho é enviado antes da consulta.
+
+Sob ASGI a resposta usa um gerador assíncrono que busca as linhas em blocos
+de ``CHUNK_SIZE`` via ``sync_to_async``; um gerador síncrono ali seria lido
+inteiro pelo Django (``sync_to_async(list)``) antes do primeiro byte.
+"""
+
+import csv
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+}
+CHUNK_SIZE = 2000
+
+
+def export_value(value):
+    """Converte valores do banco para texto/JSON (datetimes no fuso local)."""
+    if isinstance(value, datetime):
+        return timezone.localtime(value).isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+class _Echo:
+    """Buffer mínimo para o csv.writer devolver a linha em vez de gravá-la."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(columns, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow(
+            ["" if row[c] is None else export_value(row[c]) for c in columns]
+        )
+
+
+def iter_ndjson(columns, rows):
+    for row in rows:
+        payload = {column: export_value(row[column]) for column in columns}
+        yield json.dumps(payload, ensure_ascii=False) + "\n"
+
+
+def iter_batches(lines, size: int | None = None):
+    """Agrupa as linhas em blocos de texto com até ``size`` (``CHUNK_SIZE``) linhas."""
+    size = size or CHUNK_SIZE
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= size:
+            yield "".join(batch)
+            batch = []
+    if batch:
+        yield "".join(batch)
+
+
+async def aiter_export(lines):
+    """
+    Versão assíncrona do corpo da exportação.
+
+    Cada bloco é lido do gerador síncrono via ``sync_to_async`` com
+    ``thread_sensitive`` (padrão): o cursor do ``iterator()`` pertence à
+    conexão da thread da requisição e precisa ser lido nela.
+    """
+    batches = iter_batches(lines)
+    try:
+        while (chunk := await sync_to_async(next)(batches, None)) is not None:
+            yield chunk
+    finally:
+        await sync_to_async(batches.close)()
+
+
+def streaming_export(
+    queryset, columns, file_format: str, filename: str, asynchronous: bool = False
+):
+    """
+    Monta a resposta em streaming para um queryset de ``values()``.
+
+    Com ``asynchronous=True`` (requisição ASGI) o corpo é um gerador
+    assíncrono, lido em blocos, para o servidor enviar conforme as linhas saem.
+    """
+    content_type, extension = EXPORT_FORMATS[file_format]
+    rows = queryset.iterator(chunk_size=CHUNK_SIZE)
+    body = (
+        iter_csv(columns, rows) if file_format == "csv" else iter_ndjson(columns, rows)
+    )
+    if asynchronous:
+        body = aiter_export(body)
+    response = StreamingHttpResponse(body, content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{extension}"'
+    return response
+
+
+class ExportMixin:
+    """
+    Adiciona ``GET <lista>/export/?file_format=csv|ndjson`` ao ViewSet.
+
+    Aplica os mesmos filtros do ``filterset_class`` da view. A view define
+    ``export_fields`` (campos do model), ``export_annotations``
+    (``{coluna: expressão}``, ex.: nome da categoria), ``export_ordering`` e
+    ``export_filename``.
+    """
+
+    export_fields: tuple = ("id",)
+    export_annotations: dict = {}
+    export_ordering: tuple = ("pk",)
+    export_filename = "export"
+
+    @action(detail=False, methods=["get"], pagination_class=None)
+    def export(self, request):
+        """Exporta os registros filtrados em CSV (padrão) ou NDJSON."""
+        file_format = request.query_params.get("file_format", "csv")
+        if file_format not in EXPORT_FORMATS:
+            return Response(
+                {"error": "Formato inválido. Use csv ou ndjson"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        queryset = DjangoFilterBackend().filter_queryset(
+            request, self.get_queryset(), self
+        )
+        queryset = queryset.order_by(*self.export_ordering).values(
+            *self.export_fields, **self.export_annotations
+        )
+        columns = [*self.export_fields, *self.export_annotations]
+        filename = f"{self.export_filename}-{timezone.localdate():%Y%m%d}"
+        return streaming_export(
+            queryset,
+            columns,
+            file_format,
+            filename,
+            asynchronous=isinstance(request._request, ASGIRequest),
+        )
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from apps.core.search import SEARCH_INDEXES
+
+
+class Command(BaseCommand):
+    help = "Recria a estrutura dos índices de busca textual e reindexa o conteúdo."
+
+    def handle(self, *args, **options):
+        if not SEARCH_INDEXES:
+            self.stdout.write("Nenhum indice de busca registrado.")
+            return
+
+        for index in SEARCH_INDEXES:
+            if not index.install(connection):
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Banco '{connection.vendor}' sem suporte; "
+                        f"{index.table} usa busca simples."
+                    )
+                )
+                return
+            self.stdout.write(f"Indice de busca atualizado: {index.table}")
+
+        self.stdout.write(self.style.SUCCESS("Concluido."))
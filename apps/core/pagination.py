@@ -0,0 +1,234 @@
+"""
+Paginação por cursor (keyset).
+
+``PageNumberPagination`` faz OFFSET + ``COUNT(*)`` sobre toda a tabela do
+usuário a cada página. A paginação keyset filtra a partir da última linha
+vista (``WHERE (date, created_at, id) < (...)``) usando o índice da
+ordenação, então a página N custa o mesmo que a página 1, e não conta o
+total.
+
+As views escolhem a ordenação do cursor com ``cursor_ordering``; ela deve
+terminar em um campo único (``id``) e não ter campos nulos. No modo cursor
+o parâmetro ``?ordering=`` é ignorado.
+"""
+
+import base64
+import json
+from datetime import date
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class _CursorEncoder(json.JSONEncoder):
+    # Ao contrário do DjangoJSONEncoder, preserva os microssegundos: a
+    # posição precisa ser exata para a comparação de igualdade do keyset.
+    def default(self, o):
+        if isinstance(o, date):
+            return o.isoformat()
+        if isinstance(o, Decimal):
+            return str(o)
+        return super().default(o)
+
+
+def encode_cursor(values: list, reverse: bool) -> str:
+    """Codifica a posição (valores da ordenação) em base64 url-safe."""
+    payload = json.dumps({"p": values, "r": reverse}, cls=_CursorEncoder)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, fields=None) -> tuple[list, bool]:
+    """
+    Decodifica um cursor gerado por ``encode_cursor``. Com ``fields`` (campos
+    do model na ordem da ordenação), confere a quantidade de valores e os
+    converte e valida com cada campo, para que um cursor adulterado não
+    chegue ao filtro da queryset.
+
+    Raises:
+        NotFound: Se o cursor for inválido
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        values, reverse = list(payload["p"]), bool(payload["r"])
+    except (TypeError, KeyError, ValueError, UnicodeError):
+        raise NotFound("Cursor inválido.")
+    if fields is None:
+        return values, reverse
+
+    if len(values) != len(fields):
+        raise NotFound("Cursor inválido.")
+    try:
+        values = [_cursor_value(field, value) for field, value in zip(fields, values)]
+    except (ValidationError, TypeError, ValueError):
+        raise NotFound("Cursor inválido.")
+    return values, reverse
+
+
+def _cursor_value(field, value):
+    if value is None:  # a ordenação do cursor não tem campos nulos
+        raise ValueError("Valor nulo no cursor")
+    value = field.to_python(value)
+    field.run_validators(value)  # ex.: limites do inteiro no banco
+    return value
+
+
+def model_field(model, path: str):
+    """Campo do model para um caminho de ordenação (``"-date"``, ``"a__b"``)."""
+    *relations, name = path.lstrip("-").split("__")
+    for relation in relations:
+        model = model._meta.get_field(relation).related_model
+    return model._meta.get_field(name)
+
+
+def keyset_filter(ordering, values, reverse=False) -> Q:
+    """
+    Monta o filtro "linhas depois da posição" para a ordenação informada.
+
+    Para ``("-date", "id")`` gera ``date < v0 OR (date = v0 AND id > v1)``;
+    com ``reverse`` a comparação é invertida (linhas antes da posição).
+    """
+    condition = Q()
+    equal_prefix = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip("-")
+        descending = field.startswith("-") != reverse
+        lookup = "lt" if descending else "gt"
+        condition |= equal_prefix & Q(**{f"{name}__{lookup}": value})
+        equal_prefix &= Q(**{name: value})
+    return condition
+
+
+class KeysetPagination(BasePagination):
+    """Paginação keyset sobre ``view.cursor_ordering``, sem contagem total."""
+
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    ordering = ("-id",)
+
+    def get_ordering(self, view):
+        return tuple(getattr(view, "cursor_ordering", self.ordering))
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = self.get_ordering(view)
+        page_size = self.get_page_size(request)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        reverse = False
+        if cursor:
+            fields = [model_field(queryset.model, field) for field in self.ordering]
+            values, reverse = decode_cursor(cursor, fields)
+            queryset = queryset.filter(keyset_filter(self.ordering, values, reverse))
+
+        if reverse:
+            queryset = queryset.order_by(*(self._invert(f) for f in self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        results = list(queryset[: page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+        if reverse:
+            results.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = bool(cursor)
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._build_link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self._build_link(self.page[0], reverse=True)
+
+    def _build_link(self, instance, reverse):
+        values = [self._position_value(instance, field) for field in self.ordering]
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, encode_cursor(values, reverse)
+        )
+
+    @staticmethod
+    def _position_value(instance, field):
+        value = instance
+        for attr in field.lstrip("-").split("__"):
+            value = getattr(value, attr)
+        return value
+
+    @staticmethod
+    def _invert(field):
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+
+class PageOrCursorPagination(PageNumberPagination):
+    """
+    Paginação por página (padrão) ou por cursor, escolhida por requisição.
+
+    O modo cursor é usado com ``?pagination=cursor`` ou quando a requisição
+    já traz ``?cursor=`` (links next/previous).
+    """
+
+    mode_query_param = "pagination"
+    cursor_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        if self.use_cursor(request):
+            self.cursor_paginator = self.cursor_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def use_cursor(self, request):
+        params = request.query_params
+        return (
+            params.get(self.mode_query_param) == "cursor"
+            or self.cursor_class.cursor_query_param in params
+        )
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
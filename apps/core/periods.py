@@ -0,0 +1,77 @@
+"""
+Utilitários de mês e período.
+
+Filtros por mês devem usar intervalos semiabertos ``[início, próximo_início)``
+sobre a coluna de data, que aproveitam índices B-tree, em vez de lookups
+``__year``/``__month`` (compilados para EXTRACT/funções sobre a coluna).
+"""
+
+from calendar import monthrange
+from datetime import MAXYEAR, date, datetime, time, timedelta
+
+from django.utils import timezone
+
+
+def add_months(value: date, months: int) -> date:
+    """Soma meses a uma data, ajustando o dia ao fim do mês quando necessário."""
+    total_months = value.month - 1 + months
+    year = value.year + total_months // 12
+    month = total_months % 12 + 1
+    day = min(value.day, monthrange(year, month)[1])
+    return date(year, month, day)
+
+
+def parse_month(value: str) -> date:
+    """
+    Converte "YYYY-MM" no primeiro dia do mês.
+
+    Raises:
+        ValueError: Se o formato ou o mês forem inválidos, ou se o mês
+            seguinte (fim do intervalo semiaberto) não for representável
+    """
+    try:
+        year, month = value.split("-")
+        first_day = date(int(year), int(month), 1)
+    except (AttributeError, TypeError) as exc:
+        raise ValueError(f"Mês inválido: {value!r}") from exc
+    if (first_day.year, first_day.month) == (MAXYEAR, 12):
+        raise ValueError(f"Mês inválido: {value!r}")
+    return first_day
+
+
+def month_bounds(month: date) -> tuple[date, date]:
+    """Retorna (primeiro dia do mês, primeiro dia do mês seguinte)."""
+    first_day = month.replace(day=1)
+    return first_day, add_months(first_day, 1)
+
+
+def local_day_start(value: date) -> datetime:
+    """Meia-noite (timezone local) do dia informado, como datetime aware."""
+    return timezone.make_aware(datetime.combine(value, time.min))
+
+
+def date_range_filter(field: str, start: date, end: date) -> dict:
+    """Filtro semiaberto ``start <= field < end`` para campos DateField."""
+    return {f"{field}__gte": start, f"{field}__lt": end}
+
+
+def datetime_range_filter(field: str, start: date, end: date) -> dict:
+    """Filtro semiaberto por dias locais para campos DateTimeField."""
+    return {
+        f"{field}__gte": local_day_start(start),
+        f"{field}__lt": local_day_start(end),
+    }
+
+
+def month_filter(field: str, month: date) -> dict:
+    """Filtro semiaberto do mês para um DateField."""
+    return date_range_filter(field, *month_bounds(month))
+
+
+def month_datetime_filter(field: str, month: date) -> dict:
+    """Filtro semiaberto do mês (timezone local) para um DateTimeField."""
+    return datetime_range_filter(field, *month_bounds(month))
+
+
+def next_day(value: date) -> date:
+    return value + timedelta(days=1)
@@ -0,0 +1,245 @@
+"""
+Busca textual indexada para o parâmetro ``?search=``.
+
+- PostgreSQL: coluna ``search_vector`` (tsvector gerado, config
+  ``portuguese``, pesos A/B/C/D na ordem das colunas) com índice GIN.
+- SQLite: tabela virtual FTS5 *external content* ``<tabela>_fts``, mantida
+  por triggers. Não há stemmer português no FTS5; cada termo vira uma busca
+  por prefixo, sem acentos.
+- Outros bancos: ``SearchFilter`` padrão (ILIKE).
+
+Os resultados são anotados com ``search_rank`` (maior = mais relevante) e
+ordenados por ele. A estrutura é criada por migrações
+(``FullTextIndex.operation()``) e pode ser reinstalada com o comando
+``rebuild_search_index`` (ex.: após o SQLite recriar a tabela em um
+ALTER, o que descarta os triggers).
+"""
+
+import re
+
+from django.db import connections, migrations
+from django.db.models import BooleanField, FloatField, Value
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import SearchFilter
+
+WEIGHTS = "ABCD"
+SQLITE_WEIGHTS = {"A": 4.0, "B": 2.0, "C": 1.0, "D": 0.5}
+
+# Índices declarados pelos apps, usados pelo comando rebuild_search_index.
+SEARCH_INDEXES: list["FullTextIndex"] = []
+
+
+class TableSQL(RawSQL):
+    """
+    ``RawSQL`` em que ``{table}`` vira o alias da tabela base da consulta.
+
+    Em subqueries o Django renomeia a tabela (ex.: ``U0``), então o nome
+    literal não pode ser usado para correlacionar colunas fora do model.
+    """
+
+    def as_sql(self, compiler, connection):
+        alias = compiler.quote_name_unless_alias(compiler.query.get_initial_alias())
+        return f"({self.sql.format(table=alias)})", self.params
+
+
+def register(index: "FullTextIndex") -> "FullTextIndex":
+    """Registra o índice para o comando ``rebuild_search_index``."""
+    SEARCH_INDEXES.append(index)
+    return index
+
+
+class FullTextIndex:
+    """Índice full-text sobre colunas de texto de uma tabela.
+
+    A ordem de ``columns`` define o peso de cada coluna (a primeira é a mais
+    relevante).
+    """
+
+    def __init__(self, table: str, columns, config: str = "portuguese"):
+        self.table = table
+        self.columns = tuple(columns)
+        self.config = config
+
+    @property
+    def fts_table(self) -> str:
+        return f"{self.table}_fts"
+
+    # --- DDL -----------------------------------------------------------
+
+    def postgresql_sql(self) -> list[str]:
+        vector = " || ".join(
+            f"setweight(to_tsvector('{self.config}', coalesce(\"{column}\", '')), '{weight}')"
+            for column, weight in zip(self.columns, WEIGHTS)
+        )
+        return [
+            (
+                f'ALTER TABLE "{self.table}" ADD COLUMN IF NOT EXISTS "search_vector" '
+                f"tsvector GENERATED ALWAYS AS ({vector}) STORED"
+            ),
+            (
+                f'CREATE INDEX IF NOT EXISTS "{self.table}_search_idx" '
+                f'ON "{self.table}" USING GIN ("search_vector")'
+            ),
+        ]
+
+    def postgresql_reverse_sql(self) -> list[str]:
+        return [
+            f'DROP INDEX IF EXISTS "{self.table}_search_idx"',
+            f'ALTER TABLE "{self.table}" DROP COLUMN IF EXISTS "search_vector"',
+        ]
+
+    def sqlite_sql(self) -> list[str]:
+        columns = ", ".join(f'"{column}"' for column in self.columns)
+        new_values = ", ".join(f'new."{column}"' for column in self.columns)
+        old_values = ", ".join(f'old."{column}"' for column in self.columns)
+        fts = self.fts_table
+        delete_old = (
+            f'INSERT INTO "{fts}"("{fts}", rowid, {columns}) '
+            f"VALUES ('delete', old.\"id\", {old_values});"
+        )
+        insert_new = (
+            f'INSERT INTO "{fts}"(rowid, {columns}) VALUES (new."id", {new_values});'
+        )
+        return [
+            (
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts}" USING fts5({columns}, '
+                f"content='{self.table}', content_rowid='id', "
+                f"tokenize='unicode61 remove_diacritics 2')"
+            ),
+            (
+                f'CREATE TRIGGER IF NOT EXISTS "{fts}_ai" AFTER INSERT ON "{self.table}" '
+                f"BEGIN {insert_new} END"
+            ),
+            (
+                f'CREATE TRIGGER IF NOT EXISTS "{fts}_ad" AFTER DELETE ON "{self.table}" '
+                f"BEGIN {delete_old} END"
+            ),
+            (
+                f'CREATE TRIGGER IF NOT EXISTS "{fts}_au" AFTER UPDATE ON "{self.table}" '
+                f"BEGIN {delete_old} {insert_new} END"
+            ),
+            f'INSERT INTO "{fts}"("{fts}") VALUES (\'rebuild\')',
+        ]
+
+    def sqlite_reverse_sql(self) -> list[str]:
+        fts = self.fts_table
+        return [
+            f'DROP TRIGGER IF EXISTS "{fts}_ai"',
+            f'DROP TRIGGER IF EXISTS "{fts}_ad"',
+            f'DROP TRIGGER IF EXISTS "{fts}_au"',
+            f'DROP TABLE IF EXISTS "{fts}"',
+        ]
+
+    def install(self, connection) -> bool:
+        """Cria (ou completa) a estrutura do índice. Retorna False se o banco não suporta."""
+        return self._execute(connection, f"{connection.vendor}_sql")
+
+    def uninstall(self, connection) -> bool:
+        return self._execute(connection, f"{connection.vendor}_reverse_sql")
+
+    def _execute(self, connection, method_name) -> bool:
+        method = getattr(self, method_name, None)
+        if method is None:
+            return False
+        with connection.cursor() as cursor:
+            for statement in method():
+                cursor.execute(statement)
+        return True
+
+    def operation(self) -> migrations.RunPython:
+        """Operação de migração que cria o índice no banco em uso."""
+
+        def forwards(apps, schema_editor):
+            self.install(schema_editor.connection)
+
+        def backwards(apps, schema_editor):
+            self.uninstall(schema_editor.connection)
+
+        return migrations.RunPython(forwards, backwards)
+
+    # --- Consulta ------------------------------------------------------
+
+    def search(self, queryset, term: str):
+        """
+        Filtra e ordena ``queryset`` por relevância para ``term``.
+
+        Retorna None se o banco não tem suporte (o chamador usa ILIKE).
+        O resultado também pode ser usado como subquery (ex.:
+        ``values("fk_id")`` em um ``__in``).
+        """
+        vendor = connections[queryset.db].vendor
+        if vendor == "postgresql":
+            return self._search_postgresql(queryset, term)
+        if vendor == "sqlite":
+            return self._search_sqlite(queryset, term)
+        return None
+
+    def _search_postgresql(self, queryset, term):
+        from django.contrib.postgres.search import (
+            SearchQuery,
+            SearchRank,
+            SearchVectorField,
+        )
+
+        vector = TableSQL(
+            '{table}."search_vector"', [], output_field=SearchVectorField()
+        )
+        query = SearchQuery(term, config=self.config, search_type="websearch")
+        return (
+            queryset.alias(search_vector=vector)
+            .filter(search_vector=query)
+            .annotate(search_rank=SearchRank(vector, query))
+            .order_by("-search_rank", "-pk")
+        )
+
+    def _search_sqlite(self, queryset, term):
+        match = sqlite_match_expression(term)
+        if not match:
+            return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+        fts = self.fts_table
+        weights = ", ".join(
+            str(SQLITE_WEIGHTS[weight]) for _, weight in zip(self.columns, WEIGHTS)
+        )
+        # Junta com a tabela FTS5 em uma única passada: o MATCH seleciona as
+        # linhas e bm25() (menor = melhor) vira o rank com sinal invertido,
+        # mantendo "maior = mais relevante" como no PostgreSQL. A condição
+        # de junção usa o alias da tabela base para valer também em subqueries.
+        join = TableSQL(
+            f'"{fts}".rowid = {{table}}."id"', [], output_field=BooleanField()
+        )
+        return (
+            queryset.extra(tables=[fts], where=[f'"{fts}" MATCH %s'], params=[match])
+            .filter(join)
+            .annotate(
+                search_rank=RawSQL(
+                    f'-bm25("{fts}", {weights})', [], output_field=FloatField()
+                )
+            )
+            .order_by("-search_rank", "-pk")
+        )
+
+
+def sqlite_match_expression(term: str) -> str:
+    """Converte o texto digitado em uma expressão MATCH segura (termos por prefixo)."""
+    tokens = re.findall(r"\w+", term)
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    ``SearchFilter`` que usa o índice full-text da view (``search_index``).
+
+    Views sem ``search_index``, ou bancos sem suporte, mantêm o
+    comportamento padrão com ``search_fields``.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        index = getattr(view, "search_index", None)
+        terms = self.get_search_terms(request)
+        if index is None or not terms:
+            return super().filter_queryset(request, queryset, view)
+
+        results = index.search(queryset, " ".join(terms))
+        if results is None:
+            return super().filter_queryset(request, queryset, view)
+        return results
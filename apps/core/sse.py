@@ -0,0 +1,29 @@
+"""
+Server-sent events (``text/event-stream``).
+
+``sse_event`` formata um evento com payload JSON (quebras de linha do texto
+ficam escapadas, então cada evento ocupa uma única linha ``data:``).
+``EventStreamRenderer`` permite que views com streaming negociem
+``Accept: text/event-stream``; respostas comuns (ex.: erros de validação)
+saem como um evento ``error``.
+"""
+
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+
+def sse_event(event: str, data) -> str:
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+class EventStreamRenderer(BaseRenderer):
+    media_type = "text/event-stream"
+    format = "event-stream"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return sse_event("error", data).encode(self.charset)
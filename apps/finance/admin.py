@@ -1,6 +1,15 @@
 from django.contrib import admin
 
-from .models import Account, Budget, Category, Goal, GoalContribution, Transaction
+from .models import (
+    Account,
+    Budget,
+    Category,
+    Goal,
+    GoalContribution,
+    MonthlyCategoryTotal,
+    Tag,
+    Transaction,
+)
 
 
 @admin.register(Account)
@@ -34,6 +43,27 @@ class TransactionAdmin(admin.ModelAdmin):
     date_hierarchy = "date"
 
 
+@admin.register(Tag)
+class TagAdmin(admin.ModelAdmin):
+    list_display = ["name", "user", "created_at"]
+    search_fields = ["name", "user__username"]
+
+
+@admin.register(MonthlyCategoryTotal)
+class MonthlyCategoryTotalAdmin(admin.ModelAdmin):
+    list_display = [
+        "month",
+        "user",
+        "category",
+        "transaction_type",
+        "total",
+        "count",
+        "updated_at",
+    ]
+    list_filter = ["transaction_type", "month"]
+    search_fields = ["user__username", "category__name"]
+
+
 @admin.register(Budget)
 class BudgetAdmin(admin.ModelAdmin):
     list_display = [
@@ -0,0 +1,139 @@
+"""
+Avaliação de orçamentos: período vigente e gasto de cada orçamento.
+
+Todos os gastos são buscados em uma única consulta com agregação
+condicional (um ``Sum`` filtrado por orçamento), em vez de uma consulta
+por orçamento.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.db.models import Q, Sum
+
+from apps.core.periods import add_months
+
+from .models import Budget, Transaction
+
+
+def get_period_range(
+    start_date: date, period_type: str, today: date
+) -> tuple[date, date]:
+    """Retorna (início, fim) do período do orçamento que contém ``today``."""
+    if today < start_date:
+        if period_type == Budget.PeriodType.WEEKLY:
+            period_start = start_date
+            period_end = start_date + timedelta(days=6)
+        elif period_type == Budget.PeriodType.MONTHLY:
+            period_start = start_date
+            period_end = add_months(start_date, 1) - timedelta(days=1)
+        else:
+            period_start = start_date
+            period_end = add_months(start_date, 12) - timedelta(days=1)
+        return period_start, period_end
+
+    if period_type == Budget.PeriodType.WEEKLY:
+        weeks = (today - start_date).days // 7
+        period_start = start_date + timedelta(days=weeks * 7)
+        period_end = period_start + timedelta(days=6)
+        return period_start, period_end
+
+    if period_type == Budget.PeriodType.MONTHLY:
+        months = (today.year - start_date.year) * 12 + (today.month - start_date.month)
+        period_start = add_months(start_date, months)
+        if period_start > today:
+            period_start = add_months(period_start, -1)
+        period_end = add_months(period_start, 1) - timedelta(days=1)
+        return period_start, period_end
+
+    years = today.year - start_date.year
+    period_start = add_months(start_date, years * 12)
+    if period_start > today:
+        period_start = add_months(period_start, -12)
+    period_end = add_months(period_start, 12) - timedelta(days=1)
+    return period_start, period_end
+
+
+def active_budgets(user, today: date):
+    """Orçamentos ativos do usuário que ainda não terminaram em ``today``."""
+    return (
+        Budget.objects.filter(user=user, is_active=True)
+        .filter(Q(end_date__isnull=True) | Q(end_date__gte=today))
+        .select_related("category")
+    )
+
+
+def get_budgets_spent(
+    user, budgets, today: date
+) -> dict[int, tuple[date, date, Decimal]]:
+    """
+    Retorna {budget_id: (início, fim, gasto)} para os orçamentos informados.
+    Executa uma única consulta, independente da quantidade de orçamentos.
+    """
+    windows = {
+        budget.id: (
+            budget.category_id,
+            *get_period_range(budget.start_date, budget.period_type, today),
+        )
+        for budget in budgets
+    }
+    if not windows:
+        return {}
+
+    aggregates = {
+        f"spent_{budget_id}": Sum(
+            "amount",
+            filter=Q(
+                category_id=category_id,
+                date__gte=period_start,
+                date__lte=period_end,
+            ),
+        )
+        for budget_id, (category_id, period_start, period_end) in windows.items()
+    }
+    totals = Transaction.objects.filter(
+        user=user,
+        transaction_type=Transaction.TransactionType.EXPENSE,
+        is_confirmed=True,
+        category_id__in={category_id for category_id, _, _ in windows.values()},
+        date__gte=min(period_start for _, period_start, _ in windows.values()),
+        date__lte=max(period_end for _, _, period_end in windows.values()),
+    ).aggregate(**aggregates)
+
+    return {
+        budget_id: (
+            period_start,
+            period_end,
+            totals[f"spent_{budget_id}"] or Decimal("0"),
+        )
+        for budget_id, (_, period_start, period_end) in windows.items()
+    }
+
+
+def evaluate_budgets(user, budgets, today: date) -> list[dict]:
+    """Monta o status (gasto, restante, % usado) de cada orçamento."""
+    budgets = list(budgets)
+    spent_by_budget = get_budgets_spent(user, budgets, today)
+
+    status_list = []
+    for budget in budgets:
+        period_start, period_end, spent = spent_by_budget[budget.id]
+        percentage = float((spent / budget.amount) * 100) if budget.amount else 0.0
+        status_list.append(
+            {
+                "id": budget.id,
+                "category": budget.category_id,
+                "category_name": budget.category.name,
+                "amount": float(budget.amount),
+                "spent": float(spent),
+                "remaining": float(budget.amount - spent),
+                "percentage_used": round(percentage, 2),
+                "alert_threshold": budget.alert_threshold,
+                "alert_reached": percentage >= budget.alert_threshold,
+                "period_type": budget.period_type,
+                "period_start": period_start.isoformat(),
+                "period_end": period_end.isoformat(),
+            }
+        )
+
+    return status_list
@@ -0,0 +1,279 @@
+"""
+Categorizador local: naive Bayes multinomial por usuário, em NumPy.
+
+Treinado com as transações confirmadas e categorizadas do próprio usuário
+(descrição -> categoria). As features são palavras, pares de palavras e
+trigramas de caracteres das descrições normalizadas (sem acento, minúsculas,
+sem números).
+
+Os modelos ficam em um LRU por processo e são atualizados de forma
+incremental: a cada uso, uma agregação (maior id, maior ``updated_at`` e
+contagem) indica se há transações novas (treino parcial) ou editadas/
+removidas (novo treino completo). O treino gera um novo modelo, que
+substitui o anterior; requisições concorrentes continuam usando o antigo.
+"""
+
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+
+import numpy as np
+from django.conf import settings
+from django.db.models import Count, Max, Q
+
+from .models import Transaction
+
+ALPHA = 0.5
+WORD = re.compile(r"[a-z]{2,}")
+
+
+def extract_features(text: str) -> list[str]:
+    """Palavras, bigramas de palavras e trigramas de caracteres."""
+    normalized = unicodedata.normalize("NFKD", text.lower())
+    folded = "".join(ch for ch in normalized if not unicodedata.combining(ch))
+    words = WORD.findall(folded)
+
+    features = [f"w:{word}" for word in words]
+    features += [f"b:{a}_{b}" for a, b in zip(words, words[1:])]
+    for word in words:
+        padded = f" {word} "
+        features += [f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2)]
+    return features
+
+
+class NaiveBayesCategorizer:
+    """Naive Bayes multinomial com vocabulário e classes crescentes."""
+
+    def __init__(self):
+        self.vocabulary: dict[str, int] = {}
+        self.classes: list[int] = []
+        self.class_types: list[str] = []
+        self._class_index: dict[int, int] = {}
+        self.feature_counts = np.zeros((0, 0))
+        self.class_counts = np.zeros(0)
+        self.samples = 0
+        self._log_probs = None
+        # Marca d'água das transações já vistas.
+        self.last_pk = 0
+        self.last_updated = None
+        self.total = 0
+
+    def partial_fit(self, rows):
+        """Treina com (descrição, category_id, category_type) adicionais."""
+        class_rows, feature_cols = [], []
+        doc_classes = []
+        for description, category_id, category_type in rows:
+            class_idx = self._class_index.get(category_id)
+            if class_idx is None:
+                class_idx = self._class_index[category_id] = len(self.classes)
+                self.classes.append(category_id)
+                self.class_types.append(category_type)
+            doc_classes.append(class_idx)
+            for feature in extract_features(description):
+                col = self.vocabulary.setdefault(feature, len(self.vocabulary))
+                class_rows.append(class_idx)
+                feature_cols.append(col)
+
+        n_classes, n_features = len(self.classes), len(self.vocabulary)
+        grow_rows = n_classes - self.feature_counts.shape[0]
+        grow_cols = n_features - self.feature_counts.shape[1]
+        if grow_rows or grow_cols:
+            self.feature_counts = np.pad(
+                self.feature_counts, ((0, grow_rows), (0, grow_cols))
+            )
+            self.class_counts = np.pad(self.class_counts, (0, grow_rows))
+
+        np.add.at(self.feature_counts, (class_rows, feature_cols), 1)
+        np.add.at(self.class_counts, doc_classes, 1)
+        self.samples += len(doc_classes)
+        self._log_probs = None
+
+    def _log_probabilities(self):
+        """(log P(feature|classe), log contagem de docs), recalculados após treino."""
+        if self._log_probs is None:
+            counts = self.feature_counts + ALPHA
+            self._log_probs = (
+                np.log(counts) - np.log(counts.sum(axis=1, keepdims=True)),
+                np.log(self.class_counts),
+            )
+        return self._log_probs
+
+    def copy(self) -> "NaiveBayesCategorizer":
+        """Cópia independente (o treino parcial não altera o modelo em uso)."""
+        clone = NaiveBayesCategorizer()
+        clone.vocabulary = dict(self.vocabulary)
+        clone.classes = list(self.classes)
+        clone.class_types = list(self.class_types)
+        clone._class_index = dict(self._class_index)
+        clone.feature_counts = self.feature_counts.copy()
+        clone.class_counts = self.class_counts.copy()
+        clone.samples = self.samples
+        return clone
+
+    def predict_many(self, texts, category_type: str | None = None, category_ids=None):
+        """
+        Retorna [(category_id, probabilidade)] para cada texto, restrito ao
+        tipo/ids informados. ``(None, 0.0)`` quando nada se aplica.
+        """
+        mask = np.ones(len(self.classes), dtype=bool)
+        if category_type:
+            mask &= np.array([t == category_type for t in self.class_types], dtype=bool)
+        if category_ids is not None:
+            allowed = set(category_ids)
+            mask &= np.array([c in allowed for c in self.classes], dtype=bool)
+        candidates = np.flatnonzero(mask)
+        if not len(candidates):
+            return [(None, 0.0) for _ in texts]
+
+        all_log_likelihood, all_log_prior = self._log_probabilities()
+        log_likelihood = all_log_likelihood[candidates]
+        # A normalização do prior é constante entre candidatos e não altera o softmax.
+        log_prior = all_log_prior[candidates]
+
+        results = []
+        for text in texts:
+            columns = [
+                self.vocabulary[f]
+                for f in extract_features(text)
+                if f in self.vocabulary
+            ]
+            if not columns:
+                results.append((None, 0.0))
+                continue
+            # Média por feature escalada por sqrt(n): evita probabilidades
+            # saturadas pelo número de trigramas e deixa o limiar significativo.
+            scores = log_prior + log_likelihood[:, columns].mean(axis=1) * np.sqrt(
+                len(columns)
+            )
+            probabilities = np.exp(scores - scores.max())
+            probabilities /= probabilities.sum()
+            best = int(probabilities.argmax())
+            results.append((self.classes[candidates[best]], float(probabilities[best])))
+        return results
+
+    def predict(self, text: str, category_type: str | None = None, category_ids=None):
+        return self.predict_many([text], category_type, category_ids)[0]
+
+
+def _training_rows(user_id):
+    return Transaction.objects.filter(
+        user_id=user_id, is_confirmed=True, category__isnull=False
+    ).exclude(description="")
+
+
+class CategorizerRegistry:
+    """LRU de modelos por usuário, com atualização incremental."""
+
+    def __init__(self, max_users: int = 256):
+        self.max_users = max_users
+        self._lock = threading.Lock()
+        self._models: OrderedDict[int, NaiveBayesCategorizer] = OrderedDict()
+
+    def get(self, user_id: int) -> NaiveBayesCategorizer | None:
+        """Modelo atualizado do usuário, ou None se o histórico é pequeno."""
+        stats = _training_rows(user_id).aggregate(
+            last_pk=Max("pk"), last_updated=Max("updated_at"), total=Count("pk")
+        )
+        if stats["total"] < getattr(settings, "AI_LOCAL_CATEGORIZER_MIN_SAMPLES", 20):
+            self.discard(user_id)
+            return None
+
+        with self._lock:
+            model = self._models.get(user_id)
+        if model is not None and (
+            model.last_pk,
+            model.last_updated,
+            model.total,
+        ) == (stats["last_pk"], stats["last_updated"], stats["total"]):
+            self._touch(user_id, model)
+            return model
+
+        if model is not None:
+            model = self._refresh(user_id, model, stats)
+        if model is None:
+            model = NaiveBayesCategorizer()
+            rows = _training_rows(user_id).values_list(
+                "description", "category_id", "category__category_type"
+            )
+            model.partial_fit(rows.iterator(chunk_size=2000))
+        model.last_pk = stats["last_pk"]
+        model.last_updated = stats["last_updated"]
+        model.total = stats["total"]
+        self._touch(user_id, model)
+        return model
+
+    def _refresh(self, user_id, model, stats):
+        """Treino parcial com as transações novas; None se houve edição/remoção."""
+        changed = list(
+            _training_rows(user_id)
+            .filter(Q(pk__gt=model.last_pk) | Q(updated_at__gt=model.last_updated))
+            .values_list("pk", "description", "category_id", "category__category_type")
+        )
+        if any(pk <= model.last_pk for pk, *_ in changed):
+            return None
+        if model.total + len(changed) != stats["total"]:
+            return None
+        model = model.copy()
+        model.partial_fit(row[1:] for row in changed)
+        return model
+
+    def _touch(self, user_id, model):
+        with self._lock:
+            self._models[user_id] = model
+            self._models.move_to_end(user_id)
+            while len(self._models) > self.max_users:
+                self._models.popitem(last=False)
+
+    def discard(self, user_id=None):
+        with self._lock:
+            if user_id is None:
+                self._models.clear()
+            else:
+                self._models.pop(user_id, None)
+
+
+registry = CategorizerRegistry()
+
+
+def get_threshold() -> float:
+    return getattr(settings, "AI_LOCAL_CATEGORIZER_THRESHOLD", 0.85)
+
+
+def suggest_categories(
+    user, texts, category_type: str | None = None, category_ids=None
+):
+    """
+    ``suggest_category`` para vários textos: o modelo do usuário é obtido
+    uma vez e os textos são classificados com ``predict_many``.
+    """
+    if not getattr(settings, "AI_LOCAL_CATEGORIZER_ENABLED", True):
+        return [(None, 0.0) for _ in texts]
+    model = registry.get(user.id)
+    if model is None:
+        return [(None, 0.0) for _ in texts]
+    threshold = get_threshold()
+    return [
+        (category_id if confidence >= threshold else None, confidence)
+        for category_id, confidence in model.predict_many(
+            texts, category_type, category_ids
+        )
+    ]
+
+
+def suggest_category(
+    user, text: str, category_type: str | None = None, category_ids=None
+):
+    """
+    Retorna (category_id, confiança) quando o modelo local do usuário tem
+    confiança acima de ``AI_LOCAL_CATEGORIZER_THRESHOLD``; senão (None, confiança).
+    """
+    if not getattr(settings, "AI_LOCAL_CATEGORIZER_ENABLED", True):
+        return None, 0.0
+    model = registry.get(user.id)
+    if model is None:
+        return None, 0.0
+    category_id, confidence = model.predict(text, category_type, category_ids)
+    if confidence < get_threshold():
+        return None, confidence
+    return category_id, confidence
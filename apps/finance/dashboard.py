@@ -0,0 +1,108 @@
+"""
+Dados do dashboard em uma única resposta.
+
+Substitui as chamadas separadas do frontend (relatório do mês atual e do
+anterior, metas ativas, status dos orçamentos e transações do mês) por
+consultas agrupadas:
+
+1. totais consolidados dos dois meses (``get_months_summary``);
+2. série diária do mês, agregada no banco a partir do queryset do mês;
+3. metas ativas, sem as contribuições;
+4. orçamentos ativos e 5. gasto de todos eles (``evaluate_budgets``).
+"""
+
+from datetime import date
+
+from django.db.models import Sum
+
+from apps.core.periods import add_months, month_filter
+
+from .budgets import active_budgets, evaluate_budgets
+from .models import Goal, Transaction
+from .monthly_totals import get_months_summary
+
+
+def month_report(month: date, summary: dict) -> dict:
+    """Formata o resumo do mês no formato de ``reports/monthly/``."""
+    return {
+        "month": f"{month:%Y-%m}",
+        "income": float(summary["income"]),
+        "expenses": float(summary["expenses"]),
+        "balance": float(summary["income"] - summary["expenses"]),
+        "top_expense_categories": summary["top_expense_categories"],
+        "transaction_count": summary["transaction_count"],
+    }
+
+
+def month_transactions(user, month: date):
+    """Transações confirmadas do mês (base da série diária)."""
+    return Transaction.objects.filter(
+        user=user, is_confirmed=True, **month_filter("date", month)
+    )
+
+
+def get_daily_totals(transactions) -> list[dict]:
+    """Receitas e despesas por dia, agregadas no banco."""
+    rows = (
+        transactions.values("date", "transaction_type")
+        .annotate(total=Sum("amount"))
+        .order_by("date")
+    )
+
+    days = {}
+    for row in rows:
+        day = days.setdefault(
+            row["date"],
+            {"date": row["date"].isoformat(), "income": 0.0, "expenses": 0.0},
+        )
+        key = (
+            "income"
+            if row["transaction_type"] == Transaction.TransactionType.INCOME
+            else "expenses"
+        )
+        day[key] += float(row["total"])
+    return list(days.values())
+
+
+def get_active_goals(user) -> list[dict]:
+    """Metas ativas com o progresso calculado (sem contribuições)."""
+    goals = Goal.objects.filter(user=user, status=Goal.GoalStatus.ACTIVE).only(
+        "id",
+        "name",
+        "goal_type",
+        "target_amount",
+        "current_amount",
+        "target_date",
+        "icon",
+        "color",
+        "created_at",
+    )
+    return [
+        {
+            "id": goal.id,
+            "name": goal.name,
+            "goal_type": goal.goal_type,
+            "target_amount": str(goal.target_amount),
+            "current_amount": str(goal.current_amount),
+            "target_date": goal.target_date.isoformat() if goal.target_date else None,
+            "icon": goal.icon,
+            "color": goal.color,
+            "progress_percentage": goal.progress_percentage,
+        }
+        for goal in goals
+    ]
+
+
+def build_dashboard(user, month: date, today: date) -> dict:
+    """Monta o payload completo do dashboard (sem insights de IA)."""
+    previous = add_months(month, -1)
+    summaries = get_months_summary(user, [month, previous])
+
+    return {
+        "month": f"{month:%Y-%m}",
+        "report": month_report(month, summaries[month]),
+        "previous_report": month_report(previous, summaries[previous]),
+        "daily": get_daily_totals(month_transactions(user, month)),
+        "goals": get_active_goals(user),
+        "budgets": evaluate_budgets(user, active_budgets(user, today), today),
+    }
@@ -0,0 +1,418 @@
+"""
+Importação em lote de extratos bancários (CSV e OFX).
+
+Os arquivos são lidos de forma incremental (linha a linha) e gravados com
+``bulk_create`` em lotes. Categorias e contas são resolvidas por nome a
+partir de um dicionário em memória por usuário. Como ``bulk_create`` não
+dispara signals, ao final a importação:
+
+- aplica os totais mensais consolidados, uma vez por mês/categoria/tipo;
+- gera os vínculos de tags das transações criadas;
+- envia ``transactions_imported`` uma única vez, para que os alertas de
+  orçamento sejam avaliados uma vez por orçamento afetado.
+"""
+
+import csv
+import io
+import re
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import islice
+
+from django.conf import settings
+from django.db import transaction as db_transaction
+
+from .categorizer import get_threshold
+from .categorizer import registry as categorizer_registry
+from .models import Account, Category, Transaction
+from .monthly_totals import apply_transaction_delta
+from .signals import transactions_imported
+from .tags import rebuild_transaction_tags
+
+BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 50
+FILE_FORMATS = ("csv", "ofx")
+
+# Cabeçalhos aceitos no CSV (comparados sem acento e em minúsculas).
+CSV_COLUMNS = {
+    "date": ("date", "data"),
+    "description": ("description", "descricao", "historico", "memo"),
+    "amount": ("amount", "valor"),
+    "type": ("type", "tipo"),
+    "category": ("category", "categoria"),
+    "account": ("account", "conta"),
+    "tags": ("tags",),
+    "notes": ("notes", "observacoes", "observacao"),
+}
+
+TYPE_ALIASES = {
+    "income": Transaction.TransactionType.INCOME,
+    "receita": Transaction.TransactionType.INCOME,
+    "entrada": Transaction.TransactionType.INCOME,
+    "credit": Transaction.TransactionType.INCOME,
+    "expense": Transaction.TransactionType.EXPENSE,
+    "despesa": Transaction.TransactionType.EXPENSE,
+    "saida": Transaction.TransactionType.EXPENSE,
+    "debit": Transaction.TransactionType.EXPENSE,
+}
+
+
+class StatementImportError(ValueError):
+    """Linha ou arquivo inválido na importação."""
+
+
+@dataclass
+class StatementRow:
+    """Linha normalizada de um extrato."""
+
+    line: int
+    date: date
+    description: str
+    amount: Decimal
+    transaction_type: str
+    category: str = ""
+    account: str = ""
+    tags: str = ""
+    notes: str = ""
+
+
+@dataclass
+class ImportResult:
+    """Resumo da importação."""
+
+    created: int = 0
+    skipped: int = 0
+    uncategorized: int = 0
+    auto_categorized: int = 0
+    errors: list[dict] = field(default_factory=list)
+    affected_budgets: int = 0
+
+    def add_error(self, line: int, message: str):
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+    def to_dict(self) -> dict:
+        return {
+            "created": self.created,
+            "skipped": self.skipped,
+            "uncategorized": self.uncategorized,
+            "auto_categorized": self.auto_categorized,
+            "errors": self.errors,
+            "affected_budgets": self.affected_budgets,
+        }
+
+
+def _fold(value: str) -> str:
+    """Minúsculas e sem acentos, para comparar nomes e cabeçalhos."""
+    normalized = unicodedata.normalize("NFKD", value.strip().lower())
+    return "".join(ch for ch in normalized if not unicodedata.combining(ch))
+
+
+AMOUNT_FIELD = Transaction._meta.get_field("amount")
+AMOUNT_PATTERN = re.compile(r"\d+(\.\d+)?")
+
+
+def parse_amount(value: str) -> Decimal:
+    """
+    Aceita "1.234,56", "1234.56", "-R$ 10,00" e "(10,00)". Recusa NaN,
+    infinito, expoentes e valores que não cabem em ``Transaction.amount``.
+    """
+    raw = value.strip().replace("R$", "").replace(" ", "")
+    negative = raw.startswith("-") or (raw.startswith("(") and raw.endswith(")"))
+    raw = raw.strip("-()+")
+    if "," in raw:
+        raw = raw.replace(".", "").replace(",", ".")
+    if not AMOUNT_PATTERN.fullmatch(raw):
+        raise StatementImportError(f"Valor inválido: {value!r}")
+    amount = Decimal(raw)
+    _, digits, exponent = amount.normalize().as_tuple()
+    integer_digits = len(digits) + exponent
+    if (
+        -exponent > AMOUNT_FIELD.decimal_places
+        or integer_digits > AMOUNT_FIELD.max_digits - AMOUNT_FIELD.decimal_places
+    ):
+        raise StatementImportError(f"Valor fora do limite: {value!r}")
+    return -amount if negative else amount
+
+
+def parse_date(value: str) -> date:
+    """Aceita YYYY-MM-DD, DD/MM/YYYY, DD-MM-YYYY e YYYYMMDD (OFX)."""
+    value = value.strip()
+    if re.match(r"\d{8}", value):
+        # OFX: YYYYMMDD seguido opcionalmente de hora e timezone.
+        value, formats = value[:8], ("%Y%m%d",)
+    else:
+        formats = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y")
+    for fmt in formats:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise StatementImportError(f"Data inválida: {value!r}")
+
+
+def _signed_row(
+    line, tx_date, description, amount, type_value="", **extra
+) -> StatementRow:
+    transaction_type = TYPE_ALIASES.get(_fold(type_value)) if type_value else None
+    if transaction_type is None:
+        transaction_type = (
+            Transaction.TransactionType.EXPENSE
+            if amount < 0
+            else Transaction.TransactionType.INCOME
+        )
+    amount = abs(amount)
+    if not amount:
+        raise StatementImportError("Valor zerado")
+    if not description:
+        raise StatementImportError("Descrição vazia")
+    return StatementRow(
+        line=line,
+        date=tx_date,
+        description=description[:255],
+        amount=amount,
+        transaction_type=transaction_type,
+        **extra,
+    )
+
+
+def iter_csv_rows(stream, result: ImportResult):
+    """Lê um CSV (separador ``,`` ou ``;``) e gera ``StatementRow`` válidas."""
+    first_line = stream.readline()
+    delimiter = ";" if first_line.count(";") > first_line.count(",") else ","
+    header = next(csv.reader([first_line], delimiter=delimiter), [])
+    positions = {}
+    for index, name in enumerate(header):
+        folded = _fold(name)
+        for column, aliases in CSV_COLUMNS.items():
+            if folded in aliases:
+                positions.setdefault(column, index)
+    missing = {"date", "description", "amount"} - positions.keys()
+    if missing:
+        raise StatementImportError(
+            f"Colunas obrigatórias ausentes: {', '.join(sorted(missing))}"
+        )
+
+    def cell(values, column):
+        index = positions.get(column)
+        return (
+            values[index].strip() if index is not None and index < len(values) else ""
+        )
+
+    for line, values in enumerate(csv.reader(stream, delimiter=delimiter), start=2):
+        if not any(value.strip() for value in values):
+            continue
+        try:
+            yield _signed_row(
+                line,
+                parse_date(cell(values, "date")),
+                cell(values, "description"),
+                parse_amount(cell(values, "amount")),
+                cell(values, "type"),
+                category=cell(values, "category"),
+                account=cell(values, "account"),
+                tags=cell(values, "tags"),
+                notes=cell(values, "notes"),
+            )
+        except StatementImportError as exc:
+            result.add_error(line, str(exc))
+
+
+OFX_TAG = re.compile(r"<(/?)([A-Z0-9.]+)>([^<\r\n]*)", re.IGNORECASE)
+
+
+def iter_ofx_rows(stream, result: ImportResult):
+    """
+    Lê um OFX (SGML 1.x ou XML 2.x) e gera ``StatementRow`` para cada
+    ``<STMTTRN>``. Não carrega o arquivo inteiro em memória.
+    """
+    current = None
+    start_line = 0
+    for line_number, line in enumerate(stream, start=1):
+        for closing, tag, value in OFX_TAG.findall(line):
+            tag = tag.upper()
+            if tag == "STMTTRN":
+                if not closing:
+                    current, start_line = {}, line_number
+                elif current is not None:
+                    try:
+                        yield _signed_row(
+                            start_line,
+                            parse_date(current.get("DTPOSTED", "")),
+                            (current.get("MEMO") or current.get("NAME") or "").strip(),
+                            parse_amount(current.get("TRNAMT", "")),
+                        )
+                    except StatementImportError as exc:
+                        result.add_error(start_line, str(exc))
+                    current = None
+            elif current is not None and not closing and value.strip():
+                current[tag] = value.strip()
+
+
+OFX_CHARSET = re.compile(rb"CHARSET:\s*(\S+)|encoding=[\"']([\w-]+)", re.IGNORECASE)
+
+
+def detect_encoding(uploaded, file_format: str) -> str:
+    """CSV: UTF-8 (com ou sem BOM). OFX: charset declarado no cabeçalho."""
+    if file_format != "ofx":
+        return "utf-8-sig"
+    head = uploaded.read(1024)
+    uploaded.seek(0)
+    match = OFX_CHARSET.search(head)
+    charset = (match.group(1) or match.group(2)).decode() if match else ""
+    if charset.isdigit():
+        return f"cp{charset}"
+    return charset.lower() if charset and charset.upper() != "NONE" else "utf-8-sig"
+
+
+def open_statement(uploaded, encoding: str):
+    """Abre um arquivo binário (upload ou disco) como texto em streaming."""
+    return io.TextIOWrapper(uploaded, encoding=encoding, errors="replace", newline="")
+
+
+def detect_format(filename: str, file_format: str | None = None) -> str:
+    """Retorna o formato informado ou deduzido da extensão do arquivo."""
+    file_format = (file_format or filename.rsplit(".", 1)[-1]).lower()
+    if file_format not in FILE_FORMATS:
+        raise StatementImportError("Formato não suportado. Use csv ou ofx")
+    return file_format
+
+
+class StatementImporter:
+    """Grava linhas de extrato de um usuário em lotes."""
+
+    def __init__(
+        self, user, account: Account | None = None, batch_size: int = BATCH_SIZE
+    ):
+        self.user = user
+        self.account = account
+        self.batch_size = batch_size
+        self.categories = {
+            (category.category_type, _fold(category.name)): category.id
+            for category in Category.objects.filter(user=user).only(
+                "id", "name", "category_type"
+            )
+        }
+        self.accounts = {
+            _fold(acc.name): acc.id
+            for acc in Account.objects.filter(user=user).only("id", "name")
+        }
+        # Carregado uma vez: o modelo não é re-treinado com as próprias sugestões.
+        self.categorizer = (
+            categorizer_registry.get(user.id)
+            if getattr(settings, "AI_LOCAL_CATEGORIZER_ENABLED", True)
+            else None
+        )
+        self.threshold = get_threshold()
+        self.result = ImportResult()
+        self._rollup = defaultdict(lambda: [Decimal("0"), 0])
+        self._expense_categories = set()
+
+    def build(self, row: StatementRow) -> Transaction:
+        category_id = None
+        if row.category:
+            category_id = self.categories.get(
+                (row.transaction_type, _fold(row.category))
+            )
+        confidence = None
+        if category_id is None and self.categorizer is not None and row.description:
+            suggested, score = self.categorizer.predict(
+                row.description, row.transaction_type
+            )
+            if suggested is not None and score >= self.threshold:
+                category_id, confidence = suggested, round(score, 3)
+                self.result.auto_categorized += 1
+        if category_id is None:
+            self.result.uncategorized += 1
+
+        account_id = self.accounts.get(_fold(row.account)) if row.account else None
+        if account_id is None and self.account is not None:
+            account_id = self.account.id
+
+        return Transaction(
+            user=self.user,
+            transaction_type=row.transaction_type,
+            amount=row.amount,
+            date=row.date,
+            description=row.description,
+            category_id=category_id,
+            account_id=account_id,
+            tags=row.tags[:255],
+            notes=row.notes,
+            is_confirmed=True,
+            ai_categorized=confidence is not None,
+            ai_confidence=confidence,
+        )
+
+    def run(self, rows) -> ImportResult:
+        rows = iter(rows)
+        with db_transaction.atomic():
+            while batch := [self.build(row) for row in islice(rows, self.batch_size)]:
+                self._write(batch)
+            self._finish()
+        return self.result
+
+    def _write(self, batch: list[Transaction]):
+        created = Transaction.objects.bulk_create(batch)
+        self.result.created += len(created)
+        for tx in created:
+            bucket = self._rollup[
+                (tx.date.replace(day=1), tx.category_id, tx.transaction_type)
+            ]
+            bucket[0] += tx.amount
+            bucket[1] += 1
+            if (
+                tx.transaction_type == Transaction.TransactionType.EXPENSE
+                and tx.category_id
+            ):
+                self._expense_categories.add(tx.category_id)
+
+        # Tags por lote: o ``pk__in`` fica limitado a ``batch_size`` parâmetros
+        tagged_ids = [tx.pk for tx in created if tx.tags]
+        if tagged_ids:
+            rebuild_transaction_tags(
+                transactions=Transaction.objects.filter(pk__in=tagged_ids)
+            )
+
+    def _finish(self):
+        for (month, category_id, transaction_type), (
+            total,
+            count,
+        ) in self._rollup.items():
+            apply_transaction_delta(
+                self.user.id, month, category_id, transaction_type, total, count
+            )
+
+        responses = transactions_imported.send(
+            sender=Transaction,
+            user=self.user,
+            category_ids=self._expense_categories,
+        )
+        self.result.affected_budgets = sum(
+            response or 0 for _, response in responses if isinstance(response, int)
+        )
+
+
+def import_statement(
+    user, uploaded, file_format: str, account=None, encoding=None
+) -> ImportResult:
+    """
+    Importa um extrato (arquivo binário) para o usuário.
+
+    Raises:
+        StatementImportError: Se o arquivo/cabeçalho for inválido
+    """
+    stream = open_statement(
+        uploaded, encoding or detect_encoding(uploaded, file_format)
+    )
+    importer = StatementImporter(user, account=account)
+    parser = iter_csv_rows if file_format == "csv" else iter_ofx_rows
+    try:
+        importer.run(parser(stream, importer.result))
+    finally:
+        stream.detach()
+    return importer.result
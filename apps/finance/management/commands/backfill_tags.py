@@ -0,0 +1,29 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.finance.tags import rebuild_transaction_tags
+
+
+class Command(BaseCommand):
+    help = "Gera as tags normalizadas a partir do campo tags das transações."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--username",
+            help="Processa apenas as transações de um usuario especifico.",
+        )
+
+    def handle(self, *args, **options):
+        username = options.get("username")
+
+        if username:
+            user = get_user_model().objects.filter(username=username).first()
+            if not user:
+                raise CommandError(f"Usuario '{username}' nao encontrado.")
+            created = rebuild_transaction_tags(user=user)
+        else:
+            created = rebuild_transaction_tags()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Concluido. Vinculos de tags criados: {created}.")
+        )
@@ -0,0 +1,64 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.finance.importers import (
+    FILE_FORMATS,
+    StatementImportError,
+    detect_format,
+    import_statement,
+)
+from apps.finance.models import Account
+
+
+class Command(BaseCommand):
+    help = "Importa um extrato bancario (CSV ou OFX) para um usuario."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Caminho do arquivo do extrato.")
+        parser.add_argument("--username", required=True)
+        parser.add_argument(
+            "--file-format",
+            choices=FILE_FORMATS,
+            help="Formato do arquivo (padrao: deduzido da extensao).",
+        )
+        parser.add_argument("--account", help="Nome da conta padrao das transacoes.")
+        parser.add_argument(
+            "--encoding", help="Encoding do arquivo (padrao: automatico)."
+        )
+
+    def handle(self, *args, **options):
+        username = options["username"]
+        user = get_user_model().objects.filter(username=username).first()
+        if not user:
+            raise CommandError(f"Usuario '{username}' nao encontrado.")
+
+        account = None
+        if options.get("account"):
+            account = Account.objects.filter(user=user, name=options["account"]).first()
+            if not account:
+                raise CommandError(f"Conta '{options['account']}' nao encontrada.")
+
+        path = options["path"]
+        try:
+            file_format = detect_format(path, options.get("file_format"))
+            with open(path, "rb") as statement:
+                result = import_statement(
+                    user,
+                    statement,
+                    file_format,
+                    account=account,
+                    encoding=options.get("encoding"),
+                )
+        except (OSError, StatementImportError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        for error in result.errors:
+            self.stdout.write(
+                self.style.WARNING(f"Linha {error['line']}: {error['error']}")
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Concluido. Transacoes importadas: {result.created}; "
+                f"ignoradas: {result.skipped}; sem categoria: {result.uncategorized}."
+            )
+        )
@@ -0,0 +1,29 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.finance.monthly_totals import rebuild_monthly_totals
+
+
+class Command(BaseCommand):
+    help = "Regenera os totais mensais consolidados a partir das transações."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--username",
+            help="Regenera apenas os totais de um usuario especifico.",
+        )
+
+    def handle(self, *args, **options):
+        username = options.get("username")
+
+        if username:
+            user = get_user_model().objects.filter(username=username).first()
+            if not user:
+                raise CommandError(f"Usuario '{username}' nao encontrado.")
+            created = rebuild_monthly_totals(user=user)
+        else:
+            created = rebuild_monthly_totals()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Concluido. Totais mensais regenerados: {created}.")
+        )
@@ -2,6 +2,7 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 
 from apps.finance.models import Budget, Category, Transaction
+from apps.finance.monthly_totals import rebuild_monthly_totals
 
 try:
     from apps.notifications.models import AlertRule
@@ -39,9 +40,7 @@ class Command(BaseCommand):
 
         if not qs.exists():
             self.stdout.write(
-                self.style.WARNING(
-                    "Nenhuma categoria 'Saúde e Farmácia' encontrada."
-                )
+                self.style.WARNING("Nenhuma categoria 'Saúde e Farmácia' encontrada.")
             )
             return
 
@@ -94,6 +93,8 @@ class Command(BaseCommand):
                 if not dry_run:
                     with transaction.atomic():
                         tx_qs.update(category=target)
+                        # update() não dispara signals; recalcula os totais mensais
+                        rebuild_monthly_totals(user=category.user)
 
                         for budget in budget_qs:
                             budget_key = (budget.period_type, budget.start_date)
@@ -163,9 +164,7 @@ class Command(BaseCommand):
 
             renamed += 1
             self.stdout.write(
-                self.style.SUCCESS(
-                    f"{category.user.username}: renomeado para 'Saúde'."
-                )
+                self.style.SUCCESS(f"{category.user.username}: renomeado para 'Saúde'.")
             )
 
         self.stdout.write(
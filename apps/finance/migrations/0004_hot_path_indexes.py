@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("agenda", "0003_hot_path_indexes"),
+        ("finance", "0003_monthly_category_total"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "-date", "-created_at"],
+                name="transaction_user_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(
+                    ("is_confirmed", True), ("transaction_type", "EXPENSE")
+                ),
+                fields=["user", "category", "date"],
+                name="transaction_budget_spend_idx",
+            ),
+        ),
+    ]
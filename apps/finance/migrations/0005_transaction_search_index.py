@@ -0,0 +1,16 @@
+from django.db import migrations
+
+from apps.core.search import FullTextIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0004_hot_path_indexes"),
+    ]
+
+    operations = [
+        FullTextIndex(
+            "finance_transaction", ["description", "tags", "notes"]
+        ).operation(),
+    ]
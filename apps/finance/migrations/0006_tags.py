@@ -0,0 +1,127 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_tags(apps, schema_editor):
+    Transaction = apps.get_model("finance", "Transaction")
+    Tag = apps.get_model("finance", "Tag")
+    TransactionTag = apps.get_model("finance", "TransactionTag")
+
+    def parse(value):
+        names = []
+        for raw in value.split(","):
+            name = " ".join(raw.split()).lower()[:50]
+            if name and name not in names:
+                names.append(name)
+        return names
+
+    rows = list(
+        Transaction.objects.exclude(tags="").values_list("id", "user_id", "tags")
+    )
+    names = {(user_id, name) for _, user_id, tags in rows for name in parse(tags)}
+    Tag.objects.bulk_create(
+        [Tag(user_id=user_id, name=name) for user_id, name in names],
+        batch_size=1000,
+    )
+    tag_ids = {
+        (user_id, name): tag_id
+        for tag_id, user_id, name in Tag.objects.values_list("id", "user_id", "name")
+    }
+    TransactionTag.objects.bulk_create(
+        [
+            TransactionTag(transaction_id=tx_id, tag_id=tag_ids[(user_id, name)])
+            for tx_id, user_id, tags in rows
+            for name in parse(tags)
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0005_transaction_search_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tag",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, verbose_name="Nome")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="tags",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Tag",
+                "verbose_name_plural": "Tags",
+                "ordering": ["name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="TransactionTag",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="transaction_links",
+                        to="finance.tag",
+                    ),
+                ),
+                (
+                    "transaction",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="tag_links",
+                        to="finance.transaction",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Tag da Transação",
+                "verbose_name_plural": "Tags das Transações",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="tag",
+            constraint=models.UniqueConstraint(
+                fields=("user", "name"), name="unique_user_tag"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="transactiontag",
+            constraint=models.UniqueConstraint(
+                fields=("tag", "transaction"), name="unique_transaction_tag"
+            ),
+        ),
+        migrations.RunPython(populate_tags, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,8 @@
 from django.conf import settings
 from django.db import models
 
+from apps.core.search import FullTextIndex, register
+
 
 class Account(models.Model):
     """Conta financeira (Dinheiro, PIX, Banco, Cartão)."""
@@ -92,6 +94,29 @@ class Category(models.Model):
         return f"{self.name} ({self.get_category_type_display()})"
 
 
+class Tag(models.Model):
+    """Tag normalizada (minúsculas, espaços simples) de transações."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="tags",
+    )
+    name = models.CharField("Nome", max_length=50)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Tag"
+        verbose_name_plural = "Tags"
+        ordering = ["name"]
+        constraints = [
+            models.UniqueConstraint(fields=["user", "name"], name="unique_user_tag")
+        ]
+
+    def __str__(self):
+        return self.name
+
+
 class Transaction(models.Model):
     """Transação financeira (Entrada ou Saída)."""
 
@@ -170,6 +195,19 @@ class Transaction(models.Model):
         verbose_name = "Transação"
         verbose_name_plural = "Transações"
         ordering = ["-date", "-created_at"]
+        indexes = [
+            # Listagem, filtro por mês e transações recentes do usuário.
+            models.Index(
+                fields=["user", "-date", "-created_at"],
+                name="transaction_user_date_idx",
+            ),
+            # Gasto de orçamentos e alertas: só despesas confirmadas.
+            models.Index(
+                fields=["user", "category", "date"],
+                name="transaction_budget_spend_idx",
+                condition=models.Q(transaction_type="EXPENSE", is_confirmed=True),
+            ),
+        ]
 
     def __str__(self):
         sign = "+" if self.transaction_type == self.TransactionType.INCOME else "-"
@@ -183,6 +221,84 @@ class Transaction(models.Model):
         return [tag.strip() for tag in self.tags.split(",") if tag.strip()]
 
 
+class TransactionTag(models.Model):
+    """Vínculo transação-tag, mantido a partir de ``Transaction.tags``."""
+
+    transaction = models.ForeignKey(
+        Transaction,
+        on_delete=models.CASCADE,
+        related_name="tag_links",
+    )
+    tag = models.ForeignKey(
+        Tag,
+        on_delete=models.CASCADE,
+        related_name="transaction_links",
+    )
+
+    class Meta:
+        verbose_name = "Tag da Transação"
+        verbose_name_plural = "Tags das Transações"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tag", "transaction"], name="unique_transaction_tag"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.transaction_id} #{self.tag_id}"
+
+
+TRANSACTION_SEARCH_INDEX = register(
+    FullTextIndex("finance_transaction", ["description", "tags", "notes"])
+)
+
+
+class MonthlyCategoryTotal(models.Model):
+    """Total mensal consolidado por usuário, categoria e tipo.
+
+    Mantido pelos signals de Transaction e regenerável pelo comando
+    ``rebuild_monthly_totals``. Considera apenas transações confirmadas.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="monthly_totals",
+    )
+    month = models.DateField("Mês", help_text="Primeiro dia do mês")
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="monthly_totals",
+        verbose_name="Categoria",
+    )
+    transaction_type = models.CharField(
+        "Tipo",
+        max_length=10,
+        choices=Transaction.TransactionType.choices,
+    )
+    total = models.DecimalField("Total", max_digits=14, decimal_places=2, default=0)
+    count = models.IntegerField("Quantidade", default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Total Mensal"
+        verbose_name_plural = "Totais Mensais"
+        ordering = ["-month"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "month", "category", "transaction_type"],
+                name="unique_monthly_category_total",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} {self.transaction_type}: R${self.total}"
+
+
 class Budget(models.Model):
     """Orçamento por categoria."""
 
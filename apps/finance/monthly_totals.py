@@ -0,0 +1,161 @@
+"""
+Totais mensais consolidados (rollup) por usuário, categoria e tipo.
+
+Os relatórios leem desta tabela em vez de re-agregar as transações a cada
+requisição. Os signals de Transaction aplicam deltas incrementais e
+``rebuild_monthly_totals`` regenera tudo a partir das transações.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncMonth
+
+from .models import MonthlyCategoryTotal, Transaction
+
+
+def month_start(value: date) -> date:
+    """Retorna o primeiro dia do mês da data informada."""
+    return value.replace(day=1)
+
+
+def apply_transaction_delta(
+    user_id: int,
+    tx_date: date,
+    category_id: int | None,
+    transaction_type: str,
+    amount: Decimal,
+    count: int,
+) -> None:
+    """Soma (ou subtrai, com valores negativos) um delta ao total do mês."""
+    lookup = {
+        "user_id": user_id,
+        "month": month_start(tx_date),
+        "category_id": category_id,
+        "transaction_type": transaction_type,
+    }
+    rows = MonthlyCategoryTotal.objects.filter(**lookup)
+    # Categorias excluídas viram NULL e podem deixar mais de uma linha no
+    # mesmo "balde"; atualiza sempre uma única linha para não duplicar o delta.
+    pk = rows.values_list("pk", flat=True).first()
+    if pk is None:
+        if count <= 0:
+            # Nada a descontar (ex.: exclusão em cascata do usuário); o
+            # comando de rebuild corrige eventuais divergências.
+            return
+        try:
+            with transaction.atomic():
+                MonthlyCategoryTotal.objects.create(**lookup, total=amount, count=count)
+            return
+        except IntegrityError:
+            pk = rows.values_list("pk", flat=True).first()
+
+    MonthlyCategoryTotal.objects.filter(pk=pk).update(
+        total=F("total") + amount,
+        count=F("count") + count,
+    )
+
+
+def rebuild_monthly_totals(user=None) -> int:
+    """
+    Regenera os totais mensais a partir das transações confirmadas.
+    Retorna quantidade de linhas criadas.
+    """
+    transactions = Transaction.objects.filter(is_confirmed=True)
+    totals = MonthlyCategoryTotal.objects.all()
+    if user is not None:
+        transactions = transactions.filter(user=user)
+        totals = totals.filter(user=user)
+
+    rows = (
+        transactions.annotate(month=TruncMonth("date"))
+        .values("user_id", "month", "category_id", "transaction_type")
+        .annotate(total=Sum("amount"), count=Count("id"))
+        .order_by()
+    )
+
+    with transaction.atomic():
+        totals.delete()
+        created = MonthlyCategoryTotal.objects.bulk_create(
+            [MonthlyCategoryTotal(**row) for row in rows],
+            batch_size=1000,
+        )
+
+    return len(created)
+
+
+def get_month_summary(user, month: date) -> dict:
+    """
+    Retorna receitas, despesas, categorias de gasto e contagem do mês.
+    Executa uma única consulta sobre os totais consolidados.
+    """
+    return get_months_summary(user, [month])[month]
+
+
+def get_months_summary(user, months) -> dict:
+    """
+    Retorna {mês: resumo} (ver ``get_month_summary``) para os meses
+    informados, em uma única consulta.
+    """
+    summaries = {
+        month: {
+            "income": Decimal("0"),
+            "expenses": Decimal("0"),
+            "top_expense_categories": [],
+            "transaction_count": 0,
+        }
+        for month in months
+    }
+    rows = (
+        MonthlyCategoryTotal.objects.filter(user=user, month__in=summaries, count__gt=0)
+        .values("month", "transaction_type", "category__name", "category__color")
+        .annotate(total=Sum("total"), count=Sum("count"))
+        .order_by("-total")
+    )
+
+    for row in rows:
+        summary = summaries[row["month"]]
+        summary["transaction_count"] += row["count"]
+        if row["transaction_type"] == Transaction.TransactionType.INCOME:
+            summary["income"] += row["total"]
+            continue
+        summary["expenses"] += row["total"]
+        summary["top_expense_categories"].append(
+            {
+                "category__name": row["category__name"],
+                "category__color": row["category__color"],
+                "total": row["total"],
+            }
+        )
+
+    return summaries
+
+
+def get_months_history(user, first_month: date, last_month: date) -> dict:
+    """
+    Retorna {mês: {"income": Decimal, "expenses": Decimal}} para o intervalo
+    de meses (inclusivo) em uma única consulta.
+    """
+    rows = (
+        MonthlyCategoryTotal.objects.filter(
+            user=user,
+            month__gte=first_month,
+            month__lte=last_month,
+        )
+        .values("month", "transaction_type")
+        .annotate(total=Sum("total"))
+        .order_by()
+    )
+
+    history = {}
+    for row in rows:
+        totals = history.setdefault(
+            row["month"], {"income": Decimal("0"), "expenses": Decimal("0")}
+        )
+        if row["transaction_type"] == Transaction.TransactionType.INCOME:
+            totals["income"] += row["total"]
+        else:
+            totals["expenses"] += row["total"]
+    return history
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from .categorizer import suggest_category
 from .default_categories import get_or_create_category
 from .models import Account, Budget, Category, Goal, GoalContribution, Transaction
 
@@ -146,6 +147,19 @@ class TransactionSerializer(serializers.ModelSerializer):
                 validated_data["category"] = category
                 validated_data["ai_categorized"] = True
 
+        # Sem categoria: tenta o modelo local treinado com o histórico do usuário
+        request = self.context.get("request")
+        if validated_data.get("category") is None and request and request.user:
+            category_id, confidence = suggest_category(
+                request.user,
+                validated_data.get("description", ""),
+                validated_data.get("transaction_type"),
+            )
+            if category_id is not None:
+                validated_data["category_id"] = category_id
+                validated_data["ai_categorized"] = True
+                validated_data["ai_confidence"] = round(confidence, 3)
+
         return super().create(validated_data)
 
 
@@ -296,5 +310,7 @@ class GoalSerializer(serializers.ModelSerializer):
 
     def validate_target_amount(self, value):
         if value <= 0:
-            raise serializers.ValidationError("O valor da meta deve ser maior que zero.")
+            raise serializers.ValidationError(
+                "O valor da meta deve ser maior que zero."
+            )
         return value
@@ -1,10 +1,22 @@
 """
-Signals para criar categorias padrão para novos usuários.
+Signals para criar categorias padrão para novos usuários e manter os
+totais mensais consolidados e as tags normalizadas em sincronia com as
+transações.
 """
 
+from decimal import Decimal
+
 from django.conf import settings
-from django.db.models.signals import post_save
-from django.dispatch import receiver
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import Signal, receiver
+
+from .models import Transaction
+from .monthly_totals import apply_transaction_delta
+from .tags import sync_transaction_tags
+
+# Enviado uma vez ao fim de uma importação em lote (bulk_create não dispara
+# post_save). Argumentos: user, category_ids (categorias de despesa afetadas).
+transactions_imported = Signal()
 
 
 # Categorias padrão de despesas com cores distintas
@@ -95,3 +107,86 @@ def create_default_categories(sender, instance, created, **kwargs):
                 "group": cat_data.get("group", ""),
             },
         )
+
+
+def _rollup_key(values: dict) -> tuple | None:
+    """Retorna a chave do total mensal de uma transação ou None se não conta."""
+    if not values["is_confirmed"]:
+        return None
+    return (
+        values["user_id"],
+        Transaction._meta.get_field("date").to_python(values["date"]),
+        values["category_id"],
+        values["transaction_type"],
+    )
+
+
+def _rollup_values(instance) -> dict:
+    return {
+        "user_id": instance.user_id,
+        "date": instance.date,
+        "category_id": instance.category_id,
+        "transaction_type": instance.transaction_type,
+        "amount": instance.amount,
+        "is_confirmed": instance.is_confirmed,
+    }
+
+
+@receiver(pre_save, sender=Transaction)
+def track_transaction_rollup(sender, instance, **kwargs):
+    """Guarda os valores anteriores para o delta do total mensal e as tags."""
+    instance._rollup_old = None
+    if instance.pk:
+        instance._rollup_old = (
+            Transaction.objects.filter(pk=instance.pk)
+            .values(
+                "user_id",
+                "date",
+                "category_id",
+                "transaction_type",
+                "amount",
+                "is_confirmed",
+                "tags",
+            )
+            .first()
+        )
+
+
+@receiver(post_save, sender=Transaction)
+def update_rollup_on_save(sender, instance, created, **kwargs):
+    """Aplica o delta da transação criada/alterada nos totais mensais."""
+    old = getattr(instance, "_rollup_old", None)
+    new = _rollup_values(instance)
+    old_key = _rollup_key(old) if old else None
+    new_key = _rollup_key(new)
+    new_amount = Decimal(str(new["amount"]))
+
+    if old_key is not None and old_key == new_key:
+        delta = new_amount - old["amount"]
+        if delta:
+            apply_transaction_delta(*new_key, delta, 0)
+        return
+
+    if old_key is not None:
+        apply_transaction_delta(*old_key, -old["amount"], -1)
+    if new_key is not None:
+        apply_transaction_delta(*new_key, new_amount, 1)
+
+
+@receiver(post_save, sender=Transaction)
+def sync_tags_on_save(sender, instance, created, **kwargs):
+    """Atualiza os vínculos de tags quando o campo ``tags`` muda."""
+    old = getattr(instance, "_rollup_old", None)
+    old_tags = old["tags"] if old else ""
+    if (old_tags or "") == (instance.tags or ""):
+        return
+    sync_transaction_tags(instance)
+
+
+@receiver(post_delete, sender=Transaction)
+def update_rollup_on_delete(sender, instance, **kwargs):
+    """Remove a transação excluída dos totais mensais."""
+    values = _rollup_values(instance)
+    key = _rollup_key(values)
+    if key is not None:
+        apply_transaction_delta(*key, -Decimal(str(values["amount"])), -1)
@@ -0,0 +1,130 @@
+"""
+Tags normalizadas das transações.
+
+``Transaction.tags`` continua sendo o campo editável (texto separado por
+vírgula); as tabelas ``Tag``/``TransactionTag`` são derivadas dele pelo
+signal de Transaction e regeneráveis com o comando ``backfill_tags``.
+Filtros e relatórios por tag usam essas tabelas indexadas em vez de
+busca por substring.
+"""
+
+from datetime import date
+
+from django.db import transaction as db_transaction
+from django.db.models import Count, Sum
+
+from .models import Tag, Transaction, TransactionTag
+
+TAG_MAX_LENGTH = Tag._meta.get_field("name").max_length
+
+
+def normalize_tag(value: str) -> str:
+    """Minúsculas, espaços simples e limite de tamanho."""
+    return " ".join(value.split()).lower()[:TAG_MAX_LENGTH]
+
+
+def parse_tags(value: str) -> list[str]:
+    """Converte o texto "a, b, A" em nomes normalizados únicos, na ordem."""
+    names = []
+    for raw in (value or "").split(","):
+        name = normalize_tag(raw)
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def get_or_create_tags(user_id: int, names) -> dict[str, int]:
+    """Retorna {nome: tag_id}, criando as tags que faltam em lote."""
+    names = set(names)
+    if not names:
+        return {}
+    Tag.objects.bulk_create(
+        [Tag(user_id=user_id, name=name) for name in names],
+        ignore_conflicts=True,
+    )
+    return dict(
+        Tag.objects.filter(user_id=user_id, name__in=names).values_list("name", "id")
+    )
+
+
+def sync_transaction_tags(transaction: Transaction) -> None:
+    """Ajusta os vínculos de uma transação ao conteúdo de ``tags``."""
+    tag_ids = set(
+        get_or_create_tags(transaction.user_id, parse_tags(transaction.tags)).values()
+    )
+    links = TransactionTag.objects.filter(transaction=transaction)
+    current = set(links.values_list("tag_id", flat=True))
+
+    if current - tag_ids:
+        links.filter(tag_id__in=current - tag_ids).delete()
+    TransactionTag.objects.bulk_create(
+        [
+            TransactionTag(transaction=transaction, tag_id=tag_id)
+            for tag_id in tag_ids - current
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def rebuild_transaction_tags(user=None, transactions=None) -> int:
+    """
+    Regenera os vínculos de tags a partir de ``Transaction.tags``.
+
+    Restringe a ``user`` ou a um queryset de ``transactions`` quando
+    informados. Retorna a quantidade de vínculos criados.
+    """
+    if transactions is None:
+        transactions = Transaction.objects.all()
+    if user is not None:
+        transactions = transactions.filter(user=user)
+
+    rows = list(
+        transactions.exclude(tags="").values_list("id", "user_id", "tags").order_by()
+    )
+    names_by_user: dict[int, set[str]] = {}
+    for _, user_id, tags in rows:
+        names_by_user.setdefault(user_id, set()).update(parse_tags(tags))
+
+    with db_transaction.atomic():
+        TransactionTag.objects.filter(
+            transaction__in=transactions.values("id")
+        ).delete()
+        tag_ids = {
+            user_id: get_or_create_tags(user_id, names)
+            for user_id, names in names_by_user.items()
+        }
+        created = TransactionTag.objects.bulk_create(
+            [
+                TransactionTag(transaction_id=tx_id, tag_id=tag_ids[user_id][name])
+                for tx_id, user_id, tags in rows
+                for name in parse_tags(tags)
+            ],
+            batch_size=1000,
+        )
+    return len(created)
+
+
+def spend_by_tag(user, start: date, end: date, transaction_type=None) -> list[dict]:
+    """
+    Total e quantidade por tag no intervalo ``[start, end)``, em uma única
+    consulta agrupada. Considera apenas transações confirmadas.
+    """
+    rows = (
+        TransactionTag.objects.filter(
+            tag__user=user,
+            transaction__user=user,
+            transaction__is_confirmed=True,
+            transaction__transaction_type=(
+                transaction_type or Transaction.TransactionType.EXPENSE
+            ),
+            transaction__date__gte=start,
+            transaction__date__lt=end,
+        )
+        .values("tag__name")
+        .annotate(total=Sum("transaction__amount"), count=Count("transaction_id"))
+        .order_by("-total", "tag__name")
+    )
+    return [
+        {"tag": row["tag__name"], "total": row["total"], "count": row["count"]}
+        for row in rows
+    ]
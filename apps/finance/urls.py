@@ -12,5 +12,7 @@ router.register(r"goals", views.GoalViewSet, basename="goal")
 
 urlpatterns = [
     path("", include(router.urls)),
+    path("dashboard/", views.dashboard, name="dashboard"),
     path("reports/monthly/", views.monthly_report, name="monthly-report"),
+    path("reports/tags/", views.tag_report, name="tag-report"),
 ]
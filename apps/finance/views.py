@@ -1,16 +1,32 @@
-from calendar import monthrange
 from datetime import date, timedelta
-from decimal import Decimal
 
-from django.db.models import Q, Sum
-from django_filters import rest_framework as filters
+from django.db.models import F
 from django.utils import timezone
+from django_filters import rest_framework as filters
 from rest_framework import status, viewsets
 from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from .models import Account, Budget, Category, Goal, Transaction
+from apps.core.exports import ExportMixin
+from apps.core.pagination import PageOrCursorPagination
+from apps.core.periods import month_bounds, month_filter, next_day, parse_month
+
+from .budgets import active_budgets, evaluate_budgets
+from .dashboard import build_dashboard, month_report
+from .importers import StatementImportError, detect_format, import_statement
+from .models import (
+    TRANSACTION_SEARCH_INDEX,
+    Account,
+    Budget,
+    Category,
+    Goal,
+    Tag,
+    Transaction,
+)
+from .monthly_totals import get_month_summary
 from .serializers import (
     AccountSerializer,
     BudgetSerializer,
@@ -19,49 +35,7 @@ from .serializers import (
     GoalSerializer,
     TransactionSerializer,
 )
-
-
-def _add_months(value: date, months: int) -> date:
-    total_months = value.month - 1 + months
-    year = value.year + total_months // 12
-    month = total_months % 12 + 1
-    day = min(value.day, monthrange(year, month)[1])
-    return date(year, month, day)
-
-
-def _get_period_range(start_date: date, period_type: str, today: date) -> tuple[date, date]:
-    if today < start_date:
-        if period_type == Budget.PeriodType.WEEKLY:
-            period_start = start_date
-            period_end = start_date + timedelta(days=6)
-        elif period_type == Budget.PeriodType.MONTHLY:
-            period_start = start_date
-            period_end = _add_months(start_date, 1) - timedelta(days=1)
-        else:
-            period_start = start_date
-            period_end = _add_months(start_date, 12) - timedelta(days=1)
-        return period_start, period_end
-
-    if period_type == Budget.PeriodType.WEEKLY:
-        weeks = (today - start_date).days // 7
-        period_start = start_date + timedelta(days=weeks * 7)
-        period_end = period_start + timedelta(days=6)
-        return period_start, period_end
-
-    if period_type == Budget.PeriodType.MONTHLY:
-        months = (today.year - start_date.year) * 12 + (today.month - start_date.month)
-        period_start = _add_months(start_date, months)
-        if period_start > today:
-            period_start = _add_months(period_start, -1)
-        period_end = _add_months(period_start, 1) - timedelta(days=1)
-        return period_start, period_end
-
-    years = today.year - start_date.year
-    period_start = _add_months(start_date, years * 12)
-    if period_start > today:
-        period_start = _add_months(period_start, -12)
-    period_end = _add_months(period_start, 12) - timedelta(days=1)
-    return period_start, period_end
+from .tags import normalize_tag, spend_by_tag
 
 
 class AccountViewSet(viewsets.ModelViewSet):
@@ -98,26 +72,62 @@ class TransactionFilter(filters.FilterSet):
     account = filters.NumberFilter(field_name="account_id")
     start_date = filters.DateFilter(field_name="date", lookup_expr="gte")
     end_date = filters.DateFilter(field_name="date", lookup_expr="lte")
+    tag = filters.CharFilter(method="filter_by_tag")
 
     class Meta:
         model = Transaction
-        fields = ["month", "type", "category", "account", "start_date", "end_date"]
+        fields = [
+            "month",
+            "type",
+            "category",
+            "account",
+            "start_date",
+            "end_date",
+            "tag",
+        ]
 
     def filter_by_month(self, queryset, name, value):
         """Filter by month in format YYYY-MM."""
         try:
-            year, month = value.split("-")
-            return queryset.filter(date__year=int(year), date__month=int(month))
-        except (ValueError, AttributeError):
-            return queryset
+            month = parse_month(value)
+        except ValueError:
+            raise ValidationError({"month": "Formato inválido. Use YYYY-MM"})
+        return queryset.filter(**month_filter("date", month))
+
+    def filter_by_tag(self, queryset, name, value):
+        """Filtra pela tag normalizada (índice de tags, sem busca por substring)."""
+        tag_ids = Tag.objects.filter(
+            user=self.request.user, name=normalize_tag(value)
+        ).values("id")
+        return queryset.filter(tag_links__tag_id__in=tag_ids)
 
 
-class TransactionViewSet(viewsets.ModelViewSet):
+class TransactionViewSet(ExportMixin, viewsets.ModelViewSet):
     serializer_class = TransactionSerializer
     permission_classes = [IsAuthenticated]
     filterset_class = TransactionFilter
     search_fields = ["description", "notes", "tags"]
+    search_index = TRANSACTION_SEARCH_INDEX
+    export_fields = (
+        "id",
+        "date",
+        "transaction_type",
+        "amount",
+        "description",
+        "tags",
+        "notes",
+        "is_confirmed",
+        "created_at",
+    )
+    export_annotations = {
+        "category_name": F("category__name"),
+        "account_name": F("account__name"),
+    }
+    export_ordering = ("-date", "-created_at", "id")
+    export_filename = "transacoes"
     ordering_fields = ["date", "amount", "created_at"]
+    pagination_class = PageOrCursorPagination
+    cursor_ordering = ("-date", "-created_at", "id")
 
     def get_queryset(self):
         return Transaction.objects.filter(user=self.request.user).select_related(
@@ -127,6 +137,45 @@ class TransactionViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser],
+    )
+    def bulk_import(self, request):
+        """
+        Importa extrato CSV ou OFX em lote.
+        Form-data: file, file_format (csv|ofx, opcional: usa a extensão),
+        account (id da conta padrão, opcional).
+        """
+        uploaded = request.FILES.get("file")
+        if not uploaded:
+            return Response(
+                {"error": "Envie o arquivo no campo 'file'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        account = None
+        account_id = request.data.get("account")
+        if account_id:
+            account = Account.objects.filter(user=request.user, pk=account_id).first()
+            if account is None:
+                return Response(
+                    {"error": "Conta não encontrada."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        try:
+            file_format = detect_format(uploaded.name, request.data.get("file_format"))
+            result = import_statement(
+                request.user, uploaded, file_format, account=account
+            )
+        except StatementImportError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(result.to_dict(), status=status.HTTP_201_CREATED)
+
 
 class BudgetFilter(filters.FilterSet):
     category = filters.NumberFilter(field_name="category_id")
@@ -155,48 +204,10 @@ class BudgetViewSet(viewsets.ModelViewSet):
     def status(self, request):
         """Retorna status dos orçamentos ativos no período atual."""
         today = timezone.localdate()
-        budgets = (
-            self.get_queryset()
-            .filter(is_active=True)
-            .filter(Q(end_date__isnull=True) | Q(end_date__gte=today))
+        status_list = evaluate_budgets(
+            request.user, active_budgets(request.user, today), today
         )
 
-        status_list = []
-        for budget in budgets:
-            period_start, period_end = _get_period_range(
-                budget.start_date, budget.period_type, today
-            )
-            spent = (
-                Transaction.objects.filter(
-                    user=request.user,
-                    transaction_type=Transaction.TransactionType.EXPENSE,
-                    category=budget.category,
-                    date__gte=period_start,
-                    date__lte=period_end,
-                    is_confirmed=True,
-                ).aggregate(total=Sum("amount"))["total"]
-                or Decimal("0")
-            )
-            percentage = (
-                float((spent / budget.amount) * 100) if budget.amount else 0.0
-            )
-            status_list.append(
-                {
-                    "id": budget.id,
-                    "category": budget.category_id,
-                    "category_name": budget.category.name,
-                    "amount": float(budget.amount),
-                    "spent": float(spent),
-                    "remaining": float(budget.amount - spent),
-                    "percentage_used": round(percentage, 2),
-                    "alert_threshold": budget.alert_threshold,
-                    "alert_reached": percentage >= budget.alert_threshold,
-                    "period_type": budget.period_type,
-                    "period_start": period_start.isoformat(),
-                    "period_end": period_end.isoformat(),
-                }
-            )
-
         return Response(status_list)
 
 
@@ -259,51 +270,74 @@ def monthly_report(request):
     """
     month = request.query_params.get("month")
     if not month:
-        return Response({"error": "Parâmetro 'month' é obrigatório (YYYY-MM)"}, status=400)
+        return Response(
+            {"error": "Parâmetro 'month' é obrigatório (YYYY-MM)"}, status=400
+        )
 
     try:
-        year, month_num = month.split("-")
-        year = int(year)
-        month_num = int(month_num)
-    except (ValueError, AttributeError):
+        month_date = parse_month(month)
+    except ValueError:
         return Response({"error": "Formato inválido. Use YYYY-MM"}, status=400)
 
-    transactions = Transaction.objects.filter(
-        user=request.user,
-        date__year=year,
-        date__month=month_num,
-        is_confirmed=True,
-    )
+    # Totais consolidados do mês (uma leitura indexada em vez de varrer transações)
+    summary = get_month_summary(request.user, month_date)
+    return Response(month_report(month_date, summary))
 
-    income = (
-        transactions.filter(transaction_type=Transaction.TransactionType.INCOME).aggregate(
-            total=Sum("amount")
-        )["total"]
-        or 0
-    )
 
-    expenses = (
-        transactions.filter(transaction_type=Transaction.TransactionType.EXPENSE).aggregate(
-            total=Sum("amount")
-        )["total"]
-        or 0
-    )
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def dashboard(request):
+    """
+    Retorna em uma única resposta os dados do dashboard: relatório do mês e
+    do mês anterior, série diária, metas ativas e status dos orçamentos.
+    Query param: month (YYYY-MM, padrão: mês atual)
+    """
+    today = timezone.localdate()
+    month = request.query_params.get("month")
+    try:
+        month_date = parse_month(month) if month else today.replace(day=1)
+    except ValueError:
+        return Response({"error": "Formato inválido. Use YYYY-MM"}, status=400)
 
-    # Categorias de gasto ordenadas por total
-    top_expense_categories = (
-        transactions.filter(transaction_type=Transaction.TransactionType.EXPENSE)
-        .values("category__name", "category__color")
-        .annotate(total=Sum("amount"))
-        .order_by("-total")
-    )
+    return Response(build_dashboard(request.user, month_date, today))
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def tag_report(request):
+    """
+    Retorna total e quantidade de transações por tag.
+    Query params: month (YYYY-MM) ou start_date/end_date (YYYY-MM-DD,
+    inclusivos); type (EXPENSE|INCOME, padrão EXPENSE). Padrão: mês atual.
+    """
+    params = request.query_params
+    transaction_type = params.get("type", Transaction.TransactionType.EXPENSE)
+    if transaction_type not in Transaction.TransactionType.values:
+        return Response({"error": "Tipo inválido. Use EXPENSE ou INCOME"}, status=400)
+
+    try:
+        if params.get("start_date") or params.get("end_date"):
+            start = date.fromisoformat(params["start_date"])
+            end = next_day(date.fromisoformat(params["end_date"]))
+        else:
+            month = params.get("month")
+            month_date = parse_month(month) if month else timezone.localdate()
+            start, end = month_bounds(month_date)
+    except (KeyError, ValueError):
+        return Response(
+            {"error": "Informe month (YYYY-MM) ou start_date e end_date (YYYY-MM-DD)"},
+            status=400,
+        )
 
+    tags = spend_by_tag(request.user, start, end, transaction_type)
     return Response(
         {
-            "month": month,
-            "income": float(income),
-            "expenses": float(expenses),
-            "balance": float(income - expenses),
-            "top_expense_categories": list(top_expense_categories),
-            "transaction_count": transactions.count(),
+            "start_date": start.isoformat(),
+            "end_date": (end - timedelta(days=1)).isoformat(),
+            "type": transaction_type,
+            "tags": [
+                {"tag": row["tag"], "total": float(row["total"]), "count": row["count"]}
+                for row in tags
+            ],
         }
     )
@@ -121,6 +121,18 @@ class Notification(models.Model):
         verbose_name = "Notificação"
         verbose_name_plural = "Notificações"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at"],
+                name="notification_user_created_idx",
+            ),
+            # Contagem de não lidas (total e por prioridade).
+            models.Index(
+                fields=["user", "priority"],
+                name="notification_unread_idx",
+                condition=models.Q(is_read=False),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.user.username}"
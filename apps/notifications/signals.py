@@ -11,6 +11,7 @@ from django.dispatch import receiver
 from django.utils import timezone
 
 from apps.finance.models import Budget, Goal, GoalContribution, Transaction
+from apps.finance.signals import transactions_imported
 
 from .models import AlertRule, Notification
 
@@ -41,24 +42,37 @@ def check_budget_on_transaction(sender, instance, created, **kwargs):
     if not instance.category:
         return
 
-    today = timezone.localdate()
-    budgets = Budget.objects.filter(
-        user=instance.user,
-        category=instance.category,
-        is_active=True,
-        start_date__lte=today,
-    ).filter(
-        Q(end_date__isnull=True) | Q(end_date__gte=today)
-    )
+    for budget in _active_budgets(instance.user, [instance.category_id]):
+        _check_budget_alerts(budget, instance.user)
 
+
+@receiver(transactions_imported)
+def check_budgets_on_import(sender, user, category_ids, **kwargs):
+    """Verifica cada orçamento afetado uma única vez após importação em lote."""
+    budgets = list(_active_budgets(user, category_ids)) if category_ids else []
     for budget in budgets:
-        _check_budget_alerts(budget, instance.user)
+        _check_budget_alerts(budget, user)
+    return len(budgets)
+
+
+def _active_budgets(user, category_ids):
+    today = timezone.localdate()
+    return (
+        Budget.objects.filter(
+            user=user,
+            category_id__in=category_ids,
+            is_active=True,
+            start_date__lte=today,
+        )
+        .filter(Q(end_date__isnull=True) | Q(end_date__gte=today))
+        .select_related("category")
+    )
 
 
 def _check_budget_alerts(budget, user):
     """Verifica alertas de orçamento."""
-    from datetime import timedelta
     from calendar import monthrange
+    from datetime import timedelta
 
     today = timezone.localdate()
 
@@ -67,15 +81,21 @@ def _check_budget_alerts(budget, user):
         period_start = budget.start_date + timedelta(days=weeks * 7)
         period_end = period_start + timedelta(days=6)
     elif budget.period_type == Budget.PeriodType.MONTHLY:
-        period_start = today.replace(day=min(budget.start_date.day, monthrange(today.year, today.month)[1]))
+        period_start = today.replace(
+            day=min(budget.start_date.day, monthrange(today.year, today.month)[1])
+        )
         if period_start > today:
             if today.month == 1:
                 period_start = period_start.replace(year=today.year - 1, month=12)
             else:
-                new_day = min(budget.start_date.day, monthrange(today.year, today.month - 1)[1])
+                new_day = min(
+                    budget.start_date.day, monthrange(today.year, today.month - 1)[1]
+                )
                 period_start = period_start.replace(month=today.month - 1, day=new_day)
         next_month = period_start.month + 1 if period_start.month < 12 else 1
-        next_year = period_start.year if period_start.month < 12 else period_start.year + 1
+        next_year = (
+            period_start.year if period_start.month < 12 else period_start.year + 1
+        )
         period_end = period_start.replace(
             year=next_year,
             month=next_month,
@@ -83,19 +103,18 @@ def _check_budget_alerts(budget, user):
         ) - timedelta(days=1)
     else:
         period_start = budget.start_date
-        period_end = budget.start_date.replace(year=budget.start_date.year + 1) - timedelta(days=1)
+        period_end = budget.start_date.replace(
+            year=budget.start_date.year + 1
+        ) - timedelta(days=1)
 
-    spent = (
-        Transaction.objects.filter(
-            user=user,
-            transaction_type=Transaction.TransactionType.EXPENSE,
-            category=budget.category,
-            date__gte=period_start,
-            date__lte=period_end,
-            is_confirmed=True,
-        ).aggregate(total=Sum("amount"))["total"]
-        or Decimal("0")
-    )
+    spent = Transaction.objects.filter(
+        user=user,
+        transaction_type=Transaction.TransactionType.EXPENSE,
+        category=budget.category,
+        date__gte=period_start,
+        date__lte=period_end,
+        is_confirmed=True,
+    ).aggregate(total=Sum("amount"))["total"] or Decimal("0")
 
     percentage = float(spent / budget.amount * 100) if budget.amount else 0
 
@@ -103,9 +122,7 @@ def _check_budget_alerts(budget, user):
         user=user,
         alert_type=AlertRule.AlertType.BUDGET_THRESHOLD,
         is_enabled=True,
-    ).filter(
-        Q(category__isnull=True) | Q(category=budget.category)
-    )
+    ).filter(Q(category__isnull=True) | Q(category=budget.category))
 
     for rule in threshold_rules:
         threshold = rule.threshold_percentage or 80
@@ -6,6 +6,8 @@ from rest_framework.exceptions import MethodNotAllowed
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from apps.core.pagination import PageOrCursorPagination
+
 from .models import AlertRule, Notification
 from .serializers import AlertRuleSerializer, NotificationSerializer
 
@@ -26,7 +28,9 @@ class AlertRuleViewSet(viewsets.ModelViewSet):
     filterset_class = AlertRuleFilter
 
     def get_queryset(self):
-        return AlertRule.objects.filter(user=self.request.user).select_related("category")
+        return AlertRule.objects.filter(user=self.request.user).select_related(
+            "category"
+        )
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -35,7 +39,10 @@ class AlertRuleViewSet(viewsets.ModelViewSet):
     def setup_defaults(self, request):
         """Cria regras de alerta padrão para o usuário."""
         defaults = [
-            {"alert_type": AlertRule.AlertType.BUDGET_THRESHOLD, "threshold_percentage": 80},
+            {
+                "alert_type": AlertRule.AlertType.BUDGET_THRESHOLD,
+                "threshold_percentage": 80,
+            },
             {"alert_type": AlertRule.AlertType.BUDGET_EXCEEDED},
             {"alert_type": AlertRule.AlertType.GOAL_ACHIEVED},
             {"alert_type": AlertRule.AlertType.UNUSUAL_EXPENSE},
@@ -80,6 +87,8 @@ class NotificationViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     filterset_class = NotificationFilter
     http_method_names = ["get", "patch", "delete", "post"]
+    pagination_class = PageOrCursorPagination
+    cursor_ordering = ("-created_at", "-id")
 
     def get_queryset(self):
         return Notification.objects.filter(user=self.request.user)
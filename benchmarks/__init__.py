@@ -0,0 +1,14 @@
+"""
+Benchmarks de desempenho.
+
+Cada módulo roda isolado em um banco de teste descartável:
+
+    python -m benchmarks.<modulo> [opções]
+
+Importar o pacote configura o Django, então os módulos importam models e
+views no topo, como o resto do projeto.
+"""
+
+from . import _django
+
+_django.setup()
@@ -0,0 +1,61 @@
+"""
+Categorização: tamanho do prompt de N chamadas simples vs uma chamada em lote.
+
+Monta os prompts reais (``CATEGORIZE_PROMPT`` por texto e
+``BATCH_CATEGORIZE_PROMPT`` por lote) com as categorias padrão de despesa e
+estima os tokens de entrada (~4 caracteres por token). A lista de
+categorias e as instruções, que dominam o prompt, passam a ir uma vez por
+lote em vez de uma vez por texto.
+
+Uso:
+    python -m benchmarks.categorize_batch [--texts 25] [--batch-size 25]
+"""
+
+import argparse
+
+from apps.ai.services.categorization_service import (
+    BATCH_CATEGORIZE_PROMPT,
+    CATEGORIZE_PROMPT,
+)
+from apps.finance.default_categories import get_default_expense_category_names
+
+SAMPLES = [
+    "uber 23,50", "mercado 150 pix", "ifood pizza 64,80", "farmácia 45,90",
+    "academia 99,90", "conta de luz 180", "padaria 12", "cinema 44",
+]  # fmt: skip
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--texts", type=int, default=25)
+    parser.add_argument("--batch-size", type=int, default=25)
+    args = parser.parse_args()
+
+    categories = "\n".join(f"- {name}" for name in get_default_expense_category_names())
+    texts = [SAMPLES[i % len(SAMPLES)] for i in range(args.texts)]
+
+    single = sum(
+        estimate_tokens(CATEGORIZE_PROMPT.format(categories=categories, text=text))
+        for text in texts
+    )
+    batched = calls = 0
+    for start in range(0, len(texts), args.batch_size):
+        chunk = texts[start : start + args.batch_size]
+        numbered = "\n".join(f"{i}. {text}" for i, text in enumerate(chunk))
+        batched += estimate_tokens(
+            BATCH_CATEGORIZE_PROMPT.format(categories=categories, texts=numbered)
+        )
+        calls += 1
+
+    print(f"{args.texts} textos, lotes de {args.batch_size}")
+    print(f"simples: {args.texts:>4} chamadas, ~{single:>7} tokens de entrada")
+    print(f"lote:    {calls:>4} chamadas, ~{batched:>7} tokens de entrada")
+    print(f"redução: {single / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
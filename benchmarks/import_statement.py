@@ -0,0 +1,101 @@
+"""
+Importação de extrato: pipeline em lote vs criação linha a linha.
+
+Gera um CSV sintético, importa com ``import_statement`` e compara com
+``Transaction.objects.create`` por linha (que dispara os signals de totais,
+tags e alertas de orçamento a cada transação). A criação por linha é medida
+em uma amostra e extrapolada.
+
+Uso:
+    python -m benchmarks.import_statement [--rows 20000] [--sample 500]
+"""
+
+import argparse
+import io
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.finance.importers import import_statement
+from apps.finance.models import Budget, Category, Transaction
+from apps.notifications.models import AlertRule
+from benchmarks import _django
+
+CATEGORIES = [
+    "Mercado",
+    "Combustível",
+    "Farmácia",
+    "Restaurantes e Delivery",
+    "Lazer e Cultura",
+]
+
+
+def build_csv(rows: int, rng) -> bytes:
+    today = timezone.localdate()
+    lines = ["Data;Descrição;Valor;Categoria;Tags"]
+    for i in range(rows):
+        day = today - timedelta(days=rng.randrange(365))
+        lines.append(
+            f"{day:%d/%m/%Y};Compra {i};-{rng.randint(100, 50000) / 100:.2f};"
+            f"{rng.choice(CATEGORIES)};{rng.choice(['casa', 'viagem', 'trabalho'])}"
+        )
+    return "\n".join(lines).encode()
+
+
+def setup_user(username: str):
+    user = get_user_model().objects.create_user(username=username, password="x")
+    start = timezone.localdate().replace(day=1)
+    for category in Category.objects.filter(user=user, name__in=CATEGORIES):
+        Budget.objects.create(
+            user=user, category=category, amount=Decimal("500"), start_date=start
+        )
+    AlertRule.objects.create(user=user, alert_type=AlertRule.AlertType.BUDGET_EXCEEDED)
+    return user
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--sample", type=int, default=500)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    content = build_csv(args.rows, rng)
+
+    with _django.scratch_database():
+        user = setup_user("bench_import")
+        start = time.perf_counter()
+        result = import_statement(user, io.BytesIO(content), "csv")
+        bulk_seconds = time.perf_counter() - start
+        print(f"Lote: {result.created} linhas em {bulk_seconds:.2f} s")
+
+        user = setup_user("bench_rows")
+        categories = dict(
+            Category.objects.filter(user=user, category_type="EXPENSE").values_list(
+                "name", "id"
+            )
+        )
+        start = time.perf_counter()
+        for i in range(args.sample):
+            Transaction.objects.create(
+                user=user,
+                transaction_type="EXPENSE",
+                amount=Decimal(rng.randint(100, 50000)) / 100,
+                date=date.today() - timedelta(days=rng.randrange(365)),
+                description=f"Compra {i}",
+                category_id=categories[rng.choice(CATEGORIES)],
+                tags="casa",
+            )
+        per_row = (time.perf_counter() - start) / args.sample
+        print(
+            f"Linha a linha: {per_row * 1000:.2f} ms/linha "
+            f"(~{per_row * args.rows:.1f} s para {args.rows} linhas)"
+        )
+
+
+if __name__ == "__main__":
+    main()
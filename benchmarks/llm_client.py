@@ -0,0 +1,100 @@
+"""
+Cliente LLM: instância nova por chamada vs cliente compartilhado do processo.
+
+Sobe um servidor local que imita ``/chat/completions`` (HTTP/1.1 com
+keep-alive) e mede o tempo por chamada criando um ``OpenAI`` a cada vez
+(comportamento antigo: novo pool httpx, novo contexto TLS e nova conexão)
+e usando ``get_llm_client`` (pool compartilhado). Contra Groq/Ollama remotos
+a diferença é maior, pois cada conexão nova também paga o handshake TLS.
+
+Uso:
+    python -m benchmarks.llm_client [--calls 200]
+"""
+
+import argparse
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import override_settings
+from openai import OpenAI
+
+from apps.ai.services.llm_clients import registry
+from apps.ai.services.ollama_client import get_llm_client
+from benchmarks import _django
+
+COMPLETION = json.dumps(
+    {
+        "id": "bench",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "stub",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": "{}"},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = set()
+
+    def do_POST(self):
+        self.connections.add(self.client_address)
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(COMPLETION)))
+        self.end_headers()
+        self.wfile.write(COMPLETION)
+
+    def log_message(self, *args):
+        pass
+
+
+def call(client):
+    client.chat.completions.create(
+        model="stub", messages=[{"role": "user", "content": "uber 23,50"}]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}/v1"
+
+    with override_settings(LLM_PROVIDER="ollama", OLLAMA_BASE_URL=base_url):
+        StubHandler.connections.clear()
+        fresh = _django.timed(
+            lambda: call(OpenAI(api_key="ollama", base_url=base_url)), args.calls
+        )
+        fresh_connections = len(StubHandler.connections)
+
+        call(get_llm_client("parse"))  # aquece o registro
+        StubHandler.connections.clear()
+        pooled = _django.timed(lambda: call(get_llm_client("parse")), args.calls)
+        pooled_connections = len(StubHandler.connections)
+        registry.clear()
+
+    server.shutdown()
+    print(
+        f"Cliente novo por chamada: {fresh:.2f} ms/chamada ({fresh_connections} conexões)"
+    )
+    print(
+        f"Cliente compartilhado:    {pooled:.2f} ms/chamada ({pooled_connections} conexões)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Filtros por mês: ``__year``/``__month`` vs intervalo semiaberto.
+
+Popula um banco descartável com o histórico de um usuário "pesado" e
+compara o plano de execução (EXPLAIN) e o tempo das duas formas de filtro
+para transações e eventos.
+
+Uso:
+    python -m benchmarks.month_filters [--rows 200000] [--years 5]
+"""
+
+import argparse
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.agenda.models import Event
+from apps.core.periods import month_datetime_filter, month_filter, parse_month
+from apps.finance.models import Transaction
+from benchmarks import _django
+
+
+def seed(rows: int, years: int):
+    user_model = get_user_model()
+    user = user_model.objects.create_user(username="bench_heavy", password="x")
+    other = user_model.objects.create_user(username="bench_other", password="x")
+
+    rng = random.Random(42)
+    first_day = date.today() - timedelta(days=365 * years)
+    span = 365 * years
+
+    batch = []
+    for i in range(rows):
+        batch.append(
+            Transaction(
+                user=user if i % 10 else other,
+                transaction_type=rng.choice(["INCOME", "EXPENSE", "EXPENSE"]),
+                amount=Decimal(rng.randint(100, 50000)) / 100,
+                date=first_day + timedelta(days=rng.randrange(span)),
+                description=f"Transacao {i}",
+            )
+        )
+        if len(batch) == 5000:
+            Transaction.objects.bulk_create(batch)
+            batch = []
+    Transaction.objects.bulk_create(batch)
+
+    now = timezone.now()
+    Event.objects.bulk_create(
+        [
+            Event(
+                user=user,
+                title=f"Evento {i}",
+                start_datetime=now - timedelta(hours=rng.randrange(span * 24)),
+            )
+            for i in range(rows // 10)
+        ],
+        batch_size=5000,
+    )
+    return user
+
+
+def report(label: str, queryset):
+    plan = queryset.explain()
+    elapsed = _django.timed(lambda: queryset.count())
+    print(f"\n== {label} ({elapsed:.2f} ms/count)")
+    print(queryset.query)
+    print(plan)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--month", default=date.today().strftime("%Y-%m"))
+    args = parser.parse_args()
+
+    with _django.scratch_database() as connection:
+        user = seed(args.rows, args.years)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+        month = parse_month(args.month)
+        transactions = Transaction.objects.filter(user=user, is_confirmed=True)
+        events = Event.objects.filter(user=user)
+
+        report(
+            "Transações: date__year/date__month",
+            transactions.filter(date__year=month.year, date__month=month.month),
+        )
+        report(
+            "Transações: intervalo semiaberto",
+            transactions.filter(**month_filter("date", month)),
+        )
+        report(
+            "Eventos: start_datetime__year/__month",
+            events.filter(
+                start_datetime__year=month.year, start_datetime__month=month.month
+            ),
+        )
+        report(
+            "Eventos: intervalo semiaberto",
+            events.filter(**month_datetime_filter("start_datetime", month)),
+        )
+
+
+if __name__ == "__main__":
+    main()
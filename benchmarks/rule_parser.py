@@ -0,0 +1,128 @@
+"""
+Parser por regras: cobertura, acurácia e latência sobre um corpus rotulado.
+
+Lê ``benchmarks/data/parse_corpus.jsonl`` (texto e campos esperados, com
+"hoje" fixo em 2026-01-15) e mede, com as categorias padrão:
+
+- extração: em quantos textos as regras preenchem valor/tipo/data e quantos
+  campos saem corretos;
+- caminho rápido: quantos textos são respondidos sem LLM (acima de
+  ``AI_RULE_PARSER_MIN_CONFIDENCE``) e quantos desses estão totalmente corretos;
+- abstenção: textos marcados ``"llm": true`` devem seguir para o LLM;
+- latência por texto (mediana), para comparar com uma chamada ao LLM.
+
+Uso:
+    python -m benchmarks.rule_parser [--corpus caminho.jsonl] [--repeat 50] [--verbose]
+"""
+
+import argparse
+import json
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+from django.conf import settings
+
+from apps.ai.services.rule_parser import extract_fields, parse_transaction_rules
+from apps.finance.default_categories import (
+    get_default_expense_category_names,
+    get_default_income_category_names,
+)
+from benchmarks import _django
+
+TODAY = date(2026, 1, 15)
+CORPUS = Path(__file__).parent / "data" / "parse_corpus.jsonl"
+FIELDS = ("type", "amount", "date", "account", "description")
+
+
+def load(path: Path) -> list[dict]:
+    with path.open(encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+def extracted(fields) -> dict:
+    return {
+        "type": fields.transaction_type,
+        "amount": fields.amount,
+        "date": fields.date.isoformat(),
+        "account": fields.account_suggestion,
+        "description": fields.description,
+    }
+
+
+def expected(entry: dict) -> dict:
+    return {**{key: entry[key] for key in FIELDS}, "amount": Decimal(entry["amount"])}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", type=Path, default=CORPUS)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--verbose", action="store_true", help="lista os erros")
+    args = parser.parse_args()
+
+    corpus = load(args.corpus)
+    expense, income = (
+        get_default_expense_category_names(),
+        get_default_income_category_names(),
+    )
+    threshold = settings.AI_RULE_PARSER_MIN_CONFIDENCE
+    labeled = [entry for entry in corpus if not entry.get("llm")]
+    ambiguous = [entry for entry in corpus if entry.get("llm")]
+
+    filled, field_hits, errors = 0, dict.fromkeys(FIELDS, 0), []
+    for entry in labeled:
+        fields = extract_fields(entry["text"], TODAY)
+        if fields is None:
+            errors.append((entry["text"], "sem extração"))
+            continue
+        filled += 1
+        got, want = extracted(fields), expected(entry)
+        for key in FIELDS:
+            if got[key] == want[key]:
+                field_hits[key] += 1
+            else:
+                errors.append((entry["text"], f"{key}: {got[key]!r} != {want[key]!r}"))
+
+    answered = correct = false_answers = 0
+    for entry in corpus:
+        proposal = parse_transaction_rules(entry["text"], expense, income, today=TODAY)
+        if proposal is None or proposal.confidence < threshold:
+            continue
+        answered += 1
+        if entry.get("llm"):
+            false_answers += 1
+            errors.append((entry["text"], "respondido, mas deveria ir ao LLM"))
+            continue
+        got = extracted(extract_fields(entry["text"], TODAY))
+        if got == expected(entry) and proposal.category_suggestion == entry["category"]:
+            correct += 1
+
+    texts = [entry["text"] for entry in corpus]
+    per_text = _django.timed(
+        lambda: [
+            parse_transaction_rules(text, expense, income, today=TODAY)
+            for text in texts
+        ],
+        repeat=args.repeat,
+    ) / len(texts)
+
+    print(
+        f"corpus: {len(corpus)} textos ({len(labeled)} rotulados, {len(ambiguous)} ambíguos)"
+    )
+    print(f"extração: {filled}/{len(labeled)} textos com campos preenchidos")
+    for key in FIELDS:
+        print(f"  {key:<12} {field_hits[key] / max(filled, 1):6.1%}")
+    print(
+        f"caminho rápido: {answered}/{len(corpus)} sem LLM ({answered / len(corpus):.1%}); "
+        f"{correct} totalmente corretos; {false_answers} ambíguos respondidos"
+    )
+    print(f"latência: {per_text * 1000:.1f} µs por texto (mediana)")
+
+    if args.verbose:
+        for text, error in errors:
+            print(f"  {text!r}: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Busca textual: ``SearchFilter`` (ILIKE) vs índice full-text.
+
+Popula o histórico de um usuário em etapas e mede, a cada tamanho, o tempo
+da primeira página de ``?search=`` pelas duas formas. O ILIKE cresce
+linearmente com o histórico; o índice depende só do número de resultados.
+
+Uso:
+    python -m benchmarks.search [--steps 10000 50000 200000] [--term "posto"]
+"""
+
+import argparse
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+
+from apps.finance.models import TRANSACTION_SEARCH_INDEX, Transaction
+from benchmarks import _django
+
+WORDS = (
+    "mercado padaria farmacia aluguel uber ifood cinema academia luz agua "
+    "internet escola livraria restaurante feira pet shop presente viagem"
+).split()
+
+
+def grow(user, total: int, current: int, rng):
+    batch = []
+    for i in range(current, total):
+        words = rng.sample(WORDS, 3)
+        if i % 500 == 0:
+            words.append("posto")
+        batch.append(
+            Transaction(
+                user=user,
+                transaction_type="EXPENSE",
+                amount=Decimal(rng.randint(100, 50000)) / 100,
+                date=date(2020, 1, 1) + timedelta(days=rng.randrange(2000)),
+                description=" ".join(words).capitalize(),
+                notes=rng.choice(WORDS),
+            )
+        )
+        if len(batch) == 5000:
+            Transaction.objects.bulk_create(batch)
+            batch = []
+    Transaction.objects.bulk_create(batch)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--steps", type=int, nargs="+", default=[10_000, 50_000, 200_000]
+    )
+    parser.add_argument("--term", default="posto")
+    args = parser.parse_args()
+
+    with _django.scratch_database():
+        user = get_user_model().objects.create_user(
+            username="bench_search", password="x"
+        )
+        base = Transaction.objects.filter(user=user)
+        ilike = base.filter(
+            Q(description__icontains=args.term)
+            | Q(notes__icontains=args.term)
+            | Q(tags__icontains=args.term)
+        ).order_by("-date")
+        indexed = TRANSACTION_SEARCH_INDEX.search(base, args.term)
+
+        rng = random.Random(42)
+        current = 0
+        print(f"{'linhas':>10} {'ILIKE (ms)':>12} {'full-text (ms)':>15}")
+        for step in sorted(args.steps):
+            grow(user, step, current, rng)
+            current = step
+            ilike_ms = _django.timed(lambda: list(ilike[:20]))
+            indexed_ms = _django.timed(lambda: list(indexed[:20]))
+            print(f"{step:>10} {ilike_ms:>12.2f} {indexed_ms:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Registro de uso da IA: INSERT por chamada vs buffer gravado em lote.
+
+Mede a latência de ``POST /api/ai/forecast/`` (LLM substituído por uma
+resposta imediata, para isolar o custo do próprio servidor) e de
+``log_ai_usage`` isolado, com ``AI_USAGE_LOG_BUFFER`` desligado (um
+INSERT + commit por chamada) e ligado (``bulk_create`` a cada
+``MAX_SIZE`` registros). Em bancos com fsync por commit (PostgreSQL em
+disco) a diferença por requisição é maior que no SQLite de teste.
+
+Uso:
+    python -m benchmarks.usage_log [--requests 300] [--max-size 100]
+"""
+
+import argparse
+from datetime import date
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.test.utils import setup_test_environment
+from rest_framework.test import APIClient
+
+from apps.ai.models import AIUsageLog
+from apps.ai.services.forecast_service import ForecastResult
+from apps.ai.usage_log import usage_log_buffer
+from apps.ai.views import log_ai_usage
+from apps.finance.models import Transaction
+from benchmarks import _django
+
+FORECAST = ForecastResult(
+    summary="Mês estável.",
+    forecast_income=5000.0,
+    forecast_expenses=3000.0,
+    forecast_balance=2000.0,
+    recommendations=[],
+)
+USAGE = {"model": "stub", "input_tokens": 300, "output_tokens": 80, "total_tokens": 380}
+
+
+def measure(client, user, config: dict, calls: int) -> tuple[float, float]:
+    with override_settings(AI_USAGE_LOG_BUFFER=config, AI_RATE_LIMIT_PER_HOUR=10**9):
+        request = _django.timed(
+            lambda: client.post(
+                "/api/ai/forecast/?refresh=1", {"months": 3}, format="json"
+            ),
+            calls,
+        )
+        log = _django.timed(
+            lambda: log_ai_usage(user, "forecast", "Forecast", USAGE), calls
+        )
+        usage_log_buffer.stop()
+    return request, log
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--max-size", type=int, default=100)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    with _django.scratch_database():
+        user = get_user_model().objects.create_user(
+            username="bench_usage", password="x"
+        )
+        Transaction.objects.create(
+            user=user,
+            transaction_type="INCOME",
+            amount=5000,
+            date=date.today(),
+            description="Salário",
+        )
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        with (
+            patch("apps.ai.views.is_ollama_available", return_value=True),
+            patch(
+                "apps.ai.views.agenerate_cashflow_forecast",
+                return_value=(FORECAST, {**USAGE}),
+            ),
+        ):
+            direct = measure(client, user, {"ENABLED": False}, args.requests)
+            buffered = measure(
+                client,
+                user,
+                {"ENABLED": True, "MAX_SIZE": args.max_size, "FLUSH_INTERVAL": 60.0},
+                args.requests,
+            )
+        written = AIUsageLog.objects.count()
+
+    print(f"{args.requests} requisições por modo; {written} registros gravados")
+    for label, (request, log) in (("INSERT por chamada", direct), ("buffer", buffered)):
+        print(f"{label:<18}: {request:.3f} ms/requisição, {log:.3f} ms/registro")
+
+
+if __name__ == "__main__":
+    main()
@@ -137,7 +137,7 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_FILTER_BACKENDS": (
         "django_filters.rest_framework.DjangoFilterBackend",
-        "rest_framework.filters.SearchFilter",
+        "apps.core.search.FullTextSearchFilter",
         "rest_framework.filters.OrderingFilter",
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
@@ -180,5 +180,96 @@ GROQ_MODEL = os.getenv("GROQ_MODEL", "llama3-8b-8192")
 # AI Limits - configurações para economia de tokens
 AI_MAX_INPUT_CHARS = 500  # Limita input do usuário
 AI_MAX_OUTPUT_TOKENS = 200  # Limita resposta da IA
-AI_RATE_LIMIT_PER_HOUR = 30  # Rate limit por usuário
+AI_RATE_LIMIT_PER_HOUR = 30  # Rate limit por usuário (requisições ao LLM por janela)
+AI_CHAT_HISTORY_TOKEN_BUDGET = (
+    1000  # tokens de histórico por mensagem do chat (resumo + recentes)
+)
+AI_CHAT_SUMMARY_MAX_TOKENS = 200  # tamanho do resumo das mensagens antigas
+AI_CHAT_HISTORY_LOW_WATER = 0.5  # fração da janela mantida após um resumo
+AI_CATEGORIZE_BATCH_MAX = 100  # textos por requisição em /categorize/batch/
+AI_CATEGORIZE_BATCH_SIZE = 25  # textos por chamada ao LLM (um prompt por lote)
 AI_TEMPERATURE = 0.3  # Baixa temperatura = respostas mais determinísticas
+
+# Cliente LLM - pool de conexões compartilhado pelo processo
+AI_HTTP_MAX_CONNECTIONS = 20
+AI_ASYNC_HTTP_MAX_CONNECTIONS = 200  # views assíncronas: chamadas simultâneas ao LLM
+AI_HTTP_MAX_KEEPALIVE = 10
+AI_HTTP_KEEPALIVE_EXPIRY = 60.0  # segundos
+AI_CONNECT_TIMEOUT = 5.0
+AI_TIMEOUTS = {  # segundos de leitura por funcionalidade
+    "default": 30.0,
+    "parse": 15.0,
+    "categorize": 15.0,
+    "insights": 45.0,
+    "chat": 60.0,
+    "forecast": 45.0,
+    "budget": 45.0,
+    "probe": 5.0,
+}
+
+# Saúde do LLM - cache da sonda e circuit breaker
+AI_HEALTH_TTL = 30.0  # segundos sem nova sonda enquanto o provedor responde
+AI_BREAKER_FAILURES = 3  # falhas seguidas para abrir o circuito
+AI_BREAKER_COOLDOWN = 30.0  # segundos respondendo 503 sem acessar a rede
+
+# Tarefas de IA em segundo plano (?async=1; comando runworker)
+AI_JOB_WORKER_CONCURRENCY = 4  # chamadas simultâneas ao LLM por worker
+AI_JOB_POLL_INTERVAL = 1.0  # segundos entre consultas à fila vazia
+AI_JOB_MAX_ATTEMPTS = 3
+AI_JOB_RETRY_BACKOFF = 5.0  # segundos antes da 2ª tentativa; dobra a cada falha
+AI_JOB_LOCK_TIMEOUT = 300  # reserva expirada (worker parou) volta para a fila
+
+# Categorizador local (naive Bayes treinado com o histórico do usuário)
+AI_LOCAL_CATEGORIZER_ENABLED = True
+AI_LOCAL_CATEGORIZER_THRESHOLD = 0.85  # confiança mínima para dispensar o LLM
+AI_LOCAL_CATEGORIZER_MIN_SAMPLES = 20  # transações categorizadas para treinar
+
+# Parser por regras (pt-BR) antes do LLM no parse de transações
+AI_RULE_PARSER_ENABLED = True
+AI_RULE_PARSER_MIN_CONFIDENCE = 0.7  # abaixo disso a proposta vem do LLM
+
+# Cache de respostas do LLM (parse e categorização); TTL 0 desativa
+AI_RESPONSE_CACHE = {
+    "BACKEND": os.getenv(
+        "AI_RESPONSE_CACHE_BACKEND", "local"
+    ),  # local | django | dotted.path
+    "MAX_ENTRIES": 1000,  # apenas backend local
+    "TTL": 24 * 60 * 60,  # segundos
+    "CACHE_ALIAS": "default",  # apenas backend django
+}
+
+# Rate limit por janela deslizante (contadores atômicos, sem COUNT em AIUsageLog).
+# O backend local é por processo: com runworker e limites de tokens use "django"
+# com um cache compartilhado (Redis/Memcached), senão ?async=1 é recusado.
+AI_RATE_LIMIT = {
+    "BACKEND": os.getenv(
+        "AI_RATE_LIMIT_BACKEND", "local"
+    ),  # local | django | dotted.path
+    "CACHE_ALIAS": "default",  # apenas backend django
+    "WINDOW": 60 * 60,  # segundos
+    "FEATURE_LIMITS": {},  # funcionalidade -> requisições por janela, ex.: {"chat": 20}
+    "TOKENS_PER_WINDOW": 0,  # tokens por usuário na janela; 0 desativa
+    "FEATURE_TOKEN_LIMITS": {},  # funcionalidade -> tokens por janela
+}
+
+# Contexto financeiro do chat em cache por usuário (invalidado por signals); TTL 0 desativa.
+# A invalidação só chega a todos os workers num cache compartilhado (Redis/Memcached):
+# com o cache em memória padrão (sem CACHES) cada processo teria a sua versão e os
+# demais enviariam contexto desatualizado até o TTL, então o cache fica desativado.
+AI_CHAT_CONTEXT_CACHE = {
+    "CACHE_ALIAS": "default",
+    "TTL": 10 * 60,  # segundos
+    "ALLOW_LOCAL_MEMORY": False,  # True: aceita LocMemCache (um único processo servidor)
+}
+
+# Registros de uso da IA gravados em lote (bulk_create) fora do caminho da requisição
+AI_USAGE_LOG_BUFFER = {
+    "ENABLED": os.getenv("AI_USAGE_LOG_BUFFER_ENABLED", "true").lower()
+    in ("true", "1", "yes"),
+    "MAX_SIZE": 100,  # registros por gravação
+    "FLUSH_INTERVAL": 5.0,  # segundos máximos de espera de um registro
+}
+
+# Retenção dos registros brutos (comando rollup_ai_usage --prune); relatórios usam o rollup diário
+AI_USAGE_LOG_RETENTION_DAYS = 90
+AI_USAGE_LOG_PRUNE_BATCH_SIZE = 5000  # registros por DELETE
@@ -9,6 +9,8 @@ import type {
   CategorizeResponse,
   ForecastResponse,
   BudgetCheckResponse,
+  DashboardResponse,
+  MonthlyReport,
   Transaction,
   Category,
   Account,
@@ -207,21 +209,17 @@ export const financeApi = {
   },
 
   // Reports
-  getMonthlyReport: async (
-    month: string
-  ): Promise<{
-    month: string
-    income: number
-    expenses: number
-    balance: number
-    top_expense_categories: Array<{
-      category__name: string | null
-      category__color?: string | null
-      total: number
-    }>
-    transaction_count: number
-  }> => {
-    const response = await api.get("/reports/monthly/", { params: { month } })
+  getMonthlyReport: async (month: string): Promise<MonthlyReport> => {
+    const response = await api.get<MonthlyReport>("/reports/monthly/", {
+      params: { month },
+    })
+    return response.data
+  },
+
+  getDashboard: async (month?: string): Promise<DashboardResponse> => {
+    const response = await api.get<DashboardResponse>("/dashboard/", {
+      params: { month },
+    })
     return response.data
   },
 
@@ -378,6 +376,54 @@ export const aiApi = {
     return response.data
   },
 
+  // Resposta token a token (server-sent events); retorna o evento final.
+  chatStream: async (
+    payload: { message: string; conversation_id?: number },
+    onToken: (text: string) => void,
+    signal?: AbortSignal
+  ): Promise<ChatResponse> => {
+    const response = await fetch(`${API_URL}/api/ai/chat/stream/`, {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        Accept: "text/event-stream",
+        Authorization: `Bearer ${getStoredTokens()?.access ?? ""}`,
+      },
+      body: JSON.stringify(payload),
+      signal,
+    })
+    if (response.status === 401) {
+      // Token expirado: a rota sem streaming renova o token pelo interceptor
+      return aiApi.chat(payload)
+    }
+    if (!response.body) {
+      throw new Error("Erro ao processar chat")
+    }
+
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader()
+    let buffer = ""
+    for (;;) {
+      const { value, done } = await reader.read()
+      if (done) break
+      buffer += value
+      let end = buffer.indexOf("\n\n")
+      while (end >= 0) {
+        const lines = buffer.slice(0, end).split("\n")
+        buffer = buffer.slice(end + 2)
+        end = buffer.indexOf("\n\n")
+
+        const event = lines.find((line) => line.startsWith("event: "))?.slice(7)
+        const data = lines.find((line) => line.startsWith("data: "))?.slice(6)
+        if (!event || !data) continue
+        const parsed = JSON.parse(data)
+        if (event === "token") onToken(parsed.text)
+        if (event === "done") return parsed as ChatResponse
+        if (event === "error") throw new Error(parsed.error)
+      }
+    }
+    throw new Error("Conexão encerrada antes do fim da resposta")
+  },
+
   getChatConversations: async (): Promise<ChatConversation[]> => {
     const response = await api.get<ChatConversation[]>("/ai/chat/conversations/")
     return response.data
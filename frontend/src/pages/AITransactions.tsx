@@ -83,6 +83,7 @@ export function AITransactionsPage() {
       setInputText("")
       queryClient.invalidateQueries({ queryKey: ["transactions"] })
       queryClient.invalidateQueries({ queryKey: ["monthlyReport"] })
+      queryClient.invalidateQueries({ queryKey: ["dashboard"] })
     },
   })
 
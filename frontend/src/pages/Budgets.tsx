@@ -101,6 +101,7 @@ export function BudgetsPage() {
       handleCreateDialogChange(false)
       queryClient.invalidateQueries({ queryKey: ["budgets"] })
       queryClient.invalidateQueries({ queryKey: ["budgetStatus"] })
+      queryClient.invalidateQueries({ queryKey: ["dashboard"] })
     },
   })
 
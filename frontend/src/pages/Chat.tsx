@@ -44,6 +44,8 @@ export function ChatPage() {
   const [selectedId, setSelectedId] = useState<number | null>(null)
   const [isCreatingNew, setIsCreatingNew] = useState(false)
   const [message, setMessage] = useState("")
+  const [streamingText, setStreamingText] = useState("")
+  const abortRef = useRef<AbortController | null>(null)
   const [isConversationOverlayOpen, setIsConversationOverlayOpen] = useState(false)
 
   const { data: conversations, isLoading: conversationsLoading } = useQuery({
@@ -65,22 +67,33 @@ export function ChatPage() {
   })
 
   const chatMutation = useMutation({
-    mutationFn: () =>
-      aiApi.chat({
-        message,
-        conversation_id: effectiveSelectedId ?? undefined,
-      }),
-    onSuccess: (data) => {
+    mutationFn: () => {
+      abortRef.current = new AbortController()
+      setStreamingText("")
+      return aiApi.chatStream(
+        {
+          message,
+          conversation_id: effectiveSelectedId ?? undefined,
+        },
+        (text) => setStreamingText((current) => current + text),
+        abortRef.current.signal
+      )
+    },
+    onSuccess: async (data) => {
       setSelectedId(data.conversation_id)
       setIsCreatingNew(false) // Nova conversa foi criada, desativa flag
       setMessage("")
       queryClient.invalidateQueries({ queryKey: ["chatConversations"] })
-      queryClient.invalidateQueries({
+      await queryClient.invalidateQueries({
         queryKey: ["chatConversation", data.conversation_id],
       })
     },
+    onSettled: () => setStreamingText(""),
   })
 
+  // Sair da página cancela a geração em andamento
+  useEffect(() => () => abortRef.current?.abort(), [])
+
   const deleteMutation = useMutation({
     mutationFn: (conversationId: number) =>
       aiApi.deleteChatConversation(conversationId),
@@ -127,7 +140,7 @@ export function ChatPage() {
   // Scroll para o final quando novas mensagens chegam
   useEffect(() => {
     messagesEndRef.current?.scrollIntoView({ behavior: "smooth" })
-  }, [conversationDetail?.messages])
+  }, [conversationDetail?.messages, streamingText])
 
   return (
     <div className="flex h-[calc(100vh-7rem)] flex-col gap-4 overflow-hidden">
@@ -219,9 +232,9 @@ export function ChatPage() {
                       <Skeleton className="h-8 w-8 shrink-0 rounded-lg" />
                     </div>
                   </div>
-                ) : conversationDetail?.messages?.length ? (
+                ) : conversationDetail?.messages?.length || chatMutation.isPending ? (
                   <div className="space-y-4">
-                    {conversationDetail.messages.map((msg) => (
+                    {conversationDetail?.messages?.map((msg) => (
                       <div
                         key={msg.id}
                         className={cn(
@@ -261,17 +274,23 @@ export function ChatPage() {
                       </div>
                     ))}
 
-                    {/* Indicador de digitando */}
+                    {/* Resposta em streaming ou indicador de digitando */}
                     {chatMutation.isPending && (
                       <div className="flex gap-3">
                         <div className="flex h-8 w-8 shrink-0 items-center justify-center rounded-lg bg-violet-500/20">
                           <Bot className="h-4 w-4 text-violet-400" />
                         </div>
-                        <div className="flex items-center gap-1.5 rounded-2xl border border-border/40 bg-muted/10 px-4 py-3">
-                          <span className="h-2 w-2 animate-bounce rounded-full bg-violet-400 [animation-delay:-0.3s]" />
-                          <span className="h-2 w-2 animate-bounce rounded-full bg-violet-400 [animation-delay:-0.15s]" />
-                          <span className="h-2 w-2 animate-bounce rounded-full bg-violet-400" />
-                        </div>
+                        {streamingText ? (
+                          <div className="max-w-[80%] rounded-2xl border border-border/40 bg-muted/10 px-4 py-3 text-foreground">
+                            <Markdown content={streamingText} />
+                          </div>
+                        ) : (
+                          <div className="flex items-center gap-1.5 rounded-2xl border border-border/40 bg-muted/10 px-4 py-3">
+                            <span className="h-2 w-2 animate-bounce rounded-full bg-violet-400 [animation-delay:-0.3s]" />
+                            <span className="h-2 w-2 animate-bounce rounded-full bg-violet-400 [animation-delay:-0.15s]" />
+                            <span className="h-2 w-2 animate-bounce rounded-full bg-violet-400" />
+                          </div>
+                        )}
                       </div>
                     )}
 
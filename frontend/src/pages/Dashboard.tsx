@@ -1,6 +1,6 @@
 import { useMemo, useState } from "react"
 import { useQuery } from "@tanstack/react-query"
-import { format, subMonths } from "date-fns"
+import { format } from "date-fns"
 import { ptBR } from "date-fns/locale"
 import { Link } from "react-router-dom"
 import {
@@ -61,35 +61,13 @@ const CHART_COLORS = [
 
 export function DashboardPage() {
   const currentMonth = useMemo(() => format(new Date(), "yyyy-MM"), [])
-  const lastMonth = useMemo(
-    () => format(subMonths(new Date(), 1), "yyyy-MM"),
-    []
-  )
-
-  const { data: report, isLoading: reportLoading } = useQuery({
-    queryKey: ["monthlyReport", currentMonth],
-    queryFn: () => financeApi.getMonthlyReport(currentMonth),
-  })
-
-  const { data: lastMonthReport } = useQuery({
-    queryKey: ["monthlyReport", lastMonth],
-    queryFn: () => financeApi.getMonthlyReport(lastMonth),
-  })
-
-  const { data: goals } = useQuery({
-    queryKey: ["goals", "ACTIVE"],
-    queryFn: () => financeApi.getGoals({ status: "ACTIVE" }),
-  })
-
-  const { data: budgetStatus } = useQuery({
-    queryKey: ["budgetStatus"],
-    queryFn: () => financeApi.getBudgetStatus(),
-  })
 
-  const { data: transactions } = useQuery({
-    queryKey: ["transactions", { month: currentMonth }],
-    queryFn: () => financeApi.getTransactions({ month: currentMonth }),
+  const { data: dashboard, isLoading: reportLoading } = useQuery({
+    queryKey: ["dashboard", currentMonth],
+    queryFn: () => financeApi.getDashboard(currentMonth),
   })
+  const report = dashboard?.report
+  const lastMonthReport = dashboard?.previous_report
 
   const { data: insights, isLoading: insightsLoading } = useQuery({
     queryKey: ["insights", currentMonth],
@@ -116,22 +94,13 @@ export function DashboardPage() {
   }, [report, lastMonthReport])
 
   const chartData = useMemo(() => {
-    if (!transactions?.results) return []
-    const grouped = transactions.results.reduce(
-      (acc, tx) => {
-        const day = format(new Date(tx.date + "T12:00:00"), "dd/MM")
-        if (!acc[day]) acc[day] = { day, income: 0, expenses: 0 }
-        if (tx.transaction_type === "INCOME") {
-          acc[day].income += parseFloat(tx.amount)
-        } else {
-          acc[day].expenses += parseFloat(tx.amount)
-        }
-        return acc
-      },
-      {} as Record<string, { day: string; income: number; expenses: number }>
-    )
-    return Object.values(grouped).sort((a, b) => a.day.localeCompare(b.day))
-  }, [transactions])
+    if (!dashboard?.daily) return []
+    return dashboard.daily.map((point) => ({
+      day: format(new Date(point.date + "T12:00:00"), "dd/MM"),
+      income: point.income,
+      expenses: point.expenses,
+    }))
+  }, [dashboard])
 
   const pieData = useMemo(() => {
     if (!report?.top_expense_categories) return []
@@ -228,9 +197,9 @@ export function DashboardPage() {
     )
   }
 
-  const activeGoals = goals?.results.slice(0, 3) || []
+  const activeGoals = dashboard?.goals.slice(0, 3) || []
   const alertedBudgets =
-    budgetStatus?.filter((b) => b.alert_reached).slice(0, 3) || []
+    dashboard?.budgets.filter((b) => b.alert_reached).slice(0, 3) || []
 
   if (reportLoading) {
     return (
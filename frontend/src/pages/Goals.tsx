@@ -107,6 +107,7 @@ export function GoalsPage() {
     onSuccess: () => {
       handleCreateDialogChange(false)
       queryClient.invalidateQueries({ queryKey: ["goals"] })
+      queryClient.invalidateQueries({ queryKey: ["dashboard"] })
     },
   })
 
@@ -135,6 +136,7 @@ export function GoalsPage() {
       }),
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ["goals"] })
+      queryClient.invalidateQueries({ queryKey: ["dashboard"] })
     },
   })
 
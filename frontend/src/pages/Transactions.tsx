@@ -221,6 +221,7 @@ export function TransactionsPage() {
       handleCreateDialogChange(false)
       queryClient.invalidateQueries({ queryKey: ["transactions"] })
       queryClient.invalidateQueries({ queryKey: ["monthlyReport"] })
+      queryClient.invalidateQueries({ queryKey: ["dashboard"] })
       queryClient.invalidateQueries({ queryKey: ["budgetStatus"] })
     },
   })
@@ -233,6 +234,7 @@ export function TransactionsPage() {
       setEditDateError("")
       queryClient.invalidateQueries({ queryKey: ["transactions"] })
       queryClient.invalidateQueries({ queryKey: ["monthlyReport"] })
+      queryClient.invalidateQueries({ queryKey: ["dashboard"] })
       queryClient.invalidateQueries({ queryKey: ["budgetStatus"] })
     },
   })
@@ -243,6 +245,7 @@ export function TransactionsPage() {
       setDeletingTransaction(null)
       queryClient.invalidateQueries({ queryKey: ["transactions"] })
       queryClient.invalidateQueries({ queryKey: ["monthlyReport"] })
+      queryClient.invalidateQueries({ queryKey: ["dashboard"] })
       queryClient.invalidateQueries({ queryKey: ["budgetStatus"] })
     },
   })
@@ -267,6 +270,7 @@ export function TransactionsPage() {
       handleCreateDialogChange(false)
       queryClient.invalidateQueries({ queryKey: ["transactions"] })
       queryClient.invalidateQueries({ queryKey: ["monthlyReport"] })
+      queryClient.invalidateQueries({ queryKey: ["dashboard"] })
       queryClient.invalidateQueries({ queryKey: ["budgetStatus"] })
     },
   })
@@ -210,6 +210,10 @@ export interface ChatResponse {
     tokens_used: number
     requests_remaining: number
   }
+  timing?: {
+    first_token_ms: number | null
+    total_ms: number | null
+  }
 }
 
 export interface CategorizeResponse {
@@ -255,6 +259,41 @@ export interface BudgetCheckResponse {
   }
 }
 
+// Dashboard types
+export interface MonthlyReport {
+  month: string
+  income: number
+  expenses: number
+  balance: number
+  top_expense_categories: Array<{
+    category__name: string | null
+    category__color?: string | null
+    total: number
+  }>
+  transaction_count: number
+}
+
+export interface DashboardGoal {
+  id: number
+  name: string
+  goal_type: Goal["goal_type"]
+  target_amount: string
+  current_amount: string
+  target_date: string | null
+  icon: string
+  color: string
+  progress_percentage: number
+}
+
+export interface DashboardResponse {
+  month: string
+  report: MonthlyReport
+  previous_report: MonthlyReport
+  daily: Array<{ date: string; income: number; expenses: number }>
+  goals: DashboardGoal[]
+  budgets: BudgetStatus[]
+}
+
 // Notification types
 export interface Notification {
   id: number
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import pytest
 from django.urls import reverse
 from django.utils import timezone
@@ -66,3 +68,33 @@ class TestEventViewSet:
         }
         response = authenticated_client.post(url, data)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_filter_by_month_uses_local_month_bounds(self, authenticated_client, user):
+        """Filtro por mês inclui o mês inteiro no fuso local e nada além."""
+        for title, naive in [
+            ("Antes", datetime(2026, 1, 31, 23, 30)),
+            ("Início", datetime(2026, 2, 1, 0, 0)),
+            ("Fim", datetime(2026, 2, 28, 23, 59)),
+            ("Depois", datetime(2026, 3, 1, 0, 0)),
+        ]:
+            Event.objects.create(
+                user=user,
+                title=title,
+                event_type="AULA",
+                start_datetime=timezone.make_aware(naive),
+            )
+
+        url = reverse("event-list")
+        response = authenticated_client.get(url, {"month": "2026-02"})
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["title"] for item in response.data["results"]] == ["Início", "Fim"]
+
+        response = authenticated_client.get(
+            url, {"start_date": "2026-02-28", "end_date": "2026-03-01"}
+        )
+        assert [item["title"] for item in response.data["results"]] == ["Fim", "Depois"]
+
+    def test_filter_by_invalid_month(self, authenticated_client):
+        """Mês sem mês seguinte representável responde 400."""
+        response = authenticated_client.get(reverse("event-list"), {"month": "9999-12"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
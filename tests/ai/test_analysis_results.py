@@ -0,0 +1,139 @@
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.ai.jobs import claim_jobs, enqueue, run_job
+from apps.ai.models import AIAnalysisResult, AIJob, AIUsageLog
+from apps.ai.services.forecast_service import ForecastResult
+from apps.finance.models import Transaction
+
+FORECAST = ForecastResult(
+    summary="Mês estável.",
+    forecast_income=5000.0,
+    forecast_expenses=3000.0,
+    forecast_balance=2000.0,
+    recommendations=["Manter a reserva"],
+)
+
+
+def _transaction(user, amount=5000):
+    return Transaction.objects.create(
+        user=user,
+        transaction_type="INCOME",
+        amount=amount,
+        date=timezone.localdate(),
+        description="Salário",
+    )
+
+
+@pytest.mark.django_db
+@patch("apps.ai.views.is_ollama_available", return_value=True)
+@patch(
+    "apps.ai.views.agenerate_cashflow_forecast",
+    return_value=(FORECAST, {"total_tokens": 90}),
+)
+class TestStoredForecast:
+    url = "forecast"
+
+    def _post(self, client, query=""):
+        return client.post(reverse(self.url) + query, {"months": 2}, format="json")
+
+    def test_same_data_reuses_analysis(
+        self, mock_forecast, mock_ollama, authenticated_client, user
+    ):
+        """Segunda visita com os mesmos dados não chama o LLM nem gasta tokens."""
+        _transaction(user)
+
+        first = self._post(authenticated_client)
+        second = self._post(authenticated_client)
+
+        assert mock_forecast.await_count == 1
+        assert first.data["usage"]["tokens_used"] == 90
+        assert second.data["usage"]["tokens_used"] == 0
+        assert second.data["usage"]["cached"] is True
+        assert second.data["forecast"] == first.data["forecast"]
+        assert AIUsageLog.objects.filter(user=user).count() == 1
+        stored = AIAnalysisResult.objects.get(user=user)
+        assert stored.period == "2m"
+        assert stored.tokens_used == 90
+
+    def test_data_change_triggers_new_analysis(
+        self, mock_forecast, mock_ollama, authenticated_client, user
+    ):
+        """Nova transação no período muda o fingerprint e gera nova análise."""
+        _transaction(user)
+        self._post(authenticated_client)
+
+        _transaction(user, amount=1200)
+        response = self._post(authenticated_client)
+
+        assert mock_forecast.await_count == 2
+        assert response.data["usage"]["tokens_used"] == 90
+        assert AIAnalysisResult.objects.filter(user=user).count() == 1
+
+    def test_refresh_forces_new_analysis(
+        self, mock_forecast, mock_ollama, authenticated_client, user
+    ):
+        """?refresh=1 ignora a análise guardada."""
+        _transaction(user)
+        self._post(authenticated_client)
+
+        response = self._post(authenticated_client, "?refresh=1")
+
+        assert mock_forecast.await_count == 2
+        assert response.data["usage"]["tokens_used"] == 90
+
+    def test_stored_analysis_served_without_llm(
+        self, mock_forecast, mock_ollama, authenticated_client, user
+    ):
+        """Análise guardada continua disponível com o LLM fora do ar."""
+        _transaction(user)
+        self._post(authenticated_client)
+        mock_ollama.return_value = False
+
+        response = self._post(authenticated_client)
+
+        assert response.status_code == 200
+        assert response.data["usage"]["cached"] is True
+
+    def test_stored_analysis_ignores_rate_limit_and_async(
+        self, mock_forecast, mock_ollama, authenticated_client, user, settings
+    ):
+        """Análise guardada sai antes do rate limit e em vez de enfileirar tarefa."""
+        _transaction(user)
+        self._post(authenticated_client)
+        settings.AI_RATE_LIMIT_PER_HOUR = 1
+
+        limited = self._post(authenticated_client)
+        queued = self._post(authenticated_client, "?async=1")
+
+        assert limited.status_code == 200
+        assert limited.data["usage"]["cached"] is True
+        assert queued.status_code == 200
+        assert queued.data["usage"]["cached"] is True
+        assert not AIJob.objects.exists()
+        assert self._post(authenticated_client, "?refresh=1").status_code == 429
+
+
+@pytest.mark.django_db
+@patch(
+    "apps.ai.views.generate_cashflow_forecast",
+    return_value=(FORECAST, {"total_tokens": 90}),
+)
+def test_job_reuses_stored_analysis(mock_forecast, user):
+    """Tarefas em segundo plano usam e alimentam as mesmas análises guardadas."""
+    _transaction(user)
+
+    for _ in range(2):
+        enqueue(user, AIUsageLog.Feature.FORECAST, {"months": 2})
+        job = run_job(claim_jobs(1)[0])
+
+    assert mock_forecast.call_count == 1
+    assert job.result["usage"] == {"tokens_used": 0, "cached": True}
+    assert job.result["forecast"]["summary"] == "Mês estável."
+
+    enqueue(user, AIUsageLog.Feature.FORECAST, {"months": 2, "refresh": True})
+    run_job(claim_jobs(1)[0])
+    assert mock_forecast.call_count == 2
@@ -0,0 +1,168 @@
+import asyncio
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncRequestFactory
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import force_authenticate
+
+from apps.ai import views
+from apps.ai.models import AIUsageLog
+from apps.ai.services import TransactionProposal, aparse_transaction_text
+
+DELAY = 0.2
+
+CONTENT = (
+    '{"type":"EXPENSE","amount":"38,90","date":"2026-01-02",'
+    '"description":"Cordas","confidence":0.8}'
+)
+
+
+class FakeAsyncClient:
+    """Imita ``AsyncOpenAI``: cada chamada espera ``DELAY`` sem bloquear o loop."""
+
+    def __init__(self):
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(DELAY)
+        message = SimpleNamespace(content=CONTENT)
+        usage = SimpleNamespace(prompt_tokens=50, completion_tokens=20, total_tokens=70)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+
+def test_async_service_calls_overlap():
+    """Chamadas simultâneas ao LLM esperam juntas, sem uma thread por chamada."""
+    client = FakeAsyncClient()
+
+    async def run():
+        return await asyncio.gather(
+            *(aparse_transaction_text(f"paguei {i} em cordas") for i in range(20))
+        )
+
+    with patch(
+        "apps.ai.services.ollama_client.get_async_llm_client", return_value=client
+    ):
+        started = time.monotonic()
+        results = async_to_sync(run)()
+        elapsed = time.monotonic() - started
+
+    assert client.calls == 20
+    assert elapsed < DELAY * 5
+    assert all(proposal.amount == Decimal("38.90") for proposal, _ in results)
+    assert results[0][1]["total_tokens"] == 70
+
+
+@pytest.mark.django_db
+@patch("apps.ai.views.is_ollama_available", return_value=True)
+class TestAsyncViews:
+    def test_concurrent_requests_share_the_event_loop(
+        self, mock_ollama, user, settings
+    ):
+        """Várias requisições em andamento no mesmo loop; cada uma grava seu log."""
+        settings.AI_RULE_PARSER_ENABLED = False
+        factory = AsyncRequestFactory()
+
+        async def parse(text, **kwargs):
+            await asyncio.sleep(DELAY)
+            proposal = TransactionProposal(
+                transaction_type="EXPENSE",
+                amount=Decimal("10"),
+                date="2026-01-02",
+                description=text,
+                confidence=0.8,
+            )
+            return proposal, {"model": "m", "total_tokens": 70}
+
+        def request(text):
+            request = factory.post(
+                reverse("parse-transaction"),
+                {"text": text},
+                content_type="application/json",
+            )
+            force_authenticate(request, user=user)
+            return views.parse_transaction(request)
+
+        async def run():
+            return await asyncio.gather(*(request(f"compra {i}") for i in range(10)))
+
+        with patch("apps.ai.views.aparse_transaction_text", side_effect=parse):
+            started = time.monotonic()
+            responses = async_to_sync(run)()
+            elapsed = time.monotonic() - started
+
+        assert [response.status_code for response in responses] == [200] * 10
+        assert elapsed < DELAY * 5
+        assert AIUsageLog.objects.filter(user=user).count() == 10
+
+    def test_concurrent_requests_respect_rate_limit(self, mock_ollama, user, settings):
+        """Requisições simultâneas reservam o limite antes do LLM: só 3 passam."""
+        settings.AI_RULE_PARSER_ENABLED = False
+        settings.AI_RATE_LIMIT_PER_HOUR = 3
+        factory = AsyncRequestFactory()
+
+        async def parse(text, **kwargs):
+            await asyncio.sleep(DELAY)
+            proposal = TransactionProposal(
+                transaction_type="EXPENSE",
+                amount=Decimal("10"),
+                date="2026-01-02",
+                description=text,
+                confidence=0.8,
+            )
+            return proposal, {"model": "m", "total_tokens": 70}
+
+        def request(text):
+            request = factory.post(
+                reverse("parse-transaction"),
+                {"text": text},
+                content_type="application/json",
+            )
+            force_authenticate(request, user=user)
+            return views.parse_transaction(request)
+
+        async def run():
+            return await asyncio.gather(*(request(f"compra {i}") for i in range(20)))
+
+        with patch(
+            "apps.ai.views.aparse_transaction_text", side_effect=parse
+        ) as mock_parse:
+            responses = async_to_sync(run)()
+
+        codes = [response.status_code for response in responses]
+        assert codes.count(200) == 3
+        assert codes.count(429) == 17
+        assert mock_parse.call_count == 3
+        assert sorted(
+            response.data["usage"]["requests_remaining"]
+            for response in responses
+            if response.status_code == 200
+        ) == [0, 1, 2]
+        assert views.check_rate_limit(user) == (False, 0)
+
+    def test_unavailable_llm_returns_reservation(
+        self, mock_ollama, authenticated_client, user
+    ):
+        """Sem LLM disponível a requisição reservada é devolvida."""
+        mock_ollama.return_value = False
+        _, before = views.check_rate_limit(user)
+
+        response = authenticated_client.post(
+            reverse("categorize"), {"text": "compra xyz"}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert views.check_rate_limit(user) == (True, before)
+
+    def test_unsupported_method(self, mock_ollama, authenticated_client):
+        """Métodos fora da lista continuam respondendo 405."""
+        response = authenticated_client.get(reverse("parse-transaction"))
+
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
@@ -0,0 +1,237 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.ai.models import AIUsageLog
+from apps.ai.services import (
+    categorize_transaction_texts,
+    response_cache,
+    response_cache_key,
+)
+from apps.finance.categorizer import registry
+
+CATEGORIES = ["Mercado", "Uber e 99", "Outros"]
+
+
+class FakeCompletions:
+    def __init__(self, content: str):
+        self.content = content
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        message = type("Message", (), {"content": self.content})()
+        choice = type("Choice", (), {"message": message})()
+        usage = type(
+            "Usage",
+            (),
+            {"prompt_tokens": 90, "completion_tokens": 30, "total_tokens": 120},
+        )()
+        return type("Response", (), {"choices": [choice], "usage": usage})()
+
+
+class FakeClient:
+    def __init__(self, content: str):
+        self.chat = type("Chat", (), {"completions": FakeCompletions(content)})()
+
+
+@patch("apps.ai.services.categorization_service.get_ollama_client")
+def test_batch_uses_one_prompt_and_maps_indexes(mock_client):
+    """Um único prompt com a lista de categorias; resposta mapeada por índice."""
+    client = FakeClient(
+        json.dumps(
+            [
+                {"i": 1, "category": "uber e 99", "confidence": 0.9},
+                {"i": 0, "category": "Mercado", "confidence": 0.8},
+                {"i": 2, "category": "Inexistente", "confidence": 0.4},
+                {"i": 9, "category": "Mercado", "confidence": 0.9},
+            ]
+        )
+    )
+    mock_client.return_value = client
+
+    results, usage = categorize_transaction_texts(
+        ["mercado 150", "uber 23,50", "xyz", "sem resposta"], CATEGORIES
+    )
+
+    assert results == [
+        ("Mercado", 0.8),
+        ("Uber e 99", 0.9),
+        ("Outros", 0.4),
+        (None, 0.0),
+    ]
+    assert usage["total_tokens"] == 120
+    assert len(client.chat.completions.calls) == 1
+    prompt = client.chat.completions.calls[0]["messages"][1]["content"]
+    assert prompt.count("- Uber e 99") == 1
+    assert "3. sem resposta" in prompt
+
+
+@patch("apps.ai.services.categorization_service.get_ollama_client")
+def test_batch_invalid_json_raises(mock_client):
+    """Resposta que não é JSON vira ValueError, como no categorize simples."""
+    mock_client.return_value = FakeClient("não sei")
+
+    with pytest.raises(ValueError):
+        categorize_transaction_texts(["mercado"], CATEGORIES)
+
+
+@pytest.mark.django_db
+class TestCategorizeBatchView:
+    url = "categorize-batch"
+
+    def test_validates_texts(self, authenticated_client, settings):
+        """Lista vazia, itens vazios e excesso de textos são rejeitados."""
+        settings.AI_CATEGORIZE_BATCH_MAX = 2
+        url = reverse(self.url)
+
+        assert (
+            authenticated_client.post(url, {"texts": []}, format="json").status_code
+            == 400
+        )
+        response = authenticated_client.post(
+            url, {"texts": ["uber", " "]}, format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "índice 1" in response.data["error"]
+        response = authenticated_client.post(
+            url, {"texts": ["a", "b", "c"]}, format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @patch("apps.ai.views.is_ollama_available", return_value=True)
+    @patch("apps.ai.views.categorize_transaction_texts")
+    def test_one_call_and_log_per_chunk(
+        self, mock_batch, mock_ollama, authenticated_client, user, settings
+    ):
+        """Pendentes vão em lotes; textos repetidos são enviados uma vez."""
+        settings.AI_CATEGORIZE_BATCH_SIZE = 2
+        mock_batch.side_effect = lambda texts, categories: (
+            [("Mercado", 0.7)] * len(texts),
+            {"model": "m", "total_tokens": 100},
+        )
+        texts = ["mercado 1", "mercado 2", "Mercado  1", "mercado 3"]
+
+        response = authenticated_client.post(
+            reverse(self.url),
+            {"texts": texts, "category_type": "EXPENSE"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [call.args[0] for call in mock_batch.call_args_list] == [
+            ["mercado 1", "mercado 2"],
+            ["mercado 3"],
+        ]
+        results = response.data["results"]
+        assert [item["index"] for item in results] == [0, 1, 2, 3]
+        assert all(item["source"] == "llm" for item in results)
+        assert results[0]["suggestion"]["name"] == "Mercado"
+        assert results[0]["suggestion"]["id"] is not None
+        assert response.data["usage"] == {
+            "tokens_used": 200,
+            "llm_calls": 2,
+            "requests_remaining": settings.AI_RATE_LIMIT_PER_HOUR - 2,
+        }
+        assert AIUsageLog.objects.filter(user=user).count() == 2
+
+    @patch("apps.ai.views.is_ollama_available", return_value=True)
+    @patch("apps.ai.views.categorize_transaction_texts")
+    def test_cached_items_skip_llm(
+        self, mock_batch, mock_ollama, authenticated_client, user
+    ):
+        """Itens já em cache (do categorize simples ou de outro lote) não vão ao LLM."""
+        from apps.ai.views import _categorize_choices, get_llm_model
+
+        _, names = _categorize_choices(user, "EXPENSE")
+        response_cache.set(
+            response_cache_key(get_llm_model(), "categorize", "uber", names),
+            {"name": "Uber e 99", "confidence": 0.9},
+        )
+
+        response = authenticated_client.post(
+            reverse(self.url),
+            {"texts": ["uber"], "category_type": "EXPENSE"},
+            format="json",
+        )
+
+        assert response.data["results"][0]["source"] == "cache"
+        assert response.data["usage"]["llm_calls"] == 0
+        mock_batch.assert_not_called()
+        mock_ollama.assert_not_called()
+
+    @patch("apps.ai.views.is_ollama_available", return_value=True)
+    @patch("apps.ai.views.categorize_transaction_texts")
+    def test_rate_limit_skips_remaining_chunks(
+        self, mock_batch, mock_ollama, authenticated_client, settings
+    ):
+        """Lotes além do saldo do rate limit não são enviados."""
+        settings.AI_CATEGORIZE_BATCH_SIZE = 1
+        settings.AI_RATE_LIMIT_PER_HOUR = 1
+        mock_batch.return_value = (
+            [("Mercado", 0.7)],
+            {"model": "m", "total_tokens": 10},
+        )
+
+        response = authenticated_client.post(
+            reverse(self.url), {"texts": ["mercado", "padaria"]}, format="json"
+        )
+
+        assert [item["source"] for item in response.data["results"]] == [
+            "llm",
+            "skipped",
+        ]
+        assert mock_batch.call_count == 1
+
+    @patch("apps.ai.views.is_ollama_available", return_value=True)
+    @patch("apps.ai.views.categorize_transaction_texts")
+    def test_token_limit_applies(
+        self, mock_batch, mock_ollama, authenticated_client, user, settings
+    ):
+        """Limite de tokens esgotado bloqueia o lote mesmo com requisições sobrando."""
+        settings.AI_CATEGORIZE_BATCH_SIZE = 1
+        settings.AI_RATE_LIMIT = {
+            **settings.AI_RATE_LIMIT,
+            "FEATURE_TOKEN_LIMITS": {"categorize": 100},
+        }
+        mock_batch.return_value = (
+            [("Mercado", 0.7)],
+            {"model": "m", "total_tokens": 100},
+        )
+        url = reverse(self.url)
+
+        response = authenticated_client.post(
+            url, {"texts": ["mercado", "padaria"]}, format="json"
+        )
+        blocked = authenticated_client.post(url, {"texts": ["farmácia"]}, format="json")
+
+        assert [item["source"] for item in response.data["results"]] == [
+            "llm",
+            "skipped",
+        ]
+        assert blocked.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert mock_batch.call_count == 1
+
+    @patch("apps.ai.views.is_ollama_available", return_value=True)
+    @patch("apps.ai.views.categorize_transaction_texts")
+    def test_local_model_loaded_once(
+        self, mock_batch, mock_ollama, authenticated_client
+    ):
+        """O modelo local é obtido uma vez por requisição, não por texto."""
+        mock_batch.side_effect = lambda texts, categories: (
+            [("Mercado", 0.7)] * len(texts),
+            {"model": "m", "total_tokens": 10},
+        )
+
+        with patch.object(registry, "get", wraps=registry.get) as spy:
+            response = authenticated_client.post(
+                reverse(self.url),
+                {"texts": ["mercado", "padaria", "uber"]},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        spy.assert_called_once()
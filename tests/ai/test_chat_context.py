@@ -0,0 +1,123 @@
+import pytest
+from django.utils import timezone
+
+from apps.ai.services.chat_service import build_chat_messages
+from apps.finance.models import Goal, Transaction
+from apps.finance.signals import transactions_imported
+
+
+def _system_prompt(user):
+    return build_chat_messages(user, "Como estou?")[0]["content"]
+
+
+def _transaction(user, description="Mercado"):
+    return Transaction.objects.create(
+        user=user,
+        transaction_type="EXPENSE",
+        amount=150,
+        date=timezone.localdate(),
+        description=description,
+    )
+
+
+@pytest.fixture(autouse=True)
+def local_context_cache(settings):
+    """Testes rodam num único processo: aceita o cache em memória."""
+    settings.AI_CHAT_CONTEXT_CACHE = {
+        **settings.AI_CHAT_CONTEXT_CACHE,
+        "ALLOW_LOCAL_MEMORY": True,
+    }
+
+
+@pytest.mark.django_db
+class TestFinancialContextCache:
+    def test_burst_hits_database_once(self, user, django_assert_num_queries):
+        """Mensagens seguidas reaproveitam o contexto: prompt idêntico e sem consultas."""
+        _transaction(user)
+        first = _system_prompt(user)
+
+        with django_assert_num_queries(0):
+            second = _system_prompt(user)
+
+        assert second == first
+        assert "Mercado" in first
+
+    def test_transaction_changes_invalidate(self, user):
+        """Criar ou excluir transações gera um novo contexto."""
+        _system_prompt(user)
+
+        transaction = _transaction(user, "Farmácia")
+        assert "Farmácia" in _system_prompt(user)
+
+        transaction.delete()
+        assert "Farmácia" not in _system_prompt(user)
+
+    def test_goal_changes_invalidate(self, user):
+        """Metas alteradas entram no próximo contexto."""
+        _system_prompt(user)
+
+        Goal.objects.create(user=user, name="Viagem", target_amount=5000)
+
+        assert "Viagem" in _system_prompt(user)
+
+    def test_import_invalidates(self, user):
+        """Importação em lote (sem post_save) também invalida."""
+        before = _system_prompt(user)
+        Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    user=user,
+                    transaction_type="EXPENSE",
+                    amount=80,
+                    date=timezone.localdate(),
+                    description="Padaria",
+                )
+            ]
+        )
+        assert _system_prompt(user) == before
+
+        transactions_imported.send(sender=Transaction, user=user, category_ids=set())
+
+        assert "Padaria" in _system_prompt(user)
+
+    def test_ttl_zero_disables_cache(self, user, settings):
+        """Com TTL 0 o contexto é montado a cada mensagem."""
+        settings.AI_CHAT_CONTEXT_CACHE = {**settings.AI_CHAT_CONTEXT_CACHE, "TTL": 0}
+        _system_prompt(user)
+
+        Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    user=user,
+                    transaction_type="EXPENSE",
+                    amount=80,
+                    date=timezone.localdate(),
+                    description="Padaria",
+                )
+            ]
+        )
+
+        assert "Padaria" in _system_prompt(user)
+
+    def test_process_local_cache_disabled_by_default(self, user, settings):
+        """Cache em memória é por processo: sem ALLOW_LOCAL_MEMORY não é usado."""
+        settings.AI_CHAT_CONTEXT_CACHE = {
+            **settings.AI_CHAT_CONTEXT_CACHE,
+            "ALLOW_LOCAL_MEMORY": False,
+        }
+        _system_prompt(user)
+
+        # Escrita sem signal, como a de outro processo que não invalidou este
+        Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    user=user,
+                    transaction_type="EXPENSE",
+                    amount=80,
+                    date=timezone.localdate(),
+                    description="Padaria",
+                )
+            ]
+        )
+
+        assert "Padaria" in _system_prompt(user)
@@ -0,0 +1,205 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.urls import reverse
+
+from apps.ai.models import AIUsageLog, ChatConversation, ChatMessage
+from apps.ai.services.chat_history import SUMMARY_HEADER, estimate_tokens, split_history
+from apps.ai.views import check_rate_limit
+
+
+def _message(role, tokens):
+    return SimpleNamespace(role=role, content="x" * tokens * 4, tokens_used=0)
+
+
+def test_split_history_fits_budget():
+    """A janela guarda as mais recentes que cabem e não começa com resposta."""
+    newest_first = [
+        _message("assistant", 30),
+        _message("user", 30),
+        _message("assistant", 30),
+        _message("user", 30),
+    ]
+
+    window, overflow = split_history(newest_first, budget=90)
+
+    assert window == newest_first[1::-1]
+    assert overflow == newest_first[:1:-1]
+
+
+def _conversation(user, turns, chars=400):
+    conversation = ChatConversation.objects.create(user=user, title="Longa")
+    for index in range(turns):
+        ChatMessage.objects.create(
+            conversation=conversation, role="user", content=f"{index} " + "p" * chars
+        )
+        ChatMessage.objects.create(
+            conversation=conversation,
+            role="assistant",
+            content=f"{index} " + "r" * chars,
+        )
+    return conversation
+
+
+def _history_tokens(history):
+    return sum(estimate_tokens(item["content"]) for item in history)
+
+
+@pytest.mark.django_db
+@patch("apps.ai.views.is_ollama_available", return_value=True)
+@patch("apps.ai.views.agenerate_chat_response")
+@patch("apps.ai.views.asummarize_conversation")
+class TestChatHistory:
+    url = "chat"
+
+    def _post(self, client, conversation, mock_chat):
+        mock_chat.return_value = MagicMock(
+            message="Resposta", usage_info={"total_tokens": 40, "output_tokens": 20}
+        )
+        return client.post(
+            reverse(self.url),
+            {"message": "E agora?", "conversation_id": conversation.id},
+            format="json",
+        )
+
+    def test_overflow_is_summarized_once(
+        self, mock_summary, mock_chat, mock_ollama, authenticated_client, user, settings
+    ):
+        """Mensagens fora do orçamento viram resumo; o histórico enviado fica no limite."""
+        settings.AI_CHAT_HISTORY_TOKEN_BUDGET = 600
+        settings.AI_CHAT_SUMMARY_MAX_TOKENS = 100
+        mock_summary.return_value = (
+            "Usuário quer poupar R$ 500.",
+            {"total_tokens": 90},
+        )
+        conversation = _conversation(user, turns=20)
+
+        self._post(authenticated_client, conversation, mock_chat)
+
+        [[summary, overflow], _] = mock_summary.call_args
+        assert summary == ""
+        assert overflow[0].content.startswith("0 ")
+        history = mock_chat.call_args.args[2]
+        assert history[0] == {
+            "role": "system",
+            "content": f"{SUMMARY_HEADER}\nUsuário quer poupar R$ 500.",
+        }
+        assert history[1]["role"] == "user"
+        assert _history_tokens(history[1:]) <= 500
+        conversation.refresh_from_db()
+        assert conversation.summary == "Usuário quer poupar R$ 500."
+        assert conversation.summary_until == overflow[-1].id
+        assert AIUsageLog.objects.filter(
+            input_text__startswith="Resumo da conversa"
+        ).exists()
+
+        # Próxima mensagem ainda cabe na janela: usa o resumo salvo, sem nova chamada
+        mock_summary.reset_mock()
+        self._post(authenticated_client, conversation, mock_chat)
+        mock_summary.assert_not_called()
+        assert mock_chat.call_args.args[2][0] == history[0]
+
+    def test_short_conversation_skips_summary(
+        self, mock_summary, mock_chat, mock_ollama, authenticated_client, user
+    ):
+        """Conversas que cabem no orçamento vão inteiras, sem resumo."""
+        conversation = _conversation(user, turns=2, chars=20)
+
+        self._post(authenticated_client, conversation, mock_chat)
+
+        mock_summary.assert_not_called()
+        assert len(mock_chat.call_args.args[2]) == 4
+
+    def test_summary_failure_keeps_chat_working(
+        self, mock_summary, mock_chat, mock_ollama, authenticated_client, user, settings
+    ):
+        """Falha no resumo não bloqueia o chat; as mensagens antigas ficam pendentes."""
+        settings.AI_CHAT_HISTORY_TOKEN_BUDGET = 600
+        settings.AI_CHAT_SUMMARY_MAX_TOKENS = 100
+        mock_summary.side_effect = ValueError("timeout")
+        conversation = _conversation(user, turns=20)
+
+        response = self._post(authenticated_client, conversation, mock_chat)
+
+        assert response.status_code == 200
+        assert _history_tokens(mock_chat.call_args.args[2]) <= 500
+        conversation.refresh_from_db()
+        assert conversation.summary_until is None
+
+    def test_summary_reserves_its_own_request(
+        self, mock_summary, mock_chat, mock_ollama, authenticated_client, user, settings
+    ):
+        """O resumo consome uma requisição verificada e o saldo informado a inclui."""
+        settings.AI_CHAT_HISTORY_TOKEN_BUDGET = 600
+        settings.AI_CHAT_SUMMARY_MAX_TOKENS = 100
+        settings.AI_RATE_LIMIT_PER_HOUR = 5
+        mock_summary.return_value = ("Resumo.", {"total_tokens": 90})
+        conversation = _conversation(user, turns=20)
+
+        response = self._post(authenticated_client, conversation, mock_chat)
+
+        assert response.data["usage"]["requests_remaining"] == 3
+        assert response["X-RateLimit-Remaining"] == "3"
+        assert check_rate_limit(user) == (True, 3)
+
+    def test_summary_skipped_without_requests_left(
+        self, mock_summary, mock_chat, mock_ollama, authenticated_client, user, settings
+    ):
+        """Com uma requisição sobrando, só o chat é chamado; o resumo fica para depois."""
+        settings.AI_CHAT_HISTORY_TOKEN_BUDGET = 600
+        settings.AI_CHAT_SUMMARY_MAX_TOKENS = 100
+        settings.AI_RATE_LIMIT_PER_HOUR = 1
+        conversation = _conversation(user, turns=20)
+
+        response = self._post(authenticated_client, conversation, mock_chat)
+
+        assert response.status_code == 200
+        assert response.data["usage"]["requests_remaining"] == 0
+        mock_summary.assert_not_called()
+        assert _history_tokens(mock_chat.call_args.args[2]) <= 500
+        conversation.refresh_from_db()
+        assert conversation.summary_until is None
+
+    def test_summary_every_few_turns(
+        self, mock_summary, mock_chat, mock_ollama, authenticated_client, user
+    ):
+        """Ao transbordar a janela cai até a marca baixa: o resumo não ocorre a cada turno."""
+        mock_summary.return_value = ("Resumo.", {"total_tokens": 50})
+        mock_chat.return_value = MagicMock(
+            message="r" * 440, usage_info={"total_tokens": 300, "output_tokens": 110}
+        )
+        conversation = ChatConversation.objects.create(user=user, title="Longa")
+
+        for _ in range(20):  # ~210 tokens por turno, janela de 800 tokens
+            response = authenticated_client.post(
+                reverse(self.url),
+                {"message": "p" * 400, "conversation_id": conversation.id},
+                format="json",
+            )
+            assert response.status_code == 200
+            assert _history_tokens(mock_chat.call_args.args[2][1:]) <= 800
+
+        assert mock_summary.call_count == 6
+
+    def test_old_backlog_summarized_in_chunks(
+        self, mock_summary, mock_chat, mock_ollama, authenticated_client, user, settings
+    ):
+        """Mensagens além da leitura não são perdidas: entram no resumo em ordem, por trechos."""
+        settings.AI_CHAT_HISTORY_TOKEN_BUDGET = 600
+        settings.AI_CHAT_SUMMARY_MAX_TOKENS = 100
+        mock_summary.return_value = ("Resumo.", {"total_tokens": 50})
+        conversation = _conversation(user, turns=30)
+
+        with patch("apps.ai.views.CHAT_HISTORY_SCAN_LIMIT", 10):
+            self._post(authenticated_client, conversation, mock_chat)
+            self._post(authenticated_client, conversation, mock_chat)
+
+        first, second = (call.args[1] for call in mock_summary.call_args_list)
+        assert [msg.content.split()[0] for msg in first] == [
+            str(i // 2) for i in range(10)
+        ]
+        assert second[0].content.startswith("5 ")
+        assert second[0].id > first[-1].id
+        conversation.refresh_from_db()
+        assert conversation.summary_until == second[-1].id
@@ -0,0 +1,288 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import openai
+import pytest
+from asgiref.sync import async_to_sync
+from django.core import signals
+from django.core.asgi import get_asgi_application
+from django.db import close_old_connections
+from django.test import AsyncRequestFactory
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import force_authenticate
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.ai import views
+from apps.ai.models import AIUsageLog, ChatConversation, ChatMessage
+from apps.ai.services import llm_health
+
+DELAY = 0.1
+
+
+def _chunk(text=None, usage=None):
+    choices = (
+        [] if text is None else [SimpleNamespace(delta=SimpleNamespace(content=text))]
+    )
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class FakeStream:
+    """Imita ``openai.AsyncStream``: iterável assíncrono de chunks com ``close()``."""
+
+    def __init__(self, chunks, fail_after=None, delay=0):
+        self.chunks = chunks
+        self.fail_after = fail_after
+        self.delay = delay
+        self.sent = 0
+        self.closed = False
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            if self.sent:
+                await asyncio.sleep(self.delay)
+            if self.closed:
+                return
+            if self.fail_after is not None and self.sent == self.fail_after:
+                raise openai.APIConnectionError(
+                    request=httpx.Request("POST", "http://llm")
+                )
+            self.sent += 1
+            yield chunk
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeClient:
+    def __init__(self, stream):
+        self.stream = stream
+        self.kwargs = None
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        self.kwargs = kwargs
+        return self.stream
+
+
+def _parse(raw: bytes):
+    events = []
+    for block in raw.decode().split("\n\n"):
+        if block:
+            event, data = block.split("\n")
+            events.append(
+                (event.removeprefix("event: "), json.loads(data.removeprefix("data: ")))
+            )
+    return events
+
+
+def _post(user, data, **extra):
+    request = AsyncRequestFactory().post(
+        reverse("chat-stream"), data, content_type="application/json", **extra
+    )
+    force_authenticate(request, user=user)
+    return views.chat_stream(request)
+
+
+def _stream(user, stream, data=None):
+    """Resposta da view e os eventos lidos do gerador assíncrono."""
+
+    async def run():
+        response = await _post(user, data or {"message": "Oi"})
+        parts = [part async for part in response.streaming_content]
+        return response, _parse(b"".join(parts))
+
+    with patch(
+        "apps.ai.services.chat_service.get_async_llm_client",
+        return_value=FakeClient(stream),
+    ):
+        return async_to_sync(run)()
+
+
+USAGE = SimpleNamespace(prompt_tokens=80, completion_tokens=3, total_tokens=83)
+
+
+@pytest.mark.django_db
+@patch("apps.ai.views.is_ollama_available", return_value=True)
+class TestChatStream:
+    def test_streams_tokens_and_persists_on_completion(self, mock_ollama, user):
+        """Tokens chegam como eventos; mensagens e uso são gravados no fim."""
+        stream = FakeStream(
+            [_chunk("Olá"), _chunk(", tudo"), _chunk(" bem?"), _chunk(usage=USAGE)]
+        )
+
+        response, events = _stream(user, stream)
+
+        assert response["Content-Type"] == "text/event-stream"
+        assert response.is_async
+        assert [name for name, _ in events] == [
+            "start",
+            "token",
+            "token",
+            "token",
+            "done",
+        ]
+        assert (
+            "".join(data["text"] for name, data in events if name == "token")
+            == "Olá, tudo bem?"
+        )
+        done = events[-1][1]
+        assert done["message"] == "Olá, tudo bem?"
+        assert done["usage"]["tokens_used"] == 83
+        assert done["timing"]["first_token_ms"] is not None
+
+        conversation = ChatConversation.objects.get(user=user)
+        assert done["conversation_id"] == conversation.id
+        assert list(
+            conversation.messages.order_by("id").values_list("role", "content")
+        ) == [
+            ("user", "Oi"),
+            ("assistant", "Olá, tudo bem?"),
+        ]
+        log = AIUsageLog.objects.get(user=user)
+        assert log.success is True
+
+    def test_client_disconnect_closes_upstream(self, mock_ollama, user):
+        """Desconexão (tarefa cancelada pelo ASGI) fecha o provedor e não grava mensagens."""
+        stream = FakeStream(
+            [_chunk("a"), _chunk("b"), _chunk("c"), _chunk(usage=USAGE)], delay=DELAY
+        )
+
+        async def run():
+            response = await _post(user, {"message": "Oi"})
+            received = []
+
+            async def consume():
+                async for part in response.streaming_content:
+                    received.append(part)
+
+            task = asyncio.create_task(consume())
+            while len(received) < 2:  # start e primeiro token
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with patch(
+            "apps.ai.services.chat_service.get_async_llm_client",
+            return_value=FakeClient(stream),
+        ):
+            async_to_sync(run)()
+
+        assert stream.closed is True
+        assert stream.sent == 1
+        assert not ChatMessage.objects.exists()
+        log = AIUsageLog.objects.get(user=user)
+        assert log.success is False
+        assert log.error_message == "Cancelado pelo cliente"
+
+    def test_upstream_error_emits_error_event(self, mock_ollama, user):
+        """Falha no meio da geração vira evento de erro e log sem sucesso."""
+        stream = FakeStream([_chunk("a"), _chunk("b")], fail_after=1)
+
+        _, events = _stream(user, stream)
+
+        assert [name for name, _ in events] == ["start", "token", "error"]
+        assert stream.closed is True
+        assert not ChatMessage.objects.exists()
+        assert AIUsageLog.objects.get(user=user).success is False
+        llm_health.reset()
+
+    def test_save_error_emits_error_event(self, mock_ollama, user):
+        """Falha ao gravar a resposta também vira evento de erro, com o uso registrado."""
+        stream = FakeStream([_chunk("a"), _chunk(usage=USAGE)])
+
+        with patch(
+            "apps.ai.views._asave_chat_turn", side_effect=RuntimeError("disco cheio")
+        ):
+            _, events = _stream(user, stream)
+
+        assert [name for name, _ in events] == ["start", "token", "error"]
+        log = AIUsageLog.objects.get(user=user)
+        assert log.success is False
+        assert log.error_message == "disco cheio"
+        assert log.input_tokens == 80
+
+    def test_validation_error_as_event_stream(self, mock_ollama, authenticated_client):
+        """Com Accept: text/event-stream, erros de validação saem como evento."""
+        response = authenticated_client.post(
+            reverse("chat-stream"), {}, format="json", HTTP_ACCEPT="text/event-stream"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.content.decode().startswith("event: error\ndata: ")
+
+
+@pytest.mark.django_db
+@patch("apps.ai.views.is_ollama_available", return_value=True)
+def test_asgi_sends_first_event_before_stream_ends(mock_ollama, user):
+    """Pelo handler ASGI, os eventos saem conforme chegam (sem ler o stream inteiro)."""
+    stream = FakeStream(
+        [_chunk("a"), _chunk("b"), _chunk("c"), _chunk(usage=USAGE)], delay=DELAY
+    )
+    body = json.dumps({"message": "Oi"}).encode()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": reverse("chat-stream"),
+        "query_string": b"",
+        "headers": [
+            (b"host", b"testserver"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"authorization", f"Bearer {AccessToken.for_user(user)}".encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    sent = []
+
+    async def run():
+        requests = [{"type": "http.request", "body": body, "more_body": False}]
+        finished = asyncio.Event()
+
+        async def receive():
+            if requests:
+                return requests.pop()
+            await finished.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append((time.monotonic(), message))
+            if message["type"] == "http.response.body" and not message.get("more_body"):
+                finished.set()
+
+        await get_asgi_application()(scope, receive, send)
+
+    # Como o test client: a conexão da transação do teste não é fechada no fim da requisição
+    signals.request_started.disconnect(close_old_connections)
+    signals.request_finished.disconnect(close_old_connections)
+    try:
+        with patch(
+            "apps.ai.services.chat_service.get_async_llm_client",
+            return_value=FakeClient(stream),
+        ):
+            async_to_sync(run)()
+    finally:
+        signals.request_started.connect(close_old_connections)
+        signals.request_finished.connect(close_old_connections)
+
+    assert sent[0][1]["status"] == 200
+    bodies = [(at, message.get("body", b"")) for at, message in sent[1:]]
+    first_token_at = next(at for at, chunk in bodies if b"event: token" in chunk)
+    done_at = next(at for at, chunk in bodies if b"event: done" in chunk)
+    assert done_at - first_token_at >= 2 * DELAY
+    assert [name for name, _ in _parse(b"".join(chunk for _, chunk in bodies))] == [
+        "start",
+        "token",
+        "token",
+        "token",
+        "done",
+    ]
@@ -0,0 +1,146 @@
+from unittest.mock import patch
+
+import httpx
+import openai
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.ai.services import llm_health
+from apps.ai.services.health import LLMHealth
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeProbe:
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def __call__(self):
+        self.calls += 1
+        if self.fail:
+            raise httpx.ConnectError("recusado")
+        return ["llama3.1:8b"]
+
+
+@pytest.fixture
+def health(settings):
+    settings.AI_HEALTH_TTL = 30
+    settings.AI_BREAKER_FAILURES = 3
+    settings.AI_BREAKER_COOLDOWN = 60
+    clock, probe = FakeClock(), FakeProbe()
+    return LLMHealth(probe=probe, key=lambda: "ollama", clock=clock), clock, probe
+
+
+def _connection_error():
+    return openai.APIConnectionError(request=httpx.Request("POST", "http://llm.local"))
+
+
+class TestLLMHealth:
+    def test_probe_result_is_cached(self, health):
+        """Dentro do TTL a disponibilidade não gera nova sonda."""
+        state, clock, probe = health
+
+        assert state.is_available()
+        assert state.is_available()
+        assert state.available_models() == ["llama3.1:8b"]
+        assert probe.calls == 1
+
+        clock.now += 31
+        assert state.is_available()
+        assert probe.calls == 2
+
+    def test_successful_calls_skip_probe(self, health):
+        """Chamadas reais bem-sucedidas renovam o estado sem sonda."""
+        state, clock, probe = health
+
+        with state.track():
+            pass
+        clock.now += 20
+        with state.track():
+            pass
+        clock.now += 20
+
+        assert state.is_available()
+        assert probe.calls == 0
+
+    def test_breaker_opens_and_fails_fast(self, health):
+        """Falhas seguidas abrem o circuito: sem rede até o cooldown."""
+        state, clock, probe = health
+        for _ in range(3):
+            with pytest.raises(openai.APIConnectionError):
+                with state.track():
+                    raise _connection_error()
+
+        assert not state.is_available()
+        assert state.retry_after() == 61
+        assert probe.calls == 0
+
+        clock.now += 61
+        assert state.is_available()
+        assert probe.calls == 1
+        assert state.retry_after() == 0
+
+    def test_failed_probe_opens_breaker(self, health):
+        """Sonda com falha abre o circuito imediatamente."""
+        state, clock, probe = health
+        probe.fail = True
+
+        assert not state.is_available()
+        assert not state.is_available()
+        assert probe.calls == 1
+
+        clock.now += 61
+        probe.fail = False
+        assert state.is_available()
+
+    def test_request_errors_do_not_count(self, health):
+        """Erros que não indicam indisponibilidade não afetam o circuito."""
+        state, _, _ = health
+        for _ in range(5):
+            with pytest.raises(ValueError):
+                with state.track():
+                    raise ValueError("JSON inválido")
+
+        assert state.retry_after() == 0
+
+
+@pytest.mark.django_db
+class TestCircuitBreakerViews:
+    @pytest.fixture(autouse=True)
+    def reset_health(self):
+        llm_health.reset()
+        yield
+        llm_health.reset()
+
+    def test_open_breaker_returns_503_without_probe(
+        self, authenticated_client, settings
+    ):
+        """Com o circuito aberto a view responde 503 sem acessar o provedor."""
+        settings.AI_BREAKER_FAILURES = 1
+        llm_health.record_failure()
+
+        with patch.object(llm_health, "_probe") as probe:
+            response = authenticated_client.post(
+                reverse("parse-transaction"), {"text": "uber 23,50"}
+            )
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert int(response["Retry-After"]) > 0
+        probe.assert_not_called()
+
+    def test_healthcheck_probes_once(self, api_client):
+        """Healthcheck obtém disponibilidade e modelos com uma única sonda."""
+        with patch.object(llm_health, "_probe", return_value=["llama3.1:8b"]) as probe:
+            response = api_client.get(reverse("healthcheck"))
+
+        assert response.data["llm"]["available"] is True
+        assert response.data["llm"]["installed_models"] == ["llama3.1:8b"]
+        assert probe.call_count == 1
@@ -0,0 +1,261 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db import OperationalError
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.ai.jobs import claim_jobs, enqueue, run_job
+from apps.ai.models import AIJob, AIUsageLog
+from apps.ai.services.forecast_service import ForecastResult
+from apps.ai.services.rate_limit import RateLimiter
+from apps.ai.views import check_rate_limit
+from apps.finance.models import Transaction
+from tests.factories import UserFactory
+
+FORECAST = ForecastResult(
+    summary="Mês estável.",
+    forecast_income=5000.0,
+    forecast_expenses=3000.0,
+    forecast_balance=2000.0,
+    recommendations=["Manter a reserva"],
+)
+
+
+@pytest.fixture
+def history(user):
+    Transaction.objects.create(
+        user=user,
+        transaction_type="INCOME",
+        amount=5000,
+        date=timezone.localdate(),
+        description="Salário",
+    )
+
+
+@pytest.mark.django_db
+class TestAsyncMode:
+    @patch("apps.ai.views.agenerate_monthly_insights")
+    def test_insights_returns_job(self, mock_insights, authenticated_client, user):
+        """Com ?async=1 a view só enfileira e responde 202 com o id."""
+        response = authenticated_client.post(
+            reverse("insights") + "?async=1", {"month": "2026-01"}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        job = AIJob.objects.get(pk=response.data["job_id"])
+        assert job.user == user
+        assert job.feature == AIUsageLog.Feature.INSIGHTS
+        assert job.payload == {"month": "2026-01", "refresh": False}
+        assert job.status == AIJob.Status.PENDING
+        assert response.data["status_url"] == reverse("ai-job-detail", args=[job.id])
+        mock_insights.assert_not_called()
+
+    def test_validates_before_enqueue(self, authenticated_client):
+        """Parâmetros inválidos e rate limit esgotado não criam tarefas."""
+        response = authenticated_client.post(
+            reverse("forecast") + "?async=1", {"months": 0}, format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        with patch("apps.ai.views.areserve_rate_limit", return_value=(False, 0)):
+            response = authenticated_client.post(reverse("budget-check") + "?async=1")
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+        assert not AIJob.objects.exists()
+
+    def test_enqueue_reserves_rate_limit(self, authenticated_client, user, settings):
+        """A requisição é reservada ao enfileirar; rajadas não criam tarefas extras."""
+        settings.AI_RATE_LIMIT_PER_HOUR = 2
+        url = reverse("forecast") + "?async=1"
+
+        first = authenticated_client.post(url, {"months": 3}, format="json")
+        repeated = authenticated_client.post(url, {"months": 3}, format="json")
+        other = authenticated_client.post(url, {"months": 6}, format="json")
+        blocked = authenticated_client.post(url, {"months": 12}, format="json")
+
+        assert first.data["usage"]["requests_remaining"] == 1
+        assert repeated.status_code == status.HTTP_202_ACCEPTED
+        assert repeated.data["job_id"] == first.data["job_id"]
+        assert other.data["usage"]["requests_remaining"] == 0
+        assert blocked.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert AIJob.objects.count() == 2
+
+    @patch(
+        "apps.ai.views.generate_cashflow_forecast",
+        return_value=(FORECAST, {"total_tokens": 90}),
+    )
+    def test_worker_counts_only_tokens(
+        self, mock_forecast, authenticated_client, user, history, settings
+    ):
+        """O worker não conta a requisição de novo, só os tokens da chamada."""
+        settings.AI_RATE_LIMIT = {**settings.AI_RATE_LIMIT, "TOKENS_PER_WINDOW": 90}
+        # Limite de tokens com ?async=1 exige contadores compartilhados
+        with patch.object(RateLimiter, "shared", True):
+            authenticated_client.post(
+                reverse("forecast") + "?async=1", {"months": 2}, format="json"
+            )
+
+        run_job(claim_jobs(1)[0])
+
+        assert check_rate_limit(user) == (False, settings.AI_RATE_LIMIT_PER_HOUR - 1)
+
+
+@pytest.mark.django_db
+class TestQueue:
+    def test_claim_reserves_ready_jobs_once(self, user):
+        """Tarefas reservadas ou agendadas para depois não são entregues de novo."""
+        first = enqueue(user, AIUsageLog.Feature.BUDGET_CHECK)
+        second = enqueue(user, AIUsageLog.Feature.FORECAST, {"months": 3})
+        later = enqueue(user, AIUsageLog.Feature.BUDGET_CHECK)
+        AIJob.objects.filter(pk=later.pk).update(
+            run_after=timezone.now() + timedelta(minutes=5)
+        )
+
+        claimed = claim_jobs(10)
+
+        assert [job.pk for job in claimed] == [first.pk, second.pk]
+        assert all(job.status == AIJob.Status.RUNNING for job in claimed)
+        assert AIJob.objects.get(pk=first.pk).attempts == 1
+        assert claim_jobs(10) == []
+
+    def test_stale_lock_is_reclaimed(self, user, settings):
+        """Reserva de um worker que parou expira e a tarefa volta a ser entregue."""
+        settings.AI_JOB_LOCK_TIMEOUT = 60
+        job = enqueue(user, AIUsageLog.Feature.BUDGET_CHECK)
+        claim_jobs(1)
+        AIJob.objects.filter(pk=job.pk).update(
+            locked_at=timezone.now() - timedelta(minutes=2)
+        )
+
+        [reclaimed] = claim_jobs(1)
+
+        assert reclaimed.pk == job.pk
+        assert reclaimed.attempts == 2
+
+    def test_stale_lock_without_attempts_fails(self, user, settings):
+        """Reserva expirada de tarefa sem tentativas sobrando não roda de novo."""
+        settings.AI_JOB_LOCK_TIMEOUT = 60
+        settings.AI_JOB_MAX_ATTEMPTS = 1
+        job = enqueue(user, AIUsageLog.Feature.BUDGET_CHECK)
+        claim_jobs(1)
+        AIJob.objects.filter(pk=job.pk).update(
+            locked_at=timezone.now() - timedelta(minutes=2)
+        )
+
+        assert claim_jobs(1) == []
+
+        job.refresh_from_db()
+        assert job.status == AIJob.Status.FAILED
+        assert job.attempts == 1
+        assert job.finished_at is not None
+
+    @patch("apps.ai.jobs.SAVE_RETRY_DELAY", 0)
+    def test_result_save_is_retried(self, user):
+        """Erro transitório ao gravar o resultado é repetido."""
+        enqueue(user, AIUsageLog.Feature.BUDGET_CHECK)
+        [job] = claim_jobs(1)
+        save = AIJob.save
+        calls = []
+
+        def flaky_save(self, *args, **kwargs):
+            calls.append(self.status)
+            if len(calls) == 1:
+                raise OperationalError("database table is locked")
+            return save(self, *args, **kwargs)
+
+        with patch.object(AIJob, "save", flaky_save):
+            run_job(job)
+
+        assert calls == [AIJob.Status.DONE, AIJob.Status.DONE]
+        assert AIJob.objects.get(pk=job.pk).status == AIJob.Status.DONE
+
+    @patch("apps.ai.jobs.SAVE_RETRY_DELAY", 0)
+    def test_result_save_failure_marks_job_failed(self, user):
+        """Sem conseguir gravar o resultado, a tarefa falha em vez de ficar em execução."""
+        enqueue(user, AIUsageLog.Feature.BUDGET_CHECK)
+        [job] = claim_jobs(1)
+        save = AIJob.save
+
+        def save_fails_when_done(self, *args, **kwargs):
+            if self.status == AIJob.Status.DONE:
+                raise OperationalError("database table is locked")
+            return save(self, *args, **kwargs)
+
+        with patch.object(AIJob, "save", save_fails_when_done):
+            job = run_job(job)
+
+        job.refresh_from_db()
+        assert job.status == AIJob.Status.FAILED
+        assert job.locked_at is None
+        assert "database table is locked" in job.error_message
+
+    @patch(
+        "apps.ai.views.generate_cashflow_forecast",
+        return_value=(FORECAST, {"total_tokens": 90}),
+    )
+    def test_run_job_stores_result(
+        self, mock_forecast, authenticated_client, user, history
+    ):
+        """O resultado tem o formato da resposta síncrona e fica no status."""
+        enqueue(user, AIUsageLog.Feature.FORECAST, {"months": 2})
+        [job] = claim_jobs(1)
+
+        job = run_job(job)
+
+        assert job.status == AIJob.Status.DONE
+        assert AIUsageLog.objects.filter(user=user, success=True).count() == 1
+        response = authenticated_client.get(reverse("ai-job-detail", args=[job.pk]))
+        assert response.data["status"] == "done"
+        assert response.data["result"]["forecast"]["summary"] == "Mês estável."
+        assert len(response.data["result"]["history"]) == 2
+        assert response.data["result"]["usage"] == {"tokens_used": 90}
+
+    @patch(
+        "apps.ai.views.generate_cashflow_forecast",
+        side_effect=ValueError("JSON inválido"),
+    )
+    def test_failures_retry_with_backoff(
+        self, mock_forecast, authenticated_client, user, history, settings
+    ):
+        """Falha volta para a fila com espera; após o limite, a tarefa falha."""
+        settings.AI_JOB_MAX_ATTEMPTS = 2
+        enqueue(user, AIUsageLog.Feature.FORECAST, {"months": 1})
+
+        job = run_job(claim_jobs(1)[0])
+        assert job.status == AIJob.Status.PENDING
+        assert job.run_after > timezone.now()
+        assert claim_jobs(1) == []
+
+        AIJob.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        job = run_job(claim_jobs(1)[0])
+
+        assert job.status == AIJob.Status.FAILED
+        assert AIUsageLog.objects.filter(user=user, success=False).count() == 2
+        response = authenticated_client.get(reverse("ai-job-detail", args=[job.pk]))
+        assert response.data["error"] == "JSON inválido"
+
+    def test_job_detail_is_per_user(self, authenticated_client):
+        """Tarefas de outro usuário não são visíveis."""
+        job = enqueue(UserFactory(), AIUsageLog.Feature.BUDGET_CHECK)
+
+        response = authenticated_client.get(reverse("ai-job-detail", args=[job.pk]))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db(transaction=True)
+def test_runworker_once_processes_queue(user):
+    """O worker consome a fila e encerra com --once."""
+    jobs = [enqueue(user, AIUsageLog.Feature.BUDGET_CHECK) for _ in range(3)]
+
+    # Uma thread: o SQLite dos testes não aceita gravações concorrentes
+    call_command("runworker", "--once", "--concurrency", "1", "--poll-interval", "0.01")
+
+    for job in jobs:
+        job.refresh_from_db()
+        assert job.status == AIJob.Status.DONE
+        assert job.result["summary"] == "Nenhum orçamento ativo cadastrado."
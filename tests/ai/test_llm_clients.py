@@ -0,0 +1,69 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import override_settings
+
+from apps.ai.services.llm_clients import registry
+from apps.ai.services.ollama_client import get_async_llm_client, get_llm_client
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    registry.clear()
+    yield
+    registry.clear()
+
+
+@override_settings(LLM_PROVIDER="ollama", OLLAMA_BASE_URL="http://llm.local/v1")
+def test_client_is_reused():
+    """Chamadas seguidas devolvem o mesmo cliente (mesmo pool de conexões)."""
+    assert get_llm_client() is get_llm_client()
+    assert len(registry) == 1
+
+
+@override_settings(
+    LLM_PROVIDER="ollama",
+    OLLAMA_BASE_URL="http://llm.local/v1",
+    AI_TIMEOUTS={"default": 30.0, "chat": 90.0},
+)
+def test_feature_timeout_shares_pool():
+    """Timeouts por funcionalidade compartilham o mesmo httpx.Client."""
+    default = get_llm_client()
+    chat = get_llm_client("chat")
+
+    assert chat is not default
+    assert chat._client is default._client
+    assert chat.timeout.read == 90.0
+    assert get_llm_client("outro").timeout.read == 30.0
+    assert len(registry) == 1
+
+
+def test_settings_change_invalidates_clients():
+    """Mudar provedor/URL descarta e fecha os clientes anteriores."""
+    with override_settings(LLM_PROVIDER="ollama", OLLAMA_BASE_URL="http://a.local/v1"):
+        first = get_llm_client()
+
+    assert len(registry) == 0
+    assert first._client.is_closed
+
+    with override_settings(LLM_PROVIDER="ollama", OLLAMA_BASE_URL="http://b.local/v1"):
+        second = get_llm_client()
+        assert str(second.base_url).startswith("http://b.local/v1")
+
+
+@override_settings(LLM_PROVIDER="ollama", OLLAMA_BASE_URL="http://llm.local/v1")
+def test_async_clients_are_per_event_loop():
+    """No mesmo loop o AsyncOpenAI é reaproveitado; cada loop tem o seu."""
+
+    async def clients():
+        return (
+            get_async_llm_client(),
+            get_async_llm_client(),
+            get_async_llm_client("chat"),
+        )
+
+    first, same, chat = async_to_sync(clients)()
+    other_loop, _, _ = async_to_sync(clients)()
+
+    assert first is same
+    assert chat._client is first._client
+    assert other_loop is not first
@@ -0,0 +1,169 @@
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+
+from apps.ai.models import AIJob
+from apps.ai.services.rate_limit import (
+    DjangoCacheCounterBackend,
+    LocalCounterBackend,
+    RateLimiter,
+)
+from apps.ai.views import check_rate_limit, log_ai_usage
+
+
+class FakeClock:
+    def __init__(self, now=36_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def limiter(clock, settings):
+    settings.AI_RATE_LIMIT_PER_HOUR = 10
+    settings.AI_RATE_LIMIT = {"BACKEND": "local", "WINDOW": 100}
+    limiter = RateLimiter(clock=clock)
+    limiter._backend = LocalCounterBackend(clock=clock)
+    return limiter
+
+
+class TestSlidingWindow:
+    def test_hits_consume_requests(self, limiter):
+        """Cada chamada registrada reduz as requisições restantes."""
+        for _ in range(3):
+            limiter.hit(1, "chat")
+
+        assert limiter.check(1) == (True, 7)
+        assert limiter.check(2) == (True, 10)
+
+    def test_previous_window_is_weighted(self, limiter, clock):
+        """Uso da janela anterior conta proporcionalmente ao que ainda cobre."""
+        for _ in range(10):
+            limiter.hit(1, "chat")
+        assert limiter.check(1) == (False, 0)
+
+        clock.now += 100 + 25  # 25% da nova janela: 75% da anterior ainda conta
+        assert limiter.check(1) == (True, 2)
+
+        clock.now += 100  # duas janelas depois: nada conta
+        assert limiter.check(1) == (True, 10)
+
+    def test_feature_limit(self, limiter, settings):
+        """Limite por funcionalidade bloqueia só ela."""
+        settings.AI_RATE_LIMIT = {
+            **settings.AI_RATE_LIMIT,
+            "FEATURE_LIMITS": {"chat": 2},
+        }
+        limiter.hit(1, "chat")
+        limiter.hit(1, "chat")
+
+        assert limiter.check(1, "chat") == (False, 0)
+        assert limiter.check(1, "insights") == (True, 8)
+
+    def test_token_limit(self, limiter, settings):
+        """Limites de tokens bloqueiam mesmo com requisições sobrando."""
+        settings.AI_RATE_LIMIT = {
+            **settings.AI_RATE_LIMIT,
+            "TOKENS_PER_WINDOW": 1000,
+            "FEATURE_TOKEN_LIMITS": {"forecast": 300},
+        }
+        limiter.hit(1, "forecast", tokens=400)
+
+        assert limiter.check(1, "forecast") == (False, 9)
+        assert limiter.check(1, "chat") == (True, 9)
+
+        limiter.hit(1, "chat", tokens=600)
+        assert limiter.check(1, "chat") == (False, 8)
+
+    def test_reserve_decides_on_incremented_value(self, limiter, clock):
+        """Reservas contam na hora: a décima primeira é recusada e devolvida."""
+        assert [limiter.reserve(1, "chat") for _ in range(11)] == [
+            (True, left) for left in range(9, -1, -1)
+        ] + [(False, 0)]
+        assert limiter.check(1) == (False, 0)
+
+        limiter.release(1, "chat")
+        assert limiter.check(1) == (True, 1)
+
+        clock.now += 200  # devolução de janela expirada não deixa saldo extra
+        limiter.release(1, "chat")
+        assert limiter.check(1) == (True, 10)
+
+    def test_reserve_respects_token_limit(self, limiter, settings):
+        """Sem saldo de tokens a reserva é recusada sem consumir requisições."""
+        settings.AI_RATE_LIMIT = {**settings.AI_RATE_LIMIT, "TOKENS_PER_WINDOW": 100}
+        assert limiter.reserve(1, "chat") == (True, 9)
+        limiter.hit(1, "chat", tokens=100, requests=0)
+
+        assert limiter.reserve(1, "chat") == (False, 0)
+        assert limiter.check(1, "chat") == (False, 9)
+
+
+def test_django_cache_backend(settings):
+    """Backend do cache do Django incrementa os contadores atomicamente."""
+    settings.CACHES = {
+        "ratelimit": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    backend = DjangoCacheCounterBackend("ratelimit")
+
+    assert backend.incr("requests:1:5", 1, 60) == 1
+    assert backend.incr("requests:1:5", 2, 60) == 3
+    assert backend.get_many(["requests:1:5", "requests:1:4"]) == {"requests:1:5": 3}
+    assert backend.incr("requests:1:5", -1, 60) == 2
+    assert backend.incr("requests:1:4", -1, 60) == 0  # devolução sem contador
+    assert backend.get_many(["requests:1:4"]) == {}
+    assert not backend.shared  # cache em memória é por processo
+
+
+@pytest.mark.django_db
+def test_check_without_queries(user, settings, django_assert_num_queries):
+    """O uso registrado consome o limite; a verificação não consulta o banco."""
+    settings.AI_RATE_LIMIT_PER_HOUR = 2
+    log_ai_usage(user, "chat", "oi", {"model": "m", "total_tokens": 10})
+
+    with django_assert_num_queries(0):
+        assert check_rate_limit(user) == (True, 1)
+
+
+@pytest.mark.django_db
+@patch("apps.ai.views.is_ollama_available", return_value=True)
+class TestRateLimitResponses:
+    def test_headers_come_from_limiter(
+        self, mock_ollama, authenticated_client, user, settings
+    ):
+        """Respostas trazem limite e saldo do limiter; 429 com saldo zero."""
+        settings.AI_RATE_LIMIT_PER_HOUR = 2
+        settings.AI_RATE_LIMIT = {
+            **settings.AI_RATE_LIMIT,
+            "FEATURE_LIMITS": {"forecast": 1},
+        }
+        url = reverse("forecast")
+
+        ok = authenticated_client.post(url, {"months": 2}, format="json")
+        log_ai_usage(user, "forecast", "Forecast", {"model": "m"})
+        limited = authenticated_client.post(url, {"months": 2}, format="json")
+
+        assert (ok["X-RateLimit-Limit"], ok["X-RateLimit-Remaining"]) == ("1", "1")
+        assert limited.status_code == 429
+        assert (limited["X-RateLimit-Limit"], limited["X-RateLimit-Remaining"]) == (
+            "1",
+            "0",
+        )
+
+    def test_async_refused_with_local_token_limit(
+        self, mock_ollama, authenticated_client, settings
+    ):
+        """Tokens do worker não chegam a contadores locais: ?async=1 é recusado."""
+        settings.AI_RATE_LIMIT = {**settings.AI_RATE_LIMIT, "TOKENS_PER_WINDOW": 1000}
+
+        response = authenticated_client.post(reverse("budget-check") + "?async=1")
+
+        assert response.status_code == 400
+        assert not AIJob.objects.exists()
@@ -0,0 +1,150 @@
+import threading
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.urls import reverse
+from rest_framework import status
+
+from apps.ai.models import AIUsageLog
+from apps.ai.services import TransactionProposal
+from apps.ai.services.response_cache import (
+    DjangoCacheBackend,
+    LocalLRUBackend,
+    ResponseCache,
+    response_cache_key,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_key_normalizes_text_and_categories():
+    """Caixa, espaços e ordem das categorias não mudam a chave."""
+    key = response_cache_key(
+        "m", "categorize", "Uber  23,50", ["Transporte", "Mercado"]
+    )
+
+    assert key == response_cache_key(
+        "m", "categorize", "uber 23,50", ["mercado", "transporte"]
+    )
+    assert key != response_cache_key(
+        "m", "parse", "uber 23,50", ["mercado", "transporte"]
+    )
+    assert key != response_cache_key("m", "categorize", "uber 23,50", ["mercado"])
+    assert key != response_cache_key(
+        "outro", "categorize", "uber 23,50", ["mercado", "transporte"]
+    )
+
+
+def test_local_backend_lru_and_ttl():
+    """Backend local descarta o menos usado e entradas expiradas."""
+    clock = FakeClock()
+    backend = LocalLRUBackend(max_entries=2, ttl=10, clock=clock)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    backend.get("a")
+    backend.set("c", 3)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+
+    clock.now += 11
+    assert backend.get("a") is None
+    assert len(backend) == 1
+
+
+def test_blocking_backend_runs_off_the_event_loop(settings):
+    """Com o cache do Django (rede), aget/aset não bloqueiam o event loop."""
+    settings.AI_RESPONSE_CACHE = {**settings.AI_RESPONSE_CACHE, "BACKEND": "django"}
+    cache = ResponseCache()
+    threads = []
+    get, set_ = DjangoCacheBackend.get, DjangoCacheBackend.set
+
+    def record(method):
+        def wrapper(self, *args):
+            threads.append(threading.get_ident())
+            return method(self, *args)
+
+        return wrapper
+
+    async def run():
+        loop_thread = threading.get_ident()
+        await cache.aset("k", {"name": "Mercado"})
+        return loop_thread, await cache.aget("k")
+
+    with (
+        patch.object(DjangoCacheBackend, "get", record(get)),
+        patch.object(DjangoCacheBackend, "set", record(set_)),
+    ):
+        loop_thread, value = async_to_sync(run)()
+
+    assert value == {"name": "Mercado"}
+    assert len(threads) == 2
+    assert loop_thread not in threads
+
+
+@pytest.mark.django_db
+class TestCachedViews:
+    @patch("apps.ai.views.is_ollama_available", return_value=True)
+    @patch("apps.ai.views.aparse_transaction_text")
+    def test_parse_hit_skips_llm_and_rate_limit(
+        self, mock_parse, mock_ollama, authenticated_client, user, settings
+    ):
+        """Acerto no cache não chama o LLM, não gera log e não consome o limite."""
+        mock_parse.return_value = (
+            TransactionProposal(
+                transaction_type="EXPENSE",
+                amount=Decimal("23.50"),
+                date="2026-01-02",
+                description="Uber",
+                confidence=0.9,
+            ),
+            {"model": "llama3.1:8b", "total_tokens": 120},
+        )
+        url = reverse("parse-transaction")
+
+        first = authenticated_client.post(url, {"text": "uber 23,50"})
+        settings.AI_RATE_LIMIT_PER_HOUR = 1  # esgotado após a primeira chamada
+        second = authenticated_client.post(url, {"text": "Uber  23,50"})
+
+        assert second.status_code == status.HTTP_200_OK
+        assert second.data["proposal"] == first.data["proposal"]
+        assert second.data["usage"] == {
+            "tokens_used": 0,
+            "requests_remaining": 0,
+            "cached": True,
+        }
+        assert mock_parse.call_count == 1
+        assert AIUsageLog.objects.filter(user=user).count() == 1
+
+    @patch("apps.ai.views.is_ollama_available", return_value=True)
+    @patch("apps.ai.views.acategorize_transaction_text")
+    def test_categorize_hit_returns_remaining(
+        self, mock_categorize, mock_ollama, authenticated_client, user
+    ):
+        """Categorização em cache devolve a mesma sugestão e o limite atual."""
+        mock_categorize.return_value = (
+            "Transporte",
+            0.8,
+            {"model": "m", "total_tokens": 50},
+        )
+        url = reverse("categorize")
+
+        first = authenticated_client.post(
+            url, {"text": "uber", "category_type": "EXPENSE"}
+        )
+        second = authenticated_client.post(
+            url, {"text": "uber", "category_type": "EXPENSE"}
+        )
+
+        assert first.data["usage"]["requests_remaining"] == 29
+        assert second.data["usage"]["requests_remaining"] == 29
+        assert second.data["suggestion"] == first.data["suggestion"]
+        assert mock_categorize.call_count == 1
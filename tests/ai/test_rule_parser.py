@@ -0,0 +1,162 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.ai.models import AIUsageLog
+from apps.ai.services.rule_parser import extract_fields, parse_transaction_rules
+
+TODAY = date(2026, 1, 15)  # quinta-feira
+
+
+@pytest.mark.parametrize(
+    "text, transaction_type, amount, day, account, description",
+    [
+        (
+            "paguei 38,90 em cordas no pix ontem",
+            "EXPENSE",
+            "38.90",
+            date(2026, 1, 14),
+            "PIX",
+            "Cordas",
+        ),
+        (
+            "gastei 50 no mercado com cartão",
+            "EXPENSE",
+            "50",
+            TODAY,
+            "Cartão",
+            "Mercado",
+        ),
+        ("recebi 1500 de salário", "INCOME", "1500", TODAY, None, "Salário"),
+        (
+            "R$ 1.200,50 aluguel dia 5",
+            "EXPENSE",
+            "1200.50",
+            date(2026, 1, 5),
+            None,
+            "Aluguel",
+        ),
+        (
+            "vendi a guitarra por 800 reais 05/01",
+            "INCOME",
+            "800",
+            date(2026, 1, 5),
+            None,
+            "Guitarra",
+        ),
+        (
+            "recebi 2 mil do cachê na sexta",
+            "INCOME",
+            "2000",
+            date(2026, 1, 9),
+            None,
+            "Cachê",
+        ),
+        ("padaria 12 hj às 8:30", "EXPENSE", "12", TODAY, None, "Padaria"),
+        (
+            "gasolina R$200 no débito automático",
+            "EXPENSE",
+            "200",
+            TODAY,
+            "Banco",
+            "Gasolina",
+        ),
+        (
+            "farmácia 45,90 dia 20",
+            "EXPENSE",
+            "45.90",
+            date(2025, 12, 20),
+            None,
+            "Farmácia",
+        ),
+    ],
+)
+def test_extract_fields(text, transaction_type, amount, day, account, description):
+    """Valor, tipo, data, forma de pagamento e descrição vêm das regras."""
+    fields = extract_fields(text, today=TODAY)
+
+    assert fields.transaction_type == transaction_type
+    assert fields.amount == Decimal(amount)
+    assert fields.date == day
+    assert fields.account_suggestion == account
+    assert fields.description == description
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "teste",
+        "99 taxi 23,50",  # dois valores possíveis
+        "paguei 50 e recebi 20",  # tipo contraditório
+        "comprei tênis 3x de 100",  # parcelado
+        "mercado 31/02",  # data inválida
+        "uber 20 ontem 10/01",  # datas conflitantes
+    ],
+)
+def test_ambiguous_text_needs_llm(text):
+    """Sem campos obrigatórios inequívocos as regras não respondem."""
+    assert extract_fields(text, today=TODAY) is None
+
+
+def test_category_from_name_or_categorizer():
+    """Categoria citada no texto tem prioridade; senão usa o categorizador."""
+    proposal = parse_transaction_rules(
+        "gastei 150 no mercado", ["Mercado", "Transporte"], ["Salario"], today=TODAY
+    )
+    assert proposal.category_suggestion == "Mercado"
+    assert proposal.confidence == 0.85
+
+    calls = []
+
+    def categorize(description, category_type):
+        calls.append((description, category_type))
+        return "Transporte", 0.9
+
+    proposal = parse_transaction_rules(
+        "uber 23,50", ["Mercado"], [], categorize, today=TODAY
+    )
+    assert proposal.category_suggestion == "Transporte"
+    assert calls == [("Uber", "EXPENSE")]
+
+    assert parse_transaction_rules("cordas 38,90", ["Mercado"], [], today=TODAY) is None
+
+
+@pytest.mark.django_db
+class TestRuleParserView:
+    @patch("apps.ai.views.is_ollama_available", return_value=True)
+    @patch("apps.ai.views.aparse_transaction_text")
+    def test_structured_text_skips_llm(
+        self, mock_parse, mock_ollama, authenticated_client, user
+    ):
+        """Texto resolvido pelas regras não chama o LLM nem consome o limite."""
+        response = authenticated_client.post(
+            reverse("parse-transaction"), {"text": "paguei 150 no mercado no pix"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["proposal"]["category_suggestion"] == "Mercado"
+        assert response.data["proposal"]["amount"] == 150.0
+        assert response.data["proposal"]["account_suggestion"] == "PIX"
+        assert response.data["usage"]["rules"] is True
+        assert response.data["usage"]["tokens_used"] == 0
+        mock_parse.assert_not_called()
+        assert not AIUsageLog.objects.filter(user=user).exists()
+
+    @patch("apps.ai.views.is_ollama_available", return_value=True)
+    @patch("apps.ai.views.aparse_transaction_text")
+    def test_disabled_rule_parser_uses_llm(
+        self, mock_parse, mock_ollama, authenticated_client, settings
+    ):
+        """Com o parser desativado todo texto segue para o LLM."""
+        settings.AI_RULE_PARSER_ENABLED = False
+        mock_parse.side_effect = ValueError("Resposta inválida da IA")
+
+        authenticated_client.post(
+            reverse("parse-transaction"), {"text": "paguei 150 no mercado"}
+        )
+
+        mock_parse.assert_called_once()
@@ -0,0 +1,86 @@
+import pytest
+
+from apps.ai.models import AIUsageLog
+from apps.ai.usage_log import UsageLogBuffer
+from apps.ai.views import log_ai_usage
+
+USAGE = {"model": "m", "input_tokens": 120, "output_tokens": 30, "total_tokens": 150}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def buffered(settings):
+    settings.AI_USAGE_LOG_BUFFER = {
+        "ENABLED": True,
+        "MAX_SIZE": 3,
+        "FLUSH_INTERVAL": 3600,
+    }
+
+
+def _log(user, text="uber 23,50"):
+    return AIUsageLog(
+        user=user, feature="parse_transaction", input_text=text, model_name="m"
+    )
+
+
+@pytest.mark.django_db
+class TestUsageLogBuffer:
+    def test_flushes_on_size(self, user, buffered):
+        """Registros só são gravados, em lote, ao atingir o tamanho máximo."""
+        buffer = UsageLogBuffer()
+        buffer.add(_log(user))
+        buffer.add(_log(user))
+        assert not AIUsageLog.objects.exists()
+
+        buffer.add(_log(user))
+
+        assert AIUsageLog.objects.count() == 3
+        assert len(buffer) == 0
+        buffer.stop()
+
+    def test_flushes_on_interval(self, user, buffered):
+        """Registro que esperou além do intervalo força a gravação."""
+        clock = FakeClock()
+        buffer = UsageLogBuffer(clock=clock)
+        buffer.add(_log(user))
+        clock.now += 3600
+
+        buffer.add(_log(user))
+
+        assert AIUsageLog.objects.count() == 2
+        buffer.stop()
+
+    def test_stop_flushes_pending(self, user, buffered):
+        """Encerramento grava o que estiver no buffer."""
+        buffer = UsageLogBuffer()
+        buffer.add(_log(user))
+
+        buffer.stop()
+
+        assert AIUsageLog.objects.count() == 1
+
+    def test_created_at_is_call_time(self, user, buffered):
+        """A data do registro é a da chamada, não a da gravação em lote."""
+        buffer = UsageLogBuffer()
+        log = _log(user)
+        buffer.add(log)
+        buffer.stop()
+
+        assert AIUsageLog.objects.get().created_at == log.created_at
+
+
+@pytest.mark.django_db
+def test_log_records_tokens(user):
+    """Sem buffer o registro é gravado na hora, com os tokens reais."""
+    log_ai_usage(user, "forecast", "Forecast", USAGE)
+
+    log = AIUsageLog.objects.get(user=user)
+    assert (log.input_tokens, log.output_tokens) == (120, 30)
+    assert log.input_chars == len("Forecast")
@@ -0,0 +1,135 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.ai.models import AIUsageDaily, AIUsageLog
+from apps.ai.usage_rollup import prune_usage_logs, rollup_usage
+from tests.factories import UserFactory
+
+
+def _log(user, days_ago=0, feature="chat", success=True, tokens=(100, 20), model="m"):
+    return AIUsageLog.objects.create(
+        user=user,
+        feature=feature,
+        model_name=model,
+        success=success,
+        input_tokens=tokens[0],
+        output_tokens=tokens[1],
+        created_at=timezone.now() - timedelta(days=days_ago),
+    )
+
+
+@pytest.mark.django_db
+class TestRollup:
+    def test_aggregates_by_day_feature_and_model(self, user):
+        """Chamadas, falhas e tokens somados por (usuário, dia, funcionalidade, modelo)."""
+        _log(user)
+        _log(user, success=False, tokens=(50, 0))
+        _log(user, feature="insights")
+        _log(user, days_ago=1)
+
+        assert rollup_usage() == 3
+
+        today = AIUsageDaily.objects.get(
+            user=user, feature="chat", day=timezone.localdate()
+        )
+        assert (today.calls, today.failures) == (2, 1)
+        assert (today.input_tokens, today.output_tokens) == (150, 20)
+
+    def test_incremental_runs_do_not_duplicate(self, user):
+        """Nova execução recalcula só os últimos dias, sem duplicar."""
+        _log(user, days_ago=10)
+        _log(user)
+        rollup_usage()
+        _log(user)
+
+        rollup_usage()
+
+        assert AIUsageDaily.objects.count() == 2
+        assert AIUsageDaily.objects.get(day=timezone.localdate()).calls == 2
+
+    def test_pruned_days_are_kept(self, user):
+        """Recalcular desde antes da retenção não apaga dias já sem registros brutos."""
+        _log(user, days_ago=100)
+        _log(user, days_ago=2)
+        _log(user)
+        rollup_usage()
+
+        assert prune_usage_logs(retention_days=90, batch_size=1) == 1
+        rollup_usage(since=timezone.localdate() - timedelta(days=200))
+
+        assert AIUsageLog.objects.count() == 2
+        assert AIUsageDaily.objects.count() == 3
+
+    def test_prune_keeps_unconsolidated_rows(self, user):
+        """Sem rollup, nada é apagado."""
+        _log(user, days_ago=100)
+
+        assert prune_usage_logs(retention_days=90) == 0
+        assert AIUsageLog.objects.exists()
+
+    def test_command(self, user):
+        """O comando consolida e aplica a retenção."""
+        _log(user, days_ago=100)
+        _log(user)
+
+        call_command("rollup_ai_usage", "--prune", "--retention-days", "30")
+
+        assert AIUsageDaily.objects.count() == 2
+        assert AIUsageLog.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestUsageReport:
+    url = "ai-usage-report"
+
+    def test_report_reads_rollup(self, authenticated_client, user):
+        """O relatório soma o rollup do usuário, sem ler os registros brutos."""
+        _log(user, tokens=(100, 20))
+        _log(user, feature="insights", tokens=(300, 80))
+        _log(UserFactory())
+        rollup_usage()
+        AIUsageLog.objects.all().delete()
+
+        response = authenticated_client.get(reverse(self.url))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["totals"] == {
+            "calls": 2,
+            "failures": 0,
+            "input_tokens": 400,
+            "output_tokens": 100,
+        }
+        assert [row["feature"] for row in response.data["by_feature"]] == [
+            "chat",
+            "insights",
+        ]
+        assert response.data["by_day"][0]["day"] == timezone.localdate()
+
+    def test_all_users_only_for_staff(self, authenticated_client, user):
+        """``all=1`` soma todos os usuários apenas para staff."""
+        _log(user)
+        _log(UserFactory())
+        rollup_usage()
+
+        response = authenticated_client.get(reverse(self.url) + "?all=1")
+        assert response.data["totals"]["calls"] == 1
+
+        user.is_staff = True
+        user.save()
+        response = authenticated_client.get(reverse(self.url) + "?all=1")
+        assert response.data["totals"]["calls"] == 2
+
+    def test_invalid_dates(self, authenticated_client):
+        """Datas inválidas ou invertidas retornam 400."""
+        response = authenticated_client.get(reverse(self.url) + "?start=2026-13-01")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = authenticated_client.get(
+            reverse(self.url) + "?start=2026-02-01&end=2026-01-01"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
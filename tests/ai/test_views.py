@@ -72,7 +72,7 @@ class TestParseTransaction:
         assert "muito longo" in response.data["error"]
 
     @patch("apps.ai.views.is_ollama_available")
-    @patch("apps.ai.views.parse_transaction_text")
+    @patch("apps.ai.views.aparse_transaction_text")
     def test_parse_transaction_success(
         self, mock_parse, mock_ollama, authenticated_client, user, settings
     ):
@@ -103,7 +103,7 @@ class TestParseTransaction:
         assert response.data["usage"]["tokens_used"] == 150
 
     @patch("apps.ai.views.is_ollama_available")
-    @patch("apps.ai.views.parse_transaction_text")
+    @patch("apps.ai.views.aparse_transaction_text")
     def test_parse_transaction_logs_usage(
         self, mock_parse, mock_ollama, authenticated_client, user, settings
     ):
@@ -117,7 +117,10 @@ class TestParseTransaction:
             description="Teste",
             confidence=0.8,
         )
-        mock_parse.return_value = (mock_proposal, {"model": "llama3.1:8b", "total_tokens": 100})
+        mock_parse.return_value = (
+            mock_proposal,
+            {"model": "llama3.1:8b", "total_tokens": 100},
+        )
 
         url = reverse("parse-transaction")
         authenticated_client.post(url, {"text": "teste"})
@@ -129,7 +132,9 @@ class TestParseTransaction:
         assert log.success is True
 
     @patch("apps.ai.views.is_ollama_available")
-    def test_parse_transaction_ollama_unavailable(self, mock_ollama, authenticated_client):
+    def test_parse_transaction_ollama_unavailable(
+        self, mock_ollama, authenticated_client
+    ):
         """Parse transaction retorna erro se LLM nao esta disponivel."""
         mock_ollama.return_value = False
 
@@ -138,7 +143,7 @@ class TestParseTransaction:
         assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
         assert "LLM" in response.data["error"]
 
-    @patch("apps.ai.views.check_rate_limit")
+    @patch("apps.ai.views.areserve_rate_limit")
     def test_parse_transaction_rate_limited(
         self, mock_rate_limit, authenticated_client, settings
     ):
@@ -165,7 +170,9 @@ class TestInsights:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     @patch("apps.ai.views.is_ollama_available")
-    def test_insights_invalid_month_format(self, mock_ollama, authenticated_client, settings):
+    def test_insights_invalid_month_format(
+        self, mock_ollama, authenticated_client, settings
+    ):
         """Insights rejeita formato de mês inválido."""
         mock_ollama.return_value = True
         url = reverse("insights")
@@ -174,7 +181,9 @@ class TestInsights:
         assert "Formato inválido" in response.data["error"]
 
     @patch("apps.ai.views.is_ollama_available")
-    def test_insights_no_transactions(self, mock_ollama, authenticated_client, settings):
+    def test_insights_no_transactions(
+        self, mock_ollama, authenticated_client, settings
+    ):
         """Insights retorna mensagem quando não há transações."""
         mock_ollama.return_value = True
         url = reverse("insights")
@@ -185,7 +194,7 @@ class TestInsights:
         assert response.data["total_expenses"] == 0
 
     @patch("apps.ai.views.is_ollama_available")
-    @patch("apps.ai.views.generate_monthly_insights")
+    @patch("apps.ai.views.agenerate_monthly_insights")
     def test_insights_with_transactions(
         self, mock_insights, mock_ollama, authenticated_client, user, settings
     ):
@@ -244,8 +253,10 @@ class TestInsights:
         assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
         assert "LLM" in response.data["error"]
 
-    @patch("apps.ai.views.check_rate_limit")
-    def test_insights_rate_limited(self, mock_rate_limit, authenticated_client, settings):
+    @patch("apps.ai.views.areserve_rate_limit")
+    def test_insights_rate_limited(
+        self, mock_rate_limit, authenticated_client, settings
+    ):
         """Insights retorna 429 quando rate limited."""
         mock_rate_limit.return_value = (False, 0)
 
@@ -267,7 +278,7 @@ class TestCategorize:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     @patch("apps.ai.views.is_ollama_available")
-    @patch("apps.ai.views.categorize_transaction_text")
+    @patch("apps.ai.views.acategorize_transaction_text")
     def test_categorize_success(
         self, mock_categorize, mock_ollama, authenticated_client, user
     ):
@@ -304,7 +315,7 @@ class TestForecast:
         assert "Sem histórico" in response.data["forecast"]["summary"]
 
     @patch("apps.ai.views.is_ollama_available")
-    @patch("apps.ai.views.generate_cashflow_forecast")
+    @patch("apps.ai.views.agenerate_cashflow_forecast")
     def test_forecast_with_transactions(
         self, mock_forecast, mock_ollama, authenticated_client, user
     ):
@@ -346,7 +357,7 @@ class TestBudgetCheck:
         assert "Nenhum orçamento" in response.data["summary"]
 
     @patch("apps.ai.views.is_ollama_available")
-    @patch("apps.ai.views.generate_budget_check")
+    @patch("apps.ai.views.agenerate_budget_check")
     def test_budget_check_with_budgets(
         self, mock_budget_check, mock_ollama, authenticated_client, user
     ):
@@ -399,7 +410,7 @@ class TestChat:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     @patch("apps.ai.views.is_ollama_available")
-    @patch("apps.ai.views.generate_chat_response")
+    @patch("apps.ai.views.agenerate_chat_response")
     def test_chat_creates_conversation(
         self, mock_chat, mock_ollama, authenticated_client, user
     ):
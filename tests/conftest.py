@@ -26,3 +26,49 @@ def authenticated_client(api_client, user):
     """Retorna um cliente API autenticado."""
     api_client.force_authenticate(user=user)
     return api_client
+
+
+@pytest.fixture(autouse=True)
+def clear_ai_response_cache():
+    """Isola o cache de respostas do LLM entre os testes."""
+    from apps.ai.services import response_cache
+
+    response_cache.reset()
+    yield
+    response_cache.reset()
+
+
+@pytest.fixture(autouse=True)
+def clear_django_cache():
+    """Isola o cache do Django (ex.: contexto financeiro do chat) entre os testes."""
+    from django.core.cache import cache
+
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_ai_rate_limiter():
+    """Isola os contadores do rate limit entre os testes."""
+    from apps.ai.services import rate_limiter
+
+    rate_limiter.reset()
+    yield
+    rate_limiter.reset()
+
+
+@pytest.fixture(autouse=True)
+def sync_ai_usage_log(settings):
+    """Registros de uso gravados na hora (sem buffer), salvo nos testes do buffer."""
+    settings.AI_USAGE_LOG_BUFFER = {**settings.AI_USAGE_LOG_BUFFER, "ENABLED": False}
+
+
+@pytest.fixture(autouse=True)
+def clear_local_categorizer():
+    """Isola os modelos do categorizador local entre os testes."""
+    from apps.finance.categorizer import registry
+
+    registry.discard()
+    yield
+    registry.discard()
@@ -0,0 +1,135 @@
+import csv
+import io
+import json
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.agenda.models import Event
+from apps.finance.models import Transaction
+from tests.factories import EventFactory, TransactionFactory
+
+
+def _content(response) -> str:
+    return b"".join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db
+class TestExports:
+    def test_transactions_csv_streams_with_filters(self, authenticated_client, user):
+        """CSV em streaming, com nomes de categoria/conta e filtros da listagem."""
+        tx = TransactionFactory(
+            user=user,
+            date=date(2026, 3, 5),
+            amount=Decimal("12.50"),
+            description="Padaria",
+        )
+        TransactionFactory(user=user, date=date(2026, 4, 1))
+        TransactionFactory(date=date(2026, 3, 6))  # outro usuário
+
+        response = authenticated_client.get(
+            reverse("transaction-export"), {"month": "2026-03"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert isinstance(response, StreamingHttpResponse)
+        assert response["Content-Disposition"].endswith('.csv"')
+        rows = list(csv.DictReader(io.StringIO(_content(response))))
+        assert len(rows) == 1
+        assert rows[0]["id"] == str(tx.id)
+        assert rows[0]["amount"] == "12.50"
+        assert rows[0]["category_name"] == tx.category.name
+        assert rows[0]["account_name"] == tx.account.name
+
+    def test_header_is_sent_before_query(self, authenticated_client, user):
+        """O cabeçalho do CSV sai antes de qualquer consulta às linhas."""
+        TransactionFactory.create_batch(3, user=user)
+        response = authenticated_client.get(reverse("transaction-export"))
+        chunks = iter(response.streaming_content)
+
+        with CaptureQueriesContext(connection) as ctx:
+            header = next(chunks)
+
+        assert header.decode().startswith("id,date,transaction_type")
+        assert len(ctx.captured_queries) == 0
+        assert len(list(chunks)) == 3
+
+    def test_events_ndjson(self, authenticated_client, user):
+        """NDJSON: um objeto JSON por linha, respeitando o filtro de status."""
+        EventFactory(
+            user=user, status=Event.EventStatus.PAID, expected_amount=Decimal("80")
+        )
+        EventFactory(user=user, status=Event.EventStatus.PENDING)
+
+        response = authenticated_client.get(
+            reverse("event-export"),
+            {"file_format": "ndjson", "status": Event.EventStatus.PAID},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in _content(response).splitlines()]
+        assert len(lines) == 1
+        assert lines[0]["status"] == Event.EventStatus.PAID
+        assert lines[0]["expected_amount"] == "80.00"
+
+    def test_invalid_format(self, authenticated_client):
+        """Formato desconhecido retorna 400."""
+        response = authenticated_client.get(
+            reverse("transaction-export"), {"file_format": "xlsx"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Transaction.objects.exists()
+
+
+@pytest.mark.django_db
+class TestAsyncExports:
+    """Sob ASGI o corpo é assíncrono e lido em blocos, não de uma vez."""
+
+    def _get(self, user, url, data=None):
+        headers = {"authorization": f"Bearer {AccessToken.for_user(user)}"}
+
+        async def run():
+            response = await AsyncClient().get(url, data, headers=headers)
+            return response, [chunk async for chunk in response.streaming_content]
+
+        return async_to_sync(run)()
+
+    @patch("apps.core.exports.CHUNK_SIZE", 2)
+    def test_asgi_streams_in_batches(self, user):
+        """Cada bloco traz até CHUNK_SIZE linhas (o cabeçalho conta como linha)."""
+        TransactionFactory.create_batch(4, user=user)
+
+        response, chunks = self._get(user, reverse("transaction-export"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.is_async
+        assert len(chunks) == 3
+        rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+        assert len(rows) == 4
+
+    def test_asgi_ndjson_with_filters(self, user):
+        """Os filtros da listagem também valem no caminho assíncrono."""
+        EventFactory(user=user, status=Event.EventStatus.PAID)
+        EventFactory(user=user, status=Event.EventStatus.PENDING)
+
+        response, chunks = self._get(
+            user,
+            reverse("event-export"),
+            {"file_format": "ndjson", "status": Event.EventStatus.PAID},
+        )
+
+        lines = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert [line["status"] for line in lines] == [Event.EventStatus.PAID]
@@ -0,0 +1,127 @@
+from datetime import date, timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.core.pagination import decode_cursor, encode_cursor
+from apps.finance.models import Transaction
+from apps.notifications.models import Notification
+from tests.factories import EventFactory
+
+
+def _collect(client, url, params):
+    """Percorre todas as páginas seguindo os links ``next``."""
+    pages = []
+    response = client.get(url, params)
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        pages.append(response.data)
+        if not response.data["next"]:
+            return pages
+        response = client.get(response.data["next"])
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    def test_cursor_roundtrip_keeps_microseconds(self):
+        """O cursor preserva a posição exata, incluindo microssegundos."""
+        now = timezone.now().replace(microsecond=123456)
+        cursor = encode_cursor([now, date(2026, 1, 5), 7], reverse=True)
+
+        assert decode_cursor(cursor) == (
+            [now.isoformat(), "2026-01-05", 7],
+            True,
+        )
+
+    def test_transactions_pages_follow_ordering(self, authenticated_client, user):
+        """Páginas por cursor seguem -date, -created_at, id sem repetir itens."""
+        for i in range(5):
+            Transaction.objects.create(
+                user=user,
+                transaction_type="EXPENSE",
+                amount="10.00",
+                date=date(2026, 1, 1 + i % 2),
+                description=f"Compra {i}",
+            )
+        expected = list(
+            Transaction.objects.filter(user=user)
+            .order_by("-date", "-created_at", "id")
+            .values_list("id", flat=True)
+        )
+
+        pages = _collect(
+            authenticated_client,
+            reverse("transaction-list"),
+            {"pagination": "cursor", "page_size": 2},
+        )
+
+        assert [len(page["results"]) for page in pages] == [2, 2, 1]
+        assert [tx["id"] for page in pages for tx in page["results"]] == expected
+        assert "count" not in pages[0]
+        assert pages[0]["previous"] is None
+
+    def test_previous_link_returns_prior_page(self, authenticated_client, user):
+        """O link previous devolve a página anterior na mesma ordem."""
+        base = timezone.now()
+        for i in range(5):
+            EventFactory(user=user, start_datetime=base + timedelta(hours=i))
+
+        pages = _collect(
+            authenticated_client,
+            reverse("event-list"),
+            {"pagination": "cursor", "page_size": 2},
+        )
+        response = authenticated_client.get(pages[2]["previous"])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"] == pages[1]["results"]
+        assert response.data["next"] is not None
+
+    def test_cursor_mode_skips_count(self, authenticated_client, user):
+        """O modo cursor não executa COUNT(*), ao contrário da paginação por página."""
+        Notification.objects.create(user=user, title="Aviso", message="Teste")
+        url = reverse("notification-list")
+
+        with CaptureQueriesContext(connection) as page_queries:
+            authenticated_client.get(url)
+        with CaptureQueriesContext(connection) as cursor_queries:
+            response = authenticated_client.get(url, {"pagination": "cursor"})
+
+        assert response.data["results"][0]["title"] == "Aviso"
+        assert any("COUNT(" in q["sql"] for q in page_queries.captured_queries)
+        assert not any("COUNT(" in q["sql"] for q in cursor_queries.captured_queries)
+
+    def test_invalid_cursor(self, authenticated_client):
+        """Cursor malformado retorna 404."""
+        response = authenticated_client.get(
+            reverse("transaction-list"), {"cursor": "invalido"}
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            ["2026-13-01", timezone.now(), 1],
+            ["2026-01-05", "ontem", 1],
+            ["2026-01-05", timezone.now(), "abc"],
+            ["2026-01-05", timezone.now(), 10**30],
+            [None, timezone.now(), 1],
+            ["2026-01-05", 1],
+        ],
+    )
+    def test_tampered_cursor_values(self, authenticated_client, values):
+        """Cursor decodificável com valores adulterados também retorna 404."""
+        response = authenticated_client.get(
+            reverse("transaction-list"),
+            {"cursor": encode_cursor(values, reverse=False)},
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_page_number_remains_default(self, authenticated_client, user):
+        """Sem parâmetro de cursor a resposta mantém count/next/previous."""
+        response = authenticated_client.get(reverse("transaction-list"))
+        assert response.data["count"] == 0
@@ -0,0 +1,101 @@
+from datetime import date, timedelta
+
+import pytest
+from django.db import connection
+from django.db.models import Count
+from django.utils import timezone
+
+from apps.agenda.models import Event
+from apps.ai.models import AIUsageLog
+from apps.core.periods import month_datetime_filter, month_filter
+from apps.finance.models import Tag, Transaction
+from apps.notifications.models import Notification
+
+
+def _explain(queryset):
+    if connection.vendor == "postgresql":
+        # Com tabelas pequenas o planner prefere seq scan; desliga para
+        # verificar que o índice é utilizável pela consulta.
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+    return queryset.explain()
+
+
+def assert_uses_index(queryset, index_name):
+    """Verifica via EXPLAIN que a consulta usa o índice informado."""
+    plan = _explain(queryset)
+    assert index_name in plan, plan
+
+
+def assert_no_full_scan(queryset):
+    """Verifica via EXPLAIN que nenhuma tabela é lida por varredura completa.
+
+    Útil para constraints UNIQUE, cujo índice o SQLite nomeia internamente.
+    """
+    plan = _explain(queryset)
+    assert "Seq Scan" not in plan, plan
+    assert not any(line.split()[3:4] == ["SCAN"] for line in plan.splitlines()), plan
+
+
+@pytest.mark.django_db
+class TestHotPathIndexes:
+    def test_transactions_by_month(self, user):
+        """Listagem filtrada por mês usa (user, date)."""
+        queryset = Transaction.objects.filter(
+            user=user, **month_filter("date", date(2026, 1, 1))
+        )
+        assert_uses_index(queryset, "transaction_user_date_idx")
+
+    def test_recent_transactions(self, user):
+        """Transações recentes do contexto do chat usam (user, date)."""
+        queryset = Transaction.objects.filter(user=user, is_confirmed=True).order_by(
+            "-date", "-created_at"
+        )[:5]
+        assert_uses_index(queryset, "transaction_user_date_idx")
+
+    def test_budget_spend(self, user):
+        """Gasto de orçamento usa o índice parcial de despesas confirmadas."""
+        queryset = Transaction.objects.filter(
+            user=user,
+            transaction_type=Transaction.TransactionType.EXPENSE,
+            is_confirmed=True,
+            category_id=1,
+            date__gte=date(2026, 1, 1),
+            date__lte=date(2026, 1, 31),
+        ).order_by()
+        assert_uses_index(queryset, "transaction_budget_spend_idx")
+
+    def test_transactions_by_tag(self, user):
+        """Filtro por tag resolve a tag por (user, name) e os vínculos por tag."""
+        tag_ids = Tag.objects.filter(user=user, name="viagem").values("id")
+        queryset = Transaction.objects.filter(tag_links__tag_id__in=tag_ids)
+        assert_no_full_scan(queryset)
+
+    def test_events_by_month(self, user):
+        """Agenda do mês usa (user, start_datetime)."""
+        queryset = Event.objects.filter(
+            user=user, **month_datetime_filter("start_datetime", date(2026, 1, 1))
+        )
+        assert_uses_index(queryset, "event_user_start_idx")
+
+    def test_notifications_list(self, user):
+        """Listagem de notificações usa (user, -created_at)."""
+        queryset = Notification.objects.filter(user=user)
+        assert_uses_index(queryset, "notification_user_created_idx")
+
+    def test_unread_count_by_priority(self, user):
+        """Contagem de não lidas usa o índice parcial."""
+        queryset = (
+            Notification.objects.filter(user=user, is_read=False)
+            .values("priority")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+        assert_uses_index(queryset, "notification_unread_idx")
+
+    def test_rate_limit_window(self, user):
+        """Uso da última hora por usuário usa (user, created_at)."""
+        queryset = AIUsageLog.objects.filter(
+            user=user, created_at__gte=timezone.now() - timedelta(hours=1)
+        )
+        assert_uses_index(queryset, "aiusagelog_user_created_idx")
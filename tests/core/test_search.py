@@ -0,0 +1,161 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.ai.models import CHAT_MESSAGE_SEARCH_INDEX, ChatConversation, ChatMessage
+from apps.core.search import sqlite_match_expression
+from apps.finance.models import Transaction
+from tests.factories import EventFactory
+
+
+def _transaction(user, description, notes=""):
+    return Transaction.objects.create(
+        user=user,
+        transaction_type="EXPENSE",
+        amount="10.00",
+        date="2026-01-10",
+        description=description,
+        notes=notes,
+    )
+
+
+def test_match_expression_escapes_operators():
+    """Termos digitados viram buscas por prefixo sem operadores do FTS5."""
+    assert sqlite_match_expression('pão "OR" -mercado*') == '"pão"* "OR"* "mercado"*'
+    assert sqlite_match_expression("  ") == ""
+
+
+@pytest.mark.django_db
+class TestFullTextSearch:
+    def test_transactions_ranked_by_relevance(self, authenticated_client, user):
+        """Match na descrição pesa mais que match nas observações."""
+        in_notes = _transaction(user, "Compra semanal", notes="feira do mercado")
+        in_description = _transaction(user, "Mercado Extra")
+        _transaction(user, "Farmácia")
+
+        response = authenticated_client.get(
+            reverse("transaction-list"), {"search": "mercado"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        ids = [tx["id"] for tx in response.data["results"]]
+        assert ids == [in_description.id, in_notes.id]
+
+    def test_search_ignores_accents_and_matches_prefix(
+        self, authenticated_client, user
+    ):
+        """Busca sem acento e por prefixo encontra a transação."""
+        tx = _transaction(user, "Farmácia São João")
+
+        response = authenticated_client.get(
+            reverse("transaction-list"), {"search": "farmac"}
+        )
+
+        assert [item["id"] for item in response.data["results"]] == [tx.id]
+
+    def test_index_follows_updates_and_deletes(self, authenticated_client, user):
+        """Triggers mantêm o índice em sincronia com a tabela."""
+        tx = _transaction(user, "Padaria")
+        tx.description = "Açougue"
+        tx.save()
+        removed = _transaction(user, "Padaria do bairro")
+        removed.delete()
+
+        url = reverse("transaction-list")
+        assert authenticated_client.get(url, {"search": "padaria"}).data["count"] == 0
+        assert authenticated_client.get(url, {"search": "acougue"}).data["count"] == 1
+
+    def test_search_is_scoped_to_user(
+        self, authenticated_client, user, django_user_model
+    ):
+        """Resultados de outros usuários não aparecem."""
+        other = django_user_model.objects.create_user(username="outro", password="x")
+        _transaction(other, "Mercado")
+
+        response = authenticated_client.get(
+            reverse("transaction-list"), {"search": "mercado"}
+        )
+
+        assert response.data["count"] == 0
+
+    def test_events_search(self, authenticated_client, user):
+        """Eventos são buscados por título e local."""
+        show = EventFactory(user=user, title="Show no Teatro", location="Centro")
+        EventFactory(
+            user=user,
+            title="Aula de violão",
+            start_datetime=timezone.now() + timedelta(days=1),
+        )
+
+        response = authenticated_client.get(reverse("event-list"), {"search": "teatro"})
+
+        assert [event["id"] for event in response.data["results"]] == [show.id]
+
+    def test_chat_conversations_search(self, authenticated_client, user):
+        """Conversas são filtradas pelo conteúdo das mensagens."""
+        match = ChatConversation.objects.create(user=user, title="Orçamento")
+        ChatMessage.objects.create(
+            conversation=match, role="user", content="Quanto gastei com gasolina?"
+        )
+        other = ChatConversation.objects.create(user=user, title="Metas")
+        ChatMessage.objects.create(
+            conversation=other, role="user", content="Como está minha reserva?"
+        )
+
+        response = authenticated_client.get(
+            reverse("chat-conversations"), {"search": "gasolina"}
+        )
+
+        assert [item["id"] for item in response.data] == [match.id]
+
+    def test_rebuild_command_reindexes(self, authenticated_client, user):
+        """O comando recria triggers e reindexa o conteúdo existente."""
+        _transaction(user, "Mercado")
+
+        call_command("rebuild_search_index")
+
+        response = authenticated_client.get(
+            reverse("transaction-list"), {"search": "mercado"}
+        )
+        assert response.data["count"] == 1
+
+    def test_chat_conversations_ranked_by_best_message(
+        self, authenticated_client, user
+    ):
+        """Conversas saem na ordem da mensagem mais relevante, não da mais recente."""
+        weak = ChatConversation.objects.create(user=user, title="Longa")
+        ChatMessage.objects.create(
+            conversation=weak,
+            role="user",
+            content="Hoje paguei aluguel, luz, internet, academia e também gasolina",
+        )
+        strong = ChatConversation.objects.create(user=user, title="Curta")
+        ChatMessage.objects.create(
+            conversation=strong, role="user", content="gasolina gasolina"
+        )
+        ChatConversation.objects.filter(pk=strong.pk).update(
+            updated_at=timezone.now() - timedelta(days=1)
+        )
+
+        response = authenticated_client.get(
+            reverse("chat-conversations"), {"search": "gasolina"}
+        )
+
+        assert [item["id"] for item in response.data] == [strong.id, weak.id]
+
+    def test_search_results_work_as_subquery(self, user):
+        """O queryset de busca pode ser usado em ``__in`` (tabela com alias)."""
+        match = ChatConversation.objects.create(user=user, title="A")
+        ChatMessage.objects.create(conversation=match, role="user", content="Mercado")
+        other = ChatConversation.objects.create(user=user, title="B")
+        ChatMessage.objects.create(conversation=other, role="user", content="Farmácia")
+
+        matches = CHAT_MESSAGE_SEARCH_INDEX.search(ChatMessage.objects.all(), "mercado")
+
+        assert list(
+            ChatConversation.objects.filter(id__in=matches.values("conversation_id"))
+        ) == [match]
@@ -1,3 +1,4 @@
+from datetime import date
 from decimal import Decimal
 
 import pytest
@@ -5,7 +6,9 @@ from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 
+from apps.finance.budgets import evaluate_budgets
 from apps.finance.models import Budget, Category, Goal, Transaction
+from tests.factories import CategoryFactory
 
 
 @pytest.mark.django_db
@@ -52,10 +55,82 @@ class TestBudgetViewSet:
         response = authenticated_client.get(url)
         assert response.status_code == status.HTTP_200_OK
         assert response.data
-        status_item = next(item for item in response.data if item["category"] == category.id)
+        status_item = next(
+            item for item in response.data if item["category"] == category.id
+        )
         assert status_item["spent"] == 50.0
         assert status_item["percentage_used"] == 25.0
 
+    def test_budget_status_query_count_is_constant(
+        self, authenticated_client, user, django_assert_num_queries
+    ):
+        """Status de vários orçamentos não faz uma consulta por orçamento."""
+        today = timezone.localdate()
+        for _ in range(5):
+            category = CategoryFactory(user=user)
+            Budget.objects.create(
+                user=user,
+                category=category,
+                amount=Decimal("100.00"),
+                period_type="MONTHLY",
+                start_date=today.replace(day=1),
+            )
+
+        url = reverse("budget-status")
+        # 1 consulta de orçamentos + 1 agregação condicional dos gastos
+        with django_assert_num_queries(2):
+            response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 5
+
+
+@pytest.mark.django_db
+class TestEvaluateBudgets:
+    def test_each_budget_uses_its_own_period(self, user):
+        """Cada orçamento soma apenas o gasto da sua janela e categoria."""
+        weekly_category = CategoryFactory(user=user)
+        monthly_category = CategoryFactory(user=user)
+        today = date(2026, 3, 18)
+        weekly = Budget.objects.create(
+            user=user,
+            category=weekly_category,
+            amount=Decimal("100.00"),
+            period_type="WEEKLY",
+            start_date=date(2026, 3, 2),
+        )
+        monthly = Budget.objects.create(
+            user=user,
+            category=monthly_category,
+            amount=Decimal("400.00"),
+            period_type="MONTHLY",
+            start_date=date(2026, 1, 1),
+        )
+        for tx_date, category, amount in [
+            (date(2026, 3, 15), weekly_category, "30.00"),  # semana anterior
+            (date(2026, 3, 16), weekly_category, "20.00"),
+            (date(2026, 3, 18), weekly_category, "5.00"),
+            (date(2026, 2, 28), monthly_category, "90.00"),  # mês anterior
+            (date(2026, 3, 1), monthly_category, "100.00"),
+        ]:
+            Transaction.objects.create(
+                user=user,
+                transaction_type="EXPENSE",
+                amount=Decimal(amount),
+                date=tx_date,
+                description="Gasto",
+                category=category,
+            )
+
+        status_by_id = {
+            item["id"]: item
+            for item in evaluate_budgets(user, [weekly, monthly], today)
+        }
+
+        assert status_by_id[weekly.id]["spent"] == 25.0
+        assert status_by_id[weekly.id]["period_start"] == "2026-03-16"
+        assert status_by_id[monthly.id]["spent"] == 100.0
+        assert status_by_id[monthly.id]["percentage_used"] == 25.0
+
 
 @pytest.mark.django_db
 class TestGoalViewSet:
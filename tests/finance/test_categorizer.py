@@ -0,0 +1,274 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.ai.models import AIUsageLog
+from apps.finance.categorizer import (
+    NaiveBayesCategorizer,
+    extract_features,
+    registry,
+    suggest_categories,
+    suggest_category,
+)
+from apps.finance.importers import StatementImporter, StatementRow
+from apps.finance.models import Category, Transaction
+
+HISTORY = {
+    "Transporte": [
+        "uber centro",
+        "uber aeroporto",
+        "99 taxi casa",
+        "uber trabalho",
+        "posto gasolina",
+    ],
+    "Mercado": [
+        "mercado extra",
+        "supermercado pao de acucar",
+        "mercado dia",
+        "feira verduras",
+        "atacadao compras",
+    ],
+    "Restaurantes": [
+        "ifood pizza",
+        "restaurante almoco",
+        "ifood lanche",
+        "padaria cafe",
+        "sushi jantar",
+    ],
+}
+
+
+@pytest.fixture
+def categories(user):
+    return {
+        name: Category.objects.get_or_create(
+            user=user, name=name, category_type=Category.CategoryType.EXPENSE
+        )[0]
+        for name in HISTORY
+    }
+
+
+@pytest.fixture
+def history(user, categories, settings):
+    """Histórico confirmado e categorizado suficiente para treinar o modelo."""
+    settings.AI_LOCAL_CATEGORIZER_MIN_SAMPLES = 10
+    settings.AI_LOCAL_CATEGORIZER_THRESHOLD = 0.8
+    for name, descriptions in HISTORY.items():
+        for description in descriptions:
+            Transaction.objects.create(
+                user=user,
+                transaction_type=Transaction.TransactionType.EXPENSE,
+                amount=Decimal("10.00"),
+                date=date(2026, 3, 1),
+                description=description,
+                category=categories[name],
+            )
+    return categories
+
+
+def test_extract_features_folds_accents():
+    """Features ignoram acentos, caixa e números."""
+    features = extract_features("Pão 12,50 Açúcar")
+
+    assert "w:pao" in features
+    assert "w:acucar" in features
+    assert "b:pao_acucar" in features
+    assert "c: pa" in features
+    assert not any(feature.startswith("w:12") for feature in features)
+
+
+class TestNaiveBayesCategorizer:
+    def test_predicts_known_vocabulary(self):
+        """Descrições parecidas com o treino têm alta confiança."""
+        model = NaiveBayesCategorizer()
+        model.partial_fit(
+            (description, name, "EXPENSE")
+            for name, descriptions in HISTORY.items()
+            for description in descriptions
+        )
+
+        category, confidence = model.predict("Uber shopping")
+        assert category == "Transporte"
+        assert confidence > 0.8
+
+        assert model.predict("xyz") == (None, 0.0)
+
+    def test_restricts_candidates(self):
+        """Tipo e ids limitam as categorias candidatas."""
+        model = NaiveBayesCategorizer()
+        model.partial_fit(
+            [("uber centro", 1, "EXPENSE"), ("salario empresa", 2, "INCOME")]
+        )
+
+        assert model.predict("uber", category_type="INCOME")[0] == 2
+        assert model.predict("uber", category_ids=[3]) == (None, 0.0)
+
+    def test_partial_fit_does_not_change_copy_source(self):
+        """Treino parcial em uma cópia preserva o modelo original."""
+        model = NaiveBayesCategorizer()
+        model.partial_fit([("uber centro", 1, "EXPENSE")])
+        before = model.predict("uber")
+
+        clone = model.copy()
+        clone.partial_fit([("uber eats", 2, "EXPENSE"), ("uber eats", 2, "EXPENSE")])
+
+        assert model.predict("uber") == before
+        assert len(clone.classes) == 2
+
+
+@pytest.mark.django_db
+class TestCategorizerRegistry:
+    def test_small_history_has_no_model(self, user, categories):
+        """Sem histórico mínimo o categorizador não sugere nada."""
+        assert registry.get(user.id) is None
+        assert suggest_category(user, "uber centro") == (None, 0.0)
+
+    def test_new_transactions_train_incrementally(self, user, history):
+        """Transações novas atualizam o modelo sem novo treino completo."""
+        model = registry.get(user.id)
+        Transaction.objects.create(
+            user=user,
+            transaction_type=Transaction.TransactionType.EXPENSE,
+            amount=Decimal("30.00"),
+            date=date(2026, 3, 2),
+            description="cinema shopping",
+            category=history["Restaurantes"],
+        )
+
+        copy = NaiveBayesCategorizer.copy
+        with patch.object(
+            NaiveBayesCategorizer, "copy", autospec=True, side_effect=copy
+        ) as spy:
+            updated = registry.get(user.id)
+
+        spy.assert_called_once_with(model)
+        assert updated is not model
+        assert updated.samples == model.samples + 1
+        assert model.samples == 15
+
+    def test_edited_transaction_triggers_full_retrain(self, user, history):
+        """Edição de transação já vista refaz o treino a partir do banco."""
+        model = registry.get(user.id)
+        tx = Transaction.objects.get(user=user, description="posto gasolina")
+        tx.category = history["Mercado"]
+        tx.save()
+
+        with patch.object(NaiveBayesCategorizer, "copy") as spy:
+            updated = registry.get(user.id)
+
+        spy.assert_not_called()
+
+        assert updated.samples == model.samples
+        mercado = updated.classes.index(history["Mercado"].id)
+        assert updated.class_counts[mercado] == 6
+
+    def test_suggest_category_respects_threshold(self, user, history, settings):
+        """Abaixo do limiar a sugestão é descartada, mas a confiança é informada."""
+        category_id, confidence = suggest_category(user, "uber para o aeroporto")
+        assert category_id == history["Transporte"].id
+
+        settings.AI_LOCAL_CATEGORIZER_THRESHOLD = 1.01
+        category_id, low = suggest_category(user, "uber para o aeroporto")
+        assert category_id is None
+        assert low == confidence
+
+    def test_suggest_categories_matches_single_suggestions(
+        self, user, history, settings
+    ):
+        """Sugestões em lote equivalem às individuais (inclusive o limiar)."""
+        settings.AI_LOCAL_CATEGORIZER_THRESHOLD = 0.5
+        texts = ["uber para o aeroporto", "posto gasolina", "xyz"]
+
+        assert suggest_categories(user, texts) == [
+            suggest_category(user, t) for t in texts
+        ]
+
+
+@pytest.mark.django_db
+class TestLocalCategorizerIntegration:
+    @patch("apps.ai.views.is_ollama_available", return_value=True)
+    @patch("apps.ai.views.acategorize_transaction_text")
+    def test_categorize_view_answers_locally(
+        self, mock_categorize, mock_ollama, authenticated_client, user, history
+    ):
+        """Com confiança suficiente a view não chama o LLM nem registra uso."""
+        response = authenticated_client.post(
+            reverse("categorize"), {"text": "uber shopping", "category_type": "EXPENSE"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["suggestion"]["id"] == history["Transporte"].id
+        assert response.data["usage"]["local"] is True
+        assert response.data["usage"]["tokens_used"] == 0
+        mock_categorize.assert_not_called()
+        assert not AIUsageLog.objects.filter(user=user).exists()
+
+    @patch("apps.ai.views.is_ollama_available", return_value=True)
+    @patch("apps.ai.views.acategorize_transaction_text")
+    def test_categorize_view_falls_back_to_llm(
+        self, mock_categorize, mock_ollama, authenticated_client, user, history
+    ):
+        """Texto desconhecido continua indo para o LLM."""
+        mock_categorize.return_value = (
+            "Mercado",
+            0.7,
+            {"model": "m", "total_tokens": 40},
+        )
+
+        response = authenticated_client.post(
+            reverse("categorize"), {"text": "qwerty", "category_type": "EXPENSE"}
+        )
+
+        assert response.data["suggestion"]["name"] == "Mercado"
+        mock_categorize.assert_called_once()
+
+    def test_transaction_without_category_is_auto_categorized(
+        self, authenticated_client, user, history
+    ):
+        """Transação criada sem categoria recebe a sugestão local."""
+        response = authenticated_client.post(
+            reverse("transaction-list"),
+            {
+                "transaction_type": "EXPENSE",
+                "amount": "25.00",
+                "date": "2026-03-10",
+                "description": "Uber centro",
+            },
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        tx = Transaction.objects.get(pk=response.data["id"])
+        assert tx.category == history["Transporte"]
+        assert tx.ai_categorized is True
+        assert tx.ai_confidence >= 0.8
+
+    def test_importer_fills_uncategorized_rows(self, user, history):
+        """Importação categoriza linhas sem categoria com o modelo local."""
+        rows = [
+            StatementRow(
+                line=1,
+                date=date(2026, 3, 5),
+                description="UBER *TRIP centro",
+                amount=Decimal("18.00"),
+                transaction_type=Transaction.TransactionType.EXPENSE,
+            ),
+            StatementRow(
+                line=2,
+                date=date(2026, 3, 6),
+                description="qwerty",
+                amount=Decimal("5.00"),
+                transaction_type=Transaction.TransactionType.EXPENSE,
+            ),
+        ]
+
+        result = StatementImporter(user).run(rows)
+
+        assert result.auto_categorized == 1
+        assert result.uncategorized == 1
+        tx = Transaction.objects.get(user=user, description="UBER *TRIP centro")
+        assert tx.category == history["Transporte"]
+        assert tx.ai_categorized is True
@@ -0,0 +1,96 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.finance.models import Budget, Goal, Transaction
+from tests.factories import CategoryFactory, TransactionFactory
+
+
+@pytest.mark.django_db
+class TestDashboard:
+    def _populate(self, user, today):
+        month = today.replace(day=1)
+        previous = (month - timedelta(days=1)).replace(day=1)
+        for index in range(3):
+            category = CategoryFactory(user=user, name=f"Categoria {index}")
+            Budget.objects.create(
+                user=user, category=category, amount=Decimal("100.00"), start_date=month
+            )
+            TransactionFactory(
+                user=user, category=category, date=month, amount=Decimal("90.00")
+            )
+            TransactionFactory(
+                user=user, category=category, date=previous, amount=Decimal("10.00")
+            )
+            goal = Goal.objects.create(
+                user=user, name=f"Meta {index}", target_amount=Decimal("1000.00")
+            )
+            goal.contributions.create(amount=Decimal("10.00"), date=today)
+        TransactionFactory(
+            user=user,
+            transaction_type=Transaction.TransactionType.INCOME,
+            category=None,
+            date=month,
+            amount=Decimal("500.00"),
+        )
+
+    def test_dashboard_payload(self, authenticated_client, user):
+        """Relatórios dos dois meses, série diária, metas e orçamentos."""
+        today = timezone.localdate()
+        self._populate(user, today)
+
+        response = authenticated_client.get(reverse("dashboard"))
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data
+        assert data["month"] == f"{today:%Y-%m}"
+        assert data["report"]["income"] == 500.0
+        assert data["report"]["expenses"] == 270.0
+        assert data["report"]["transaction_count"] == 4
+        assert data["previous_report"]["expenses"] == 30.0
+        assert data["daily"] == [
+            {
+                "date": today.replace(day=1).isoformat(),
+                "income": 500.0,
+                "expenses": 270.0,
+            }
+        ]
+        assert sorted(goal["name"] for goal in data["goals"]) == [
+            "Meta 0",
+            "Meta 1",
+            "Meta 2",
+        ]
+        assert "contributions" not in data["goals"][0]
+        assert len(data["budgets"]) == 3
+        assert all(budget["alert_reached"] for budget in data["budgets"])
+
+    def test_query_count_is_fixed(
+        self, authenticated_client, user, django_assert_num_queries
+    ):
+        """Número de consultas não depende de metas, orçamentos ou transações."""
+        self._populate(user, timezone.localdate())
+
+        # resumos dos 2 meses, série diária, metas, orçamentos, gasto dos orçamentos
+        with django_assert_num_queries(5):
+            response = authenticated_client.get(reverse("dashboard"))
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_invalid_month(self, authenticated_client):
+        """Mês inválido retorna 400."""
+        response = authenticated_client.get(reverse("dashboard"), {"month": "2026-13"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_previous_month_crosses_year(self, authenticated_client, user):
+        """Janeiro compara com dezembro do ano anterior."""
+        TransactionFactory(user=user, date=date(2025, 12, 10), amount=Decimal("40.00"))
+
+        response = authenticated_client.get(reverse("dashboard"), {"month": "2026-01"})
+
+        assert response.data["previous_report"]["month"] == "2025-12"
+        assert response.data["previous_report"]["expenses"] == 40.0
@@ -0,0 +1,239 @@
+import io
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.finance.importers import (
+    ImportResult,
+    StatementImporter,
+    StatementImportError,
+    import_statement,
+    iter_csv_rows,
+    iter_ofx_rows,
+    parse_amount,
+)
+from apps.finance.models import (
+    Account,
+    Budget,
+    Category,
+    MonthlyCategoryTotal,
+    Transaction,
+    TransactionTag,
+)
+from apps.finance.tags import rebuild_transaction_tags
+from apps.notifications.models import AlertRule, Notification
+
+OFX = """OFXHEADER:100
+DATA:OFXSGML
+CHARSET:1252
+
+<OFX>
+<BANKMSGSRSV1><STMTTRNRS><STMTRS>
+<BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20260305120000[-3:BRT]
+<TRNAMT>-45.90
+<FITID>1
+<MEMO>Padaria Pão Quente
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>CREDIT
+<DTPOSTED>20260306
+<TRNAMT>1500.00
+<FITID>2
+<NAME>Salário
+</STMTTRN>
+</BANKTRANLIST>
+</STMTRS></STMTTRNRS></BANKMSGSRSV1>
+</OFX>
+"""
+
+
+def _csv(
+    rows: int, day: int = 10, amount: str = "-10,00", category: str = "Mercado"
+) -> bytes:
+    lines = ["Data;Descrição;Valor;Categoria;Tags"]
+    lines += [
+        f"{day:02d}/03/2026;Compra {i};{amount};{category};casa" for i in range(rows)
+    ]
+    return "\n".join(lines).encode()
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1.234,56", Decimal("1234.56")),
+        ("-R$ 10,00", Decimal("-10.00")),
+        ("(7,50)", Decimal("-7.50")),
+        ("1234.5", Decimal("1234.5")),
+    ],
+)
+def test_parse_amount(value, expected):
+    """Valores em formato brasileiro e internacional."""
+    assert parse_amount(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value", ["NaN", "-Infinity", "inf", "1e9", "12345678901,00", "10,555"]
+)
+def test_parse_amount_rejects_invalid(value):
+    """NaN, infinito, expoentes e valores fora de ``Transaction.amount``."""
+    with pytest.raises(StatementImportError):
+        parse_amount(value)
+
+
+def test_invalid_amounts_reported_per_row():
+    """Valores inválidos viram erros da linha, sem interromper a leitura."""
+    content = "date,description,amount\n2026-03-01,A,NaN\n2026-03-02,B,99999999999\n2026-03-03,C,5\n"
+    result = ImportResult()
+
+    rows = list(iter_csv_rows(io.StringIO(content), result))
+
+    assert [r.description for r in rows] == ["C"]
+    assert [error["line"] for error in result.errors] == [2, 3]
+
+
+def test_csv_rows_and_errors():
+    """CSV gera linhas válidas e registra erros sem interromper a leitura."""
+    content = "date,description,amount,type\n2026-03-01,Aluguel,1200.00,despesa\nxx,Erro,1,\n2026-03-02,Pix,50,\n"
+    result = ImportResult()
+
+    rows = list(iter_csv_rows(io.StringIO(content), result))
+
+    assert [(r.description, r.transaction_type, r.amount) for r in rows] == [
+        ("Aluguel", "EXPENSE", Decimal("1200.00")),
+        ("Pix", "INCOME", Decimal("50")),
+    ]
+    assert result.skipped == 1
+    assert result.errors[0]["line"] == 3
+
+
+def test_ofx_rows():
+    """OFX SGML: sinal do valor define o tipo e a data ignora hora/timezone."""
+    rows = list(iter_ofx_rows(io.StringIO(OFX), ImportResult()))
+
+    assert [(r.date, r.description, r.transaction_type, r.amount) for r in rows] == [
+        (date(2026, 3, 5), "Padaria Pão Quente", "EXPENSE", Decimal("45.90")),
+        (date(2026, 3, 6), "Salário", "INCOME", Decimal("1500.00")),
+    ]
+
+
+@pytest.mark.django_db
+class TestStatementImport:
+    def test_import_updates_rollup_tags_and_lookups(self, user):
+        """Importação resolve categoria/conta e mantém totais e tags."""
+        category, _ = Category.objects.get_or_create(
+            user=user, name="Mercado", category_type="EXPENSE"
+        )
+        account = Account.objects.create(user=user, name="Nubank")
+
+        result = import_statement(user, io.BytesIO(_csv(3)), "csv", account=account)
+
+        assert result.created == 3
+        assert (
+            Transaction.objects.filter(
+                user=user, category=category, account=account
+            ).count()
+            == 3
+        )
+        total = MonthlyCategoryTotal.objects.get(user=user, category=category)
+        assert (total.month, total.total, total.count) == (
+            date(2026, 3, 1),
+            Decimal("30.00"),
+            3,
+        )
+        assert TransactionTag.objects.filter(tag__name="casa").count() == 3
+
+    def test_tags_rebuilt_per_batch(self, user):
+        """Tags são regeneradas a cada lote (parâmetros limitados ao tamanho do lote)."""
+        importer = StatementImporter(user, batch_size=2)
+        stream = io.StringIO(_csv(5).decode())
+
+        with patch(
+            "apps.finance.importers.rebuild_transaction_tags",
+            wraps=rebuild_transaction_tags,
+        ) as rebuild:
+            importer.run(iter_csv_rows(stream, importer.result))
+
+        assert [
+            len(call.kwargs["transactions"]) for call in rebuild.call_args_list
+        ] == [2, 2, 1]
+        assert TransactionTag.objects.filter(tag__name="casa").count() == 5
+
+    def test_budget_alert_evaluated_once_per_budget(self, user):
+        """Alertas de orçamento são avaliados uma vez por orçamento, não por linha."""
+        category, _ = Category.objects.get_or_create(
+            user=user, name="Mercado", category_type="EXPENSE"
+        )
+        today = timezone.localdate()
+        Budget.objects.create(
+            user=user,
+            category=category,
+            amount=Decimal("50.00"),
+            start_date=today.replace(day=1),
+        )
+        AlertRule.objects.create(
+            user=user, alert_type=AlertRule.AlertType.BUDGET_EXCEEDED
+        )
+        content = _csv(10, day=today.day).replace(
+            b"/03/2026", today.strftime("/%m/%Y").encode()
+        )
+
+        result = import_statement(user, io.BytesIO(content), "csv")
+
+        assert result.affected_budgets == 1
+        assert (
+            Notification.objects.filter(user=user, title__contains="estourou").count()
+            == 1
+        )
+
+    def test_query_count_does_not_grow_with_rows(self, django_user_model):
+        """Fora os INSERTs em lote, as consultas não dependem da quantidade de linhas."""
+
+        def queries_for(rows):
+            user = django_user_model.objects.create_user(username=f"import{rows}")
+            importer = StatementImporter(user, batch_size=500)
+            stream = io.StringIO(_csv(rows).decode())
+            with CaptureQueriesContext(connection) as ctx:
+                importer.run(iter_csv_rows(stream, importer.result))
+            # O bulk_create divide os lotes conforme o limite de parâmetros do banco.
+            return [
+                q["sql"]
+                for q in ctx.captured_queries
+                if not q["sql"].startswith('INSERT INTO "finance_transaction" ')
+            ]
+
+        assert len(queries_for(5)) == len(queries_for(200))
+
+    def test_import_endpoint(self, authenticated_client, user):
+        """Upload via API retorna o resumo da importação."""
+        upload = SimpleUploadedFile("extrato.ofx", OFX.encode("cp1252"))
+
+        response = authenticated_client.post(
+            reverse("transaction-bulk-import"), {"file": upload}, format="multipart"
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["created"] == 2
+        assert Transaction.objects.filter(
+            user=user, description="Padaria Pão Quente"
+        ).exists()
+
+    def test_import_endpoint_rejects_unknown_format(self, authenticated_client):
+        """Formato desconhecido retorna 400."""
+        upload = SimpleUploadedFile("extrato.xlsx", b"x")
+
+        response = authenticated_client.post(
+            reverse("transaction-bulk-import"), {"file": upload}, format="multipart"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
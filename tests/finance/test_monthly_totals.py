@@ -0,0 +1,147 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+
+from apps.finance.models import MonthlyCategoryTotal, Transaction
+from apps.finance.monthly_totals import get_month_summary, get_months_history
+from tests.factories import CategoryFactory
+
+
+def _totals(user):
+    return {
+        (row.month, row.category_id, row.transaction_type): (row.total, row.count)
+        for row in MonthlyCategoryTotal.objects.filter(user=user, count__gt=0)
+    }
+
+
+@pytest.mark.django_db
+class TestMonthlyCategoryTotal:
+    def test_create_updates_rollup(self, user):
+        """Criar transação confirmada soma no total do mês."""
+        category = CategoryFactory(user=user)
+        Transaction.objects.create(
+            user=user,
+            transaction_type="EXPENSE",
+            amount=Decimal("30.00"),
+            date="2026-01-10",
+            description="Compra 1",
+            category=category,
+        )
+        Transaction.objects.create(
+            user=user,
+            transaction_type="EXPENSE",
+            amount=Decimal("20.00"),
+            date=date(2026, 1, 20),
+            description="Compra 2",
+            category=category,
+        )
+
+        assert _totals(user) == {
+            (date(2026, 1, 1), category.id, "EXPENSE"): (Decimal("50.00"), 2)
+        }
+
+    def test_unconfirmed_transactions_are_ignored(self, user):
+        """Transações pendentes não entram nos totais até serem confirmadas."""
+        tx = Transaction.objects.create(
+            user=user,
+            transaction_type="EXPENSE",
+            amount=Decimal("10.00"),
+            date="2026-02-05",
+            description="Pendente",
+            is_confirmed=False,
+        )
+        assert _totals(user) == {}
+
+        tx.is_confirmed = True
+        tx.save()
+        assert _totals(user) == {
+            (date(2026, 2, 1), None, "EXPENSE"): (Decimal("10.00"), 1)
+        }
+
+    def test_update_moves_between_months_and_categories(self, user):
+        """Alterar data, categoria ou valor move o delta para o balde certo."""
+        old_category = CategoryFactory(user=user)
+        new_category = CategoryFactory(user=user)
+        tx = Transaction.objects.create(
+            user=user,
+            transaction_type="EXPENSE",
+            amount=Decimal("40.00"),
+            date="2026-01-31",
+            description="Conta",
+            category=old_category,
+        )
+
+        tx.amount = Decimal("45.00")
+        tx.save()
+        assert _totals(user) == {
+            (date(2026, 1, 1), old_category.id, "EXPENSE"): (Decimal("45.00"), 1)
+        }
+
+        tx.date = date(2026, 2, 1)
+        tx.category = new_category
+        tx.save()
+        assert _totals(user) == {
+            (date(2026, 2, 1), new_category.id, "EXPENSE"): (Decimal("45.00"), 1)
+        }
+
+    def test_delete_subtracts_from_rollup(self, user):
+        """Excluir transação remove seu valor dos totais."""
+        tx = Transaction.objects.create(
+            user=user,
+            transaction_type="INCOME",
+            amount=Decimal("100.00"),
+            date="2026-03-01",
+            description="Venda",
+        )
+        tx.delete()
+
+        summary = get_month_summary(user, date(2026, 3, 1))
+        assert summary["income"] == 0
+        assert summary["transaction_count"] == 0
+
+    def test_rebuild_command_matches_incremental(self, user):
+        """O rebuild regenera exatamente o que os signals mantêm."""
+        category = CategoryFactory(user=user)
+        for day, amount in [(3, "12.50"), (15, "7.50"), (28, "80.00")]:
+            Transaction.objects.create(
+                user=user,
+                transaction_type="EXPENSE",
+                amount=Decimal(amount),
+                date=date(2026, 4, day),
+                description="Gasto",
+                category=category,
+            )
+        Transaction.objects.filter(user=user).update(amount=Decimal("10.00"))
+        incremental = _totals(user)
+
+        call_command("rebuild_monthly_totals", username=user.username)
+
+        rebuilt = _totals(user)
+        assert rebuilt != incremental
+        assert rebuilt == {
+            (date(2026, 4, 1), category.id, "EXPENSE"): (Decimal("30.00"), 3)
+        }
+
+    def test_months_history(self, user):
+        """Histórico agrega receitas e despesas por mês em uma consulta."""
+        Transaction.objects.create(
+            user=user,
+            transaction_type="INCOME",
+            amount=Decimal("1000.00"),
+            date="2026-01-05",
+            description="Salário",
+        )
+        Transaction.objects.create(
+            user=user,
+            transaction_type="EXPENSE",
+            amount=Decimal("300.00"),
+            date="2026-02-10",
+            description="Aluguel",
+        )
+
+        history = get_months_history(user, date(2026, 1, 1), date(2026, 2, 1))
+
+        assert history[date(2026, 1, 1)]["income"] == Decimal("1000.00")
+        assert history[date(2026, 2, 1)]["expenses"] == Decimal("300.00")
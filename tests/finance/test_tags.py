@@ -0,0 +1,119 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from apps.finance.models import Tag, Transaction, TransactionTag
+from apps.finance.tags import parse_tags, spend_by_tag
+
+
+def _transaction(user, tags, amount="10.00", tx_date=date(2026, 3, 10), **kwargs):
+    return Transaction.objects.create(
+        user=user,
+        transaction_type=kwargs.pop("transaction_type", "EXPENSE"),
+        amount=Decimal(amount),
+        date=tx_date,
+        description="Compra",
+        tags=tags,
+        **kwargs,
+    )
+
+
+def _tag_names(tx):
+    return sorted(
+        TransactionTag.objects.filter(transaction=tx).values_list(
+            "tag__name", flat=True
+        )
+    )
+
+
+def test_parse_tags_normalizes_and_deduplicates():
+    """Tags são normalizadas (minúsculas, espaços) e sem repetição."""
+    assert parse_tags(" Viagem ,viagem,  Fim  de Semana,,") == [
+        "viagem",
+        "fim de semana",
+    ]
+    assert parse_tags("") == []
+
+
+@pytest.mark.django_db
+class TestTagSync:
+    def test_create_and_update_sync_links(self, user):
+        """Criar e editar a transação mantém os vínculos de tags."""
+        tx = _transaction(user, "Viagem, Praia")
+        assert _tag_names(tx) == ["praia", "viagem"]
+
+        tx.tags = "viagem, trabalho"
+        tx.save()
+        assert _tag_names(tx) == ["trabalho", "viagem"]
+        assert Tag.objects.filter(user=user).count() == 3
+
+    def test_tags_are_shared_per_user(self, user):
+        """Mesma tag em transações diferentes reutiliza o registro."""
+        _transaction(user, "viagem")
+        _transaction(user, "Viagem")
+        assert Tag.objects.filter(user=user, name="viagem").count() == 1
+
+    def test_backfill_command_rebuilds_links(self, user):
+        """O backfill recria vínculos de alterações feitas via update()."""
+        tx = _transaction(user, "viagem")
+        Transaction.objects.filter(pk=tx.pk).update(tags="mercado, casa")
+
+        call_command("backfill_tags", username=user.username)
+
+        assert _tag_names(tx) == ["casa", "mercado"]
+
+
+@pytest.mark.django_db
+class TestTagFilterAndReport:
+    def test_filter_by_tag(self, authenticated_client, user):
+        """?tag= filtra pela tag normalizada, sem casar substrings."""
+        match = _transaction(user, "Viagem")
+        _transaction(user, "viagem longa")
+
+        response = authenticated_client.get(
+            reverse("transaction-list"), {"tag": " VIAGEM "}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [tx["id"] for tx in response.data["results"]] == [match.id]
+
+    def test_spend_by_tag_single_query(self, user, django_assert_num_queries):
+        """Relatório por tag agrega em uma única consulta."""
+        _transaction(user, "viagem, praia", amount="100.00")
+        _transaction(user, "viagem", amount="50.00")
+        _transaction(user, "viagem", amount="999.00", tx_date=date(2026, 4, 1))
+        _transaction(user, "viagem", amount="70.00", transaction_type="INCOME")
+        _transaction(user, "praia", amount="30.00", is_confirmed=False)
+
+        with django_assert_num_queries(1):
+            rows = spend_by_tag(user, date(2026, 3, 1), date(2026, 4, 1))
+
+        assert rows == [
+            {"tag": "viagem", "total": Decimal("150.00"), "count": 2},
+            {"tag": "praia", "total": Decimal("100.00"), "count": 1},
+        ]
+
+    def test_tag_report_endpoint(self, authenticated_client, user):
+        """Endpoint retorna gastos por tag do mês informado."""
+        _transaction(user, "viagem", amount="40.00")
+
+        response = authenticated_client.get(reverse("tag-report"), {"month": "2026-03"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["start_date"] == "2026-03-01"
+        assert response.data["end_date"] == "2026-03-31"
+        assert response.data["tags"] == [{"tag": "viagem", "total": 40.0, "count": 1}]
+
+    def test_tag_report_invalid_params(self, authenticated_client):
+        """Parâmetros inválidos retornam 400."""
+        url = reverse("tag-report")
+        assert authenticated_client.get(url, {"month": "2026"}).status_code == 400
+        assert (
+            authenticated_client.get(url, {"start_date": "2026-03-01"}).status_code
+            == 400
+        )
+        assert authenticated_client.get(url, {"type": "X"}).status_code == 400
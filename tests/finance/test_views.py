@@ -35,9 +35,7 @@ class TestAccountViewSet:
 class TestCategoryViewSet:
     def test_list_categories(self, authenticated_client, user):
         """Usuário pode listar suas categorias."""
-        Category.objects.create(
-            user=user, name="Alimentação", category_type="EXPENSE"
-        )
+        Category.objects.create(user=user, name="Alimentação", category_type="EXPENSE")
         url = reverse("category-list")
         response = authenticated_client.get(url)
         assert response.status_code == status.HTTP_200_OK
@@ -139,6 +137,33 @@ class TestTransactionViewSet:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "account" in response.data
 
+    def test_filter_by_month_includes_whole_month(self, authenticated_client, user):
+        """Filtro por mês usa o intervalo [primeiro dia, primeiro dia seguinte)."""
+        for tx_date in ["2026-01-31", "2026-02-01", "2026-02-28", "2026-03-01"]:
+            Transaction.objects.create(
+                user=user,
+                transaction_type="EXPENSE",
+                amount=10,
+                date=tx_date,
+                description=f"Gasto {tx_date}",
+            )
+
+        url = reverse("transaction-list")
+        response = authenticated_client.get(url, {"month": "2026-02"})
+        assert response.status_code == status.HTTP_200_OK
+        assert sorted(item["date"] for item in response.data["results"]) == [
+            "2026-02-01",
+            "2026-02-28",
+        ]
+
+    @pytest.mark.parametrize("month", ["9999-12", "2026-13", "fev"])
+    def test_filter_by_invalid_month(self, authenticated_client, month):
+        """Mês inválido (ou sem mês seguinte representável) responde 400."""
+        response = authenticated_client.get(
+            reverse("transaction-list"), {"month": month}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
 
 @pytest.mark.django_db
 class TestMonthlyReport:
@@ -148,6 +173,15 @@ class TestMonthlyReport:
         response = authenticated_client.get(url)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+    def test_monthly_report_rejects_last_representable_month(
+        self, authenticated_client
+    ):
+        """Dezembro de 9999 não tem mês seguinte: 400 em vez de erro interno."""
+        response = authenticated_client.get(
+            reverse("monthly-report"), {"month": "9999-12"}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_monthly_report_returns_totals(self, authenticated_client, user):
         """Relatório mensal retorna totais corretos."""
         category = Category.objects.create(